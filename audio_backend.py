@@ -0,0 +1,89 @@
+from typing import Any, Callable
+
+
+class AudioBackend:
+    """Input/output audio device that calls a stream callback.
+
+    Callback gets raw bytes of interleaved float32 input frames,
+    number of frames, time information and status flags,
+    and returns output frames and a return code, like a pyaudio
+    stream callback. Status flags and return codes have PortAudio values,
+    so a callback is passed to PortAudio without a wrapper.
+    Backend can be opened again after it is closed.
+    """
+
+    INPUT_UNDERFLOW: int = 1
+    INPUT_OVERFLOW: int = 2
+    OUTPUT_UNDERFLOW: int = 4
+    OUTPUT_OVERFLOW: int = 8
+
+    CONTINUE: int = 0
+    COMPLETE: int = 1
+    ABORT: int = 2
+
+    def open(self,
+             sampling_frequency: int,
+             number_of_channels: int,
+             samples_per_buffer: int,
+             stream_callback: Callable[[bytes, int, Any, int],
+                                       tuple[Any, int]]) -> None:
+        """Open device and start calling stream callback.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            number_of_channels (int): number of interleaved channels
+            of input and output.
+            samples_per_buffer (int): number of frames in a buffer.
+            stream_callback (Callable[[bytes, int, Any, int],
+            tuple[Any, int]]): stream callback.
+
+        Raises:
+            NotImplementedError: backend does not open devices.
+            OSError: device could not be opened.
+        """
+        raise NotImplementedError("ERROR! Backend does not open devices!")
+
+    def is_active(self) -> bool:
+        """Return a flag that specifies whether device calls its callback.
+
+        Raises:
+            NotImplementedError: backend does not open devices.
+
+        Returns:
+            bool: True - device is active. False - device is stopped.
+        """
+        raise NotImplementedError("ERROR! Backend does not open devices!")
+
+    def get_input_latency(self) -> float:
+        """Return input latency reported by device.
+
+        Raises:
+            NotImplementedError: backend does not open devices.
+
+        Returns:
+            float: input latency, s.
+        """
+        raise NotImplementedError("ERROR! Backend does not open devices!")
+
+    def get_output_latency(self) -> float:
+        """Return output latency reported by device.
+
+        Raises:
+            NotImplementedError: backend does not open devices.
+
+        Returns:
+            float: output latency, s.
+        """
+        raise NotImplementedError("ERROR! Backend does not open devices!")
+
+    def stats(self) -> dict[str, Any]:
+        """Return device statistics.
+
+        Returns:
+            dict[str, Any]: statistics, none by default.
+        """
+        return {}
+
+    def close(self) -> None:
+        """Stop calling stream callback and close device."""
+        pass
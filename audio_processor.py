@@ -0,0 +1,651 @@
+import dataclasses
+import struct
+import threading
+from typing import Any
+
+import numpy
+
+from carrier_waveform import CarrierWaveform
+from effect_chain import EffectChain
+from noise_generator import NoiseGenerator
+from polyphase_resampler import PolyphaseResampler
+from processing_mode import ProcessingMode
+from ramp_shape import RampShape
+from ring_buffer import RingBuffer
+from ring_modulator import RingModulator
+from sine_wave_generator import SineWaveGenerator
+from sine_wave_parameters import SineWaveParameters
+from stream_parameters import StreamParameters
+
+
+class AudioProcessor:
+    def __init__(self,
+                 samples_per_buffer: int,
+                 sine_wave_generator: SineWaveGenerator,
+                 noise_generator: NoiseGenerator,
+                 add_noise: bool,
+                 volume: int | float,
+                 plot_ring_buffer: RingBuffer | None,
+                 processing_mode: ProcessingMode = ProcessingMode.BLOCK,
+                 number_of_channels: int = 1,
+                 carrier_phase_offsets: list[int | float] | None = None,
+                 smoothing_ramp_samples: int = 0,
+                 ramp_shape: RampShape = RampShape.LINEAR,
+                 effect_chain: list[dict[str, Any]] | None = None,
+                 resampling_factor: int = 1) -> None:
+        """Initialize input voice processing.
+
+        Interleaved buffers are processed as (frames, channels) arrays,
+        all channels in one pass. Every channel is modulated
+        by the same sine wave, optionally shifted by a per-channel phase.
+        Every channel gets its own noise.
+        Only the first channel is sent to plot.
+        Block processing runs an effect chain in place on one buffer
+        and ramps volume to a new value instead of jumping.
+        With a resampling factor voice is processed at a lower
+        internal sampling frequency. Sine wave generator, noise generator,
+        ramps and plot work at internal sampling frequency.
+
+        Args:
+            samples_per_buffer (int): number of frames in input buffer.
+            Scratch buffers are preallocated for this number of frames.
+            sine_wave_generator (SineWaveGenerator): sine wave generator.
+            noise_generator (NoiseGenerator): noise generator.
+            add_noise (bool): "add noise" parameter.
+            volume (int | float): volume.
+            plot_ring_buffer (RingBuffer | None): ring buffer with 3 rows
+            to send points to plot. None - do not send points to plot.
+            processing_mode (ProcessingMode): BLOCK - process whole buffers
+            with numpy. REFERENCE - process buffers sample by sample,
+            one channel only.
+            number_of_channels (int): number of interleaved channels.
+            carrier_phase_offsets (list[int | float] | None): sine wave
+            phase offset of every channel, degrees.
+            None - all channels get the same sine wave.
+            smoothing_ramp_samples (int): duration of a volume ramp,
+            samples. 0 - do not smooth.
+            ramp_shape (RampShape): shape of a volume ramp.
+            effect_chain (list[dict[str, Any]] | None): description
+            of effect chain stages. None - amplify, modulate, add noise,
+            clip. REFERENCE processing mode always uses this order.
+            resampling_factor (int): input sampling frequency divided by
+            internal sampling frequency. 1 - do not resample.
+            Number of frames in input buffer must be a multiple of it.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(samples_per_buffer, int)) or
+           (samples_per_buffer <= 0) or
+           (not isinstance(sine_wave_generator, SineWaveGenerator)) or
+           (not isinstance(noise_generator, NoiseGenerator)) or
+           (not isinstance(add_noise, bool)) or
+           (not isinstance(volume, (int, float))) or
+           (volume <= 0) or
+           ((plot_ring_buffer is not None) and
+            (not isinstance(plot_ring_buffer, RingBuffer))) or
+           (not isinstance(processing_mode, ProcessingMode)) or
+           (not isinstance(number_of_channels, int)) or
+           (number_of_channels <= 0) or
+           ((carrier_phase_offsets is not None) and
+            ((not isinstance(carrier_phase_offsets, list)) or
+             (len(carrier_phase_offsets) != number_of_channels) or
+             (not all(isinstance(offset, (int, float))
+                      for offset in carrier_phase_offsets)))) or
+           ((processing_mode is ProcessingMode.REFERENCE) and
+            ((number_of_channels != 1) or
+             (carrier_phase_offsets is not None) or
+             (effect_chain is not None))) or
+           ((effect_chain is not None) and
+            (EffectChain.check_description(
+                description=effect_chain,
+                sampling_frequency=sine_wave_generator.sampling_frequency)
+             is False)) or
+           (not isinstance(smoothing_ramp_samples, int)) or
+           (smoothing_ramp_samples < 0) or
+           (not isinstance(ramp_shape, RampShape)) or
+           (not isinstance(resampling_factor, int)) or
+           (resampling_factor <= 0) or
+           (samples_per_buffer % resampling_factor != 0)):
+           raise ValueError("ERROR! Invalid arguments!")
+
+        self._sine_wave_generator: SineWaveGenerator = sine_wave_generator
+        self._noise_generator: NoiseGenerator = noise_generator
+
+        # Setters publish a new snapshot. Audio callback reads it once.
+        self._parameters: StreamParameters = StreamParameters(
+            volume=volume,
+            add_noise=add_noise)
+        self._mutex_parameters: threading.Lock = threading.Lock()
+        # Changes of several parameters wait here for a buffer boundary.
+        self._pending_changes: dict[str, Any] | None = None
+        # Sine wave snapshot of pending changes, built by change_parameters().
+        self._pending_sine_wave_parameters: SineWaveParameters | None = None
+
+        self._plot_ring_buffer: RingBuffer | None = plot_ring_buffer
+
+        self._processing_mode: ProcessingMode = processing_mode
+        self._bytes_per_sample: int = numpy.dtype(numpy.float32).itemsize
+        self._number_of_channels: int = number_of_channels
+
+        # Phase offsets in sine wave periods.
+        self._carrier_phase_offsets: numpy.ndarray | None = None
+        if carrier_phase_offsets is not None:
+            self._carrier_phase_offsets = \
+                numpy.array(carrier_phase_offsets, dtype=numpy.float64) / 360
+
+        if effect_chain is None:
+            effect_chain = EffectChain.get_default_description()
+        self._effect_chain: EffectChain = EffectChain(
+            description=effect_chain,
+            sine_wave_generator=sine_wave_generator,
+            noise_generator=noise_generator,
+            volume=volume,
+            carrier_phase_offsets=self._carrier_phase_offsets,
+            smoothing_ramp_samples=smoothing_ramp_samples,
+            ramp_shape=ramp_shape)
+
+        self._resampler: PolyphaseResampler | None = None
+        internal_samples_per_buffer: int = samples_per_buffer
+        if resampling_factor > 1:
+            self._resampler = PolyphaseResampler(
+                factor=resampling_factor,
+                samples_per_buffer=samples_per_buffer,
+                number_of_channels=number_of_channels)
+            internal_samples_per_buffer = \
+                self._resampler.internal_samples_per_buffer
+
+        self._allocate_buffers(samples_per_buffer=internal_samples_per_buffer)
+        self._allocate_concealment_buffers(
+            samples_per_buffer=samples_per_buffer)
+
+    def _allocate_buffers(self, samples_per_buffer: int) -> None:
+        """Allocate scratch buffers for a number of frames.
+
+        Args:
+            samples_per_buffer (int): number of frames in processed block,
+            at internal sampling frequency.
+        """
+        self._samples_per_buffer: int = samples_per_buffer
+        shape: tuple[int, int] = (samples_per_buffer, self._number_of_channels)
+
+        self._input_voice_float32_block: numpy.ndarray = \
+            numpy.zeros(shape, dtype=numpy.float32)
+        self._input_voice_bytes: memoryview = \
+            memoryview(self._input_voice_float32_block).cast("B")
+        # Effect chain processes this block in place.
+        self._modulated_voice_block: numpy.ndarray = \
+            numpy.zeros(shape, dtype=numpy.float64)
+        self._output_block: numpy.ndarray = \
+            numpy.zeros(shape, dtype=numpy.float32)
+
+        self._effect_chain.allocate(
+            samples_per_buffer=samples_per_buffer,
+            number_of_channels=self._number_of_channels)
+        plot_sine_wave_row: numpy.ndarray | None = \
+            self._effect_chain.carrier_row
+        if plot_sine_wave_row is None:
+            plot_sine_wave_row = numpy.zeros(samples_per_buffer,
+                                             dtype=numpy.float64)
+
+        # Views are created once, so processing does not create them.
+        self._plot_rows: tuple[numpy.ndarray, ...] = (
+            self._input_voice_float32_block[:, 0],
+            plot_sine_wave_row,
+            self._modulated_voice_block[:, 0])
+
+    def _allocate_concealment_buffers(self, samples_per_buffer: int) -> None:
+        """Allocate xrun concealment buffers for a number of frames.
+
+        Args:
+            samples_per_buffer (int): number of frames in output buffer.
+        """
+        shape: tuple[int, int] = (samples_per_buffer, self._number_of_channels)
+        self._last_output_block: numpy.ndarray = \
+            numpy.zeros(shape, dtype=numpy.float32)
+        self._concealed_block: numpy.ndarray = \
+            numpy.zeros(shape, dtype=numpy.float32)
+        self._fade_in: numpy.ndarray = numpy.linspace(
+            0.0,
+            1.0,
+            samples_per_buffer,
+            endpoint=False,
+            dtype=numpy.float32).reshape(samples_per_buffer, 1)
+
+    def process(self, in_data: bytes) -> bytes | numpy.ndarray:
+        """Modulate input voice by a sine wave and return modulated voice.
+
+        Send input voice, sine wave and modulated voice samples to
+        a ring buffer for later plotting.
+
+        Args:
+            in_data (bytes): raw bytes of input voice float32 data.
+
+        Returns:
+            bytes | numpy.ndarray: raw bytes or float32 array of shape
+            (frames, channels) of modulated voice data.
+            Array is reused by the next call.
+        """
+        if self._pending_changes is not None:
+            self._apply_pending_changes()
+
+        output: bytes | numpy.ndarray = self._process(in_data=in_data)
+
+        # Remember the last good block for xrun concealment.
+        output_array: numpy.ndarray = self._get_output_array(output=output)
+        numpy.copyto(self._last_output_block, output_array)
+        return output
+
+    def change_parameters(self, changes: dict[str, Any]) -> None:
+        """Check and change several parameters at the next buffer.
+
+        All changes take effect at the same buffer boundary.
+        Changes that did not take effect yet are merged.
+        Sine wave parameters and wavetables are built here,
+        the audio callback only publishes them.
+
+        Args:
+            changes (dict[str, Any]): new values of "sine_wave_frequency",
+            "add_noise", "volume" and "carrier_waveform".
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        # Check argument.
+        if AudioProcessor.check_changes(
+            changes=changes,
+            sampling_frequency=self._sine_wave_generator.sampling_frequency) \
+            is False:
+            raise ValueError("ERROR! Invalid argument!")
+
+        # Audio callback does not wait for the mutex,
+        # so building wavetables under it does not block audio.
+        with self._mutex_parameters:
+            if (("sine_wave_frequency" in changes) or
+                ("carrier_waveform" in changes)):
+                sine_wave_parameters: SineWaveParameters = \
+                    self._sine_wave_generator.parameters
+                if self._pending_sine_wave_parameters is not None:
+                    sine_wave_parameters = self._pending_sine_wave_parameters
+                self._pending_sine_wave_parameters = \
+                    self._sine_wave_generator.create_parameters(
+                        sine_wave_frequency=changes.get(
+                            "sine_wave_frequency",
+                            sine_wave_parameters.sine_wave_frequency),
+                        carrier_waveform=changes.get(
+                            "carrier_waveform",
+                            sine_wave_parameters.carrier_waveform))
+
+            pending_changes: dict[str, Any] = {}
+            if self._pending_changes is not None:
+                pending_changes.update(self._pending_changes)
+            pending_changes.update(changes)
+            self._pending_changes = pending_changes
+
+    @staticmethod
+    def check_changes(changes: Any, sampling_frequency: int) -> bool:
+        """Check changes of several parameters.
+
+        Args:
+            changes (Any): new values by parameter names.
+            sampling_frequency (int): sampling frequency, Hz.
+
+        Returns:
+            bool: True - changes are valid.
+            False - changes are invalid.
+        """
+        if not isinstance(changes, dict):
+            return False
+
+        for name, value in changes.items():
+            valid: bool = False
+            match name:
+                case "sine_wave_frequency":
+                    valid = ((isinstance(value, (int, float))) and
+                             (value > 0) and
+                             (value < sampling_frequency/2))
+                case "add_noise":
+                    valid = isinstance(value, bool)
+                case "volume":
+                    valid = (isinstance(value, (int, float))) and (value > 0)
+                case "carrier_waveform":
+                    valid = isinstance(value, CarrierWaveform)
+            if valid is False:
+                return False
+        return True
+
+    def _apply_pending_changes(self) -> None:
+        """Apply changes of several parameters before a buffer.
+
+        Audio callback does not wait for a setter,
+        changes are applied at the next buffer instead.
+        Sine wave snapshot is already built, it is only published.
+        """
+        if self._mutex_parameters.acquire(blocking=False) is False:
+            return
+        try:
+            changes: dict[str, Any] | None = self._pending_changes
+            self._pending_changes = None
+            if changes is None:
+                return
+
+            if self._pending_sine_wave_parameters is not None:
+                self._sine_wave_generator.parameters = \
+                    self._pending_sine_wave_parameters
+                self._pending_sine_wave_parameters = None
+
+            parameters: StreamParameters = self._parameters
+            for name, value in changes.items():
+                match name:
+                    case "add_noise":
+                        parameters = dataclasses.replace(parameters,
+                                                         add_noise=value)
+                    case "volume":
+                        parameters = dataclasses.replace(parameters,
+                                                         volume=value)
+            self._parameters = parameters
+        finally:
+            self._mutex_parameters.release()
+
+    def conceal_repeat(self) -> numpy.ndarray:
+        """Return the last good block again instead of processing a buffer.
+
+        Input voice is not consumed, sine wave and noise do not advance.
+
+        Returns:
+            numpy.ndarray: float32 array of the last good modulated voice data.
+        """
+        return self._last_output_block
+
+    def conceal_crossfade(self, in_data: bytes) -> numpy.ndarray:
+        """Process a buffer and crossfade from the last good block into it.
+
+        Input voice of a buffer with an xrun may be cut or padded
+        with zeros. A linear crossfade hides the discontinuity.
+        The result is not remembered as a good block.
+
+        Args:
+            in_data (bytes): raw bytes of input voice float32 data.
+
+        Returns:
+            numpy.ndarray: float32 array of concealed modulated voice data.
+            Array is reused by the next call.
+        """
+        output: numpy.ndarray = self._get_output_array(
+            output=self._process(in_data=in_data))
+
+        # last + (current - last) * fade in.
+        numpy.subtract(output,
+                       self._last_output_block,
+                       out=self._concealed_block)
+        numpy.multiply(self._concealed_block,
+                       self._fade_in,
+                       out=self._concealed_block)
+        numpy.add(self._concealed_block,
+                  self._last_output_block,
+                  out=self._concealed_block)
+        return self._concealed_block
+
+    def _get_output_array(self,
+                          output: bytes | numpy.ndarray) -> numpy.ndarray:
+        """Return processed data as a float32 (frames, channels) array.
+
+        Scratch buffers are reallocated if buffer size changed.
+
+        Args:
+            output (bytes | numpy.ndarray): raw bytes or float32 array
+            of modulated voice data.
+
+        Returns:
+            numpy.ndarray: float32 array of modulated voice data.
+        """
+        if not isinstance(output, numpy.ndarray):
+            output = numpy.frombuffer(output, dtype=numpy.float32).reshape(
+                -1, self._number_of_channels)
+        if output.shape[0] != self._last_output_block.shape[0]:
+            self._allocate_concealment_buffers(
+                samples_per_buffer=output.shape[0])
+        return output
+
+    def _process(self, in_data: bytes) -> bytes | numpy.ndarray:
+        """Process a buffer, at internal sampling frequency if resampling.
+
+        Args:
+            in_data (bytes): raw bytes of input voice float32 data.
+
+        Returns:
+            bytes | numpy.ndarray: raw bytes or float32 array
+            of modulated voice data.
+        """
+        if self._resampler is not None:
+            output: numpy.ndarray = self._resampler.process(
+                in_data=in_data,
+                process=self._process_at_internal_rate)
+            # Interpolation overshoots clipped samples.
+            numpy.clip(output, -1.0, 1.0, out=output)
+            return output
+        return self._process_at_internal_rate(in_data=in_data)
+
+    def _process_at_internal_rate(self,
+                                  in_data: bytes) -> bytes | numpy.ndarray:
+        """Process a block in current processing mode.
+
+        Args:
+            in_data (bytes): raw bytes of input voice float32 data.
+
+        Returns:
+            bytes | numpy.ndarray: raw bytes or float32 array
+            of modulated voice data.
+        """
+        parameters: StreamParameters = self._parameters
+
+        match self._processing_mode:
+            case ProcessingMode.BLOCK:
+                return self._process_block(in_data=in_data,
+                                           parameters=parameters)
+            case ProcessingMode.REFERENCE:
+                return self._process_samples(in_data=in_data,
+                                             parameters=parameters)
+
+    def _process_block(self,
+                       in_data: bytes,
+                       parameters: StreamParameters) -> numpy.ndarray:
+        """Process input voice buffer as a whole with numpy.
+
+        Effect chain processes one buffer in place, stage by stage.
+        With the default effect chain produces the same samples
+        and the same points to plot as _process_samples().
+        Works in preallocated buffers, so nothing is allocated
+        while buffer size does not change.
+
+        Args:
+            in_data (bytes): raw bytes of input voice float32 data.
+            parameters (StreamParameters): parameters for this buffer.
+
+        Returns:
+            numpy.ndarray: float32 array of modulated voice data.
+        """
+        number_of_points: int = len(in_data) // (self._bytes_per_sample *
+                                                 self._number_of_channels)
+        if number_of_points != self._samples_per_buffer:
+            self._allocate_buffers(samples_per_buffer=number_of_points)
+
+        # Get input voice points. Calculate in float64 like Python floats do.
+        self._input_voice_bytes[:] = in_data
+        numpy.copyto(self._modulated_voice_block,
+                     self._input_voice_float32_block)
+
+        self._effect_chain.process(block=self._modulated_voice_block,
+                                   parameters=parameters)
+
+        # Send points to plot.
+        if self._plot_ring_buffer is not None:
+            self._plot_ring_buffer.write(*self._plot_rows)
+
+        numpy.copyto(self._output_block, self._modulated_voice_block)
+        return self._output_block
+
+    def _process_samples(self,
+                         in_data: bytes,
+                         parameters: StreamParameters) -> bytes:
+        """Process input voice buffer sample by sample.
+
+        Reference implementation for _process_block().
+
+        Args:
+            in_data (bytes): raw bytes of input voice float32 data.
+            parameters (StreamParameters): parameters for this buffer.
+
+        Returns:
+            bytes: raw bytes of modulated voice float32 data.
+        """
+        i: int = 0
+        output_byte_array: bytearray = bytearray()
+        input_voice_points: list[float] = []
+        sine_wave_points: list[float] = []
+        modulated_voice_points: list[float] = []
+        while (i + self._bytes_per_sample - 1) <= (len(in_data) - 1):
+            # Get input voice point as bytes.
+            input_voice_point_bytes: bytes = \
+                in_data[i:i + self._bytes_per_sample]
+            input_voice_point: float = \
+                (struct.unpack("f", input_voice_point_bytes))[0]
+
+            # Amplify.
+            amplified_voice_point: float = \
+                input_voice_point * parameters.volume
+
+            # Get sine wave point.
+            sine_wave_point: float = \
+                self._sine_wave_generator.get_sine_wave_point()
+
+            # Modulate.
+            modulated_voice_point: float = RingModulator.modulate(
+                input_voice_point=amplified_voice_point,
+                sine_wave_point=sine_wave_point)
+
+            # Add noise optionally.
+            if parameters.add_noise is True:
+                noise_point: float = self._noise_generator.get_noise_point()
+                modulated_voice_point = modulated_voice_point + noise_point
+
+            # Prevent clipping.
+            if modulated_voice_point > 1:
+                modulated_voice_point = 1
+            elif modulated_voice_point < -1:
+                modulated_voice_point = -1
+
+            # Add to output byte array.
+            modulated_voice_point_bytes: bytes = \
+                struct.pack("f", modulated_voice_point)
+            for output_byte in modulated_voice_point_bytes:
+                output_byte_array.append(output_byte)
+
+            # Collect points to plot. Input is plotted before the chain,
+            # like in _process_block().
+            input_voice_points.append(input_voice_point)
+            sine_wave_points.append(sine_wave_point)
+            modulated_voice_points.append(modulated_voice_point)
+
+            # Increment index.
+            i = i + self._bytes_per_sample
+
+        # Send points to plot.
+        if self._plot_ring_buffer is not None:
+            self._plot_ring_buffer.write(numpy.array(input_voice_points),
+                                         numpy.array(sine_wave_points),
+                                         numpy.array(modulated_voice_points))
+
+        output_bytes: bytes = bytes(output_byte_array)
+        return output_bytes
+
+    @property
+    def processing_mode(self) -> ProcessingMode:
+        """Return processing mode.
+
+        Returns:
+            ProcessingMode: processing mode.
+        """
+        return self._processing_mode
+
+    @property
+    def parameters(self) -> StreamParameters:
+        """Return current parameters snapshot.
+
+        Returns:
+            StreamParameters: current parameters snapshot.
+        """
+        return self._parameters
+
+    @property
+    def added_latency_samples(self) -> int:
+        """Return latency added by resampling.
+
+        Returns:
+            int: added latency, input samples. 0 - no resampling.
+        """
+        if self._resampler is None:
+            return 0
+        return self._resampler.added_latency_samples
+
+    @property
+    def add_noise(self) -> bool:
+        """Return current "add noise" parameter.
+
+        Returns:
+            bool: current "add noise" parameter.
+        """
+        return self._parameters.add_noise
+
+    @add_noise.setter
+    def add_noise(self, new_add_noise: bool) -> None:
+        """Check and set new "add noise" parameter.
+
+        New parameter takes effect at the next buffer.
+
+        Args:
+            new_add_noise (bool): new "add noise" parameter.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        # Check argument.
+        if((not isinstance(new_add_noise, bool))):
+            raise ValueError("ERROR! Invalid argument!")
+
+        with self._mutex_parameters:
+            self._parameters = dataclasses.replace(self._parameters,
+                                                   add_noise=new_add_noise)
+
+    @property
+    def volume(self) -> float:
+        """Return volume.
+
+        Returns:
+            float: volume.
+        """
+        return self._parameters.volume
+
+    @volume.setter
+    def volume(self, new_volume: int | float) -> None:
+        """Check and set new volume.
+
+        New volume takes effect at the next buffer.
+
+        Args:
+            new_volume (int | float): new volume.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        # Check argument.
+        if((not isinstance(new_volume, (int, float))) or
+           (new_volume <= 0)):
+            raise ValueError("ERROR! Invalid argument!")
+
+        with self._mutex_parameters:
+            self._parameters = dataclasses.replace(self._parameters,
+                                                   volume=new_volume)
@@ -0,0 +1,504 @@
+import argparse
+import contextlib
+import itertools
+import json
+import platform
+import sys
+import time
+from typing import Any
+
+import numpy
+
+from execution_mode import ExecutionMode
+from manual_backend import ManualBackend
+from noise_generator import NoiseGenerator
+from polyphase_resampler import PolyphaseResampler
+from processing_mode import ProcessingMode
+from ramp_shape import RampShape
+from recorder import Recorder
+from recording_format import RecordingFormat
+from ring_buffer import RingBuffer
+from sine_wave_generator import SineWaveGenerator
+from stream import Stream
+
+
+class CallbackBenchmark:
+    @staticmethod
+    def measure(sampling_frequency: int,
+                samples_per_buffer: int,
+                add_noise: bool,
+                processing_mode: ProcessingMode,
+                number_of_buffers: int,
+                execution_mode: ExecutionMode = ExecutionMode.IN_CALLBACK,
+                number_of_channels: int = 1,
+                smoothing_ramp_ms: int | float = 0.0,
+                ramp_shape: RampShape = RampShape.LINEAR,
+                resampling_factor: int = 1,
+                record_directory: str | None = None) -> dict[str, Any]:
+        """Measure processing time of stream callback buffers.
+
+        Synthetic input voice goes through the stream callback
+        of a Stream opened on a manual backend, without an audio device,
+        so status flags, statistics, xrun recovery policy
+        and recorder are timed together with processing.
+        Noise pool holds noise of all buffers, like a refill thread
+        that keeps up, so buffers are not slowed down by noise batches.
+        In WORKER_PROCESS execution mode buffers are sent
+        once per buffer period, like an audio device does,
+        and only the time spent in the callback is measured.
+        With smoothing, volume and sine wave frequency change
+        once per second of audio, like from the menu, and ramp.
+        With a resampling factor voice is processed at sampling frequency
+        divided by it, resampling time is included. Frequency response
+        of resampling is measured too.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            samples_per_buffer (int): number of samples in a buffer.
+            add_noise (bool): "add noise" parameter.
+            processing_mode (ProcessingMode): processing mode.
+            number_of_buffers (int): number of measured buffers.
+            execution_mode (ExecutionMode): execution mode.
+            number_of_channels (int): number of interleaved channels.
+            smoothing_ramp_ms (int | float): duration of volume
+            and frequency ramps, ms. 0 - do not smooth or change them.
+            ramp_shape (RampShape): shape of volume and frequency ramps.
+            resampling_factor (int): sampling frequency divided by
+            internal sampling frequency. 1 - do not resample.
+            record_directory (str | None): directory to record
+            input and output to. None - do not record.
+
+        Returns:
+            dict[str, Any]: configuration and processing time statistics.
+        """
+        WARM_UP_BUFFERS: int = 10
+        SINE_WAVE_FREQUENCY: float = 220.0
+        VOLUME: float = 2.0
+        # Changed values for smoothing.
+        OTHER_SINE_WAVE_FREQUENCY: float = 230.0
+        OTHER_VOLUME: float = 3.0
+        PARAMETER_CHANGE_INTERVAL_S: float = 1.0
+        NOISE_BATCH_SIZE: int = 8192
+
+        internal_sampling_frequency: int = \
+            sampling_frequency // resampling_factor
+        smoothing_ramp_samples: int = round(smoothing_ramp_ms
+                                            * internal_sampling_frequency
+                                            / 1000)
+        sine_wave_generator: SineWaveGenerator = SineWaveGenerator(
+            sampling_frequency=internal_sampling_frequency,
+            sine_wave_frequency=SINE_WAVE_FREQUENCY,
+            smoothing_ramp_samples=smoothing_ramp_samples,
+            ramp_shape=ramp_shape)
+        noise_points: int = ((WARM_UP_BUFFERS + number_of_buffers)
+                             * samples_per_buffer * number_of_channels)
+        noise_generator: NoiseGenerator = NoiseGenerator(
+            seed=0,
+            pool_size=max(2, -(-noise_points // NOISE_BATCH_SIZE) + 1)
+                      * NOISE_BATCH_SIZE,
+            batch_size=NOISE_BATCH_SIZE,
+            real_time=False)
+        plot_ring_buffer: RingBuffer = RingBuffer(
+            number_of_rows=3,
+            capacity=samples_per_buffer * 4)
+        recorder: Recorder | None = None
+        if record_directory is not None:
+            recorder = Recorder(
+                directory=record_directory,
+                recording_format=RecordingFormat.RAW,
+                sampling_frequency=sampling_frequency,
+                samples_per_buffer=samples_per_buffer,
+                number_of_channels=number_of_channels,
+                number_of_slots=max(4, round(2.0 * sampling_frequency
+                                             / samples_per_buffer)),
+                max_file_size_bytes=None,
+                max_file_duration_s=None)
+        manual_backend: ManualBackend = ManualBackend()
+        # Stream prints latencies, standard output is for JSON lines.
+        with contextlib.redirect_stdout(sys.stderr):
+            stream: Stream = Stream(
+                sampling_frequency=sampling_frequency,
+                samples_per_buffer=samples_per_buffer,
+                sine_wave_generator=sine_wave_generator,
+                noise_generator=noise_generator,
+                add_noise=add_noise,
+                volume=VOLUME,
+                plot_ring_buffer=plot_ring_buffer,
+                processing_mode=processing_mode,
+                execution_mode=execution_mode,
+                number_of_channels=number_of_channels,
+                smoothing_ramp_samples=smoothing_ramp_samples,
+                ramp_shape=ramp_shape,
+                recorder=recorder,
+                audio_backend=manual_backend,
+                resampling_factor=resampling_factor)
+        buffer_period_s: float = samples_per_buffer / sampling_frequency
+        parameter_change_interval: int = max(
+            1, round(PARAMETER_CHANGE_INTERVAL_S / buffer_period_s))
+
+        random_generator: numpy.random.Generator = numpy.random.default_rng(0)
+        in_data: bytes = (random_generator.standard_normal(
+            (samples_per_buffer, number_of_channels))
+            * 0.1).astype(numpy.float32).tobytes()
+
+        processing_times_s: numpy.ndarray = numpy.zeros(number_of_buffers)
+        try:
+            for _ in range(WARM_UP_BUFFERS):
+                manual_backend.call(in_data=in_data)
+
+            next_buffer_time: float = time.perf_counter()
+            for i in range(number_of_buffers):
+                if execution_mode is ExecutionMode.WORKER_PROCESS:
+                    next_buffer_time = next_buffer_time + buffer_period_s
+                    time.sleep(max(0.0, next_buffer_time - time.perf_counter()))
+                if ((smoothing_ramp_samples > 0) and
+                    (i % parameter_change_interval == 0)):
+                    is_other: bool = \
+                        (i // parameter_change_interval) % 2 == 0
+                    stream.change_parameters(changes={
+                        "volume": OTHER_VOLUME if is_other else VOLUME,
+                        "sine_wave_frequency":
+                            OTHER_SINE_WAVE_FREQUENCY if is_other
+                            else SINE_WAVE_FREQUENCY})
+                start_time: float = time.perf_counter()
+                manual_backend.call(in_data=in_data)
+                processing_times_s[i] = time.perf_counter() - start_time
+            statistics: dict[str, Any] = stream.stats()
+            added_latency_ms: float = stream.added_latency_ms
+        finally:
+            stream.close()
+            noise_generator.close()
+            if recorder is not None:
+                recorder.close()
+
+        buffer_period_ms: float = buffer_period_s * 1000
+        late_blocks: int = 0
+        if execution_mode is ExecutionMode.WORKER_PROCESS:
+            late_blocks = (statistics["worker_late_blocks"] +
+                           statistics["worker_dropped_blocks"])
+        recorder_dropped_blocks: int = \
+            statistics.get("recorder_dropped_blocks", 0)
+        response: dict[str, float | None] = {
+            "passband_ripple_db": None,
+            "alias_rejection_db": None
+        }
+        if resampling_factor > 1:
+            response = CallbackBenchmark.measure_resampling_response(
+                sampling_frequency=sampling_frequency,
+                samples_per_buffer=samples_per_buffer,
+                resampling_factor=resampling_factor)
+        processing_times_ms: numpy.ndarray = processing_times_s * 1000
+        mean_ms: float = float(numpy.mean(processing_times_ms))
+        p99_ms: float = float(numpy.percentile(processing_times_ms, 99))
+        max_ms: float = float(numpy.max(processing_times_ms))
+
+        return {
+            "sampling_frequency": sampling_frequency,
+            "samples_per_buffer": samples_per_buffer,
+            "add_noise": add_noise,
+            "processing_mode": processing_mode.name.lower(),
+            "execution_mode": execution_mode.name.lower(),
+            "number_of_channels": number_of_channels,
+            "smoothing_ramp_ms": smoothing_ramp_ms,
+            "ramp_shape": ramp_shape.name.lower(),
+            "resampling_factor": resampling_factor,
+            "recording": recorder is not None,
+            "number_of_buffers": number_of_buffers,
+            "buffer_period_ms": buffer_period_ms,
+            "mean_ms": mean_ms,
+            "p99_ms": p99_ms,
+            "max_ms": max_ms,
+            "mean_load": mean_ms / buffer_period_ms,
+            "p99_load": p99_ms / buffer_period_ms,
+            "max_load": max_ms / buffer_period_ms,
+            "added_latency_ms": added_latency_ms,
+            "late_blocks": late_blocks,
+            "recorder_dropped_blocks": recorder_dropped_blocks,
+            **response
+        }
+
+    @staticmethod
+    def measure_resampling_response(sampling_frequency: int,
+                                    samples_per_buffer: int,
+                                    resampling_factor: int) \
+            -> dict[str, float]:
+        """Measure what resampling does to tones compared to full rate.
+
+        Tones go down to internal sampling frequency and back up
+        without processing, one tone per channel, so all tones
+        are resampled at once. Full rate path returns tones unchanged.
+        Passband tones are up to 0.4 of internal sampling frequency,
+        which covers voice at 16000 Hz. Tones from internal Nyquist
+        frequency up to Nyquist frequency can not be represented
+        at internal sampling frequency, whatever comes out of them
+        is aliasing or imaging.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            samples_per_buffer (int): number of samples in a buffer.
+            resampling_factor (int): sampling frequency divided by
+            internal sampling frequency.
+
+        Returns:
+            dict[str, float]: max deviation of passband tone level, dB.
+            Level of the loudest output of a stopband tone
+            below its input level, dB.
+        """
+        DURATION_S: float = 0.5
+        NUMBER_OF_TONES: int = 32
+
+        internal_sampling_frequency: float = \
+            sampling_frequency / resampling_factor
+        passband_frequencies: numpy.ndarray = numpy.linspace(
+            100.0, 0.4 * internal_sampling_frequency, NUMBER_OF_TONES)
+        stopband_frequencies: numpy.ndarray = numpy.linspace(
+            0.5 * internal_sampling_frequency,
+            0.5 * sampling_frequency,
+            NUMBER_OF_TONES,
+            endpoint=False)
+        frequencies: numpy.ndarray = numpy.concatenate(
+            (passband_frequencies, stopband_frequencies))
+
+        resampler: PolyphaseResampler = PolyphaseResampler(
+            factor=resampling_factor,
+            samples_per_buffer=samples_per_buffer,
+            number_of_channels=frequencies.size)
+        number_of_buffers: int = round(DURATION_S * sampling_frequency
+                                       / samples_per_buffer)
+        t: numpy.ndarray = numpy.arange(
+            number_of_buffers * samples_per_buffer) / sampling_frequency
+        tones: numpy.ndarray = numpy.sin(
+            2 * numpy.pi * t[:, numpy.newaxis] * frequencies).astype(
+                numpy.float32)
+        output: numpy.ndarray = numpy.zeros_like(tones)
+        for i in range(number_of_buffers):
+            start: int = i * samples_per_buffer
+            end: int = start + samples_per_buffer
+            output[start:end] = resampler.process(
+                in_data=tones[start:end].tobytes(),
+                process=lambda in_data: in_data)
+
+        # Skip filter transients.
+        settled: int = resampler.added_latency_samples + samples_per_buffer
+        levels_db: numpy.ndarray = 20 * numpy.log10(
+            numpy.sqrt(numpy.mean(numpy.square(
+                output[settled:].astype(numpy.float64)), axis=0))
+            / numpy.sqrt(0.5))
+        return {
+            "passband_ripple_db":
+                float(numpy.max(numpy.abs(
+                    levels_db[:passband_frequencies.size]))),
+            "alias_rejection_db":
+                float(-numpy.max(levels_db[passband_frequencies.size:]))
+        }
+
+    @staticmethod
+    def get_machine_information() -> dict[str, Any]:
+        """Return information to tell results of different machines apart.
+
+        Returns:
+            dict[str, Any]: machine and library information.
+        """
+        return {
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "system": platform.system(),
+            "node": platform.node(),
+            "python": platform.python_version(),
+            "numpy": numpy.__version__
+        }
+
+    @staticmethod
+    def compare(results: list[dict[str, Any]],
+                baseline_results: list[dict[str, Any]],
+                tolerance: float) -> list[str]:
+        """Find configurations whose p99 time grew compared to a baseline.
+
+        Args:
+            results (list[dict[str, Any]]): current results.
+            baseline_results (list[dict[str, Any]]): baseline results.
+            tolerance (float): allowed relative growth, 0.2 - 20 %.
+
+        Returns:
+            list[str]: descriptions of regressions.
+        """
+        KEY_FIELDS: tuple[str, ...] = ("sampling_frequency",
+                                       "samples_per_buffer",
+                                       "add_noise",
+                                       "processing_mode",
+                                       "execution_mode",
+                                       "number_of_channels",
+                                       "smoothing_ramp_ms",
+                                       "ramp_shape",
+                                       "resampling_factor",
+                                       "recording")
+        # Results of older versions have no such fields.
+        DEFAULT_FIELDS: dict[str, Any] = {
+            "execution_mode": ExecutionMode.IN_CALLBACK.name.lower(),
+            "number_of_channels": 1,
+            "smoothing_ramp_ms": 0.0,
+            "ramp_shape": RampShape.LINEAR.name.lower(),
+            "resampling_factor": 1,
+            "recording": False
+        }
+
+        baseline_p99_ms: dict[tuple, float] = {
+            tuple(result.get(field, DEFAULT_FIELDS.get(field))
+                  for field in KEY_FIELDS): result["p99_ms"]
+            for result in baseline_results
+            if "p99_ms" in result}
+
+        regressions: list[str] = []
+        for result in results:
+            key: tuple = tuple(result.get(field, DEFAULT_FIELDS.get(field))
+                               for field in KEY_FIELDS)
+            if key not in baseline_p99_ms:
+                continue
+            if result["p99_ms"] > baseline_p99_ms[key] * (1 + tolerance):
+                regressions.append(
+                    f"{dict(zip(KEY_FIELDS, key))}: p99 "
+                    f"{baseline_p99_ms[key]:.3f} ms -> "
+                    f"{result['p99_ms']:.3f} ms")
+        return regressions
+
+
+def main():
+    """Run callback benchmark and print JSON lines.
+
+    First line describes the machine, every next line describes
+    one configuration. Exit code is 1 if a regression against
+    a baseline is found.
+    """
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Measure stream callback processing time "
+                    "without an audio device.")
+    argument_parser.add_argument(
+        "--sampling-frequencies",
+        type=int,
+        nargs="+",
+        default=[16000, 44100, 48000])
+    argument_parser.add_argument(
+        "--buffer-sizes",
+        type=int,
+        nargs="+",
+        default=[64, 128, 256, 512, 1024, 2048, 4096])
+    argument_parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=[mode.name.lower() for mode in ProcessingMode],
+        default=[ProcessingMode.BLOCK.name.lower()])
+    argument_parser.add_argument(
+        "--execution-modes",
+        nargs="+",
+        choices=[mode.name.lower() for mode in ExecutionMode],
+        default=[ExecutionMode.IN_CALLBACK.name.lower()],
+        help="worker_process sends buffers in real time, "
+             "so it takes a buffer period per buffer")
+    argument_parser.add_argument(
+        "--channels",
+        type=int,
+        nargs="+",
+        default=[1])
+    argument_parser.add_argument(
+        "--smoothing-ramps-ms",
+        type=float,
+        nargs="+",
+        default=[0.0],
+        help="volume and frequency ramp durations, change them once "
+             "per second of audio if not 0 (default: %(default)s)")
+    argument_parser.add_argument(
+        "--ramp-shape",
+        choices=[ramp_shape.name.lower() for ramp_shape in RampShape],
+        default=RampShape.LINEAR.name.lower())
+    argument_parser.add_argument(
+        "--resampling-factors",
+        type=int,
+        nargs="+",
+        default=[1],
+        help="process at sampling frequency divided by a factor, "
+             "factors that do not divide it are skipped "
+             "(default: %(default)s)")
+    argument_parser.add_argument(
+        "--record",
+        metavar="DIRECTORY",
+        help="record input and output of every configuration "
+             "to raw files in a directory")
+    argument_parser.add_argument(
+        "--buffers",
+        type=int,
+        default=1000,
+        help="number of measured buffers per configuration "
+             "(default: %(default)s)")
+    argument_parser.add_argument(
+        "--output",
+        help="also write JSON lines to a file")
+    argument_parser.add_argument(
+        "--baseline",
+        help="JSON lines file of a previous run to compare p99 times with")
+    argument_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative p99 growth over baseline "
+             "(default: %(default)s)")
+    arguments: argparse.Namespace = argument_parser.parse_args()
+
+    results: list[dict[str, Any]] = []
+    lines: list[str] = [json.dumps(CallbackBenchmark.get_machine_information())]
+    print(lines[0], flush=True)
+
+    for (execution_mode_name,
+         mode_name,
+         sampling_frequency,
+         samples_per_buffer,
+         number_of_channels,
+         smoothing_ramp_ms,
+         resampling_factor,
+         add_noise) in itertools.product(arguments.execution_modes,
+                                         arguments.modes,
+                                         arguments.sampling_frequencies,
+                                         arguments.buffer_sizes,
+                                         arguments.channels,
+                                         arguments.smoothing_ramps_ms,
+                                         arguments.resampling_factors,
+                                         (False, True)):
+        # Resampler takes buffers of whole internal blocks only.
+        if ((sampling_frequency % resampling_factor != 0) or
+            (samples_per_buffer % resampling_factor != 0)):
+            continue
+        result: dict[str, Any] = CallbackBenchmark.measure(
+            sampling_frequency=sampling_frequency,
+            samples_per_buffer=samples_per_buffer,
+            add_noise=add_noise,
+            processing_mode=ProcessingMode[mode_name.upper()],
+            number_of_buffers=arguments.buffers,
+            execution_mode=ExecutionMode[execution_mode_name.upper()],
+            number_of_channels=number_of_channels,
+            smoothing_ramp_ms=smoothing_ramp_ms,
+            ramp_shape=RampShape[arguments.ramp_shape.upper()],
+            resampling_factor=resampling_factor,
+            record_directory=arguments.record)
+        results.append(result)
+        lines.append(json.dumps(result))
+        print(lines[-1], flush=True)
+
+    if arguments.output is not None:
+        with open(arguments.output, "w") as output_file:
+            output_file.write("\n".join(lines) + "\n")
+
+    if arguments.baseline is not None:
+        with open(arguments.baseline, "r") as baseline_file:
+            baseline_results: list[dict[str, Any]] = \
+                [json.loads(line) for line in baseline_file if line.strip()]
+        regressions: list[str] = CallbackBenchmark.compare(
+            results=results,
+            baseline_results=baseline_results,
+            tolerance=arguments.tolerance)
+        for regression in regressions:
+            print(f"ERROR! Regression: {regression}", file=sys.stderr)
+        if len(regressions) > 0:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+from enum import Enum
+
+class CarrierWaveform(Enum):
+    SINE = 0
+    TRIANGLE = 1
+    SQUARE = 2
+    SAW = 3
\ No newline at end of file
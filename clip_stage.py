@@ -0,0 +1,46 @@
+import numpy
+
+from effect_stage import EffectStage
+from stream_parameters import StreamParameters
+
+
+class ClipStage(EffectStage):
+    def __init__(self, level: int | float = 1.0) -> None:
+        """Initialize hard clipping.
+
+        Args:
+            level (int | float): largest absolute value of a sample.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        super().__init__()
+
+        # Check argument.
+        if((not isinstance(level, (int, float))) or
+           (level <= 0)):
+            raise ValueError("ERROR! Invalid argument!")
+
+        self._level: float = level
+
+    def process(self,
+                block: numpy.ndarray,
+                parameters: StreamParameters) -> None:
+        """Clip a block in place.
+
+        Args:
+            block (numpy.ndarray): float64 block of shape
+            (frames, channels).
+            parameters (StreamParameters): parameters for this block.
+        """
+        numpy.minimum(block, self._level, out=block)
+        numpy.maximum(block, -self._level, out=block)
+
+    @property
+    def level(self) -> float:
+        """Return largest absolute value of a sample.
+
+        Returns:
+            float: largest absolute value of a sample.
+        """
+        return self._level
@@ -0,0 +1,56 @@
+import threading
+
+from parameters import Parameters
+from stream import Stream
+
+
+class ConfigWatcher:
+    def __init__(self,
+                 parameters: Parameters,
+                 stream: Stream,
+                 interval_s: int | float) -> None:
+        """Start applying changes of a configuration file periodically.
+
+        Changes that are made by someone else are checked by parameters
+        and applied to a running stream at the same buffer,
+        stream and its device are not restarted.
+
+        Args:
+            parameters (Parameters): parameters that reload config file.
+            stream (Stream): stream to apply changes to.
+            interval_s (int | float): interval between checks, s.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(parameters, Parameters)) or
+           (not isinstance(stream, Stream)) or
+           (not isinstance(interval_s, (int, float))) or
+           (interval_s <= 0)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._parameters: Parameters = parameters
+        self._stream: Stream = stream
+        self._interval_s: float = interval_s
+
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run,
+            name="ConfigWatcher",
+            daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Check config file until watcher is closed."""
+        while self._stop_event.wait(timeout=self._interval_s) is False:
+            # Stream is changed while parameters are locked,
+            # so requests of the control server can not interleave.
+            self._parameters.reload(apply=self._stream.change_parameters)
+
+    def close(self) -> None:
+        """Stop checking config file."""
+        self._stop_event.set()
+        self._thread.join()
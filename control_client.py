@@ -0,0 +1,54 @@
+import json
+import socket
+from typing import Any, TextIO
+
+
+class ControlClient:
+    def __init__(self, host: str, port: int) -> None:
+        """Connect to a control server.
+
+        Client is blocking, one request waits for its response.
+
+        Args:
+            host (str): host of a control server.
+            port (int): port of a control server.
+
+        Raises:
+            ValueError: invalid arguments.
+            OSError: could not connect.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(host, str)) or
+           (not isinstance(port, int)) or
+           (port <= 0) or
+           (port > 65535)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._socket: socket.socket = socket.create_connection((host, port))
+        self._file: TextIO = self._socket.makefile("r", encoding="utf-8")
+
+    def request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Send a request and wait for its response.
+
+        Args:
+            request (dict[str, Any]): request, for example
+            {"command": "set", "parameters": {"volume": 2}}.
+
+        Raises:
+            ConnectionError: server closed connection.
+
+        Returns:
+            dict[str, Any]: response.
+        """
+        self._socket.sendall(json.dumps(request).encode() + b"\n")
+        line: str = self._file.readline()
+        if len(line) == 0:
+            raise ConnectionError("ERROR! Control server closed connection!")
+        return json.loads(line)
+
+    def close(self) -> None:
+        """Disconnect from a control server."""
+        self._file.close()
+        self._socket.close()
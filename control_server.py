@@ -0,0 +1,275 @@
+import asyncio
+import json
+import threading
+from typing import Any
+
+from parameters import Parameters
+from stream import Stream
+
+
+class ControlServer:
+    def __init__(self,
+                 parameters: Parameters,
+                 stream: Stream,
+                 host: str,
+                 port: int) -> None:
+        """Start a control server on a local TCP socket.
+
+        Server runs an asyncio event loop in a background thread,
+        so clients do not block the main thread and each other.
+        Every request and response is one line of JSON.
+        Requests:
+        {"command": "set", "parameters": {"volume": 2, "add_noise": false}}
+        changes several parameters at the same buffer boundary,
+        if any of them is invalid, none of them is changed.
+        {"command": "get"} returns current parameters.
+        {"command": "stats"} returns stream statistics once.
+        {"command": "subscribe", "interval_s": 1} sends statistics
+        periodically until "unsubscribe" command or disconnection.
+        Requests are executed one at a time by the event loop,
+        so concurrent clients can not interleave their changes.
+        "id" of a request is returned in its response.
+
+        Args:
+            parameters (Parameters): parameters to check and save changes.
+            stream (Stream): stream to apply changes to.
+            host (str): host to listen on.
+            port (int): port to listen on. 0 - any free port.
+
+        Raises:
+            ValueError: invalid arguments.
+            OSError: server could not listen on the port.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(parameters, Parameters)) or
+           (not isinstance(stream, Stream)) or
+           (not isinstance(host, str)) or
+           (not isinstance(port, int)) or
+           (port < 0) or
+           (port > 65535)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._MIN_STATISTICS_INTERVAL_S: float = 0.1
+        self._DEFAULT_STATISTICS_INTERVAL_S: float = 1.0
+
+        self._parameters: Parameters = parameters
+        self._stream: Stream = stream
+        self._host: str = host
+        self._port: int = port
+
+        # Created by the event loop thread.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._start_error: OSError | None = None
+
+        self._ready_event: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run,
+            name="ControlServer",
+            daemon=True)
+        self._thread.start()
+        self._ready_event.wait()
+
+        if self._start_error is not None:
+            self._thread.join()
+            raise self._start_error
+
+    def _run(self) -> None:
+        """Run event loop until server is closed."""
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        """Accept clients until server is closed."""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        try:
+            server: asyncio.Server = await asyncio.start_server(
+                self._handle_client,
+                host=self._host,
+                port=self._port)
+        except OSError as e:
+            # Error is raised to the creator of the server.
+            self._start_error = e
+            self._ready_event.set()
+            return
+
+        self._port = server.sockets[0].getsockname()[1]
+        print(f"Control server is listening on {self._host}:{self._port}.")
+        self._ready_event.set()
+
+        await self._stop_event.wait()
+        server.close()
+        # Server waits for connections to be closed.
+        for writer in list(self._writers):
+            writer.close()
+        await server.wait_closed()
+
+    async def _handle_client(self,
+                             reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        """Execute requests of one client until it disconnects.
+
+        Args:
+            reader (asyncio.StreamReader): client requests.
+            writer (asyncio.StreamWriter): responses to client.
+        """
+        self._writers.add(writer)
+        subscription: asyncio.Task | None = None
+        try:
+            while True:
+                line: bytes = await reader.readline()
+                if len(line) == 0:
+                    break
+
+                request: Any = None
+                response: dict[str, Any]
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    response = {"ok": False, "error": f"Invalid JSON! {e}"}
+                else:
+                    command: Any = None
+                    if isinstance(request, dict):
+                        command = request.get("command")
+                    match command:
+                        case "subscribe":
+                            interval_s: Any = request.get(
+                                "interval_s",
+                                self._DEFAULT_STATISTICS_INTERVAL_S)
+                            if((not isinstance(interval_s, (int, float))) or
+                               (isinstance(interval_s, bool)) or
+                               (interval_s < self._MIN_STATISTICS_INTERVAL_S)):
+                                response = {
+                                    "ok": False,
+                                    "error": "\"interval_s\" must be at least "
+                                             f"{self._MIN_STATISTICS_INTERVAL_S}!"}
+                            else:
+                                if subscription is not None:
+                                    subscription.cancel()
+                                subscription = asyncio.create_task(
+                                    self._send_statistics(
+                                        writer=writer,
+                                        interval_s=interval_s))
+                                response = {"ok": True}
+                        case "unsubscribe":
+                            if subscription is not None:
+                                subscription.cancel()
+                                subscription = None
+                            response = {"ok": True}
+                        case _:
+                            response = self._execute(request=request)
+                    if isinstance(request, dict) and ("id" in request):
+                        response["id"] = request["id"]
+
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, ValueError) as e:
+            # ValueError - request line is too long.
+            print(type(e))
+            print(e)
+            print("ERROR! Control client is disconnected!")
+        finally:
+            if subscription is not None:
+                subscription.cancel()
+            self._writers.discard(writer)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def _execute(self, request: Any) -> dict[str, Any]:
+        """Execute a request that does not need a connection.
+
+        Args:
+            request (Any): decoded request.
+
+        Returns:
+            dict[str, Any]: response.
+        """
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Request must be a JSON object!"}
+
+        match request.get("command"):
+            case "set":
+                changes: Any = request.get("parameters")
+                if self._parameters.check_changes(changes=changes) is False:
+                    return {"ok": False, "error": "Invalid parameters! "
+                                                  "Nothing is changed!"}
+                # Stream checks changes before they are set and saved,
+                # so config file never differs from the stream.
+                # Parameters are locked meanwhile, so a reload
+                # of config file can not interleave with them.
+                try:
+                    self._parameters.change(
+                        changes=changes,
+                        apply=self._stream.change_parameters)
+                except ValueError as e:
+                    print(type(e))
+                    print(e)
+                    return {"ok": False, "error": "Stream rejected "
+                                                  "parameters! "
+                                                  "Nothing is changed!"}
+                return {"ok": True, "parameters": self._get_parameters()}
+            case "get":
+                return {"ok": True, "parameters": self._get_parameters()}
+            case "stats":
+                return {"ok": True, "stats": self._stream.stats()}
+            case _:
+                return {"ok": False,
+                        "error": "\"command\" must be one of "
+                                 "[\"set\", \"get\", \"stats\", "
+                                 "\"subscribe\", \"unsubscribe\"]!"}
+
+    def _get_parameters(self) -> dict[str, Any]:
+        """Return parameters that can be changed.
+
+        Returns:
+            dict[str, Any]: current values by parameter names.
+        """
+        return {
+            "sine_wave_frequency": self._parameters.sine_wave_frequency,
+            "add_noise": self._parameters.add_noise,
+            "volume": self._parameters.volume,
+            "carrier_waveform":
+                self._parameters.carrier_waveform.name.lower()
+        }
+
+    async def _send_statistics(self,
+                               writer: asyncio.StreamWriter,
+                               interval_s: int | float) -> None:
+        """Send statistics to a subscribed client periodically.
+
+        Args:
+            writer (asyncio.StreamWriter): responses to client.
+            interval_s (int | float): interval between statistics, s.
+        """
+        try:
+            while True:
+                writer.write(
+                    json.dumps({"stats": self._stream.stats()}).encode()
+                    + b"\n")
+                await writer.drain()
+                await asyncio.sleep(interval_s)
+        except ConnectionError:
+            pass
+
+    def close(self) -> None:
+        """Disconnect clients and stop server."""
+        if ((self._loop is not None) and
+            (self._stop_event is not None) and
+            (self._start_error is None)):
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+        self._thread.join()
+
+    @property
+    def port(self) -> int:
+        """Return port the server listens on.
+
+        Returns:
+            int: port.
+        """
+        return self._port
@@ -0,0 +1,738 @@
+import multiprocessing
+import multiprocessing.queues
+import multiprocessing.shared_memory
+import queue
+import time
+import traceback
+from typing import Any
+
+import numpy
+
+from audio_processor import AudioProcessor
+from carrier_waveform import CarrierWaveform
+from noise_color import NoiseColor
+from noise_generator import NoiseGenerator
+from polyphase_resampler import PolyphaseResampler
+from ramp_shape import RampShape
+from ring_buffer import RingBuffer
+from sine_wave_generator import SineWaveGenerator
+
+
+class DspWorker:
+    def __init__(self,
+                 sampling_frequency: int,
+                 samples_per_buffer: int,
+                 sine_wave_frequency: int | float,
+                 noise_color: NoiseColor,
+                 add_noise: bool,
+                 volume: int | float,
+                 plot_ring_buffer: RingBuffer | None,
+                 number_of_channels: int = 1,
+                 carrier_phase_offsets: list[int | float] | None = None,
+                 carrier_waveform: CarrierWaveform = CarrierWaveform.SINE,
+                 smoothing_ramp_samples: int = 0,
+                 ramp_shape: RampShape = RampShape.LINEAR,
+                 effect_chain: list[dict[str, Any]] | None = None,
+                 resampling_factor: int = 1) -> None:
+        """Start input voice processing in a separate process.
+
+        Amplification, modulation, noise and clipping run in a worker
+        process with its own interpreter and GIL, so plotting and menu
+        cannot delay them. Audio callback only copies blocks to and from
+        shared memory rings and never waits for the worker.
+        Output of a block is returned by the next call,
+        which adds one buffer of latency, resampling adds more.
+
+        Blocks are numbered by two sequence counters in shared memory.
+        Audio callback writes the input counter only,
+        worker writes the output counter only.
+        If processing raises an exception, the worker reports it,
+        sets a failed flag in shared memory and exits. Audio callback
+        then gets silence, and stats() show that the worker failed.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            samples_per_buffer (int): number of frames in a buffer.
+            sine_wave_frequency (int | float): sine wave frequency, Hz.
+            noise_color (NoiseColor): noise color.
+            add_noise (bool): "add noise" parameter.
+            volume (int | float): volume.
+            plot_ring_buffer (RingBuffer | None): ring buffer with 3 rows
+            to send points to plot. None - do not send points to plot.
+            number_of_channels (int): number of interleaved channels.
+            carrier_phase_offsets (list[int | float] | None): sine wave
+            phase offset of every channel, degrees.
+            None - all channels get the same sine wave.
+            carrier_waveform (CarrierWaveform): carrier waveform.
+            smoothing_ramp_samples (int): duration of volume and frequency
+            ramps, samples. 0 - do not smooth.
+            ramp_shape (RampShape): shape of volume and frequency ramps.
+            effect_chain (list[dict[str, Any]] | None): description
+            of effect chain stages. None - amplify, modulate, add noise,
+            clip.
+            resampling_factor (int): sampling frequency divided by
+            internal sampling frequency of processing. 1 - do not resample.
+            Number of frames in a buffer must be a multiple of it.
+            Sine wave frequency, ramps and plot rows are
+            at internal sampling frequency.
+
+        Raises:
+            ValueError: invalid arguments.
+            RuntimeError: worker process did not start.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(sampling_frequency, int)) or
+           (sampling_frequency <= 0) or
+           (not isinstance(samples_per_buffer, int)) or
+           (samples_per_buffer <= 0) or
+           (not isinstance(sine_wave_frequency, (int, float))) or
+           (sine_wave_frequency <= 0) or
+           (not isinstance(noise_color, NoiseColor)) or
+           (not isinstance(add_noise, bool)) or
+           (not isinstance(volume, (int, float))) or
+           (volume <= 0) or
+           ((plot_ring_buffer is not None) and
+            (not isinstance(plot_ring_buffer, RingBuffer))) or
+           (not isinstance(number_of_channels, int)) or
+           (number_of_channels <= 0) or
+           (not isinstance(carrier_waveform, CarrierWaveform)) or
+           (not isinstance(smoothing_ramp_samples, int)) or
+           (smoothing_ramp_samples < 0) or
+           (not isinstance(ramp_shape, RampShape)) or
+           (not isinstance(resampling_factor, int)) or
+           (resampling_factor <= 0) or
+           (sampling_frequency % resampling_factor != 0) or
+           (samples_per_buffer % resampling_factor != 0) or
+           (sine_wave_frequency >=
+            sampling_frequency // resampling_factor / 2)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        # Blocks that are being written, processed and read
+        # never share a slot.
+        self._NUMBER_OF_SLOTS: int = 4
+        self._START_TIMEOUT_S: float = 30.0
+        self._START_POLL_INTERVAL_S: float = 0.1
+
+        self._samples_per_buffer: int = samples_per_buffer
+        shape: tuple[int, int] = (samples_per_buffer, number_of_channels)
+        # Resampler of the worker adds the same latency as this one.
+        added_latency_samples: int = samples_per_buffer
+        if resampling_factor > 1:
+            added_latency_samples = added_latency_samples + \
+                PolyphaseResampler(
+                    factor=resampling_factor,
+                    samples_per_buffer=samples_per_buffer,
+                    number_of_channels=number_of_channels
+                ).added_latency_samples
+        self._added_latency_ms: float = \
+            added_latency_samples / sampling_frequency * 1000
+        self._plot_ring_buffer: RingBuffer | None = plot_ring_buffer
+        # Plot rows of the last processed block at internal rate.
+        plot_samples: int = -(-samples_per_buffer // resampling_factor)
+
+        bytes_per_sample: int = numpy.dtype(numpy.float32).itemsize
+        self._input_memory: multiprocessing.shared_memory.SharedMemory = \
+            multiprocessing.shared_memory.SharedMemory(
+                create=True,
+                size=self._NUMBER_OF_SLOTS * samples_per_buffer
+                     * number_of_channels * bytes_per_sample)
+        self._output_memory: multiprocessing.shared_memory.SharedMemory = \
+            multiprocessing.shared_memory.SharedMemory(
+                create=True,
+                size=self._NUMBER_OF_SLOTS * samples_per_buffer
+                     * number_of_channels * bytes_per_sample)
+        # Input voice, sine wave and modulated voice of the first channel.
+        self._plot_memory: multiprocessing.shared_memory.SharedMemory = \
+            multiprocessing.shared_memory.SharedMemory(
+                create=True,
+                size=self._NUMBER_OF_SLOTS * 3 * plot_samples
+                     * bytes_per_sample)
+        # Number of written input blocks, number of processed blocks,
+        # failed flag of the worker.
+        self._sequence_memory: multiprocessing.shared_memory.SharedMemory = \
+            multiprocessing.shared_memory.SharedMemory(
+                create=True,
+                size=3 * numpy.dtype(numpy.int64).itemsize)
+
+        self._input_blocks: numpy.ndarray = numpy.ndarray(
+            (self._NUMBER_OF_SLOTS, *shape),
+            dtype=numpy.float32,
+            buffer=self._input_memory.buf)
+        self._output_blocks: numpy.ndarray = numpy.ndarray(
+            (self._NUMBER_OF_SLOTS, *shape),
+            dtype=numpy.float32,
+            buffer=self._output_memory.buf)
+        self._plot_blocks: numpy.ndarray = numpy.ndarray(
+            (self._NUMBER_OF_SLOTS, 3, plot_samples),
+            dtype=numpy.float32,
+            buffer=self._plot_memory.buf)
+        self._sequences: numpy.ndarray = numpy.ndarray(
+            (3,),
+            dtype=numpy.int64,
+            buffer=self._sequence_memory.buf)
+        self._sequences[:] = 0
+
+        # Views are created once, so the audio callback does not create them.
+        self._input_bytes: list[memoryview] = \
+            [memoryview(self._input_blocks[slot]).cast("B")
+             for slot in range(self._NUMBER_OF_SLOTS)]
+        self._output_slots: list[numpy.ndarray] = \
+            [self._output_blocks[slot]
+             for slot in range(self._NUMBER_OF_SLOTS)]
+        self._plot_rows: list[tuple[numpy.ndarray, ...]] = \
+            [tuple(self._plot_blocks[slot])
+             for slot in range(self._NUMBER_OF_SLOTS)]
+
+        # Xrun concealment.
+        self._last_output_block: numpy.ndarray = \
+            numpy.zeros(shape, dtype=numpy.float32)
+        self._concealed_block: numpy.ndarray = \
+            numpy.zeros(shape, dtype=numpy.float32)
+        self._fade_in: numpy.ndarray = numpy.linspace(
+            0.0,
+            1.0,
+            samples_per_buffer,
+            endpoint=False,
+            dtype=numpy.float32).reshape(samples_per_buffer, 1)
+        self._silence: numpy.ndarray = numpy.zeros(shape, dtype=numpy.float32)
+
+        # Changed by audio callback only.
+        self._block_index: int = 0
+        self._late_blocks: int = 0
+        self._dropped_blocks: int = 0
+
+        self._internal_sampling_frequency: int = \
+            sampling_frequency // resampling_factor
+
+        # Parameters are kept here to be returned without asking the worker.
+        self._add_noise: bool = add_noise
+        self._volume: int | float = volume
+        self._sine_wave_frequency: int | float = sine_wave_frequency
+        self._carrier_waveform: CarrierWaveform = carrier_waveform
+
+        # Worker does not inherit audio and plot threads of this process.
+        context: multiprocessing.context.SpawnContext = \
+            multiprocessing.get_context("spawn")
+        # Simple queue writes changes to its pipe before put() returns,
+        # so the worker gets them before the next block.
+        self._parameter_queue: multiprocessing.queues.SimpleQueue = \
+            context.SimpleQueue()
+        self._error_queue: multiprocessing.Queue = context.Queue()
+        self._error: str | None = None
+        self._failed: bool = False
+        self._closed: bool = False
+        self._block_semaphore: multiprocessing.Semaphore = \
+            context.Semaphore(0)
+        self._stop_event: multiprocessing.Event = context.Event()
+        ready_event: multiprocessing.Event = context.Event()
+        self._process: multiprocessing.Process = context.Process(
+            target=DspWorker._run,
+            kwargs={
+                "input_memory_name": self._input_memory.name,
+                "output_memory_name": self._output_memory.name,
+                "plot_memory_name": self._plot_memory.name,
+                "sequence_memory_name": self._sequence_memory.name,
+                "number_of_slots": self._NUMBER_OF_SLOTS,
+                "sampling_frequency": sampling_frequency,
+                "samples_per_buffer": samples_per_buffer,
+                "number_of_channels": number_of_channels,
+                "carrier_phase_offsets": carrier_phase_offsets,
+                "sine_wave_frequency": sine_wave_frequency,
+                "carrier_waveform": carrier_waveform,
+                "smoothing_ramp_samples": smoothing_ramp_samples,
+                "ramp_shape": ramp_shape,
+                "effect_chain": effect_chain,
+                "resampling_factor": resampling_factor,
+                "noise_color": noise_color,
+                "add_noise": add_noise,
+                "volume": volume,
+                "parameter_queue": self._parameter_queue,
+                "error_queue": self._error_queue,
+                "block_semaphore": self._block_semaphore,
+                "stop_event": self._stop_event,
+                "ready_event": ready_event
+            },
+            name="DspWorker",
+            daemon=True)
+        self._process.start()
+
+        # Worker that failed to start does not keep the caller waiting.
+        start_deadline_s: float = time.perf_counter() + self._START_TIMEOUT_S
+        while ready_event.wait(timeout=self._START_POLL_INTERVAL_S) is False:
+            if ((self._process.is_alive() is False) or
+                (time.perf_counter() > start_deadline_s)):
+                self.close()
+                raise RuntimeError("ERROR! DSP worker process did not start!")
+
+    @staticmethod
+    def _run(input_memory_name: str,
+             output_memory_name: str,
+             plot_memory_name: str,
+             sequence_memory_name: str,
+             number_of_slots: int,
+             sampling_frequency: int,
+             samples_per_buffer: int,
+             number_of_channels: int,
+             carrier_phase_offsets: list[int | float] | None,
+             sine_wave_frequency: int | float,
+             carrier_waveform: CarrierWaveform,
+             smoothing_ramp_samples: int,
+             ramp_shape: RampShape,
+             effect_chain: list[dict[str, Any]] | None,
+             resampling_factor: int,
+             noise_color: NoiseColor,
+             add_noise: bool,
+             volume: int | float,
+             parameter_queue: multiprocessing.queues.SimpleQueue,
+             error_queue: multiprocessing.Queue,
+             block_semaphore: multiprocessing.Semaphore,
+             stop_event: multiprocessing.Event,
+             ready_event: multiprocessing.Event) -> None:
+        """Process blocks until stopped. Runs in the worker process.
+
+        Args:
+            input_memory_name (str): name of input blocks shared memory.
+            output_memory_name (str): name of output blocks shared memory.
+            plot_memory_name (str): name of plot rows shared memory.
+            sequence_memory_name (str): name of sequence counters
+            shared memory.
+            number_of_slots (int): number of blocks in every ring.
+            sampling_frequency (int): sampling frequency, Hz.
+            samples_per_buffer (int): number of frames in a buffer.
+            number_of_channels (int): number of interleaved channels.
+            carrier_phase_offsets (list[int | float] | None): sine wave
+            phase offset of every channel, degrees.
+            sine_wave_frequency (int | float): sine wave frequency, Hz.
+            carrier_waveform (CarrierWaveform): carrier waveform.
+            smoothing_ramp_samples (int): duration of volume and frequency
+            ramps, samples.
+            ramp_shape (RampShape): shape of volume and frequency ramps.
+            effect_chain (list[dict[str, Any]] | None): description
+            of effect chain stages.
+            resampling_factor (int): sampling frequency divided by
+            internal sampling frequency.
+            noise_color (NoiseColor): noise color.
+            add_noise (bool): "add noise" parameter.
+            volume (int | float): volume.
+            parameter_queue (multiprocessing.queues.SimpleQueue):
+            (name, value) pairs of changed parameters, "parameters" name
+            comes with a dict of several changes.
+            error_queue (multiprocessing.Queue): traceback of an exception
+            that stopped the worker.
+            block_semaphore (multiprocessing.Semaphore): released once
+            per written input block.
+            stop_event (multiprocessing.Event): set to stop the worker.
+            ready_event (multiprocessing.Event): set when the worker
+            is ready to process blocks.
+        """
+        POLL_INTERVAL_S: float = 0.1
+
+        memories: list[multiprocessing.shared_memory.SharedMemory] = []
+        for name in (input_memory_name,
+                     output_memory_name,
+                     plot_memory_name,
+                     sequence_memory_name):
+            # Shared memory is unlinked by the parent process.
+            memories.append(
+                multiprocessing.shared_memory.SharedMemory(name=name))
+
+        input_blocks: numpy.ndarray = numpy.ndarray(
+            (number_of_slots, samples_per_buffer, number_of_channels),
+            dtype=numpy.float32,
+            buffer=memories[0].buf)
+        output_blocks: numpy.ndarray = numpy.ndarray(
+            (number_of_slots, samples_per_buffer, number_of_channels),
+            dtype=numpy.float32,
+            buffer=memories[1].buf)
+        plot_samples: int = -(-samples_per_buffer // resampling_factor)
+        plot_blocks: numpy.ndarray = numpy.ndarray(
+            (number_of_slots, 3, plot_samples),
+            dtype=numpy.float32,
+            buffer=memories[2].buf)
+        sequences: numpy.ndarray = numpy.ndarray(
+            (3,),
+            dtype=numpy.int64,
+            buffer=memories[3].buf)
+        input_bytes: list[memoryview] = \
+            [memoryview(input_blocks[slot]).cast("B")
+             for slot in range(number_of_slots)]
+
+        noise_generator: NoiseGenerator | None = None
+        try:
+            noise_generator = NoiseGenerator(noise_color=noise_color)
+            # Audio processor leaves all 3 plot rows of a block here.
+            block_ring_buffer: RingBuffer = RingBuffer(
+                number_of_rows=3,
+                capacity=plot_samples)
+
+            def create_audio_processor() -> tuple[SineWaveGenerator,
+                                                  AudioProcessor]:
+                """Create a sine wave generator and an audio processor."""
+                sine_wave_generator: SineWaveGenerator = SineWaveGenerator(
+                    sampling_frequency=sampling_frequency // resampling_factor,
+                    sine_wave_frequency=sine_wave_frequency,
+                    carrier_waveform=carrier_waveform,
+                    smoothing_ramp_samples=smoothing_ramp_samples,
+                    ramp_shape=ramp_shape)
+                return (sine_wave_generator,
+                        AudioProcessor(
+                            samples_per_buffer=samples_per_buffer,
+                            sine_wave_generator=sine_wave_generator,
+                            noise_generator=noise_generator,
+                            add_noise=add_noise,
+                            volume=volume,
+                            plot_ring_buffer=block_ring_buffer,
+                            number_of_channels=number_of_channels,
+                            carrier_phase_offsets=carrier_phase_offsets,
+                            smoothing_ramp_samples=smoothing_ramp_samples,
+                            ramp_shape=ramp_shape,
+                            effect_chain=effect_chain,
+                            resampling_factor=resampling_factor))
+
+            # The first call of numpy functions is slow. It is made
+            # by another processor, so sine wave phase and filter states
+            # of the first block are the same as in the audio callback.
+            create_audio_processor()[1].process(
+                in_data=bytes(input_bytes[0].nbytes))
+            sine_wave_generator: SineWaveGenerator
+            audio_processor: AudioProcessor
+            sine_wave_generator, audio_processor = create_audio_processor()
+
+            ready_event.set()
+            while stop_event.is_set() is False:
+                if block_semaphore.acquire(timeout=POLL_INTERVAL_S) is False:
+                    continue
+
+                # Apply changed parameters.
+                while parameter_queue.empty() is False:
+                    name, value = parameter_queue.get()
+                    match name:
+                        case "add_noise":
+                            audio_processor.add_noise = value
+                        case "volume":
+                            audio_processor.volume = value
+                        case "sine_wave_frequency":
+                            sine_wave_generator.sine_wave_frequency = value
+                        case "carrier_waveform":
+                            sine_wave_generator.carrier_waveform = value
+                        case "parameters":
+                            audio_processor.change_parameters(changes=value)
+
+                block_index: int = int(sequences[1])
+                slot: int = block_index % number_of_slots
+                numpy.copyto(
+                    output_blocks[slot],
+                    audio_processor.process(in_data=input_bytes[slot]))
+                block_ring_buffer.read_latest(out=plot_blocks[slot])
+
+                # Publish processed block.
+                sequences[1] = block_index + 1
+        except Exception as e:
+            # Parent reads the flag without a lock.
+            sequences[2] = 1
+            print(type(e))
+            print(e)
+            print("ERROR! DSP worker process failed!")
+            error_queue.put(traceback.format_exc())
+        finally:
+            if noise_generator is not None:
+                noise_generator.close()
+            for view in input_bytes:
+                view.release()
+            del input_blocks, output_blocks, plot_blocks, sequences
+            for memory in memories:
+                memory.close()
+
+    def process(self, in_data: bytes) -> numpy.ndarray:
+        """Send a block to the worker and return the previous processed block.
+
+        Args:
+            in_data (bytes): raw bytes of input voice float32 data.
+
+        Returns:
+            numpy.ndarray: float32 array of modulated voice data.
+        """
+        output: numpy.ndarray = self._exchange(in_data=in_data)
+
+        # Remember the last good block for xrun concealment.
+        if output is not self._silence:
+            numpy.copyto(self._last_output_block, output)
+        return output
+
+    def conceal_repeat(self) -> numpy.ndarray:
+        """Return the last good block again instead of processing a buffer.
+
+        Returns:
+            numpy.ndarray: float32 array of the last good modulated voice data.
+        """
+        return self._last_output_block
+
+    def conceal_crossfade(self, in_data: bytes) -> numpy.ndarray:
+        """Process a buffer and crossfade from the last good block into it.
+
+        The result is not remembered as a good block.
+
+        Args:
+            in_data (bytes): raw bytes of input voice float32 data.
+
+        Returns:
+            numpy.ndarray: float32 array of concealed modulated voice data.
+        """
+        output: numpy.ndarray = self._exchange(in_data=in_data)
+
+        # last + (current - last) * fade in.
+        numpy.subtract(output,
+                       self._last_output_block,
+                       out=self._concealed_block)
+        numpy.multiply(self._concealed_block,
+                       self._fade_in,
+                       out=self._concealed_block)
+        numpy.add(self._concealed_block,
+                  self._last_output_block,
+                  out=self._concealed_block)
+        return self._concealed_block
+
+    def _exchange(self, in_data: bytes) -> numpy.ndarray:
+        """Write a block to the input ring and read the previous block.
+
+        Never waits for the worker. If the previous block is not processed
+        yet, it is late and silence is returned instead. If the worker is
+        so far behind that there is no free slot, the block is dropped.
+        After the worker failed, silence is returned.
+
+        Args:
+            in_data (bytes): raw bytes of input voice float32 data.
+
+        Returns:
+            numpy.ndarray: float32 array of modulated voice data.
+        """
+        if int(self._sequences[2]) != 0:
+            return self._silence
+
+        block_index: int = self._block_index
+        if block_index - int(self._sequences[1]) >= self._NUMBER_OF_SLOTS:
+            self._dropped_blocks += 1
+            return self._silence
+
+        self._input_bytes[block_index % self._NUMBER_OF_SLOTS][:] = in_data
+        self._block_index = block_index + 1
+        self._sequences[0] = self._block_index
+        self._block_semaphore.release()
+
+        if block_index == 0:
+            return self._silence
+        if int(self._sequences[1]) < block_index:
+            self._late_blocks += 1
+            return self._silence
+
+        slot: int = (block_index - 1) % self._NUMBER_OF_SLOTS
+        if self._plot_ring_buffer is not None:
+            self._plot_ring_buffer.write(*self._plot_rows[slot])
+        return self._output_slots[slot]
+
+    def change_parameters(self, changes: dict[str, Any]) -> None:
+        """Check and send changes of several parameters to the worker.
+
+        Worker applies all changes before the same block.
+
+        Args:
+            changes (dict[str, Any]): new values of "sine_wave_frequency",
+            "add_noise", "volume" and "carrier_waveform".
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        # Check argument.
+        if AudioProcessor.check_changes(
+            changes=changes,
+            sampling_frequency=self._internal_sampling_frequency) is False:
+            raise ValueError("ERROR! Invalid argument!")
+
+        for name, value in changes.items():
+            match name:
+                case "sine_wave_frequency":
+                    self._sine_wave_frequency = value
+                case "add_noise":
+                    self._add_noise = value
+                case "volume":
+                    self._volume = value
+                case "carrier_waveform":
+                    self._carrier_waveform = value
+        self._parameter_queue.put(("parameters", dict(changes)))
+
+    def stats(self) -> dict[str, Any]:
+        """Return worker statistics.
+
+        Returns:
+            dict[str, Any]: added latency, numbers of late
+            and dropped blocks, whether the worker process is alive
+            and whether it failed, traceback of its failure.
+        """
+        worker_alive: bool = False
+        worker_failed: bool = self._failed
+        if self._closed is False:
+            worker_alive = self._process.is_alive()
+            # Worker that was not stopped must be alive.
+            worker_failed = ((int(self._sequences[2]) != 0) or
+                             (worker_alive is False))
+        if self._error is None:
+            try:
+                self._error = self._error_queue.get_nowait()
+            except queue.Empty:
+                pass
+        return {
+            "worker_added_latency_ms": self._added_latency_ms,
+            "worker_late_blocks": self._late_blocks,
+            "worker_dropped_blocks": self._dropped_blocks,
+            "worker_alive": worker_alive,
+            "worker_failed": worker_failed,
+            "worker_error": self._error
+        }
+
+    def close(self) -> None:
+        """Stop the worker process and free shared memory."""
+        self._failed = (int(self._sequences[2]) != 0) or \
+                       (self._process.is_alive() is False)
+        self._closed = True
+        self._stop_event.set()
+        self._process.join()
+
+        for view in self._input_bytes:
+            view.release()
+        self._input_bytes = []
+        self._output_slots = []
+        self._plot_rows = []
+        del self._input_blocks, self._output_blocks, self._plot_blocks
+        del self._sequences
+        for memory in (self._input_memory,
+                       self._output_memory,
+                       self._plot_memory,
+                       self._sequence_memory):
+            memory.close()
+            memory.unlink()
+
+    @property
+    def added_latency_ms(self) -> float:
+        """Return latency added by processing in the worker process.
+
+        Returns:
+            float: added latency, ms.
+        """
+        return self._added_latency_ms
+
+    @property
+    def add_noise(self) -> bool:
+        """Return current "add noise" parameter.
+
+        Returns:
+            bool: current "add noise" parameter.
+        """
+        return self._add_noise
+
+    @add_noise.setter
+    def add_noise(self, new_add_noise: bool) -> None:
+        """Check and send new "add noise" parameter to the worker.
+
+        Args:
+            new_add_noise (bool): new "add noise" parameter.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        # Check argument.
+        if((not isinstance(new_add_noise, bool))):
+            raise ValueError("ERROR! Invalid argument!")
+
+        self._add_noise = new_add_noise
+        self._parameter_queue.put(("add_noise", new_add_noise))
+
+    @property
+    def volume(self) -> int | float:
+        """Return volume.
+
+        Returns:
+            int | float: volume.
+        """
+        return self._volume
+
+    @volume.setter
+    def volume(self, new_volume: int | float) -> None:
+        """Check and send new volume to the worker.
+
+        Args:
+            new_volume (int | float): new volume.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        # Check argument.
+        if((not isinstance(new_volume, (int, float))) or
+           (new_volume <= 0)):
+            raise ValueError("ERROR! Invalid argument!")
+
+        self._volume = new_volume
+        self._parameter_queue.put(("volume", new_volume))
+
+    @property
+    def sine_wave_frequency(self) -> int | float:
+        """Return sine wave frequency.
+
+        Returns:
+            int | float: sine wave frequency, Hz.
+        """
+        return self._sine_wave_frequency
+
+    @sine_wave_frequency.setter
+    def sine_wave_frequency(self,
+                            new_sine_wave_frequency: int | float) -> None:
+        """Check and send new sine wave frequency to the worker.
+
+        Args:
+            new_sine_wave_frequency (int | float): new sine wave frequency, Hz.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        # Check argument.
+        # Worker would fail on an invalid frequency, so it is checked here
+        # the same way the sine wave generator checks it.
+        if((not isinstance(new_sine_wave_frequency, (int, float))) or
+           (new_sine_wave_frequency <= 0) or
+           (new_sine_wave_frequency >=
+            self._internal_sampling_frequency / 2)):
+            raise ValueError("ERROR! Invalid argument!")
+
+        self._sine_wave_frequency = new_sine_wave_frequency
+        self._parameter_queue.put(("sine_wave_frequency",
+                                   new_sine_wave_frequency))
+
+    @property
+    def carrier_waveform(self) -> CarrierWaveform:
+        """Return carrier waveform.
+
+        Returns:
+            CarrierWaveform: carrier waveform.
+        """
+        return self._carrier_waveform
+
+    @carrier_waveform.setter
+    def carrier_waveform(self,
+                         new_carrier_waveform: CarrierWaveform) -> None:
+        """Check and send new carrier waveform to the worker.
+
+        Worker builds the wavetable itself.
+
+        Args:
+            new_carrier_waveform (CarrierWaveform): new carrier waveform.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        # Check argument.
+        if not isinstance(new_carrier_waveform, CarrierWaveform):
+            raise ValueError("ERROR! Invalid argument!")
+
+        self._carrier_waveform = new_carrier_waveform
+        self._parameter_queue.put(("carrier_waveform", new_carrier_waveform))
@@ -0,0 +1,225 @@
+from typing import Any, Callable
+
+import numpy
+
+from carrier_waveform import CarrierWaveform
+from clip_stage import ClipStage
+from effect_stage import EffectStage
+from effect_stage_type import EffectStageType
+from gate_stage import GateStage
+from noise_generator import NoiseGenerator
+from noise_stage import NoiseStage
+from ramp_shape import RampShape
+from ring_modulator_stage import RingModulatorStage
+from sine_wave_generator import SineWaveGenerator
+from stream_parameters import StreamParameters
+from volume_stage import VolumeStage
+
+
+class EffectChain:
+    # Options of every stage type with their exclusive minimum
+    # and inclusive maximum.
+    STAGE_OPTIONS: dict[EffectStageType, dict[str, tuple[float, float]]] = {
+        EffectStageType.VOLUME: {},
+        # Stage with frequency has its own sine wave generator.
+        EffectStageType.RING_MODULATOR: {"frequency": (0.0, 20000.0)},
+        EffectStageType.NOISE: {},
+        EffectStageType.GATE: {"threshold": (0.0, 1.0)},
+        EffectStageType.CLIP: {"level": (0.0, 1.0)}
+    }
+
+    def __init__(self,
+                 description: list[dict[str, Any]],
+                 sine_wave_generator: SineWaveGenerator,
+                 noise_generator: NoiseGenerator,
+                 volume: int | float,
+                 carrier_phase_offsets: numpy.ndarray | None,
+                 smoothing_ramp_samples: int,
+                 ramp_shape: RampShape) -> None:
+        """Build an effect chain from its description.
+
+        Description is a list of stages in processing order,
+        for example {"type": "gate", "threshold": 0.01}.
+        All stages process one shared block in place, one after another,
+        so adding a stage does not add a copy of a block.
+        Stages are not fused into one loop: every stage is its own pass
+        over the block. Only consecutive clip stages are fused into one.
+
+        Args:
+            description (list[dict[str, Any]]): stages in processing order.
+            sine_wave_generator (SineWaveGenerator): sine wave generator
+            of a ring modulator stage without frequency.
+            noise_generator (NoiseGenerator): noise generator.
+            volume (int | float): initial volume.
+            carrier_phase_offsets (numpy.ndarray | None): float64 phase
+            offset of every channel, in sine wave periods.
+            None - all channels get the same sine wave.
+            smoothing_ramp_samples (int): duration of a volume ramp,
+            samples. 0 - do not smooth.
+            ramp_shape (RampShape): shape of a volume ramp.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(sine_wave_generator, SineWaveGenerator)) or
+           (EffectChain.check_description(
+               description=description,
+               sampling_frequency=sine_wave_generator.sampling_frequency)
+            is False) or
+           (not isinstance(noise_generator, NoiseGenerator))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._stages: list[EffectStage] = []
+        self._carrier_row_stage: RingModulatorStage | None = None
+        for stage_description in description:
+            stage_type: EffectStageType = \
+                EffectStageType[stage_description["type"].upper()]
+            stage: EffectStage
+            match stage_type:
+                case EffectStageType.VOLUME:
+                    stage = VolumeStage(
+                        volume=volume,
+                        smoothing_ramp_samples=smoothing_ramp_samples,
+                        ramp_shape=ramp_shape)
+                case EffectStageType.RING_MODULATOR:
+                    stage_sine_wave_generator: SineWaveGenerator = \
+                        sine_wave_generator
+                    if "frequency" in stage_description:
+                        stage_sine_wave_generator = SineWaveGenerator(
+                            sampling_frequency=\
+                                sine_wave_generator.sampling_frequency,
+                            sine_wave_frequency=\
+                                stage_description["frequency"],
+                            carrier_waveform=CarrierWaveform.SINE)
+                    stage = RingModulatorStage(
+                        sine_wave_generator=stage_sine_wave_generator,
+                        carrier_phase_offsets=carrier_phase_offsets)
+                    if self._carrier_row_stage is None:
+                        self._carrier_row_stage = stage
+                case EffectStageType.NOISE:
+                    stage = NoiseStage(noise_generator=noise_generator)
+                case EffectStageType.GATE:
+                    stage = GateStage(
+                        threshold=stage_description["threshold"])
+                case EffectStageType.CLIP:
+                    level: int | float = stage_description.get("level", 1.0)
+                    # The tighter of consecutive clips is enough.
+                    if ((len(self._stages) > 0) and
+                        (isinstance(self._stages[-1], ClipStage))):
+                        level = min(level, self._stages[-1].level)
+                        self._stages.pop()
+                    stage = ClipStage(level=level)
+            self._stages.append(stage)
+
+        # Bound methods are looked up once, not once per block.
+        self._stage_functions: tuple[
+            Callable[[numpy.ndarray, StreamParameters], None], ...] = \
+            tuple(stage.process for stage in self._stages)
+
+    @staticmethod
+    def get_default_description() -> list[dict[str, Any]]:
+        """Return description of the original processing order.
+
+        Returns:
+            list[dict[str, Any]]: amplify, modulate, add noise, clip.
+        """
+        return [{"type": "volume"},
+                {"type": "ring_modulator"},
+                {"type": "noise"},
+                {"type": "clip"}]
+
+    @staticmethod
+    def check_description(description: Any,
+                          sampling_frequency: int | None = None) -> bool:
+        """Check effect chain description.
+
+        Args:
+            description (Any): effect chain description.
+            sampling_frequency (int | None): sampling frequency
+            of the chain, Hz. Ring modulator frequencies must be
+            below half of it. None - sampling frequency is not known yet.
+
+        Returns:
+            bool: True - description is valid.
+            False - description is invalid.
+        """
+        if not isinstance(description, list):
+            return False
+
+        stage_type_names: list[str] = \
+            [stage_type.name.lower() for stage_type in EffectStageType]
+        shared_generator_stages: int = 0
+        for stage_description in description:
+            if((not isinstance(stage_description, dict)) or
+               (not isinstance(stage_description.get("type"), str)) or
+               (stage_description["type"].lower() not in stage_type_names)):
+                return False
+
+            stage_type: EffectStageType = \
+                EffectStageType[stage_description["type"].upper()]
+            options: dict[str, tuple[float, float]] = \
+                EffectChain.STAGE_OPTIONS[stage_type]
+            for name, value in stage_description.items():
+                if name == "type":
+                    continue
+                if((name not in options) or
+                   (not isinstance(value, (int, float))) or
+                   (isinstance(value, bool)) or
+                   (value <= options[name][0]) or
+                   (value > options[name][1])):
+                    return False
+
+            if stage_type is EffectStageType.GATE:
+                if "threshold" not in stage_description:
+                    return False
+            if ((sampling_frequency is not None) and
+                (stage_description.get("frequency", 0) >=
+                 sampling_frequency / 2)):
+                return False
+            if ((stage_type is EffectStageType.RING_MODULATOR) and
+                ("frequency" not in stage_description)):
+                shared_generator_stages += 1
+
+        # Every block advances a sine wave generator once.
+        return shared_generator_stages <= 1
+
+    def allocate(self,
+                 samples_per_buffer: int,
+                 number_of_channels: int) -> None:
+        """Allocate scratch buffers of all stages for a number of frames.
+
+        Args:
+            samples_per_buffer (int): number of frames in a block.
+            number_of_channels (int): number of channels in a block.
+        """
+        for stage in self._stages:
+            stage.allocate(samples_per_buffer=samples_per_buffer,
+                           number_of_channels=number_of_channels)
+
+    def process(self,
+                block: numpy.ndarray,
+                parameters: StreamParameters) -> None:
+        """Process a block in place by all stages.
+
+        Args:
+            block (numpy.ndarray): float64 block of shape
+            (frames, channels).
+            parameters (StreamParameters): parameters for this block.
+        """
+        for stage_function in self._stage_functions:
+            stage_function(block, parameters)
+
+    @property
+    def carrier_row(self) -> numpy.ndarray | None:
+        """Return sine wave of the first ring modulator to plot.
+
+        Returns:
+            numpy.ndarray | None: float64 view of sine wave points
+            of the first channel. None - chain has no ring modulator.
+        """
+        if self._carrier_row_stage is None:
+            return None
+        return self._carrier_row_stage.carrier_row
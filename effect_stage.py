@@ -0,0 +1,39 @@
+import numpy
+
+from stream_parameters import StreamParameters
+
+
+class EffectStage:
+    """Stage of an effect chain.
+
+    Every stage processes a float64 block of shape (frames, channels)
+    in place, so stages share one buffer and no stage copies a block.
+    Scratch buffers of a stage are allocated before the first block
+    and when buffer size changes, never while processing.
+    """
+
+    def allocate(self,
+                 samples_per_buffer: int,
+                 number_of_channels: int) -> None:
+        """Allocate scratch buffers for a number of frames.
+
+        Args:
+            samples_per_buffer (int): number of frames in a block.
+            number_of_channels (int): number of channels in a block.
+        """
+        pass
+
+    def process(self,
+                block: numpy.ndarray,
+                parameters: StreamParameters) -> None:
+        """Process a block in place.
+
+        Args:
+            block (numpy.ndarray): float64 block of shape
+            (frames, channels).
+            parameters (StreamParameters): parameters for this block.
+
+        Raises:
+            NotImplementedError: stage does not process blocks.
+        """
+        raise NotImplementedError("ERROR! Stage does not process blocks!")
@@ -0,0 +1,8 @@
+from enum import Enum
+
+class EffectStageType(Enum):
+    VOLUME = 0
+    RING_MODULATOR = 1
+    NOISE = 2
+    GATE = 3
+    CLIP = 4
\ No newline at end of file
@@ -0,0 +1,5 @@
+from enum import Enum
+
+class ExecutionMode(Enum):
+    IN_CALLBACK = 0
+    WORKER_PROCESS = 1
\ No newline at end of file
@@ -0,0 +1,245 @@
+import concurrent.futures
+import os
+import time
+from typing import Any
+
+import numpy
+
+from audio_processor import AudioProcessor
+from carrier_waveform import CarrierWaveform
+from effect_chain import EffectChain
+from noise_color import NoiseColor
+from noise_generator import NoiseGenerator
+from sine_wave_generator import SineWaveGenerator
+from wav_reader import WavReader
+from wav_writer import WavWriter
+
+
+class FileRenderer:
+    @staticmethod
+    def render_file(input_file_name: str,
+                    output_file_name: str,
+                    samples_per_buffer: int,
+                    sine_wave_frequency: int | float,
+                    add_noise: bool,
+                    volume: int | float,
+                    noise_color: NoiseColor,
+                    carrier_phase_offsets: list[int | float] | None = None,
+                    carrier_waveform: CarrierWaveform = CarrierWaveform.SINE,
+                    effect_chain: list[dict[str, Any]] | None = None) \
+                        -> float:
+        """Modulate voice from a WAV file and write it to a WAV file.
+
+        Input voice goes through the same processing as in a stream,
+        buffer by buffer, as fast as possible.
+        Both files are accessed through memory maps,
+        so memory usage does not depend on file size.
+        Output file has the same number of channels as input file,
+        all channels are processed in one pass.
+
+        Args:
+            input_file_name (str): input WAV file name.
+            output_file_name (str): output WAV file name.
+            samples_per_buffer (int): number of samples in a buffer.
+            sine_wave_frequency (int | float): sine wave frequency, Hz.
+            add_noise (bool): "add noise" parameter.
+            volume (int | float): volume.
+            noise_color (NoiseColor): noise color.
+            carrier_phase_offsets (list[int | float] | None): sine wave
+            phase offset of every channel, degrees. Offsets are not used
+            if their number differs from the number of channels in a file.
+            None - all channels get the same sine wave.
+            carrier_waveform (CarrierWaveform): carrier waveform.
+            effect_chain (list[dict[str, Any]] | None): description
+            of effect chain stages. None - amplify, modulate, add noise,
+            clip.
+
+        Raises:
+            ValueError: invalid arguments, output file is input file
+            or unsupported WAV file.
+            OSError: file could not be read or written.
+
+        Returns:
+            float: ratio of audio duration to rendering time.
+        """
+        # Writer would truncate input file that reader maps.
+        if ((os.path.realpath(input_file_name) ==
+             os.path.realpath(output_file_name)) or
+            ((os.path.exists(output_file_name)) and
+             (os.path.samefile(input_file_name, output_file_name)))):
+            raise ValueError(f"ERROR! Output file {output_file_name} "
+                             f"is input file {input_file_name}!")
+
+        start_time: float = time.perf_counter()
+
+        wav_reader: WavReader = WavReader(file_name=input_file_name)
+        if ((effect_chain is not None) and
+            (EffectChain.check_description(
+                description=effect_chain,
+                sampling_frequency=wav_reader.sampling_frequency)
+             is False)):
+            wav_reader.close()
+            raise ValueError("ERROR! Invalid effect chain! Ring modulator "
+                             "frequencies must be below "
+                             f"{wav_reader.sampling_frequency / 2} Hz "
+                             f"of {input_file_name}!")
+        wav_writer: WavWriter = WavWriter(
+            file_name=output_file_name,
+            sampling_frequency=wav_reader.sampling_frequency,
+            number_of_channels=wav_reader.number_of_channels,
+            number_of_frames=wav_reader.number_of_frames)
+
+        if ((carrier_phase_offsets is not None) and
+            (len(carrier_phase_offsets) != wav_reader.number_of_channels)):
+            print(f"Carrier phase offsets are not used for {input_file_name}: "
+                  f"it has {wav_reader.number_of_channels} channels.")
+            carrier_phase_offsets = None
+
+        sine_wave_generator: SineWaveGenerator = SineWaveGenerator(
+            sampling_frequency=wav_reader.sampling_frequency,
+            sine_wave_frequency=sine_wave_frequency,
+            carrier_waveform=carrier_waveform)
+        # Rendering is faster than real time, noise must not run out.
+        noise_generator: NoiseGenerator = NoiseGenerator(
+            noise_color=noise_color,
+            real_time=False)
+        audio_processor: AudioProcessor = AudioProcessor(
+            samples_per_buffer=samples_per_buffer,
+            sine_wave_generator=sine_wave_generator,
+            noise_generator=noise_generator,
+            add_noise=add_noise,
+            volume=volume,
+            plot_ring_buffer=None,
+            number_of_channels=wav_reader.number_of_channels,
+            carrier_phase_offsets=carrier_phase_offsets,
+            effect_chain=effect_chain)
+
+        try:
+            for start_frame in range(0,
+                                     wav_reader.number_of_frames,
+                                     samples_per_buffer):
+                input_block: numpy.ndarray = wav_reader.read(
+                    start_frame=start_frame,
+                    number_of_frames=samples_per_buffer)
+
+                output_block: bytes | numpy.ndarray = audio_processor.process(
+                    in_data=input_block.tobytes())
+                wav_writer.write(
+                    start_frame=start_frame,
+                    block=numpy.frombuffer(output_block, dtype=numpy.float32)
+                          .reshape(input_block.shape))
+        finally:
+            noise_generator.close()
+            wav_writer.close()
+            wav_reader.close()
+
+        rendering_time: float = time.perf_counter() - start_time
+        audio_duration: float = (wav_reader.number_of_frames
+                                 / wav_reader.sampling_frequency)
+        real_time_ratio: float = audio_duration / rendering_time
+        print(f"Rendered {input_file_name} to {output_file_name}: "
+              f"{audio_duration:.2f} s in {rendering_time:.2f} s "
+              f"({real_time_ratio:.1f}x real time).")
+        return real_time_ratio
+
+    @staticmethod
+    def render_files(input_file_names: list[str],
+                     output_directory: str,
+                     number_of_processes: int,
+                     samples_per_buffer: int,
+                     sine_wave_frequency: int | float,
+                     add_noise: bool,
+                     volume: int | float,
+                     noise_color: NoiseColor,
+                     carrier_phase_offsets: list[int | float] | None = None,
+                     carrier_waveform: CarrierWaveform = \
+                        CarrierWaveform.SINE,
+                     effect_chain: list[dict[str, Any]] | None = None) \
+                        -> None:
+        """Render several WAV files in parallel processes.
+
+        Output files have the same names as input files
+        and are written to an output directory.
+        An input file in the output directory is not rendered,
+        it would be overwritten.
+
+        Args:
+            input_file_names (list[str]): input WAV file names.
+            output_directory (str): directory for output WAV files.
+            number_of_processes (int): number of worker processes.
+            1 - render in the current process.
+            samples_per_buffer (int): number of samples in a buffer.
+            sine_wave_frequency (int | float): sine wave frequency, Hz.
+            add_noise (bool): "add noise" parameter.
+            volume (int | float): volume.
+            noise_color (NoiseColor): noise color.
+            carrier_phase_offsets (list[int | float] | None): sine wave
+            phase offset of every channel, degrees.
+            None - all channels get the same sine wave.
+            carrier_waveform (CarrierWaveform): carrier waveform.
+            effect_chain (list[dict[str, Any]] | None): description
+            of effect chain stages. None - amplify, modulate, add noise,
+            clip.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        # Check arguments.
+        if((not isinstance(input_file_names, list)) or
+           (not isinstance(output_directory, str)) or
+           (not isinstance(number_of_processes, int)) or
+           (number_of_processes <= 0)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        os.makedirs(output_directory, exist_ok=True)
+        output_file_names: list[str] = [
+            os.path.join(output_directory, os.path.basename(input_file_name))
+            for input_file_name in input_file_names]
+
+        if number_of_processes == 1:
+            for input_file_name, output_file_name in zip(input_file_names,
+                                                         output_file_names):
+                FileRenderer._render_file_safely(
+                    input_file_name=input_file_name,
+                    output_file_name=output_file_name,
+                    samples_per_buffer=samples_per_buffer,
+                    sine_wave_frequency=sine_wave_frequency,
+                    add_noise=add_noise,
+                    volume=volume,
+                    noise_color=noise_color,
+                    carrier_phase_offsets=carrier_phase_offsets,
+                    carrier_waveform=carrier_waveform,
+                    effect_chain=effect_chain)
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=number_of_processes) as executor:
+            futures: list[concurrent.futures.Future] = [
+                executor.submit(FileRenderer._render_file_safely,
+                                input_file_name=input_file_name,
+                                output_file_name=output_file_name,
+                                samples_per_buffer=samples_per_buffer,
+                                sine_wave_frequency=sine_wave_frequency,
+                                add_noise=add_noise,
+                                volume=volume,
+                                noise_color=noise_color,
+                                carrier_phase_offsets=carrier_phase_offsets,
+                                carrier_waveform=carrier_waveform,
+                                effect_chain=effect_chain)
+                for input_file_name, output_file_name
+                in zip(input_file_names, output_file_names)]
+            concurrent.futures.wait(futures)
+
+    @staticmethod
+    def _render_file_safely(**kwargs) -> None:
+        """Render a WAV file and print an error instead of raising it.
+
+        Args:
+            **kwargs: arguments of render_file().
+        """
+        try:
+            FileRenderer.render_file(**kwargs)
+        except (OSError, ValueError) as e:
+            print(type(e))
+            print(e)
+            print(f"ERROR! Could not render {kwargs['input_file_name']}!")
@@ -0,0 +1,94 @@
+import numpy
+
+from effect_stage import EffectStage
+from stream_parameters import StreamParameters
+
+
+class GateStage(EffectStage):
+    def __init__(self, threshold: int | float) -> None:
+        """Initialize a noise gate.
+
+        A channel is muted while RMS of its block is below a threshold.
+        Gain of a channel moves linearly across a block
+        from its previous value, so opening and closing do not click.
+
+        Args:
+            threshold (int | float): RMS threshold.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        super().__init__()
+
+        # Check argument.
+        if((not isinstance(threshold, (int, float))) or
+           (threshold <= 0)):
+            raise ValueError("ERROR! Invalid argument!")
+
+        # Compared with mean square, so no square root is taken.
+        self._squared_threshold: float = threshold ** 2
+
+        self._squares: numpy.ndarray = numpy.empty((0, 0))
+        self._mean_squares: numpy.ndarray = numpy.empty(0)
+        self._gains: numpy.ndarray = numpy.empty(0)
+        self._new_gains: numpy.ndarray = numpy.empty(0)
+        self._gain_steps: numpy.ndarray = numpy.empty(0)
+        self._gain_ramp: numpy.ndarray = numpy.empty((0, 0))
+        self._ramp_fractions: numpy.ndarray = numpy.empty((0, 1))
+
+    def allocate(self,
+                 samples_per_buffer: int,
+                 number_of_channels: int) -> None:
+        """Allocate gain buffers for a number of frames.
+
+        Args:
+            samples_per_buffer (int): number of frames in a block.
+            number_of_channels (int): number of channels in a block.
+        """
+        shape: tuple[int, int] = (samples_per_buffer, number_of_channels)
+        self._squares = numpy.zeros(shape, dtype=numpy.float64)
+        self._mean_squares = numpy.zeros(number_of_channels,
+                                         dtype=numpy.float64)
+        # Gate starts open.
+        self._gains = numpy.ones(number_of_channels, dtype=numpy.float64)
+        self._new_gains = numpy.ones(number_of_channels, dtype=numpy.float64)
+        self._gain_steps = numpy.zeros(number_of_channels,
+                                       dtype=numpy.float64)
+        self._gain_ramp = numpy.zeros(shape, dtype=numpy.float64)
+        self._ramp_fractions = numpy.arange(
+            1,
+            samples_per_buffer + 1,
+            dtype=numpy.float64).reshape(samples_per_buffer, 1) \
+            / samples_per_buffer
+
+    def process(self,
+                block: numpy.ndarray,
+                parameters: StreamParameters) -> None:
+        """Gate a block in place.
+
+        Args:
+            block (numpy.ndarray): float64 block of shape
+            (frames, channels).
+            parameters (StreamParameters): parameters for this block.
+        """
+        numpy.multiply(block, block, out=self._squares)
+        numpy.mean(self._squares, axis=0, out=self._mean_squares)
+        numpy.greater_equal(self._mean_squares,
+                            self._squared_threshold,
+                            out=self._new_gains)
+
+        numpy.subtract(self._new_gains, self._gains, out=self._gain_steps)
+
+        # Gains do not change.
+        if not self._gain_steps.any():
+            if self._gains.all():
+                return
+            numpy.multiply(block, self._gains, out=block)
+            return
+
+        numpy.multiply(self._ramp_fractions,
+                       self._gain_steps,
+                       out=self._gain_ramp)
+        numpy.add(self._gain_ramp, self._gains, out=self._gain_ramp)
+        numpy.multiply(block, self._gain_ramp, out=block)
+        numpy.copyto(self._gains, self._new_gains)
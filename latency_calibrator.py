@@ -0,0 +1,204 @@
+import os
+import time
+from typing import Any
+
+from noise_generator import NoiseGenerator
+from parameters import Parameters
+from sine_wave_generator import SineWaveGenerator
+from stream import Stream
+
+
+class LatencyCalibrator:
+    @staticmethod
+    def measure(parameters: Parameters,
+                samples_per_buffer: int,
+                min_latency_ms: int | None,
+                duration_s: int | float,
+                max_load: float) -> dict[str, Any]:
+        """Run a stream with one setting and measure its stability.
+
+        Stream is built from the same parameters as a normal run:
+        effect chain, carrier waveform, noise color, channels,
+        execution mode, smoothing and resampling, so the measured
+        callback does the same work. Noise is always added,
+        because it can be turned on at any time.
+        Setting is stable if the stream stays active for the whole period,
+        no underflow or overflow happens and the longest callback
+        takes at most max load of a buffer period.
+
+        Args:
+            parameters (Parameters): application parameters.
+            samples_per_buffer (int): number of samples in a buffer.
+            min_latency_ms (int | None): PortAudio minimum latency, ms.
+            None - PortAudio default.
+            duration_s (int | float): measurement period, s.
+            max_load (float): allowed ratio of the longest callback
+            to a buffer period.
+
+        Returns:
+            dict[str, Any]: setting, latency, headroom and stability.
+        """
+        POLL_INTERVAL_S: float = 0.1
+
+        # Do not let a setting leak into the next measurement.
+        original_min_latency: str | None = \
+            os.environ.get("PA_MIN_LATENCY_MSEC")
+
+        sine_wave_generator: SineWaveGenerator = SineWaveGenerator(
+            sampling_frequency=parameters.internal_sampling_frequency,
+            sine_wave_frequency=parameters.sine_wave_frequency,
+            carrier_waveform=parameters.carrier_waveform,
+            smoothing_ramp_samples=parameters.smoothing_ramp_samples,
+            ramp_shape=parameters.smoothing_ramp_shape)
+        noise_generator: NoiseGenerator = NoiseGenerator(
+            noise_color=parameters.noise_color)
+
+        result: dict[str, Any] = {
+            "samples_per_buffer": samples_per_buffer,
+            "min_latency_ms": min_latency_ms,
+            "buffer_period_ms": (samples_per_buffer
+                                 / parameters.sampling_frequency * 1000),
+            "total_latency_ms": None,
+            "callback_duration_max_ms": None,
+            "headroom": None,
+            "xruns": None,
+            "stable": False
+        }
+
+        try:
+            stream: Stream = Stream(
+                sampling_frequency=parameters.sampling_frequency,
+                samples_per_buffer=samples_per_buffer,
+                sine_wave_generator=sine_wave_generator,
+                noise_generator=noise_generator,
+                add_noise=True,
+                volume=parameters.volume,
+                plot_ring_buffer=None,
+                min_latency_ms=min_latency_ms,
+                xrun_recovery_policy=parameters.xrun_recovery_policy,
+                max_consecutive_xruns=parameters.max_consecutive_xruns,
+                execution_mode=parameters.execution_mode,
+                number_of_channels=parameters.number_of_channels,
+                carrier_phase_offsets=parameters.carrier_phase_offsets,
+                smoothing_ramp_samples=parameters.smoothing_ramp_samples,
+                ramp_shape=parameters.smoothing_ramp_shape,
+                effect_chain=parameters.effect_chain,
+                resampling_factor=parameters.resampling_factor)
+            try:
+                end_time: float = time.perf_counter() + duration_s
+                while ((stream.is_active() is True) and
+                       (time.perf_counter() < end_time)):
+                    time.sleep(POLL_INTERVAL_S)
+                is_active: bool = stream.is_active()
+                statistics: dict[str, Any] = stream.stats()
+                result["total_latency_ms"] = stream.total_latency_ms
+            finally:
+                stream.close()
+        except (OSError, ValueError) as e:
+            print(type(e))
+            print(e)
+            print("ERROR! Could not open stream with this setting!")
+            return result
+        finally:
+            noise_generator.close()
+            if original_min_latency is None:
+                os.environ.pop("PA_MIN_LATENCY_MSEC", None)
+            else:
+                os.environ["PA_MIN_LATENCY_MSEC"] = original_min_latency
+
+        xruns: int = (statistics["input_underflows"] +
+                      statistics["input_overflows"] +
+                      statistics["output_underflows"] +
+                      statistics["output_overflows"])
+        headroom: float = 1 - (statistics["callback_duration_max_ms"]
+                               / statistics["buffer_period_ms"])
+        result["callback_duration_max_ms"] = \
+            statistics["callback_duration_max_ms"]
+        result["headroom"] = headroom
+        result["xruns"] = xruns
+        result["stable"] = ((is_active is True) and
+                            (statistics["callbacks"] > 0) and
+                            (xruns == 0) and
+                            (headroom >= 1 - max_load))
+        return result
+
+    @staticmethod
+    def calibrate(parameters: Parameters,
+                  samples_per_buffer_candidates: list[int],
+                  min_latency_ms_candidates: list[int | None],
+                  duration_s: int | float,
+                  max_load: float) -> dict[str, Any] | None:
+        """Find the stable setting with the smallest latency.
+
+        Buffer sizes are tried from the largest to the smallest,
+        every one with every minimum latency. Smaller buffer sizes
+        are not tried after a buffer size without a stable setting.
+        PortAudio reads minimum latency from PA_MIN_LATENCY_MSEC
+        in Windows host APIs only, elsewhere pass [None].
+        Buffer sizes that are not multiples of resampling factor
+        are skipped.
+
+        Args:
+            parameters (Parameters): application parameters.
+            samples_per_buffer_candidates (list[int]): buffer sizes.
+            min_latency_ms_candidates (list[int | None]): PortAudio
+            minimum latencies, ms. None - PortAudio default.
+            duration_s (int | float): measurement period of one setting, s.
+            max_load (float): allowed ratio of the longest callback
+            to a buffer period.
+
+        Raises:
+            ValueError: invalid arguments.
+
+        Returns:
+            dict[str, Any] | None: measurement of the best setting.
+            None - no setting is stable.
+        """
+        # Check arguments.
+        if((not isinstance(parameters, Parameters)) or
+           (not isinstance(samples_per_buffer_candidates, list)) or
+           (len(samples_per_buffer_candidates) == 0) or
+           (not isinstance(min_latency_ms_candidates, list)) or
+           (len(min_latency_ms_candidates) == 0) or
+           (not isinstance(duration_s, (int, float))) or
+           (duration_s <= 0) or
+           (not isinstance(max_load, float)) or
+           (max_load <= 0) or
+           (max_load > 1)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        best_result: dict[str, Any] | None = None
+        for samples_per_buffer in sorted(samples_per_buffer_candidates,
+                                         reverse=True):
+            if samples_per_buffer % parameters.resampling_factor != 0:
+                print(f"Skipping: samples per buffer = {samples_per_buffer} "
+                      "is not a multiple of resampling factor "
+                      f"{parameters.resampling_factor}.")
+                continue
+            is_any_stable: bool = False
+            for min_latency_ms in min_latency_ms_candidates:
+                print(f"Calibrating: samples per buffer = {samples_per_buffer}, "
+                      f"min latency = {min_latency_ms} ms.")
+                result: dict[str, Any] = LatencyCalibrator.measure(
+                    parameters=parameters,
+                    samples_per_buffer=samples_per_buffer,
+                    min_latency_ms=min_latency_ms,
+                    duration_s=duration_s,
+                    max_load=max_load)
+                print(f"Total latency = {result['total_latency_ms']} ms, "
+                      f"headroom = {result['headroom']}, "
+                      f"xruns = {result['xruns']}, "
+                      f"stable = {result['stable']}.")
+
+                if result["stable"] is False:
+                    continue
+                is_any_stable = True
+                if ((best_result is None) or
+                    (result["total_latency_ms"] <
+                     best_result["total_latency_ms"])):
+                    best_result = result
+
+            if is_any_stable is False:
+                break
+
+        return best_result
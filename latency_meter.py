@@ -0,0 +1,314 @@
+import os
+import time
+from typing import Any
+
+import numpy
+
+from audio_backend import AudioBackend
+
+
+class LatencyMeter:
+    def __init__(self,
+                 sampling_frequency: int,
+                 samples_per_buffer: int,
+                 number_of_channels: int,
+                 number_of_trials: int,
+                 min_latency_ms: int | None,
+                 audio_backend: AudioBackend | None = None) -> None:
+        """Prepare a round-trip latency measurement.
+
+        A chirp is played once per trial and found in the input
+        by FFT cross-correlation. The lag of the correlation peak
+        is the time from a sample leaving the callback as output
+        to the same sample coming back to the callback as input,
+        so output must be audible to input: a loopback cable
+        or a speaker near a microphone, or a simulated loopback device.
+        If audio backend is None, default PortAudio device is opened
+        through pyaudio.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            samples_per_buffer (int): number of samples in a buffer.
+            number_of_channels (int): number of channels.
+            Chirp is played on every channel and found in the first one.
+            number_of_trials (int): number of chirps.
+            min_latency_ms (int | None): PortAudio minimum latency, ms.
+            None - PortAudio default.
+            audio_backend (AudioBackend | None): device to measure.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(sampling_frequency, int)) or
+           (sampling_frequency <= 0) or
+           (not isinstance(samples_per_buffer, int)) or
+           (samples_per_buffer <= 0) or
+           (not isinstance(number_of_channels, int)) or
+           (number_of_channels <= 0) or
+           (not isinstance(number_of_trials, int)) or
+           (number_of_trials <= 0) or
+           ((min_latency_ms is not None) and
+            ((not isinstance(min_latency_ms, int)) or
+             (min_latency_ms <= 0))) or
+           ((audio_backend is not None) and
+            (not isinstance(audio_backend, AudioBackend)))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        # Trial is long enough for a chirp to come back,
+        # so max measurable latency is trial minus chirp duration.
+        self._TRIAL_DURATION_S: float = 0.5
+        self._CHIRP_DURATION_S: float = 0.05
+        self._CHIRP_START_FREQUENCY: float = 200.0
+        self._CHIRP_STOP_FREQUENCY: float = \
+            min(10000.0, 0.45 * sampling_frequency)
+        self._CHIRP_AMPLITUDE: float = 0.5
+        # Leading silence lets devices settle.
+        self._LEAD_DURATION_S: float = 0.2
+        # Correlation peak must stand out of correlation noise.
+        self._MIN_PEAK_TO_MEDIAN: float = 10.0
+        self._POLL_INTERVAL_S: float = 0.05
+
+        self._sampling_frequency: int = sampling_frequency
+        self._samples_per_buffer: int = samples_per_buffer
+        self._number_of_channels: int = number_of_channels
+        self._number_of_trials: int = number_of_trials
+        self._min_latency_ms: int | None = min_latency_ms
+        if audio_backend is None:
+            from pyaudio_backend import PyAudioBackend
+            audio_backend = PyAudioBackend()
+        self._audio_backend: AudioBackend = audio_backend
+
+        self._trial_samples: int = \
+            round(self._TRIAL_DURATION_S * sampling_frequency)
+        self._lead_samples: int = \
+            round(self._LEAD_DURATION_S * sampling_frequency)
+        self._chirp: numpy.ndarray = self._create_chirp()
+
+        # Playback and capture are preallocated, callback only copies.
+        # Last trial is followed by one more trial of silence.
+        total_samples: int = (self._lead_samples
+                              + (number_of_trials + 1) * self._trial_samples)
+        total_samples = (-(-total_samples // samples_per_buffer)
+                         * samples_per_buffer)
+        self._playback: numpy.ndarray = numpy.zeros(
+            (total_samples, number_of_channels), dtype=numpy.float32)
+        for trial in range(number_of_trials):
+            start: int = self._lead_samples + trial * self._trial_samples
+            self._playback[start:start + self._chirp.size] = \
+                self._chirp[:, numpy.newaxis]
+        self._capture: numpy.ndarray = numpy.zeros(
+            (total_samples, number_of_channels), dtype=numpy.float32)
+        self._position: int = 0
+        self._silence: bytes = bytes(samples_per_buffer * number_of_channels
+                                     * numpy.dtype(numpy.float32).itemsize)
+
+    def _create_chirp(self) -> numpy.ndarray:
+        """Create a linear chirp with Hann-shaped edges.
+
+        Returns:
+            numpy.ndarray: float32 chirp samples.
+        """
+        number_of_samples: int = \
+            round(self._CHIRP_DURATION_S * self._sampling_frequency)
+        t: numpy.ndarray = numpy.arange(number_of_samples) \
+                           / self._sampling_frequency
+        sweep_rate: float = ((self._CHIRP_STOP_FREQUENCY
+                              - self._CHIRP_START_FREQUENCY)
+                             / self._CHIRP_DURATION_S)
+        chirp: numpy.ndarray = self._CHIRP_AMPLITUDE * numpy.sin(
+            2 * numpy.pi * (self._CHIRP_START_FREQUENCY * t
+                            + sweep_rate / 2 * t ** 2))
+
+        # 10 % of chirp fades in and out.
+        fade_samples: int = number_of_samples // 10
+        fade: numpy.ndarray = 0.5 - 0.5 * numpy.cos(
+            numpy.pi * numpy.arange(fade_samples) / fade_samples)
+        chirp[:fade_samples] *= fade
+        chirp[number_of_samples - fade_samples:] *= fade[::-1]
+        return chirp.astype(numpy.float32)
+
+    def _callback(self,
+                  in_data: bytes,
+                  frame_count: int,
+                  time_info: Any,
+                  status_flags: Any):
+        """Audio backend input/output stream callback.
+
+        Save input and play the next block of chirps.
+
+        Args:
+            in_data (bytes): raw bytes of input data.
+            frame_count (int): number of input frames.
+            time_info (Any): time information.
+            status_flags (Any): portAutio callback flag.
+
+        Returns:
+            _type_: raw bytes of output data,
+            portAudio callback return code.
+        """
+        start: int = self._position
+        end: int = start + frame_count
+        if end > self._playback.shape[0]:
+            return (self._silence[:frame_count * self._number_of_channels
+                                  * numpy.dtype(numpy.float32).itemsize],
+                    AudioBackend.COMPLETE)
+
+        self._capture[start:end] = numpy.frombuffer(
+            in_data, dtype=numpy.float32).reshape(
+                -1, self._number_of_channels)
+        self._position = end
+
+        # Numpy array is passed to backend as a read-only buffer
+        # without copying.
+        return_code: int = AudioBackend.CONTINUE
+        if end == self._playback.shape[0]:
+            return_code = AudioBackend.COMPLETE
+        return (self._playback[start:end], return_code)
+
+    def measure(self) -> dict[str, Any]:
+        """Play chirps and measure round-trip latency of every trial.
+
+        Returns:
+            dict[str, Any]: setting, latency reported by the device,
+            number of trials, number of trials where chirp was found,
+            mean, median, min and max measured latency, jitter
+            as standard deviation of measured latency.
+        """
+        result: dict[str, Any] = {
+            "samples_per_buffer": self._samples_per_buffer,
+            "min_latency_ms": self._min_latency_ms,
+            "audio_backend": type(self._audio_backend).__name__,
+            "reported_latency_ms": None,
+            "trials": self._number_of_trials,
+            "valid_trials": 0,
+            "latency_ms": None,
+            "latency_median_ms": None,
+            "latency_min_ms": None,
+            "latency_max_ms": None,
+            "jitter_ms": None
+        }
+
+        # Whole measurement twice, in case a device runs slow.
+        timeout_s: float = \
+            2 * self._playback.shape[0] / self._sampling_frequency + 1
+        self._position = 0
+        completed: bool = self._play(result=result, timeout_s=timeout_s)
+        if completed is False:
+            print("ERROR! Measurement did not complete!")
+            return result
+
+        latencies_ms: numpy.ndarray = self._find_chirps() \
+                                      / self._sampling_frequency * 1000
+        latencies_ms = latencies_ms[numpy.isfinite(latencies_ms)]
+        result["valid_trials"] = int(latencies_ms.size)
+        if latencies_ms.size > 0:
+            result["latency_ms"] = float(numpy.mean(latencies_ms))
+            result["latency_median_ms"] = float(numpy.median(latencies_ms))
+            result["latency_min_ms"] = float(numpy.min(latencies_ms))
+            result["latency_max_ms"] = float(numpy.max(latencies_ms))
+            result["jitter_ms"] = float(numpy.std(latencies_ms))
+        return result
+
+    def _play(self,
+              result: dict[str, Any],
+              timeout_s: float) -> bool:
+        """Play chirps through audio backend.
+
+        Args:
+            result (dict[str, Any]): result to save reported latency to.
+            timeout_s (float): max duration of measurement, s.
+
+        Returns:
+            bool: True - all chirps were played and captured.
+            False - device could not be opened or did not complete.
+        """
+        # Do not let a setting leak into the application.
+        original_min_latency: str | None = \
+            os.environ.get("PA_MIN_LATENCY_MSEC")
+        if self._min_latency_ms is not None:
+            os.environ["PA_MIN_LATENCY_MSEC"] = str(self._min_latency_ms)
+
+        try:
+            self._audio_backend.open(
+                sampling_frequency=self._sampling_frequency,
+                number_of_channels=self._number_of_channels,
+                samples_per_buffer=self._samples_per_buffer,
+                stream_callback=self._callback)
+            try:
+                result["reported_latency_ms"] = \
+                    (self._audio_backend.get_input_latency()
+                     + self._audio_backend.get_output_latency()) * 1000
+                return self._wait(timeout_s=timeout_s)
+            finally:
+                self._audio_backend.close()
+        except OSError as e:
+            print(type(e))
+            print(e)
+            print("ERROR! Could not open stream with this setting!")
+            return False
+        finally:
+            if original_min_latency is None:
+                os.environ.pop("PA_MIN_LATENCY_MSEC", None)
+            else:
+                os.environ["PA_MIN_LATENCY_MSEC"] = original_min_latency
+
+    def _wait(self, timeout_s: float) -> bool:
+        """Wait until audio backend plays all chirps.
+
+        Args:
+            timeout_s (float): max duration of measurement, s.
+
+        Returns:
+            bool: True - all chirps were played and captured.
+            False - device stopped early or timed out.
+        """
+        end_time: float = time.perf_counter() + timeout_s
+        while ((self._audio_backend.is_active() is True) and
+               (time.perf_counter() < end_time)):
+            time.sleep(self._POLL_INTERVAL_S)
+        return self._position == self._playback.shape[0]
+
+    def _find_chirps(self) -> numpy.ndarray:
+        """Find the chirp of every trial in the captured input.
+
+        Returns:
+            numpy.ndarray: float64 lag of the chirp of every trial,
+            with sub-sample precision, samples.
+            NaN - chirp was not found.
+        """
+        max_lag: int = self._trial_samples - self._chirp.size
+        fft_size: int = 1 << (self._trial_samples
+                              + self._chirp.size - 1).bit_length()
+        chirp_spectrum_conjugate: numpy.ndarray = numpy.conj(
+            numpy.fft.rfft(self._chirp, n=fft_size))
+
+        lags: numpy.ndarray = numpy.full(self._number_of_trials, numpy.nan)
+        for trial in range(self._number_of_trials):
+            start: int = self._lead_samples + trial * self._trial_samples
+            segment: numpy.ndarray = \
+                self._capture[start:start + self._trial_samples, 0]
+            correlation: numpy.ndarray = numpy.abs(numpy.fft.irfft(
+                numpy.fft.rfft(segment, n=fft_size)
+                * chirp_spectrum_conjugate,
+                n=fft_size)[:max_lag + 1])
+
+            peak_index: int = int(numpy.argmax(correlation))
+            peak: float = correlation[peak_index]
+            if ((peak == 0) or
+                (peak < self._MIN_PEAK_TO_MEDIAN
+                 * numpy.median(correlation))):
+                continue
+
+            # Parabola through the peak and its neighbours.
+            offset: float = 0.0
+            if 0 < peak_index < max_lag:
+                left: float = correlation[peak_index - 1]
+                right: float = correlation[peak_index + 1]
+                curvature: float = left - 2 * peak + right
+                if curvature < 0:
+                    offset = 0.5 * (left - right) / curvature
+            lags[trial] = peak_index + offset
+        return lags
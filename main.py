@@ -1,17 +1,36 @@
-import queue
+import argparse
+import platform
+import time
+from typing import Any
 
+import numpy
+
+from audio_backend import AudioBackend
+from config_watcher import ConfigWatcher
+from control_client import ControlClient
+from control_server import ControlServer
+from file_renderer import FileRenderer
+from latency_calibrator import LatencyCalibrator
+from latency_meter import LatencyMeter
 from menu_state import MenuState
+from noise_generator import NoiseGenerator
 from parameters import Parameters
-from plot import Plot
+from recorder import Recorder
+from recording_format import RecordingFormat
+from ring_buffer import RingBuffer
+from simulated_device import SimulatedDevice
+from simulated_loopback import SimulatedLoopback
 from sine_wave_generator import SineWaveGenerator
+from statistics_logger import StatisticsLogger
 from stream import Stream
+from wav_reader import WavReader
+from wav_writer import WavWriter
 
 
 # TODO
 # TODOs
 
-# raspberry убрать matplotlib
-# Размер буфера, latency. https://www.portaudio.com/docs/latency.html. На распберри запускать от root, чтобы latency была меньше. You must also set PA_MIN_LATENCY_MSEC using the appropriate command for your shell.
+# Размер буфера, latency. https://www.portaudio.com/docs/latency.html. На распберри запускать от root, чтобы latency была меньше.
 # https://github.com/PortAudio/portaudio/wiki/Platforms_RaspberryPi
 # подключиться к распберри по телефону
 
@@ -22,47 +41,486 @@ from stream import Stream
 # README.md
 
 
+def parse_arguments() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Returns:
+        argparse.Namespace: command-line arguments.
+    """
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Modulate voice by a sine wave in real time.")
+    argument_parser.add_argument(
+        "--render",
+        nargs="+",
+        metavar="INPUT_WAV",
+        help="modulate WAV files instead of a microphone and exit")
+    argument_parser.add_argument(
+        "--output-directory",
+        default="rendered",
+        help="directory for rendered WAV files (default: %(default)s)")
+    argument_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of processes to render WAV files (default: %(default)s)")
+    argument_parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="do not plot and do not import matplotlib "
+             "(also \"headless\" in config file)")
+    argument_parser.add_argument(
+        "--statistics-file",
+        help="append stream statistics to a JSON lines file periodically")
+    argument_parser.add_argument(
+        "--statistics-interval",
+        type=float,
+        default=60.0,
+        help="interval between statistics lines, s (default: %(default)s)")
+    argument_parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="find the smallest stable buffer size and, on Windows, "
+             "PortAudio minimum latency, save them to config file and exit")
+    argument_parser.add_argument(
+        "--calibration-duration",
+        type=float,
+        default=10.0,
+        help="measurement period of one calibration setting, s "
+             "(default: %(default)s)")
+    argument_parser.add_argument(
+        "--measure-latency",
+        nargs="*",
+        type=int,
+        metavar="SAMPLES_PER_BUFFER",
+        help="measure round-trip latency with a chirp for every buffer size "
+             "(default: buffer size of config file) and exit, "
+             "output must be audible to input")
+    argument_parser.add_argument(
+        "--latency-trials",
+        type=int,
+        default=20,
+        help="number of chirps of a latency measurement "
+             "(default: %(default)s)")
+    argument_parser.add_argument(
+        "--simulated-latency",
+        type=float,
+        metavar="MS",
+        help="measure latency of a simulated loopback device "
+             "with this latency, ms, instead of a real device")
+    argument_parser.add_argument(
+        "--simulated-jitter",
+        type=float,
+        default=0.0,
+        metavar="MS",
+        help="max random extra latency of a simulated loopback device, ms "
+             "(default: %(default)s)")
+    argument_parser.add_argument(
+        "--simulate-input",
+        metavar="INPUT_WAV",
+        help="stream a WAV file through a simulated device instead of "
+             "a sound card, without a menu, and exit at its end")
+    argument_parser.add_argument(
+        "--simulate-output",
+        metavar="OUTPUT_WAV",
+        help="save output of a simulated device to a WAV file")
+    argument_parser.add_argument(
+        "--simulate-speed",
+        type=float,
+        default=1.0,
+        help="clock speed of a simulated device relative to real time, "
+             "0 - as fast as possible (default: %(default)s)")
+    argument_parser.add_argument(
+        "--simulate-jitter",
+        type=float,
+        default=0.0,
+        metavar="MS",
+        help="max random delay of callbacks of a simulated device, ms "
+             "(default: %(default)s)")
+    argument_parser.add_argument(
+        "--simulate-xrun-probability",
+        type=float,
+        default=0.0,
+        help="probability of a random xrun flag in a callback "
+             "of a simulated device (default: %(default)s)")
+    argument_parser.add_argument(
+        "--control-port",
+        type=int,
+        default=8765,
+        help="local TCP port of the control server, 0 - any free port "
+             "(default: %(default)s)")
+    argument_parser.add_argument(
+        "--record",
+        metavar="DIRECTORY",
+        help="record input and output voice to files in a directory")
+    argument_parser.add_argument(
+        "--record-format",
+        choices=["wav", "raw"],
+        default="wav",
+        help="format of recordings, raw - float32 samples without header "
+             "(default: %(default)s)")
+    argument_parser.add_argument(
+        "--record-max-file-size-mb",
+        type=float,
+        help="start a new recording file after this size, MB")
+    argument_parser.add_argument(
+        "--record-max-file-duration-s",
+        type=float,
+        help="start a new recording file after this duration, s")
+    return argument_parser.parse_args()
+
+
+def print_statistics(statistics: dict[str, Any]) -> None:
+    """Print stream statistics.
+
+    Args:
+        statistics (dict[str, Any]): stream statistics.
+    """
+    histogram: dict[str, list] = statistics["callback_duration_histogram"]
+    for name, value in statistics.items():
+        if name != "callback_duration_histogram":
+            print(f"{name} = {value}")
+    print("Callback duration histogram:")
+    lower_edge_ms: float = 0.0
+    for upper_edge_ms, count in zip(histogram["upper_edges_ms"],
+                                    histogram["counts"]):
+        print(f"{lower_edge_ms:.2f} - {upper_edge_ms:.2f} ms: {count}")
+        lower_edge_ms = upper_edge_ms
+    print(f"> {lower_edge_ms:.2f} ms: {histogram['counts'][-1]}")
+
+
+def read_simulated_input(file_name: str,
+                         sampling_frequency: int,
+                         number_of_channels: int) -> numpy.ndarray:
+    """Read input of a simulated device from a WAV file.
+
+    Mono file is copied to every channel.
+
+    Args:
+        file_name (str): WAV file name.
+        sampling_frequency (int): sampling frequency of stream, Hz.
+        number_of_channels (int): number of channels of stream.
+
+    Raises:
+        ValueError: sampling frequency or number of channels of file
+        do not match stream.
+        OSError: file could not be read.
+
+    Returns:
+        numpy.ndarray: float32 samples of shape (frames, channels).
+    """
+    wav_reader: WavReader = WavReader(file_name=file_name)
+    try:
+        if((wav_reader.sampling_frequency != sampling_frequency) or
+           ((wav_reader.number_of_channels != 1) and
+            (wav_reader.number_of_channels != number_of_channels))):
+            raise ValueError("ERROR! Sampling frequency or number of channels "
+                             "of simulated input do not match stream!")
+        samples: numpy.ndarray = wav_reader.read(
+            start_frame=0,
+            number_of_frames=wav_reader.number_of_frames)
+    finally:
+        wav_reader.close()
+    if samples.shape[1] != number_of_channels:
+        samples = numpy.repeat(samples, number_of_channels, axis=1)
+    return samples
+
+
+def change_parameters(control_client: ControlClient | None,
+                      parameters: Parameters,
+                      stream: Stream,
+                      changes: dict[str, Any]) -> None:
+    """Ask control server to change parameters.
+
+    If control server is not started, changes are applied
+    to the stream and saved directly, the same way the server does.
+
+    Args:
+        control_client (ControlClient | None): client of control server.
+        None - control server is not started.
+        parameters (Parameters): parameters to check and save changes.
+        stream (Stream): stream to apply changes to.
+        changes (dict[str, Any]): new values by parameter names.
+    """
+    if control_client is None:
+        try:
+            if parameters.change(changes=changes,
+                                 apply=stream.change_parameters) is False:
+                print("ERROR! Invalid parameters! Nothing is changed!")
+        except ValueError as e:
+            print(type(e))
+            print(e)
+            print("ERROR! Stream rejected parameters! Nothing is changed!")
+        return
+
+    response: dict[str, Any] = control_client.request(
+        request={"command": "set", "parameters": changes})
+    if response["ok"] is False:
+        print(f"ERROR! {response['error']}")
+
+
 def main():
     """Start the application.
 
     Initialize application parameters.
-    Start plotting input voice, sine wave and modulated voice.
+    If WAV files are given, modulate them with current parameters and exit.
+    If calibration is requested, save the smallest stable buffer size
+    and PortAudio latency and exit.
+    If latency measurement is requested, measure round-trip latency
+    of every buffer size and exit.
+    If simulated input is given, stream it through a simulated device
+    until its end instead of a sound card, without a menu.
+    Start plotting input voice, sine wave and modulated voice
+    and their spectra, unless running headless.
     Start pyaudio input/output stream that gets input voice from a microphone,
     modulates it by a sine wave and outputs modulated voice to a speaker.
-    Start a command-line menu to dynamically change sine wave frequency,
-    add or remove noise, change volume.
+    Record input and modulated voice to files, if requested.
+    Apply changes of config file made by someone else while streaming.
+    Start a control server that changes parameters for local clients.
+    Start a command-line menu, a client of the control server,
+    to dynamically change sine wave frequency, add or remove noise,
+    change volume, change carrier waveform.
     """
+    arguments: argparse.Namespace = parse_arguments()
+
     parameters: Parameters = Parameters()
+
+    if arguments.render is not None:
+        FileRenderer.render_files(
+            input_file_names=arguments.render,
+            output_directory=arguments.output_directory,
+            number_of_processes=arguments.jobs,
+            samples_per_buffer=parameters.samples_per_buffer,
+            sine_wave_frequency=parameters.sine_wave_frequency,
+            add_noise=parameters.add_noise,
+            volume=parameters.volume,
+            noise_color=parameters.noise_color,
+            carrier_phase_offsets=parameters.carrier_phase_offsets,
+            carrier_waveform=parameters.carrier_waveform,
+            effect_chain=parameters.effect_chain)
+        parameters.close()
+        return
+
+    if arguments.calibrate is True:
+        # Only Windows host APIs of PortAudio read minimum latency.
+        min_latency_ms_candidates: list[int | None] = [None]
+        if platform.system() == "Windows":
+            min_latency_ms_candidates = [None, 40, 20, 10, 5]
+        # Buffer sizes are multiples of resampling factor.
+        samples_per_buffer_candidates: list[int] = \
+            [samples_per_buffer - samples_per_buffer
+             % parameters.resampling_factor
+             for samples_per_buffer in [1024, 512, 256, 128, 64, 32]]
+        calibration_result: dict[str, Any] | None = \
+            LatencyCalibrator.calibrate(
+                parameters=parameters,
+                samples_per_buffer_candidates=samples_per_buffer_candidates,
+                min_latency_ms_candidates=min_latency_ms_candidates,
+                duration_s=arguments.calibration_duration,
+                max_load=0.7)
+        if calibration_result is None:
+            print("ERROR! No stable setting is found! "
+                  "Parameters are not changed!")
+            parameters.close()
+            return
+        parameters.samples_per_buffer = \
+            calibration_result["samples_per_buffer"]
+        parameters.min_latency_ms = calibration_result["min_latency_ms"]
+        print("Calibrated: samples per buffer = "
+              f"{parameters.samples_per_buffer}, "
+              f"min latency = {parameters.min_latency_ms} ms, "
+              f"total latency = {calibration_result['total_latency_ms']} ms.")
+        parameters.close()
+        return
+
+    if arguments.measure_latency is not None:
+        samples_per_buffer_list: list[int] = arguments.measure_latency
+        if len(samples_per_buffer_list) == 0:
+            samples_per_buffer_list = [parameters.samples_per_buffer]
+        for samples_per_buffer in samples_per_buffer_list:
+            try:
+                latency_backend: AudioBackend | None = None
+                if arguments.simulated_latency is not None:
+                    latency_backend = SimulatedLoopback(
+                        latency_ms=arguments.simulated_latency,
+                        jitter_ms=arguments.simulated_jitter,
+                        noise_level=0.001)
+                latency_meter: LatencyMeter = LatencyMeter(
+                    sampling_frequency=parameters.sampling_frequency,
+                    samples_per_buffer=samples_per_buffer,
+                    number_of_channels=parameters.number_of_channels,
+                    number_of_trials=arguments.latency_trials,
+                    min_latency_ms=parameters.min_latency_ms,
+                    audio_backend=latency_backend)
+            except ValueError as e:
+                print(type(e))
+                print(e)
+                print("ERROR! Invalid latency measurement setting!")
+                continue
+            latency_result: dict[str, Any] = latency_meter.measure()
+            for name, value in latency_result.items():
+                print(f"{name} = {value}")
+        parameters.close()
+        return
+
+    # Simulated device replays a file, random choices are repeatable.
+    simulated_device: SimulatedDevice | None = None
+    if arguments.simulate_input is not None:
+        clock_speed: float | None = arguments.simulate_speed
+        if clock_speed == 0:
+            clock_speed = None
+        try:
+            simulated_device = SimulatedDevice(
+                input_samples=read_simulated_input(
+                    file_name=arguments.simulate_input,
+                    sampling_frequency=parameters.sampling_frequency,
+                    number_of_channels=parameters.number_of_channels),
+                clock_speed=clock_speed,
+                scheduling_jitter_ms=arguments.simulate_jitter,
+                xrun_probability=arguments.simulate_xrun_probability,
+                seed=0)
+        except (ValueError, OSError) as e:
+            print(type(e))
+            print(e)
+            print("ERROR! Could not simulate a device!")
+            parameters.close()
+            return
     
+    # Voice is processed and plotted at internal sampling frequency.
     sine_wave_generator: SineWaveGenerator = SineWaveGenerator(
-        sampling_frequency=parameters.sampling_frequency,
-        sine_wave_frequency=parameters.sine_wave_frequency)
+        sampling_frequency=parameters.internal_sampling_frequency,
+        sine_wave_frequency=parameters.sine_wave_frequency,
+        carrier_waveform=parameters.carrier_waveform,
+        smoothing_ramp_samples=parameters.smoothing_ramp_samples,
+        ramp_shape=parameters.smoothing_ramp_shape)
+
+    noise_generator: NoiseGenerator = NoiseGenerator(
+        noise_color=parameters.noise_color)
 
-    multithread_queue_samples: int = parameters.samples_per_buffer * 4
-    multithread_queue: queue.Queue[tuple[float, float, float]] = \
-        queue.Queue(maxsize=multithread_queue_samples)
+    headless: bool = (arguments.headless is True) or \
+                     (parameters.headless is True)
 
-    plot: Plot = Plot(sampling_frequency=parameters.sampling_frequency,
-                      samples_per_buffer=parameters.samples_per_buffer,
-                      multithread_queue=multithread_queue)
+    # Matplotlib is imported only when plotting.
+    plot = None
+    plot_ring_buffer: RingBuffer | None = None
+    spectrum_analyzer = None
+    if headless is False:
+        from plot import Plot
+        from spectrum_analyzer import SpectrumAnalyzer
+
+        # Input voice, sine wave and modulated voice.
+        plot_ring_buffer_rows: int = 3
+        spectrum_frame_size: int = 2048
+        plot_ring_buffer_samples: int = \
+            max(parameters.internal_samples_per_buffer,
+                spectrum_frame_size) * 4
+        plot_ring_buffer = RingBuffer(number_of_rows=plot_ring_buffer_rows,
+                                      capacity=plot_ring_buffer_samples)
+
+        # Frames overlap by half, 10 frames are averaged roughly.
+        spectrum_analyzer = SpectrumAnalyzer(
+            sampling_frequency=parameters.internal_sampling_frequency,
+            ring_buffer=plot_ring_buffer,
+            frame_size=spectrum_frame_size,
+            hop_size=spectrum_frame_size // 2,
+            averaging=0.1,
+            peak_decay_db_per_s=20)
+
+        plot = Plot(sampling_frequency=parameters.internal_sampling_frequency,
+                    samples_per_buffer=parameters.internal_samples_per_buffer,
+                    plot_ring_buffer=plot_ring_buffer,
+                    frames_per_second=parameters.plot_frames_per_second,
+                    spectrum_analyzer=spectrum_analyzer)
+
+    # Ring of recorder holds 2 s of blocks.
+    recorder: Recorder | None = None
+    if arguments.record is not None:
+        max_file_size_bytes: int | None = None
+        if arguments.record_max_file_size_mb is not None:
+            max_file_size_bytes = \
+                int(arguments.record_max_file_size_mb * 1024 * 1024)
+        recorder = Recorder(
+            directory=arguments.record,
+            recording_format=RecordingFormat[arguments.record_format.upper()],
+            sampling_frequency=parameters.sampling_frequency,
+            samples_per_buffer=parameters.samples_per_buffer,
+            number_of_channels=parameters.number_of_channels,
+            number_of_slots=max(4, round(2.0 * parameters.sampling_frequency
+                                         / parameters.samples_per_buffer)),
+            max_file_size_bytes=max_file_size_bytes,
+            max_file_duration_s=arguments.record_max_file_duration_s)
 
     stream: Stream = Stream(sampling_frequency=parameters.sampling_frequency,
                             samples_per_buffer=parameters.samples_per_buffer,
                             sine_wave_generator=sine_wave_generator,
+                            noise_generator=noise_generator,
                             add_noise=parameters.add_noise,
                             volume=parameters.volume,
-                            multithread_queue=multithread_queue)
+                            plot_ring_buffer=plot_ring_buffer,
+                            min_latency_ms=parameters.min_latency_ms,
+                            xrun_recovery_policy=\
+                                parameters.xrun_recovery_policy,
+                            max_consecutive_xruns=\
+                                parameters.max_consecutive_xruns,
+                            execution_mode=parameters.execution_mode,
+                            number_of_channels=parameters.number_of_channels,
+                            carrier_phase_offsets=\
+                                parameters.carrier_phase_offsets,
+                            smoothing_ramp_samples=\
+                                parameters.smoothing_ramp_samples,
+                            ramp_shape=parameters.smoothing_ramp_shape,
+                            effect_chain=parameters.effect_chain,
+                            recorder=recorder,
+                            audio_backend=simulated_device,
+                            resampling_factor=parameters.resampling_factor)
+
+    # Process CPU time includes imports and plot creation.
+    startup_cpu_time_s: float = time.process_time()
+    print(f"Startup CPU time = {startup_cpu_time_s * 1000:.0f} ms")
+    steady_state_start_time_s: float = time.perf_counter()
+
+    statistics_logger: StatisticsLogger | None = None
+    if arguments.statistics_file is not None:
+        statistics_logger = StatisticsLogger(
+            get_statistics=stream.stats,
+            file_name=arguments.statistics_file,
+            interval_s=arguments.statistics_interval)
     
     # Main thread.
+    config_watcher: ConfigWatcher = ConfigWatcher(parameters=parameters,
+                                                  stream=stream,
+                                                  interval_s=1.0)
+    control_server: ControlServer | None = None
+    control_client: ControlClient | None = None
     menu_state: MenuState = MenuState.MAIN
     try:
+        # Menu works without control server, e.g. if its port is busy.
+        try:
+            control_server = ControlServer(parameters=parameters,
+                                           stream=stream,
+                                           host="127.0.0.1",
+                                           port=arguments.control_port)
+            control_client = ControlClient(host="127.0.0.1",
+                                           port=control_server.port)
+        except OSError as e:
+            print(type(e))
+            print(e)
+            print("ERROR! Could not start control server! "
+                  "Menu changes parameters directly!")
+
         while stream.is_active() is True:          
+            # Simulated device stops at the end of its input.
+            if simulated_device is not None:
+                time.sleep(0.1)
+                continue
+
             match menu_state:
                 case MenuState.MAIN:
                     print("Enter 1 to change sine wave frequency.")
                     print("Enter 2 to add or remove noise.")
                     print("Enter 3 to change volume.")
-                    print("Enter 4 to exit. ")
+                    print("Enter 4 to show statistics.")
+                    print("Enter 5 to change carrier waveform.")
+                    print("Enter 6 to exit. ")
                     line: str = input()
 
                     number: int = 0
@@ -79,6 +537,10 @@ def main():
                         case 3:
                             menu_state = MenuState.CHANGING_VOLUME
                         case 4:
+                            menu_state = MenuState.SHOWING_STATISTICS
+                        case 5:
+                            menu_state = MenuState.CHANGING_CARRIER_WAVEFORM
+                        case 6:
                             break
                         case _:
                             print("ERROR! Invalid number!")
@@ -88,15 +550,18 @@ def main():
                     print("Enter new sine wave frequency: ", end="")
                     line: str = input()
                     
-                    new_sine_wave_frequency: int = 0
+                    new_sine_wave_frequency: float = 0
                     try:
-                        new_sine_wave_frequency = int(line)
+                        new_sine_wave_frequency = float(line)
                     except ValueError as e:
                         new_sine_wave_frequency = 0
 
-                    parameters.sine_wave_frequency = new_sine_wave_frequency
-                    sine_wave_generator.sine_wave_frequency = \
-                        parameters.sine_wave_frequency
+                    change_parameters(
+                        control_client=control_client,
+                        parameters=parameters,
+                        stream=stream,
+                        changes={"sine_wave_frequency":
+                                     new_sine_wave_frequency})
                     
                     menu_state = MenuState.MAIN
 
@@ -111,8 +576,10 @@ def main():
                     elif ((line == "false") or (line == "False")):
                         new_add_noise = False
 
-                    parameters.add_noise = new_add_noise
-                    stream.add_noise = parameters.add_noise
+                    change_parameters(control_client=control_client,
+                                      parameters=parameters,
+                                      stream=stream,
+                                      changes={"add_noise": new_add_noise})
 
                     menu_state = MenuState.MAIN
 
@@ -126,19 +593,77 @@ def main():
                     except ValueError as e:
                         new_volume = 0
                     
-                    parameters.volume = new_volume
-                    stream.volume = parameters.volume
+                    change_parameters(control_client=control_client,
+                                      parameters=parameters,
+                                      stream=stream,
+                                      changes={"volume": new_volume})
+
+                    menu_state = MenuState.MAIN
+
+                case MenuState.SHOWING_STATISTICS:
+                    if control_client is None:
+                        print_statistics(statistics=stream.stats())
+                    else:
+                        response: dict[str, Any] = control_client.request(
+                            request={"command": "stats"})
+                        print_statistics(statistics=response["stats"])
+
+                    menu_state = MenuState.MAIN
+
+                case MenuState.CHANGING_CARRIER_WAVEFORM:
+                    print("Enter \"sine\", \"triangle\", \"square\" "
+                          "or \"saw\": ", end="")
+                    line: str = input()
+
+                    change_parameters(control_client=control_client,
+                                      parameters=parameters,
+                                      stream=stream,
+                                      changes={"carrier_waveform": line})
 
                     menu_state = MenuState.MAIN
 
+        if simulated_device is not None:
+            print_statistics(statistics=stream.stats())
+            if arguments.simulate_output is not None:
+                output_samples: numpy.ndarray = \
+                    simulated_device.output_samples
+                wav_writer: WavWriter = WavWriter(
+                    file_name=arguments.simulate_output,
+                    sampling_frequency=parameters.sampling_frequency,
+                    number_of_channels=output_samples.shape[1],
+                    number_of_frames=output_samples.shape[0])
+                wav_writer.write(start_frame=0, block=output_samples)
+                wav_writer.close()
+
     except BaseException as e:
         print(type(e))
         print(e)
         print("Stopping main thread.")
 
     finally:
-        plot.close()
+        if control_client is not None:
+            control_client.close()
+        if control_server is not None:
+            control_server.close()
+        config_watcher.close()
+        if statistics_logger is not None:
+            statistics_logger.close()
+        if plot is not None:
+            plot.close()
+        if spectrum_analyzer is not None:
+            spectrum_analyzer.close()
         stream.close()
+        if recorder is not None:
+            recorder.close()
+        noise_generator.close()
+        parameters.close()
+
+        steady_state_time_s: float = \
+            time.perf_counter() - steady_state_start_time_s
+        steady_state_cpu_time_s: float = \
+            time.process_time() - startup_cpu_time_s
+        print("Average CPU load = "
+              f"{steady_state_cpu_time_s / steady_state_time_s * 100:.1f} %")
         
 
 if __name__ == "__main__":
@@ -0,0 +1,112 @@
+from typing import Any, Callable
+
+from audio_backend import AudioBackend
+
+
+class ManualBackend(AudioBackend):
+    def __init__(self) -> None:
+        """Initialize a backend whose callback is called by its owner.
+
+        Nothing calls the callback on its own, every buffer is passed
+        by call() from the owner's thread, so the owner decides
+        what happens between buffers and times every callback.
+        """
+        super().__init__()
+
+        self._number_of_channels: int = 1
+        self._samples_per_buffer: int = 1
+        self._stream_callback: Callable[[bytes, int, Any, int],
+                                        tuple[Any, int]] | None = None
+        self._is_active: bool = False
+
+    def open(self,
+             sampling_frequency: int,
+             number_of_channels: int,
+             samples_per_buffer: int,
+             stream_callback: Callable[[bytes, int, Any, int],
+                                       tuple[Any, int]]) -> None:
+        """Keep stream callback until backend is closed.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            number_of_channels (int): number of interleaved channels
+            of input and output.
+            samples_per_buffer (int): number of frames in a buffer.
+            stream_callback (Callable[[bytes, int, Any, int],
+            tuple[Any, int]]): stream callback.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        # Check arguments.
+        if((not isinstance(sampling_frequency, int)) or
+           (sampling_frequency <= 0) or
+           (not isinstance(number_of_channels, int)) or
+           (number_of_channels <= 0) or
+           (not isinstance(samples_per_buffer, int)) or
+           (samples_per_buffer <= 0) or
+           (not callable(stream_callback))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._number_of_channels = number_of_channels
+        self._samples_per_buffer = samples_per_buffer
+        self._stream_callback = stream_callback
+        self._is_active = True
+
+    def call(self, in_data: bytes, status_flags: int = 0) -> tuple[Any, int]:
+        """Call stream callback with one buffer.
+
+        Args:
+            in_data (bytes): raw bytes of interleaved float32 input frames
+            of one buffer.
+            status_flags (int): PortAudio status flags.
+
+        Raises:
+            ValueError: backend is not open.
+
+        Returns:
+            tuple[Any, int]: output frames and return code of callback.
+            Backend stops after a return code other than CONTINUE.
+        """
+        if self._is_active is False:
+            raise ValueError("ERROR! Backend is not open!")
+
+        output_data: Any
+        return_code: int
+        output_data, return_code = self._stream_callback(
+            in_data,
+            self._samples_per_buffer,
+            None,
+            status_flags)
+        if return_code != AudioBackend.CONTINUE:
+            self._is_active = False
+        return (output_data, return_code)
+
+    def is_active(self) -> bool:
+        """Return a flag that specifies whether callback may be called.
+
+        Returns:
+            bool: True - backend is open. False - backend is stopped.
+        """
+        return self._is_active
+
+    def get_input_latency(self) -> float:
+        """Return input latency.
+
+        Returns:
+            float: no latency, s.
+        """
+        return 0.0
+
+    def get_output_latency(self) -> float:
+        """Return output latency.
+
+        Returns:
+            float: no latency, s.
+        """
+        return 0.0
+
+    def close(self) -> None:
+        """Forget stream callback."""
+        self._is_active = False
+        self._stream_callback = None
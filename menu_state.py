@@ -4,4 +4,6 @@ class MenuState(Enum):
     MAIN = 0
     CHANGING_SINE_WAVE_FREQUENCY = 1
     CHANGING_NOISE = 2
-    CHANGING_VOLUME = 3
\ No newline at end of file
+    CHANGING_VOLUME = 3
+    SHOWING_STATISTICS = 4
+    CHANGING_CARRIER_WAVEFORM = 5
\ No newline at end of file
@@ -0,0 +1,6 @@
+from enum import Enum
+
+class NoiseColor(Enum):
+    WHITE = 0
+    PINK = 1
+    BROWN = 2
@@ -1,14 +1,298 @@
-import random
+import threading
+
+import numpy
+
+from noise_color import NoiseColor
 
 
 class NoiseGenerator:
-    @staticmethod    
-    def get_noise_point() -> float:
-        """Generate and return next noise point.
+    def __init__(self,
+                 noise_color: NoiseColor = NoiseColor.WHITE,
+                 seed: int | None = None,
+                 pool_size: int = 65536,
+                 batch_size: int = 8192,
+                 real_time: bool = True) -> None:
+        """Start generating noise in a background thread.
+
+        Noise is generated in batches and stored in a pool,
+        so getting noise points only copies memory.
+        The pool is filled before the constructor returns.
+        Getting noise points never locks and never waits:
+        if the pool runs out, available points are returned
+        and the rest of a block is silence, which is counted as underrun.
+        Noise points are always taken in the order they are generated,
+        so the same seed gives the same noise while the pool keeps up.
+        Pink and brown noise are shaped by recursive filters
+        whose state is carried from batch to batch,
+        so colored noise is continuous between batches.
+
+        Args:
+            noise_color (NoiseColor): white, pink or brown noise.
+            seed (int | None): seed of random generator.
+            None - use fresh entropy.
+            pool_size (int): number of noise points in the pool.
+            batch_size (int): number of noise points generated at once.
+            real_time (bool): True - refill the pool in a background thread.
+            False - no background thread, missing points are generated
+            in place, for offline rendering where waiting is allowed.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(noise_color, NoiseColor)) or
+           ((seed is not None) and (not isinstance(seed, int))) or
+           (not isinstance(pool_size, int)) or
+           (not isinstance(batch_size, int)) or
+           (batch_size <= 0) or
+           (pool_size < 2 * batch_size) or
+           (not isinstance(real_time, bool))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._NOISE_DIVIDER: int = 10000
+        # Background thread checks the pool this often, s.
+        self._REFILL_PERIOD: float = 0.005
+        # Pink noise is a sum of one-pole filters with these poles
+        # and gains plus a direct and a one point delayed input,
+        # refined pinking filter of Paul Kellet.
+        self._PINK_POLES: list[float] = \
+            [0.99886, 0.99332, 0.969, 0.8665, 0.55, -0.7616]
+        self._PINK_GAINS: list[float] = \
+            [0.0555179, 0.0750759, 0.153852, 0.3104856, 0.5329522, -0.016898]
+        self._PINK_DIRECT_GAIN: float = 0.5362
+        self._PINK_DELAYED_GAIN: float = 0.115926
+        # Brown noise is integrated white noise with a slow leak,
+        # so it does not drift away.
+        self._BROWN_POLE: float = 0.999
+        # Impulse response this long settles for all poles.
+        self._IMPULSE_RESPONSE_SIZE: int = 65536
+
+        self._noise_color: NoiseColor = noise_color
+        self._random_generator: numpy.random.Generator = \
+            numpy.random.default_rng(seed)
+
+        self._batch_size: int = batch_size
+        self._create_shaping_filter()
+
+        # Indices only grow. Pool position is index modulo pool size.
+        # Write index is changed by the generating thread only,
+        # read index is changed by the consuming thread only.
+        # Python assignments of indices are atomic, so no lock is needed.
+        self._pool: numpy.ndarray = numpy.zeros(pool_size, dtype=numpy.float64)
+        self._read_index: int = 0
+        self._write_index: int = 0
+        self._underrun_points: int = 0
+
+        self._real_time: bool = real_time
+        while self._is_pool_full() is False:
+            self._generate_batch()
+
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+        if real_time is True:
+            self._thread = threading.Thread(target=self._refill_pool,
+                                            name="NoiseGenerator",
+                                            daemon=True)
+            self._thread.start()
+
+    def _create_shaping_filter(self) -> None:
+        """Create a filter that shapes white noise into noise color.
+
+        Filter is a sum of parallel one-pole sections. Its gain is chosen
+        so colored noise keeps the same power as white noise.
+        """
+        self._poles: numpy.ndarray = numpy.empty(0)
+        self._section_gains: numpy.ndarray = numpy.empty(0)
+        self._direct_gain: float = 1.0
+        self._delayed_gain: float = 0.0
+        match self._noise_color:
+            case NoiseColor.PINK:
+                self._poles = numpy.array(self._PINK_POLES)
+                self._section_gains = numpy.array(self._PINK_GAINS)
+                self._direct_gain = self._PINK_DIRECT_GAIN
+                self._delayed_gain = self._PINK_DELAYED_GAIN
+            case NoiseColor.BROWN:
+                self._poles = numpy.array([self._BROWN_POLE])
+                self._section_gains = numpy.array([1.0])
+                self._direct_gain = 0.0
+
+        # Outputs of sections and input point before the next batch.
+        self._section_states: numpy.ndarray = numpy.zeros(self._poles.size)
+        self._previous_point: float = 0.0
+        if self._noise_color is NoiseColor.WHITE:
+            return
+
+        # Keep the same power as white noise.
+        impulse: numpy.ndarray = numpy.zeros(self._IMPULSE_RESPONSE_SIZE)
+        impulse[0] = 1.0
+        impulse_response: numpy.ndarray = self._shape(impulse)
+        gain: float = float(numpy.sqrt(numpy.sum(impulse_response ** 2)))
+        self._section_gains /= gain
+        self._direct_gain /= gain
+        self._delayed_gain /= gain
+        self._section_states[:] = 0.0
+        self._previous_point = 0.0
+
+    def _shape(self, batch: numpy.ndarray) -> numpy.ndarray:
+        """Filter a batch of white noise and keep filter state.
+
+        Recursion y[n] = pole * y[n - 1] + gain * x[n] of every section
+        is calculated for the whole batch at once by doubling:
+        after a step with shift s every point holds
+        the sum of the last 2s inputs weighted by powers of pole.
+
+        Args:
+            batch (numpy.ndarray): float64 white noise points.
+
+        Returns:
+            numpy.ndarray: float64 colored noise points.
+        """
+        sections: numpy.ndarray = \
+            self._section_gains.reshape(-1, 1) * batch
+        sections[:, 0] += self._poles * self._section_states
+
+        pole_powers: numpy.ndarray = self._poles.reshape(-1, 1).copy()
+        shift: int = 1
+        while shift < batch.size:
+            sections[:, shift:] += pole_powers * sections[:, :-shift]
+            pole_powers *= pole_powers
+            shift *= 2
+        self._section_states = sections[:, -1].copy()
+
+        shaped_batch: numpy.ndarray = numpy.sum(sections, axis=0)
+        shaped_batch += self._direct_gain * batch
+        if self._delayed_gain != 0.0:
+            shaped_batch[0] += self._delayed_gain * self._previous_point
+            shaped_batch[1:] += self._delayed_gain * batch[:-1]
+        self._previous_point = float(batch[-1])
+        return shaped_batch
+
+    def _is_pool_full(self) -> bool:
+        """Return a flag that specifies whether the pool has no room for a batch.
+
+        Returns:
+            bool: True - pool is full. False - pool has room for a batch.
+        """
+        return ((self._write_index - self._read_index)
+                > (self._pool.size - self._batch_size))
+
+    def _generate_batch(self) -> None:
+        """Generate a batch of noise points and append it to the pool.
+
+        Must be called by one thread at a time.
+        """
+        batch: numpy.ndarray = self._random_generator.standard_normal(
+            self._batch_size)
+
+        if self._noise_color is not NoiseColor.WHITE:
+            batch = self._shape(batch)
+
+        batch /= self._NOISE_DIVIDER
+
+        start: int = self._write_index % self._pool.size
+        first_part_size: int = min(self._batch_size, self._pool.size - start)
+        self._pool[start:start + first_part_size] = batch[:first_part_size]
+        self._pool[:self._batch_size - first_part_size] = \
+            batch[first_part_size:]
+
+        # Points are in the pool before they become readable.
+        self._write_index = self._write_index + self._batch_size
+
+    def _refill_pool(self) -> None:
+        """Keep the pool full until generator is closed."""
+        while self._stop_event.is_set() is False:
+            if self._is_pool_full() is True:
+                self._stop_event.wait(self._REFILL_PERIOD)
+                continue
+            self._generate_batch()
+
+    def get_block(self,
+                  number_of_points: int,
+                  out: numpy.ndarray | None = None) -> numpy.ndarray:
+        """Return next noise points.
+
+        More points than the pool holds are taken in several parts.
+
+        Args:
+            number_of_points (int): number of noise points.
+            out (numpy.ndarray | None): float64 array to store noise points.
+            None - allocate a new array.
+
+        Raises:
+            ValueError: invalid argument.
+
+        Returns:
+            numpy.ndarray: next noise points.
+        """
+        # Check argument.
+        if((not isinstance(number_of_points, int)) or
+           (number_of_points < 0) or
+           ((out is not None) and (out.shape != (number_of_points,)))):
+            raise ValueError("ERROR! Invalid argument!")
+
+        if out is None:
+            out = numpy.empty(number_of_points, dtype=numpy.float64)
+
+        max_points: int = self._pool.size - self._batch_size
+        if number_of_points > max_points:
+            for start in range(0, number_of_points, max_points):
+                part_size: int = min(max_points, number_of_points - start)
+                self.get_block(part_size, out=out[start:start + part_size])
+            return out
+
+        if self._real_time is False:
+            while (self._write_index - self._read_index) < number_of_points:
+                self._generate_batch()
+
+        # Background thread fell behind, the rest of the block is silence.
+        available_points: int = min(number_of_points,
+                                    self._write_index - self._read_index)
+        if available_points < number_of_points:
+            self._underrun_points = \
+                self._underrun_points + number_of_points - available_points
+            out[available_points:] = 0.0
+
+        start: int = self._read_index % self._pool.size
+        first_part_size: int = min(available_points, self._pool.size - start)
+        out[:first_part_size] = self._pool[start:start + first_part_size]
+        out[first_part_size:available_points] = \
+            self._pool[:available_points - first_part_size]
+
+        self._read_index = self._read_index + available_points
+
+        return out
+
+    def get_noise_point(self) -> float:
+        """Return next noise point.
 
         Returns:
             float: next noise point.
         """
-        NOISE_DIVIDER: int = 10000
-        noise_point: float = random.gauss(mu=0.0, sigma=1.0) / NOISE_DIVIDER
-        return noise_point
\ No newline at end of file
+        noise_point: float = float(self.get_block(1)[0])
+        return noise_point
+
+    def close(self) -> None:
+        """Stop background thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    @property
+    def noise_color(self) -> NoiseColor:
+        """Return noise color.
+
+        Returns:
+            NoiseColor: noise color.
+        """
+        return self._noise_color
+
+    @property
+    def underrun_points(self) -> int:
+        """Return number of noise points replaced by silence.
+
+        Returns:
+            int: number of points that were not generated in time.
+        """
+        return self._underrun_points
@@ -0,0 +1,61 @@
+import numpy
+
+from effect_stage import EffectStage
+from noise_generator import NoiseGenerator
+from stream_parameters import StreamParameters
+
+
+class NoiseStage(EffectStage):
+    def __init__(self, noise_generator: NoiseGenerator) -> None:
+        """Initialize adding noise if "add noise" parameter is set.
+
+        Args:
+            noise_generator (NoiseGenerator): noise generator.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        super().__init__()
+
+        # Check argument.
+        if not isinstance(noise_generator, NoiseGenerator):
+            raise ValueError("ERROR! Invalid argument!")
+
+        self._noise_generator: NoiseGenerator = noise_generator
+
+        self._noise_points: numpy.ndarray = numpy.empty(0)
+        self._noise_block: numpy.ndarray = numpy.empty((0, 0))
+
+    def allocate(self,
+                 samples_per_buffer: int,
+                 number_of_channels: int) -> None:
+        """Allocate noise buffer for a number of frames.
+
+        Args:
+            samples_per_buffer (int): number of frames in a block.
+            number_of_channels (int): number of channels in a block.
+        """
+        # Noise of every channel is a contiguous part of a noise sequence,
+        # so colored noise keeps its spectrum.
+        noise_channels: numpy.ndarray = numpy.zeros(
+            (number_of_channels, samples_per_buffer),
+            dtype=numpy.float64)
+        self._noise_points = noise_channels.reshape(-1)
+        self._noise_block = noise_channels.T
+
+    def process(self,
+                block: numpy.ndarray,
+                parameters: StreamParameters) -> None:
+        """Add noise to a block in place.
+
+        Args:
+            block (numpy.ndarray): float64 block of shape
+            (frames, channels).
+            parameters (StreamParameters): parameters for this block.
+        """
+        if parameters.add_noise is False:
+            return
+
+        self._noise_generator.get_block(self._noise_points.shape[0],
+                                        out=self._noise_points)
+        numpy.add(block, self._noise_block, out=block)
@@ -0,0 +1,130 @@
+import math
+
+import numpy
+
+from ramp_shape import RampShape
+
+
+class ParameterSmoother:
+    def __init__(self,
+                 value: int | float,
+                 ramp_samples: int,
+                 ramp_shape: RampShape) -> None:
+        """Initialize smoothing of a parameter that changes between blocks.
+
+        When a target changes, the parameter ramps from its current value
+        to the target over a number of samples instead of jumping,
+        which would click. A ramp is calculated for a whole block at once.
+        A settled parameter costs no array operations.
+        Must be used from one thread only.
+
+        Args:
+            value (int | float): initial value.
+            ramp_samples (int): ramp duration, samples. Exponential ramp
+            covers 99.9 % of a change in this time. 0 - do not smooth.
+            ramp_shape (RampShape): ramp shape.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(value, (int, float))) or
+           (not isinstance(ramp_samples, int)) or
+           (ramp_samples < 0) or
+           (not isinstance(ramp_shape, RampShape))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        # Exponential ramp ends when the rest of a change is this small.
+        self._SETTLED_RATIO: float = 0.001
+
+        self._value: float = value
+        self._target: float = value
+        self._ramp_samples: int = ramp_samples
+        self._ramp_shape: RampShape = ramp_shape
+
+        self._linear_step: float = 0.0
+        self._remaining_samples: int = 0
+        self._exponential_step: float = 0.0
+        if ramp_samples > 0:
+            self._exponential_step = \
+                math.exp(math.log(self._SETTLED_RATIO) / ramp_samples)
+
+        # Sample numbers 1..N or powers of exponential step for one block.
+        self._ramp_factors: numpy.ndarray = numpy.empty(0)
+
+    def get_block(self,
+                  target: int | float,
+                  out: numpy.ndarray) -> float | numpy.ndarray:
+        """Return parameter values of the next block.
+
+        Args:
+            target (int | float): target value. A different target
+            than in the previous block starts a new ramp
+            from the current value.
+            out (numpy.ndarray): float64 array of block size
+            to store values of a ramp.
+
+        Returns:
+            float | numpy.ndarray: value of a settled parameter
+            or out with a value of every sample.
+        """
+        if target == self._value:
+            self._target = target
+            return target
+
+        if self._ramp_samples == 0:
+            self._value = target
+            self._target = target
+            return target
+
+        number_of_points: int = out.shape[0]
+        if self._ramp_factors.shape[0] != number_of_points:
+            self._ramp_factors = numpy.arange(1,
+                                              number_of_points + 1,
+                                              dtype=numpy.float64)
+            if self._ramp_shape is RampShape.EXPONENTIAL:
+                numpy.power(self._exponential_step,
+                            self._ramp_factors,
+                            out=self._ramp_factors)
+
+        if target != self._target:
+            self._target = target
+            self._linear_step = (target - self._value) / self._ramp_samples
+            self._remaining_samples = self._ramp_samples
+
+        match self._ramp_shape:
+            case RampShape.EXPONENTIAL:
+                # Remaining distance shrinks by the same ratio every sample.
+                numpy.multiply(self._ramp_factors,
+                               self._value - target,
+                               out=out)
+                numpy.add(out, target, out=out)
+                if (abs(float(out[-1]) - target) <=
+                    self._SETTLED_RATIO * abs(target)):
+                    self._value = target
+                else:
+                    self._value = float(out[-1])
+            case _:
+                numpy.multiply(self._ramp_factors, self._linear_step, out=out)
+                numpy.add(out, self._value, out=out)
+                # Stop at the target in the last block of a ramp only.
+                if self._remaining_samples > number_of_points:
+                    self._remaining_samples -= number_of_points
+                    self._value = float(out[-1])
+                else:
+                    out[self._remaining_samples:] = target
+                    self._remaining_samples = 0
+                    self._value = target
+
+        return out
+
+    @property
+    def value(self) -> float:
+        """Return value of the last sample.
+
+        Returns:
+            float: value of the last sample.
+        """
+        return self._value
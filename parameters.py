@@ -1,5 +1,16 @@
 import json
-from typing import Any
+import os
+import tempfile
+import threading
+from enum import Enum
+from typing import Any, Callable
+
+from carrier_waveform import CarrierWaveform
+from effect_chain import EffectChain
+from execution_mode import ExecutionMode
+from noise_color import NoiseColor
+from ramp_shape import RampShape
+from xrun_recovery_policy import XrunRecoveryPolicy
 
 
 class Parameters:
@@ -10,35 +21,221 @@ class Parameters:
         Load current parameters from a configuration file.
         If a configuration file is not found or is invalid,
         save current parameters to a configuration file.
+        Configuration file is saved by a background thread,
+        parameters must be closed to save the last changes.
         """
         super().__init__()
 
         self._SAMPLING_FREQUENCY: int = 48000
-        self._SAMPLES_PER_BUFFER: int = 1024 # 21.33 ms
 
-        self._MIN_SINE_WAVE_FREQUENCY: int = 1
+        self._MIN_SINE_WAVE_FREQUENCY: float = 1.0
         self._MIN_VOLUME: float = 1.0
+        self._MIN_SAMPLES_PER_BUFFER: int = 16
+        self._MIN_MIN_LATENCY_MS: int = 1
+        self._MIN_MAX_CONSECUTIVE_XRUNS: int = 1
+        self._MIN_NUMBER_OF_CHANNELS: int = 1
+        self._MIN_SMOOTHING_RAMP_TIME_MS: float = 0.0
+        self._MIN_PLOT_FRAMES_PER_SECOND: int = 1
+        self._MIN_INTERNAL_SAMPLING_FREQUENCY: int = 8000
 
-        self._MAX_SINE_WAVE_FREQUENCY: int = 500
+        self._MAX_SINE_WAVE_FREQUENCY: float = 500.0
         self._MAX_VOLUME: float = 20.0
+        self._MAX_SAMPLES_PER_BUFFER: int = 8192
+        self._MAX_MIN_LATENCY_MS: int = 1000
+        self._MAX_MAX_CONSECUTIVE_XRUNS: int = 1000
+        self._MAX_NUMBER_OF_CHANNELS: int = 32
+        self._MAX_SMOOTHING_RAMP_TIME_MS: float = 1000.0
+        self._MAX_PLOT_FRAMES_PER_SECOND: int = 60
+        self._MAX_INTERNAL_SAMPLING_FREQUENCY: int = self._SAMPLING_FREQUENCY
         
-        self._DEFAULT_SINE_WAVE_FREQUENCY: int = 220
+        self._DEFAULT_SINE_WAVE_FREQUENCY: float = 220.0
         self._DEFAULT_ADD_NOISE: bool = True
         self._DEFAULT_VOLUME: float = self._MIN_VOLUME
+        self._DEFAULT_NOISE_COLOR: NoiseColor = NoiseColor.WHITE
+        self._DEFAULT_HEADLESS: bool = False
+        self._DEFAULT_SAMPLES_PER_BUFFER: int = 1024 # 21.33 ms
+        # None - PortAudio default minimum latency.
+        self._DEFAULT_MIN_LATENCY_MS: int | None = None
+        self._DEFAULT_XRUN_RECOVERY_POLICY: XrunRecoveryPolicy = \
+            XrunRecoveryPolicy.ABORT
+        self._DEFAULT_MAX_CONSECUTIVE_XRUNS: int = 1
+        self._DEFAULT_EXECUTION_MODE: ExecutionMode = ExecutionMode.IN_CALLBACK
+        self._DEFAULT_NUMBER_OF_CHANNELS: int = 1
+        # Empty - all channels get the same sine wave.
+        self._DEFAULT_CARRIER_PHASE_OFFSETS: list[int | float] = []
+        self._DEFAULT_CARRIER_WAVEFORM: CarrierWaveform = CarrierWaveform.SINE
+        # 0 - volume and frequency change at once.
+        self._DEFAULT_SMOOTHING_RAMP_TIME_MS: float = 20.0
+        self._DEFAULT_SMOOTHING_RAMP_SHAPE: RampShape = RampShape.LINEAR
+        self._DEFAULT_EFFECT_CHAIN: list[dict[str, Any]] = \
+            EffectChain.get_default_description()
+        self._DEFAULT_PLOT_FRAMES_PER_SECOND: int = 20
+        # Sampling frequency - voice is not resampled.
+        self._DEFAULT_INTERNAL_SAMPLING_FREQUENCY: int = \
+            self._SAMPLING_FREQUENCY
                 
-        self._sine_wave_frequency: int = self._DEFAULT_SINE_WAVE_FREQUENCY
+        self._sine_wave_frequency: float = self._DEFAULT_SINE_WAVE_FREQUENCY
         self._add_noise: bool = self._DEFAULT_ADD_NOISE
         self._volume: float = self._DEFAULT_VOLUME
+        self._noise_color: NoiseColor = self._DEFAULT_NOISE_COLOR
+        self._headless: bool = self._DEFAULT_HEADLESS
+        self._samples_per_buffer: int = self._DEFAULT_SAMPLES_PER_BUFFER
+        self._min_latency_ms: int | None = self._DEFAULT_MIN_LATENCY_MS
+        self._xrun_recovery_policy: XrunRecoveryPolicy = \
+            self._DEFAULT_XRUN_RECOVERY_POLICY
+        self._max_consecutive_xruns: int = self._DEFAULT_MAX_CONSECUTIVE_XRUNS
+        self._execution_mode: ExecutionMode = self._DEFAULT_EXECUTION_MODE
+        self._number_of_channels: int = self._DEFAULT_NUMBER_OF_CHANNELS
+        self._carrier_phase_offsets: list[int | float] = \
+            list(self._DEFAULT_CARRIER_PHASE_OFFSETS)
+        self._carrier_waveform: CarrierWaveform = \
+            self._DEFAULT_CARRIER_WAVEFORM
+        self._smoothing_ramp_time_ms: float = \
+            self._DEFAULT_SMOOTHING_RAMP_TIME_MS
+        self._smoothing_ramp_shape: RampShape = \
+            self._DEFAULT_SMOOTHING_RAMP_SHAPE
+        self._effect_chain: list[dict[str, Any]] = \
+            self._DEFAULT_EFFECT_CHAIN
+        self._plot_frames_per_second: int = \
+            self._DEFAULT_PLOT_FRAMES_PER_SECOND
+        self._internal_sampling_frequency: int = \
+            self._DEFAULT_INTERNAL_SAMPLING_FREQUENCY
         
         self._CONFIG_FILE_NAME: str = "config.json"
         self._SINE_WAVE_FREQUENCY_JSON_KEY: str = "sine_wave_frequency"
         self._ADD_NOISE_JSON_KEY: str = "add_noise"
         self._VOLUME_JSON_KEY: str = "volume"
+        self._NOISE_COLOR_JSON_KEY: str = "noise_color"
+        self._HEADLESS_JSON_KEY: str = "headless"
+        self._SAMPLES_PER_BUFFER_JSON_KEY: str = "samples_per_buffer"
+        self._MIN_LATENCY_MS_JSON_KEY: str = "min_latency_ms"
+        self._XRUN_RECOVERY_POLICY_JSON_KEY: str = "xrun_recovery_policy"
+        self._MAX_CONSECUTIVE_XRUNS_JSON_KEY: str = "max_consecutive_xruns"
+        self._EXECUTION_MODE_JSON_KEY: str = "execution_mode"
+        self._NUMBER_OF_CHANNELS_JSON_KEY: str = "number_of_channels"
+        self._CARRIER_PHASE_OFFSETS_JSON_KEY: str = "carrier_phase_offsets"
+        self._CARRIER_WAVEFORM_JSON_KEY: str = "carrier_waveform"
+        self._SMOOTHING_RAMP_TIME_MS_JSON_KEY: str = "smoothing_ramp_time_ms"
+        self._SMOOTHING_RAMP_SHAPE_JSON_KEY: str = "smoothing_ramp_shape"
+        self._EFFECT_CHAIN_JSON_KEY: str = "effect_chain"
+        self._PLOT_FRAMES_PER_SECOND_JSON_KEY: str = "plot_frames_per_second"
+        self._INTERNAL_SAMPLING_FREQUENCY_JSON_KEY: str = \
+            "internal_sampling_frequency"
+        # Config file without these keys is invalid as a whole.
+        self._REQUIRED_JSON_KEYS: tuple[str, ...] = (
+            self._SINE_WAVE_FREQUENCY_JSON_KEY,
+            self._ADD_NOISE_JSON_KEY,
+            self._VOLUME_JSON_KEY)
+
+        # Saves during this time are written to config file once.
+        self._SAVE_DEBOUNCE_S: float = 0.5
+
+        # Parameters are changed by control server and config watcher.
+        self._mutex: threading.Lock = threading.Lock()
+        # Modification time of config file when it was loaded or saved.
+        # Any other modification time means someone else changed it.
+        self._config_mtime_ns: int | None = None
+        # Values of parameters that take effect after restart,
+        # as someone else wrote them to config file while running.
+        # They are saved instead of current values, so they are not lost.
+        self._pending_restart_values: dict[str, Any] = {}
+
+        self._save_pending: bool = False
+        self._save_event: threading.Event = threading.Event()
+        self._stop_event: threading.Event = threading.Event()
+        self._saver_thread: threading.Thread = threading.Thread(
+            target=self._run_saver,
+            name="ParametersSaver",
+            daemon=True)
+        self._saver_thread.start()
 
         load_status: bool = self._load()
         if load_status is False:
             self._save()
 
+    def _get_config_file_parameters(self) \
+            -> list[tuple[str, type[Enum] | None, Callable[[Any], bool], Any]]:
+        """Return parameters of a configuration file in loading order.
+
+        Every parameter is kept in an attribute named after its key.
+        Parameters stored as names are converted to their enum type.
+        Number of channels is loaded before carrier phase offsets,
+        effect chain before internal sampling frequency,
+        because checks of the latter depend on the former.
+
+        Returns:
+            list[tuple[str, type[Enum] | None, Callable[[Any], bool], Any]]:
+            config file key, enum type or None - value is kept as is,
+            check and default value of every parameter.
+        """
+        return [
+            (self._SINE_WAVE_FREQUENCY_JSON_KEY, None,
+             self._check_sine_wave_frequency,
+             self._DEFAULT_SINE_WAVE_FREQUENCY),
+            (self._ADD_NOISE_JSON_KEY, None,
+             self._check_add_noise,
+             self._DEFAULT_ADD_NOISE),
+            (self._VOLUME_JSON_KEY, None,
+             self._check_volume,
+             self._DEFAULT_VOLUME),
+            (self._NOISE_COLOR_JSON_KEY, NoiseColor,
+             self._check_noise_color,
+             self._DEFAULT_NOISE_COLOR),
+            (self._HEADLESS_JSON_KEY, None,
+             self._check_headless,
+             self._DEFAULT_HEADLESS),
+            (self._SAMPLES_PER_BUFFER_JSON_KEY, None,
+             self._check_samples_per_buffer,
+             self._DEFAULT_SAMPLES_PER_BUFFER),
+            (self._MIN_LATENCY_MS_JSON_KEY, None,
+             self._check_min_latency_ms,
+             self._DEFAULT_MIN_LATENCY_MS),
+            (self._XRUN_RECOVERY_POLICY_JSON_KEY, XrunRecoveryPolicy,
+             self._check_xrun_recovery_policy,
+             self._DEFAULT_XRUN_RECOVERY_POLICY),
+            (self._MAX_CONSECUTIVE_XRUNS_JSON_KEY, None,
+             self._check_max_consecutive_xruns,
+             self._DEFAULT_MAX_CONSECUTIVE_XRUNS),
+            (self._EXECUTION_MODE_JSON_KEY, ExecutionMode,
+             self._check_execution_mode,
+             self._DEFAULT_EXECUTION_MODE),
+            (self._NUMBER_OF_CHANNELS_JSON_KEY, None,
+             self._check_number_of_channels,
+             self._DEFAULT_NUMBER_OF_CHANNELS),
+            (self._CARRIER_PHASE_OFFSETS_JSON_KEY, None,
+             self._check_carrier_phase_offsets,
+             self._DEFAULT_CARRIER_PHASE_OFFSETS),
+            (self._CARRIER_WAVEFORM_JSON_KEY, CarrierWaveform,
+             self._check_carrier_waveform,
+             self._DEFAULT_CARRIER_WAVEFORM),
+            (self._SMOOTHING_RAMP_TIME_MS_JSON_KEY, None,
+             self._check_smoothing_ramp_time_ms,
+             self._DEFAULT_SMOOTHING_RAMP_TIME_MS),
+            (self._SMOOTHING_RAMP_SHAPE_JSON_KEY, RampShape,
+             self._check_smoothing_ramp_shape,
+             self._DEFAULT_SMOOTHING_RAMP_SHAPE),
+            (self._EFFECT_CHAIN_JSON_KEY, None,
+             self._check_effect_chain,
+             self._DEFAULT_EFFECT_CHAIN),
+            (self._PLOT_FRAMES_PER_SECOND_JSON_KEY, None,
+             self._check_plot_frames_per_second,
+             self._DEFAULT_PLOT_FRAMES_PER_SECOND),
+            (self._INTERNAL_SAMPLING_FREQUENCY_JSON_KEY, None,
+             self._check_internal_sampling_frequency,
+             self._DEFAULT_INTERNAL_SAMPLING_FREQUENCY)
+        ]
+
+    def _set_default(self, key: str, default: Any) -> None:
+        """Set default value of a parameter.
+
+        Args:
+            key (str): config file key.
+            default (Any): default value.
+        """
+        if isinstance(default, list):
+            default = list(default)
+        setattr(self, "_" + key, default)
+
     def _load(self) -> bool:
         """Load current parameters from a configuration file.
 
@@ -49,81 +246,349 @@ class Parameters:
         load_status: bool = True
 
         try:
+            self._config_mtime_ns = \
+                os.stat(self._CONFIG_FILE_NAME).st_mtime_ns
             with open(self._CONFIG_FILE_NAME, "r") as config_file:
                 parameters_from_config_file = json.load(config_file)
 
-                sine_wave_frequency_from_config_file: int = \
-                    parameters_from_config_file[
-                        self._SINE_WAVE_FREQUENCY_JSON_KEY]
-                
-                add_noise_from_config_file: bool = \
-                    parameters_from_config_file[self._ADD_NOISE_JSON_KEY]
-                
-                volume_from_config_file: float = \
-                    parameters_from_config_file[self._VOLUME_JSON_KEY]
-                
-                print("Parameters are loaded from config file successfully.")
-                
-                # Check parameters.
-                result: bool = True
-
-                result = self._check_sine_wave_frequency(
-                    sine_wave_frequency=sine_wave_frequency_from_config_file)
-                if result is True:
-                    self._sine_wave_frequency = \
-                        sine_wave_frequency_from_config_file
-                else:
-                    print("ERROR! Using default \"sine wave frequency\"!")
-                    self._sine_wave_frequency = \
-                        self._DEFAULT_SINE_WAVE_FREQUENCY
-                    load_status = False
+            # Other parameters are optional.
+            for key in self._REQUIRED_JSON_KEYS:
+                if key not in parameters_from_config_file:
+                    raise KeyError(key)
 
-                result = self._check_add_noise(
-                    add_noise=add_noise_from_config_file)
-                if result is True:
-                    self._add_noise = add_noise_from_config_file
-                else:
-                    print("ERROR! Using default \"add noise\"!")
-                    self._add_noise = self._DEFAULT_ADD_NOISE
-                    load_status = False
+            print("Parameters are loaded from config file successfully.")
 
-                result = self._check_volume(
-                    volume=volume_from_config_file)
-                if result is True:
-                    self._volume = volume_from_config_file
+            # Check parameters.
+            for key, enum_type, check, default in \
+                self._get_config_file_parameters():
+                value: Any = default
+                if key in parameters_from_config_file:
+                    value = parameters_from_config_file[key]
+                elif enum_type is not None:
+                    value = default.name.lower()
+
+                if check(value) is True:
+                    if enum_type is not None:
+                        value = enum_type[value.upper()]
+                    setattr(self, "_" + key, value)
                 else:
-                    print("ERROR! Using default \"volume\"!")
-                    self._volume = self._DEFAULT_VOLUME
+                    print("ERROR! Using default "
+                          f"\"{key.replace('_', ' ')}\"!")
+                    self._set_default(key=key, default=default)
                     load_status = False
 
-        except (OSError, json.JSONDecodeError, KeyError) as e:
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
             print(type(e))
             print(e)
             print("ERROR! Could not load parameters from config file!")
             print("ERROR! Using default parameters!")
-            self._sine_wave_frequency = self._DEFAULT_SINE_WAVE_FREQUENCY
-            self._add_noise = self._DEFAULT_ADD_NOISE
-            self._volume = self._DEFAULT_VOLUME
+            for key, _, _, default in self._get_config_file_parameters():
+                self._set_default(key=key, default=default)
             load_status = False
     
         return load_status
 
     def _save(self) -> None:
-        """Save current parameters to a configuration file."""
-        parameters_to_config_file = {
-            self._SINE_WAVE_FREQUENCY_JSON_KEY:self._sine_wave_frequency,
-            self._ADD_NOISE_JSON_KEY:self._add_noise,
-            self._VOLUME_JSON_KEY:self._volume
-        }
+        """Schedule saving of current parameters to a configuration file.
+
+        Caller does not wait for a disk.
+        """
+        self._save_pending = True
+        self._save_event.set()
+
+    def _run_saver(self) -> None:
+        """Save parameters when they are changed until parameters are closed."""
+        while True:
+            self._save_event.wait()
+            # Wait for more changes, stop waiting if closed.
+            self._stop_event.wait(timeout=self._SAVE_DEBOUNCE_S)
+            self._save_event.clear()
+            if self._save_pending is True:
+                self._save_pending = False
+                self._write_config_file()
+            if self._stop_event.is_set() is True:
+                return
+
+    def _write_config_file(self) -> None:
+        """Write current parameters to a configuration file atomically.
 
+        Parameters are written to a temporary file in the same directory,
+        which then replaces configuration file. A crash during writing
+        leaves the previous configuration file intact.
+        """
+        with self._mutex:
+            parameters_to_config_file: dict[str, Any] = \
+                self._get_config_dict()
+
+        directory: str = \
+            os.path.dirname(os.path.abspath(self._CONFIG_FILE_NAME))
+        temporary_file_name: str | None = None
         try:
-            with open(self._CONFIG_FILE_NAME, "w") as config_file:
-                json.dump(parameters_to_config_file, config_file, indent=4)
-                print("Parameters are saved to config file successfully.")
+            with tempfile.NamedTemporaryFile(mode="w",
+                                             dir=directory,
+                                             prefix=".config.",
+                                             suffix=".tmp",
+                                             delete=False) as temporary_file:
+                temporary_file_name = temporary_file.name
+                json.dump(parameters_to_config_file, temporary_file, indent=4)
+                temporary_file.flush()
+                os.fsync(temporary_file.fileno())
+
+            # Config watcher does not see a file without its time.
+            with self._mutex:
+                os.replace(temporary_file_name, self._CONFIG_FILE_NAME)
+                self._config_mtime_ns = \
+                    os.stat(self._CONFIG_FILE_NAME).st_mtime_ns
+            print("Parameters are saved to config file successfully.")
         except OSError as e:
             print(type(e))
             print(e)
             print("ERROR! Could not save parameters to config file!")
+            if temporary_file_name is not None:
+                try:
+                    os.remove(temporary_file_name)
+                except OSError:
+                    pass
+
+    def _get_config_dict(self) -> dict[str, Any]:
+        """Return parameters as they are saved to a config file.
+
+        Returns:
+            dict[str, Any]: current parameters and values that take effect
+            after restart by config file keys.
+        """
+        config_dict: dict[str, Any] = self._get_current_config_dict()
+        config_dict.update(self._pending_restart_values)
+        return config_dict
+
+    def _get_current_config_dict(self) -> dict[str, Any]:
+        """Return parameters in use in the format of a config file.
+
+        Returns:
+            dict[str, Any]: current parameters by config file keys.
+        """
+        return {
+            self._SINE_WAVE_FREQUENCY_JSON_KEY:self._sine_wave_frequency,
+            self._ADD_NOISE_JSON_KEY:self._add_noise,
+            self._VOLUME_JSON_KEY:self._volume,
+            self._NOISE_COLOR_JSON_KEY:self._noise_color.name.lower(),
+            self._HEADLESS_JSON_KEY:self._headless,
+            self._SAMPLES_PER_BUFFER_JSON_KEY:self._samples_per_buffer,
+            self._MIN_LATENCY_MS_JSON_KEY:self._min_latency_ms,
+            self._XRUN_RECOVERY_POLICY_JSON_KEY:
+                self._xrun_recovery_policy.name.lower(),
+            self._MAX_CONSECUTIVE_XRUNS_JSON_KEY:self._max_consecutive_xruns,
+            self._EXECUTION_MODE_JSON_KEY:self._execution_mode.name.lower(),
+            self._NUMBER_OF_CHANNELS_JSON_KEY:self._number_of_channels,
+            self._CARRIER_PHASE_OFFSETS_JSON_KEY:self._carrier_phase_offsets,
+            self._CARRIER_WAVEFORM_JSON_KEY:self._carrier_waveform.name.lower(),
+            self._SMOOTHING_RAMP_TIME_MS_JSON_KEY:self._smoothing_ramp_time_ms,
+            self._SMOOTHING_RAMP_SHAPE_JSON_KEY:
+                self._smoothing_ramp_shape.name.lower(),
+            self._EFFECT_CHAIN_JSON_KEY:self._effect_chain,
+            self._PLOT_FRAMES_PER_SECOND_JSON_KEY:self._plot_frames_per_second,
+            self._INTERNAL_SAMPLING_FREQUENCY_JSON_KEY:
+                self._internal_sampling_frequency
+        }
+
+    def close(self) -> None:
+        """Save the last changes and stop saving."""
+        self._stop_event.set()
+        self._save_event.set()
+        self._saver_thread.join()
+
+    def change(self,
+               changes: dict[str, Any],
+               apply: Callable[[dict[str, Any]], None] | None = None) -> bool:
+        """Check, set and save several parameters at once.
+
+        Sine wave frequency, "add noise" parameter, volume
+        and carrier waveform name can be changed. If any of them
+        is invalid, none of them is changed.
+        Changes are applied and set while parameters are locked,
+        so a concurrent reload can not interleave with them.
+
+        Args:
+            changes (dict[str, Any]): new values by config file keys.
+            apply (Callable[[dict[str, Any]], None] | None): applies
+            checked changes, with carrier waveform as CarrierWaveform,
+            before they are set, e.g. Stream.change_parameters.
+            If it raises ValueError, nothing is changed.
+            None - changes are only set and saved.
+
+        Returns:
+            bool: True - parameters are changed.
+            False - parameters are invalid and not changed.
+
+        Raises:
+            ValueError: apply rejected changes.
+        """
+        # Check all parameters before changing any of them.
+        if self.check_changes(changes=changes) is False:
+            return False
+
+        with self._mutex:
+            if apply is not None:
+                apply(self._get_applied_changes(changes=changes))
+            self._set_live_parameters(changes=changes)
+        self._save()
+        return True
+
+    def check_changes(self, changes: Any) -> bool:
+        """Check several parameters without changing them.
+
+        Args:
+            changes (Any): new values by config file keys.
+
+        Returns:
+            bool: True - all parameters can be changed to new values.
+            False - some parameter is invalid.
+        """
+        checks: dict[str, Callable[[Any], bool]] = \
+            self._get_live_parameter_checks()
+
+        if((not isinstance(changes, dict)) or
+           (len(changes) == 0)):
+            print("ERROR! Parameters to change must be a non-empty dict!")
+            return False
+        for name, value in changes.items():
+            if name not in checks:
+                print(f"ERROR! \"{name}\" can not be changed! "
+                      f"Parameters that can be changed are {list(checks)}!")
+                return False
+            if checks[name](value) is False:
+                return False
+        return True
+
+    def reload(self,
+               apply: Callable[[dict[str, Any]], None] | None = None
+               ) -> dict[str, Any]:
+        """Reload parameters that can change while streaming.
+
+        Configuration file is reloaded only if someone else changed it
+        since it was loaded or saved. Changed sine wave frequency,
+        "add noise" parameter, volume and carrier waveform name
+        are checked one by one, current values of invalid ones are kept.
+        Changes of other parameters take effect after restart,
+        until then they are kept as they are in the file
+        and saved with later changes instead of current values.
+        Configuration file is not rewritten.
+
+        Args:
+            apply (Callable[[dict[str, Any]], None] | None): applies
+            valid changed values, with carrier waveform as CarrierWaveform,
+            before they are set, while parameters are locked.
+            If it raises ValueError, current values are kept.
+            None - changes are only set.
+
+        Returns:
+            dict[str, Any]: valid changed values by config file keys.
+            Empty - nothing is changed.
+        """
+        with self._mutex:
+            try:
+                config_mtime_ns: int = \
+                    os.stat(self._CONFIG_FILE_NAME).st_mtime_ns
+            except OSError:
+                return {}
+            if config_mtime_ns == self._config_mtime_ns:
+                return {}
+            self._config_mtime_ns = config_mtime_ns
+
+            try:
+                with open(self._CONFIG_FILE_NAME, "r") as config_file:
+                    parameters_from_config_file = json.load(config_file)
+            except (OSError, json.JSONDecodeError) as e:
+                print(type(e))
+                print(e)
+                print("ERROR! Could not reload parameters from config file!")
+                return {}
+            if not isinstance(parameters_from_config_file, dict):
+                print("ERROR! Could not reload parameters from config file! "
+                      "Config file must contain a JSON object!")
+                return {}
+            print("Config file is changed. Reloading parameters.")
+
+            current_parameters: dict[str, Any] = \
+                self._get_current_config_dict()
+            checks: dict[str, Callable[[Any], bool]] = \
+                self._get_live_parameter_checks()
+            changes: dict[str, Any] = {}
+            for name, value in parameters_from_config_file.items():
+                if name not in current_parameters:
+                    continue
+                if name not in checks:
+                    if value == current_parameters[name]:
+                        self._pending_restart_values.pop(name, None)
+                    elif value != self._pending_restart_values.get(name):
+                        print(f"\"{name}\" takes effect after restart.")
+                        self._pending_restart_values[name] = value
+                elif value == current_parameters[name]:
+                    continue
+                elif checks[name](value) is True:
+                    changes[name] = value
+                else:
+                    print(f"ERROR! Keeping current \"{name}\"!")
+
+            if ((apply is not None) and
+                (len(changes) > 0)):
+                try:
+                    apply(self._get_applied_changes(changes=changes))
+                except ValueError as e:
+                    print(type(e))
+                    print(e)
+                    print("ERROR! Could not apply reloaded parameters!")
+                    return {}
+            self._set_live_parameters(changes=changes)
+        return changes
+
+    def _get_applied_changes(self,
+                             changes: dict[str, Any]) -> dict[str, Any]:
+        """Return checked changes as they are applied to a stream.
+
+        Args:
+            changes (dict[str, Any]): valid values by config file keys.
+
+        Returns:
+            dict[str, Any]: the same values, carrier waveform
+            as CarrierWaveform instead of its name.
+        """
+        applied_changes: dict[str, Any] = dict(changes)
+        if self._CARRIER_WAVEFORM_JSON_KEY in applied_changes:
+            applied_changes[self._CARRIER_WAVEFORM_JSON_KEY] = CarrierWaveform[
+                applied_changes[self._CARRIER_WAVEFORM_JSON_KEY].upper()]
+        return applied_changes
+
+    def _get_live_parameter_checks(self) -> dict[str, Callable[[Any], bool]]:
+        """Return checks of parameters that can change while streaming.
+
+        Returns:
+            dict[str, Callable[[Any], bool]]: checks by config file keys.
+        """
+        return {
+            self._SINE_WAVE_FREQUENCY_JSON_KEY:
+                self._check_sine_wave_frequency,
+            self._ADD_NOISE_JSON_KEY:self._check_add_noise,
+            self._VOLUME_JSON_KEY:self._check_volume,
+            self._CARRIER_WAVEFORM_JSON_KEY:self._check_carrier_waveform
+        }
+
+    def _set_live_parameters(self, changes: dict[str, Any]) -> None:
+        """Set checked parameters that can change while streaming.
+
+        Args:
+            changes (dict[str, Any]): valid values by config file keys.
+        """
+        for name, value in changes.items():
+            match name:
+                case self._SINE_WAVE_FREQUENCY_JSON_KEY:
+                    self._sine_wave_frequency = value
+                case self._ADD_NOISE_JSON_KEY:
+                    self._add_noise = value
+                case self._VOLUME_JSON_KEY:
+                    self._volume = value
+                case self._CARRIER_WAVEFORM_JSON_KEY:
+                    self._carrier_waveform = CarrierWaveform[value.upper()]
 
     def _check_sine_wave_frequency(self, sine_wave_frequency: Any) -> bool:
         """Check sine wave frequency.
@@ -136,14 +601,14 @@ class Parameters:
             False - sine wave frequency is invalid.
         """
         if ((sine_wave_frequency is not None) and
-            (isinstance(sine_wave_frequency, int)) and
+            (isinstance(sine_wave_frequency, (int, float))) and
             (sine_wave_frequency >= self._MIN_SINE_WAVE_FREQUENCY) and
             (sine_wave_frequency <= self._MAX_SINE_WAVE_FREQUENCY)):
             print("\"Sine wave frequency\" is valid.")
             return True
         else:
             print("ERROR! \"Sine wave frequency\" is invalid! "
-                  "\"Sine wave frequency\" must be int! "
+                  "\"Sine wave frequency\" must be int or float! "
                   "\"Sine wave frequency\" must be between "
                   f"{self._MIN_SINE_WAVE_FREQUENCY} and {self._MAX_SINE_WAVE_FREQUENCY}!")
             return False
@@ -190,6 +655,396 @@ class Parameters:
                   f"{self._MIN_VOLUME} and {self._MAX_VOLUME}!")
             return False
 
+    def _check_noise_color(self, noise_color: Any) -> bool:
+        """Check noise color.
+
+        Args:
+            noise_color (Any): noise color name.
+
+        Returns:
+            bool: True - noise color is valid.
+            False - noise color is invalid.
+        """
+        noise_color_names: list[str] = \
+            [color.name.lower() for color in NoiseColor]
+        if ((noise_color is not None) and
+            (isinstance(noise_color, str)) and
+            (noise_color.lower() in noise_color_names)):
+            print("\"Noise color\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Noise color\" is invalid! "
+                  "\"Noise color\" must be one of "
+                  f"{noise_color_names}!")
+            return False
+
+    def _check_headless(self, headless: Any) -> bool:
+        """Check "headless" argument.
+
+        Args:
+            headless (Any): "headless" argument.
+
+        Returns:
+            bool: True - "headless" argument is valid.
+            False - "headless" argument is invalid.
+        """
+        if ((headless is not None) and
+            (isinstance(headless, bool))):
+            print("\"Headless\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Headless\" is invalid! "
+                  "\"Headless\" must be bool!")
+            return False
+
+    def _check_samples_per_buffer(self, samples_per_buffer: Any) -> bool:
+        """Check number of samples in pyaudio input buffer.
+
+        Args:
+            samples_per_buffer (Any): number of samples in a buffer.
+
+        Returns:
+            bool: True - number of samples in a buffer is valid.
+            False - number of samples in a buffer is invalid.
+        """
+        if ((samples_per_buffer is not None) and
+            (isinstance(samples_per_buffer, int)) and
+            (not isinstance(samples_per_buffer, bool)) and
+            (samples_per_buffer >= self._MIN_SAMPLES_PER_BUFFER) and
+            (samples_per_buffer <= self._MAX_SAMPLES_PER_BUFFER) and
+            (samples_per_buffer % self.resampling_factor == 0)):
+            print("\"Samples per buffer\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Samples per buffer\" is invalid! "
+                  "\"Samples per buffer\" must be int! "
+                  "\"Samples per buffer\" must be between "
+                  f"{self._MIN_SAMPLES_PER_BUFFER} and {self._MAX_SAMPLES_PER_BUFFER} "
+                  f"and a multiple of {self.resampling_factor}!")
+            return False
+
+    def _check_min_latency_ms(self, min_latency_ms: Any) -> bool:
+        """Check PortAudio minimum latency.
+
+        Args:
+            min_latency_ms (Any): minimum latency, ms.
+            None - PortAudio default.
+
+        Returns:
+            bool: True - minimum latency is valid.
+            False - minimum latency is invalid.
+        """
+        if ((min_latency_ms is None) or
+            ((isinstance(min_latency_ms, int)) and
+             (not isinstance(min_latency_ms, bool)) and
+             (min_latency_ms >= self._MIN_MIN_LATENCY_MS) and
+             (min_latency_ms <= self._MAX_MIN_LATENCY_MS))):
+            print("\"Min latency\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Min latency\" is invalid! "
+                  "\"Min latency\" must be null or int! "
+                  "\"Min latency\" must be between "
+                  f"{self._MIN_MIN_LATENCY_MS} and {self._MAX_MIN_LATENCY_MS}!")
+            return False
+
+    def _check_xrun_recovery_policy(self, xrun_recovery_policy: Any) -> bool:
+        """Check xrun recovery policy.
+
+        Args:
+            xrun_recovery_policy (Any): xrun recovery policy name.
+
+        Returns:
+            bool: True - xrun recovery policy is valid.
+            False - xrun recovery policy is invalid.
+        """
+        xrun_recovery_policy_names: list[str] = \
+            [policy.name.lower() for policy in XrunRecoveryPolicy]
+        if ((xrun_recovery_policy is not None) and
+            (isinstance(xrun_recovery_policy, str)) and
+            (xrun_recovery_policy.lower() in xrun_recovery_policy_names)):
+            print("\"Xrun recovery policy\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Xrun recovery policy\" is invalid! "
+                  "\"Xrun recovery policy\" must be one of "
+                  f"{xrun_recovery_policy_names}!")
+            return False
+
+    def _check_max_consecutive_xruns(self, max_consecutive_xruns: Any) -> bool:
+        """Check number of consecutive xruns that abort the stream.
+
+        Args:
+            max_consecutive_xruns (Any): number of consecutive xruns.
+
+        Returns:
+            bool: True - number of consecutive xruns is valid.
+            False - number of consecutive xruns is invalid.
+        """
+        if ((max_consecutive_xruns is not None) and
+            (isinstance(max_consecutive_xruns, int)) and
+            (not isinstance(max_consecutive_xruns, bool)) and
+            (max_consecutive_xruns >= self._MIN_MAX_CONSECUTIVE_XRUNS) and
+            (max_consecutive_xruns <= self._MAX_MAX_CONSECUTIVE_XRUNS)):
+            print("\"Max consecutive xruns\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Max consecutive xruns\" is invalid! "
+                  "\"Max consecutive xruns\" must be int! "
+                  "\"Max consecutive xruns\" must be between "
+                  f"{self._MIN_MAX_CONSECUTIVE_XRUNS} and {self._MAX_MAX_CONSECUTIVE_XRUNS}!")
+            return False
+
+    def _check_execution_mode(self, execution_mode: Any) -> bool:
+        """Check execution mode.
+
+        Args:
+            execution_mode (Any): execution mode name.
+
+        Returns:
+            bool: True - execution mode is valid.
+            False - execution mode is invalid.
+        """
+        execution_mode_names: list[str] = \
+            [mode.name.lower() for mode in ExecutionMode]
+        if ((execution_mode is not None) and
+            (isinstance(execution_mode, str)) and
+            (execution_mode.lower() in execution_mode_names)):
+            print("\"Execution mode\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Execution mode\" is invalid! "
+                  "\"Execution mode\" must be one of "
+                  f"{execution_mode_names}!")
+            return False
+
+    def _check_number_of_channels(self, number_of_channels: Any) -> bool:
+        """Check number of channels.
+
+        Args:
+            number_of_channels (Any): number of channels.
+
+        Returns:
+            bool: True - number of channels is valid.
+            False - number of channels is invalid.
+        """
+        if ((number_of_channels is not None) and
+            (isinstance(number_of_channels, int)) and
+            (not isinstance(number_of_channels, bool)) and
+            (number_of_channels >= self._MIN_NUMBER_OF_CHANNELS) and
+            (number_of_channels <= self._MAX_NUMBER_OF_CHANNELS)):
+            print("\"Number of channels\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Number of channels\" is invalid! "
+                  "\"Number of channels\" must be int! "
+                  "\"Number of channels\" must be between "
+                  f"{self._MIN_NUMBER_OF_CHANNELS} and {self._MAX_NUMBER_OF_CHANNELS}!")
+            return False
+
+    def _check_carrier_phase_offsets(self,
+                                     carrier_phase_offsets: Any) -> bool:
+        """Check carrier phase offsets against current number of channels.
+
+        Args:
+            carrier_phase_offsets (Any): sine wave phase offset
+            of every channel, degrees.
+
+        Returns:
+            bool: True - carrier phase offsets are valid.
+            False - carrier phase offsets are invalid.
+        """
+        if ((carrier_phase_offsets is not None) and
+            (isinstance(carrier_phase_offsets, list)) and
+            ((len(carrier_phase_offsets) == 0) or
+             (len(carrier_phase_offsets) == self._number_of_channels)) and
+            (all((isinstance(offset, (int, float))) and
+                 (not isinstance(offset, bool))
+                 for offset in carrier_phase_offsets))):
+            print("\"Carrier phase offsets\" are valid.")
+            return True
+        else:
+            print("ERROR! \"Carrier phase offsets\" are invalid! "
+                  "\"Carrier phase offsets\" must be a list of int or float "
+                  "degrees! \"Carrier phase offsets\" must be empty or have "
+                  f"{self._number_of_channels} elements!")
+            return False
+
+    def _check_carrier_waveform(self, carrier_waveform: Any) -> bool:
+        """Check carrier waveform.
+
+        Args:
+            carrier_waveform (Any): carrier waveform name.
+
+        Returns:
+            bool: True - carrier waveform is valid.
+            False - carrier waveform is invalid.
+        """
+        carrier_waveform_names: list[str] = \
+            [waveform.name.lower() for waveform in CarrierWaveform]
+        if ((carrier_waveform is not None) and
+            (isinstance(carrier_waveform, str)) and
+            (carrier_waveform.lower() in carrier_waveform_names)):
+            print("\"Carrier waveform\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Carrier waveform\" is invalid! "
+                  "\"Carrier waveform\" must be one of "
+                  f"{carrier_waveform_names}!")
+            return False
+
+    def _check_smoothing_ramp_time_ms(self,
+                                      smoothing_ramp_time_ms: Any) -> bool:
+        """Check smoothing ramp time.
+
+        Args:
+            smoothing_ramp_time_ms (Any): smoothing ramp time, ms.
+
+        Returns:
+            bool: True - smoothing ramp time is valid.
+            False - smoothing ramp time is invalid.
+        """
+        if ((smoothing_ramp_time_ms is not None) and
+            (isinstance(smoothing_ramp_time_ms, (int, float))) and
+            (not isinstance(smoothing_ramp_time_ms, bool)) and
+            (smoothing_ramp_time_ms >= self._MIN_SMOOTHING_RAMP_TIME_MS) and
+            (smoothing_ramp_time_ms <= self._MAX_SMOOTHING_RAMP_TIME_MS)):
+            print("\"Smoothing ramp time\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Smoothing ramp time\" is invalid! "
+                  "\"Smoothing ramp time\" must be int or float! "
+                  "\"Smoothing ramp time\" must be between "
+                  f"{self._MIN_SMOOTHING_RAMP_TIME_MS} and {self._MAX_SMOOTHING_RAMP_TIME_MS}!")
+            return False
+
+    def _check_smoothing_ramp_shape(self, smoothing_ramp_shape: Any) -> bool:
+        """Check smoothing ramp shape.
+
+        Args:
+            smoothing_ramp_shape (Any): smoothing ramp shape name.
+
+        Returns:
+            bool: True - smoothing ramp shape is valid.
+            False - smoothing ramp shape is invalid.
+        """
+        ramp_shape_names: list[str] = \
+            [ramp_shape.name.lower() for ramp_shape in RampShape]
+        if ((smoothing_ramp_shape is not None) and
+            (isinstance(smoothing_ramp_shape, str)) and
+            (smoothing_ramp_shape.lower() in ramp_shape_names)):
+            print("\"Smoothing ramp shape\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Smoothing ramp shape\" is invalid! "
+                  "\"Smoothing ramp shape\" must be one of "
+                  f"{ramp_shape_names}!")
+            return False
+
+    def _check_effect_chain(self, effect_chain: Any) -> bool:
+        """Check effect chain description.
+
+        Ring modulator frequencies must be below Nyquist frequency
+        of current internal sampling frequency.
+
+        Args:
+            effect_chain (Any): effect chain description.
+
+        Returns:
+            bool: True - effect chain is valid.
+            False - effect chain is invalid.
+        """
+        stage_options: dict[str, list[str]] = {
+            stage_type.name.lower(): list(options)
+            for stage_type, options in EffectChain.STAGE_OPTIONS.items()}
+        if ((effect_chain is not None) and
+            (EffectChain.check_description(
+                description=effect_chain,
+                sampling_frequency=self._internal_sampling_frequency)
+             is True)):
+            print("\"Effect chain\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Effect chain\" is invalid! "
+                  "\"Effect chain\" must be a list of stages like "
+                  "{\"type\": \"gate\", \"threshold\": 0.01}! "
+                  "Stage types and their options are "
+                  f"{stage_options}! "
+                  "Only one \"ring_modulator\" may have no \"frequency\"! "
+                  "\"Frequency\" must be below "
+                  f"{self._internal_sampling_frequency / 2} Hz!")
+            return False
+
+    def _check_plot_frames_per_second(self,
+                                      plot_frames_per_second: Any) -> bool:
+        """Check plot frames per second.
+
+        Args:
+            plot_frames_per_second (Any): plot frames per second.
+
+        Returns:
+            bool: True - plot frames per second is valid.
+            False - plot frames per second is invalid.
+        """
+        if ((plot_frames_per_second is not None) and
+            (isinstance(plot_frames_per_second, int)) and
+            (not isinstance(plot_frames_per_second, bool)) and
+            (plot_frames_per_second >= self._MIN_PLOT_FRAMES_PER_SECOND) and
+            (plot_frames_per_second <= self._MAX_PLOT_FRAMES_PER_SECOND)):
+            print("\"Plot frames per second\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Plot frames per second\" is invalid! "
+                  "\"Plot frames per second\" must be int! "
+                  "\"Plot frames per second\" must be between "
+                  f"{self._MIN_PLOT_FRAMES_PER_SECOND} and {self._MAX_PLOT_FRAMES_PER_SECOND}!")
+            return False
+
+    def _check_internal_sampling_frequency(
+            self,
+            internal_sampling_frequency: Any) -> bool:
+        """Check internal sampling frequency.
+
+        Frequencies of ring modulator stages of current effect chain
+        must be below its Nyquist frequency. Current number of samples
+        in a buffer must be a multiple of resampling factor,
+        so every buffer is resampled into one whole internal block.
+
+        Args:
+            internal_sampling_frequency (Any): sampling frequency
+            of voice processing, Hz.
+
+        Returns:
+            bool: True - internal sampling frequency is valid.
+            False - internal sampling frequency is invalid.
+        """
+        if ((internal_sampling_frequency is not None) and
+            (isinstance(internal_sampling_frequency, int)) and
+            (not isinstance(internal_sampling_frequency, bool)) and
+            (internal_sampling_frequency >=
+             self._MIN_INTERNAL_SAMPLING_FREQUENCY) and
+            (internal_sampling_frequency <=
+             self._MAX_INTERNAL_SAMPLING_FREQUENCY) and
+            (self._SAMPLING_FREQUENCY % internal_sampling_frequency == 0) and
+            (self._samples_per_buffer %
+             (self._SAMPLING_FREQUENCY // internal_sampling_frequency)
+             == 0) and
+            (all(stage.get("frequency", 0) < internal_sampling_frequency / 2
+                 for stage in self._effect_chain))):
+            print("\"Internal sampling frequency\" is valid.")
+            return True
+        else:
+            print("ERROR! \"Internal sampling frequency\" is invalid! "
+                  "\"Internal sampling frequency\" must be int! "
+                  "\"Internal sampling frequency\" must be between "
+                  f"{self._MIN_INTERNAL_SAMPLING_FREQUENCY} and {self._MAX_INTERNAL_SAMPLING_FREQUENCY} "
+                  f"and divide {self._SAMPLING_FREQUENCY}! "
+                  "\"Samples per buffer\" divided by resampling factor "
+                  "must be int! "
+                  "Ring modulator frequencies of \"effect chain\" "
+                  "must be below half of it!")
+            return False
+
     @property
     def sampling_frequency(self) -> int:
         """Return current sampling frequency.
@@ -199,6 +1054,38 @@ class Parameters:
         """
         return self._SAMPLING_FREQUENCY
 
+    @property
+    def internal_sampling_frequency(self) -> int:
+        """Return sampling frequency of voice processing.
+
+        A lower frequency than sampling frequency lowers CPU load
+        only with an expensive effect chain, resampling costs more
+        than default processing saves.
+
+        Returns:
+            int: internal sampling frequency, Hz.
+            Sampling frequency - voice is not resampled.
+        """
+        return self._internal_sampling_frequency
+
+    @property
+    def resampling_factor(self) -> int:
+        """Return sampling frequency divided by internal sampling frequency.
+
+        Returns:
+            int: resampling factor. 1 - voice is not resampled.
+        """
+        return self._SAMPLING_FREQUENCY // self._internal_sampling_frequency
+
+    @property
+    def internal_samples_per_buffer(self) -> int:
+        """Return number of samples in a buffer at internal sampling frequency.
+
+        Returns:
+            int: number of samples in a buffer divided by resampling factor.
+        """
+        return self._samples_per_buffer // self.resampling_factor
+
     @property
     def samples_per_buffer(self) -> int:
         """Return current number of samples in pyaudio input buffer.
@@ -206,14 +1093,63 @@ class Parameters:
         Returns:
             int: current number of samples in pyaudio input buffer.
         """
-        return self._SAMPLES_PER_BUFFER
+        return self._samples_per_buffer
+
+    @samples_per_buffer.setter
+    def samples_per_buffer(self, new_samples_per_buffer: Any) -> None:
+        """Check, set and save new number of samples in pyaudio input buffer.
+
+        Args:
+            new_samples_per_buffer (Any): new number of samples in a buffer.
+        """
+        result: bool = self._check_samples_per_buffer(
+            samples_per_buffer=new_samples_per_buffer)
+        if result is True:
+            self._samples_per_buffer = new_samples_per_buffer
+        elif (self._DEFAULT_SAMPLES_PER_BUFFER % self.resampling_factor
+              == 0):
+            print("ERROR! Using default \"samples per buffer\"!")
+            self._samples_per_buffer = self._DEFAULT_SAMPLES_PER_BUFFER
+        else:
+            print("ERROR! Using current \"samples per buffer\"!")
+        self._pending_restart_values.pop(self._SAMPLES_PER_BUFFER_JSON_KEY,
+                                         None)
+        self._save()
+
+    @property
+    def min_latency_ms(self) -> int | None:
+        """Return current PortAudio minimum latency.
+
+        Returns:
+            int | None: current minimum latency, ms.
+            None - PortAudio default.
+        """
+        return self._min_latency_ms
+
+    @min_latency_ms.setter
+    def min_latency_ms(self, new_min_latency_ms: Any) -> None:
+        """Check, set and save new PortAudio minimum latency.
+
+        Args:
+            new_min_latency_ms (Any): new minimum latency, ms.
+            None - PortAudio default.
+        """
+        result: bool = self._check_min_latency_ms(
+            min_latency_ms=new_min_latency_ms)
+        if result is True:
+            self._min_latency_ms = new_min_latency_ms
+        else:
+            print("ERROR! Using default \"min latency\"!")
+            self._min_latency_ms = self._DEFAULT_MIN_LATENCY_MS
+        self._pending_restart_values.pop(self._MIN_LATENCY_MS_JSON_KEY, None)
+        self._save()
  
     @property
-    def sine_wave_frequency(self) -> int:
+    def sine_wave_frequency(self) -> float:
         """Return current sine wave frequency.
 
         Returns:
-            int: current sine wave frequency, Hz.
+            float: current sine wave frequency, Hz.
         """
         return self._sine_wave_frequency
     
@@ -279,4 +1215,141 @@ class Parameters:
         else:
             print("ERROR! Using default \"volume\"!")
             self._volume = self._DEFAULT_VOLUME
-        self._save()
\ No newline at end of file
+        self._save()
+
+    @property
+    def noise_color(self) -> NoiseColor:
+        """Return current noise color.
+
+        Returns:
+            NoiseColor: current noise color.
+        """
+        return self._noise_color
+
+    @property
+    def headless(self) -> bool:
+        """Return current "headless" parameter.
+
+        Returns:
+            bool: True - do not plot, matplotlib is not imported.
+            False - plot input voice, sine wave and modulated voice.
+        """
+        return self._headless
+
+    @property
+    def xrun_recovery_policy(self) -> XrunRecoveryPolicy:
+        """Return current xrun recovery policy.
+
+        Returns:
+            XrunRecoveryPolicy: current xrun recovery policy.
+        """
+        return self._xrun_recovery_policy
+
+    @property
+    def max_consecutive_xruns(self) -> int:
+        """Return number of consecutive xruns that abort the stream.
+
+        Used by ABORT xrun recovery policy only.
+
+        Returns:
+            int: number of consecutive xruns.
+        """
+        return self._max_consecutive_xruns
+
+    @property
+    def execution_mode(self) -> ExecutionMode:
+        """Return current execution mode.
+
+        Returns:
+            ExecutionMode: IN_CALLBACK - process input voice in audio
+            callback. WORKER_PROCESS - process input voice
+            in a separate process.
+        """
+        return self._execution_mode
+
+    @property
+    def number_of_channels(self) -> int:
+        """Return current number of channels.
+
+        Returns:
+            int: current number of interleaved channels.
+        """
+        return self._number_of_channels
+
+    @property
+    def carrier_phase_offsets(self) -> list[int | float] | None:
+        """Return current carrier phase offsets.
+
+        Returns:
+            list[int | float] | None: sine wave phase offset
+            of every channel, degrees. None - all channels get
+            the same sine wave.
+        """
+        if len(self._carrier_phase_offsets) == 0:
+            return None
+        return list(self._carrier_phase_offsets)
+
+    @property
+    def carrier_waveform(self) -> CarrierWaveform:
+        """Return current carrier waveform.
+
+        Returns:
+            CarrierWaveform: current carrier waveform.
+        """
+        return self._carrier_waveform
+
+    @carrier_waveform.setter
+    def carrier_waveform(self, new_carrier_waveform: Any) -> None:
+        """Check, set and save new carrier waveform.
+
+        Args:
+            new_carrier_waveform (Any): new carrier waveform name.
+        """
+        result: bool = self._check_carrier_waveform(
+            carrier_waveform=new_carrier_waveform)
+        if result is True:
+            self._carrier_waveform = \
+                CarrierWaveform[new_carrier_waveform.upper()]
+        else:
+            print("ERROR! Using default \"carrier waveform\"!")
+            self._carrier_waveform = self._DEFAULT_CARRIER_WAVEFORM
+        self._save()
+
+    @property
+    def smoothing_ramp_samples(self) -> int:
+        """Return duration of volume and frequency ramps.
+
+        Returns:
+            int: duration of volume and frequency ramps,
+            samples at internal sampling frequency.
+            0 - volume and frequency change at once.
+        """
+        return round(self._smoothing_ramp_time_ms
+                     * self._internal_sampling_frequency / 1000)
+
+    @property
+    def smoothing_ramp_shape(self) -> RampShape:
+        """Return shape of volume and frequency ramps.
+
+        Returns:
+            RampShape: shape of volume and frequency ramps.
+        """
+        return self._smoothing_ramp_shape
+
+    @property
+    def effect_chain(self) -> list[dict[str, Any]]:
+        """Return current effect chain description.
+
+        Returns:
+            list[dict[str, Any]]: effect chain stages in processing order.
+        """
+        return [dict(stage) for stage in self._effect_chain]
+
+    @property
+    def plot_frames_per_second(self) -> int:
+        """Return target frame rate of the plot.
+
+        Returns:
+            int: plot frames per second.
+        """
+        return self._plot_frames_per_second
\ No newline at end of file
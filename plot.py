@@ -1,5 +1,5 @@
-import queue
 import threading
+import time
 from typing import Any
 
 import matplotlib.animation
@@ -7,16 +7,36 @@ import matplotlib.axes
 import matplotlib.figure
 import matplotlib.lines
 import matplotlib.pyplot as plt
+import numpy
+
+from ring_buffer import RingBuffer
+from spectrum_analyzer import SpectrumAnalyzer
 
 
 class Plot:
     def __init__(self,
                  sampling_frequency: int,
                  samples_per_buffer: int,
-                 multithread_queue: queue.Queue[tuple[float, float, float]]) \
-                    -> None:
+                 plot_ring_buffer: RingBuffer,
+                 frames_per_second: int,
+                 spectrum_analyzer: SpectrumAnalyzer | None = None) -> None:
         """Start plotting input voice, sine wave and modulated voice.
 
+        Only lines are redrawn over a saved background (blitting),
+        axes, titles and legends are drawn once. Frame rate does not
+        depend on buffer size. If drawing a frame takes longer
+        than a frame interval, the next frame is skipped,
+        so redraws do not pile up in the GUI event loop.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            samples_per_buffer (int): number of points to plot.
+            plot_ring_buffer (RingBuffer): ring buffer with input voice,
+            sine wave and modulated voice.
+            frames_per_second (int): target frame rate.
+            spectrum_analyzer (SpectrumAnalyzer | None): analyzer
+            of the same ring buffer. None - do not plot spectra.
+
         Raises:
             ValueError: invalid arguments.
         """
@@ -27,37 +47,77 @@ class Plot:
            (sampling_frequency <= 0) or
            (not isinstance(samples_per_buffer, int)) or
            (samples_per_buffer <= 0) or
-           (not isinstance(multithread_queue, queue.Queue))):
+           (not isinstance(plot_ring_buffer, RingBuffer)) or
+           (not isinstance(frames_per_second, int)) or
+           (frames_per_second <= 0) or
+           ((spectrum_analyzer is not None) and
+            (not isinstance(spectrum_analyzer, SpectrumAnalyzer)))):
             raise ValueError("ERROR! Invalid arguments!")
 
-        self._samples_per_update_interval: int = samples_per_buffer
-        sample_time_ms: float = 1 / sampling_frequency * 1000
-        self._update_interval_ms: int = int(sample_time_ms
-                                            * self._samples_per_update_interval)
+        self._samples_per_frame: int = samples_per_buffer
+        self._update_interval_ms: int = round(1000 / frames_per_second)
+        self._update_interval_s: float = self._update_interval_ms / 1000
+
+        self._previous_frame_time_s: float = time.perf_counter()
+        self._skipped_frames: int = 0
+
+        self._plot_ring_buffer: RingBuffer = plot_ring_buffer
+        self._frame: numpy.ndarray = numpy.zeros(
+            (3, self._samples_per_frame), dtype=numpy.float32)
 
-        self._multithread_queue: queue.Queue[tuple[float, float, float]] = \
-            multithread_queue
+        self._spectrum_analyzer: SpectrumAnalyzer | None = spectrum_analyzer
 
         self._figure: matplotlib.figure.Figure = plt.figure()
-        self._axes: matplotlib.axes.Axes = self._figure.add_subplot()
+        number_of_subplots: int = 1
+        if spectrum_analyzer is not None:
+            number_of_subplots = 2
+        self._axes: matplotlib.axes.Axes = \
+            self._figure.add_subplot(number_of_subplots, 1, 1)
 
         self._input_voice_line: matplotlib.lines.Line2D
         self._sine_wave_line: matplotlib.lines.Line2D
         self._modulated_voice_line: matplotlib.lines.Line2D
         self._input_voice_line, *other_lines = self._axes.plot(
-            [], [], label="Input voice")
+            [], [], label="Input voice", animated=True)
         self._sine_wave_line, *other_lines = self._axes.plot(
-            [], [], label="Sine wave")
+            [], [], label="Sine wave", animated=True)
         self._modulated_voice_line, *other_lines = self._axes.plot(
-            [], [], label="Modulated voice")
+            [], [], label="Modulated voice", animated=True)
         
-        self._axes.set_xlim(left=0, right=self._samples_per_update_interval - 1)
+        self._axes.set_xlim(left=0, right=self._samples_per_frame - 1)
         self._axes.set_ylim(bottom=-1, top=1)
         self._axes.set_title(label="Audio signals")
         self._axes.set_xlabel(xlabel="Points")
         self._axes.set_ylabel(ylabel="Float value")  
         self._axes.legend(loc="lower left")
 
+        # Spectra are only drawn here, they are calculated by the analyzer.
+        self._spectrum_lines: tuple[matplotlib.lines.Line2D, ...] = ()
+        if spectrum_analyzer is not None:
+            spectrum_axes: matplotlib.axes.Axes = \
+                self._figure.add_subplot(number_of_subplots, 1, 2)
+            input_voice_spectrum_line: matplotlib.lines.Line2D
+            modulated_voice_spectrum_line: matplotlib.lines.Line2D
+            modulated_voice_peak_line: matplotlib.lines.Line2D
+            input_voice_spectrum_line, *other_lines = spectrum_axes.plot(
+                [], [], label="Input voice", animated=True)
+            modulated_voice_spectrum_line, *other_lines = spectrum_axes.plot(
+                [], [], label="Modulated voice", animated=True)
+            modulated_voice_peak_line, *other_lines = spectrum_axes.plot(
+                [], [], label="Modulated voice peaks", linestyle=":",
+                animated=True)
+            self._spectrum_lines = (input_voice_spectrum_line,
+                                    modulated_voice_spectrum_line,
+                                    modulated_voice_peak_line)
+
+            spectrum_axes.set_xlim(left=0, right=sampling_frequency / 2)
+            spectrum_axes.set_ylim(bottom=-120, top=0)
+            spectrum_axes.set_title(label="Spectra")
+            spectrum_axes.set_xlabel(xlabel="Frequency, Hz")
+            spectrum_axes.set_ylabel(ylabel="Power, dB")
+            spectrum_axes.legend(loc="upper right")
+            self._figure.tight_layout()
+
         self._running: bool = True
         self._mutex_running: threading.Lock = threading.Lock()
 
@@ -69,6 +129,7 @@ class Plot:
                 init_func=self._init_animation,
                 interval=self._update_interval_ms,
                 repeat=False,
+                blit=True,
                 cache_frame_data=False)
         plt.show(block=False)
 
@@ -80,84 +141,107 @@ class Plot:
             line to draw sine wave,
             line to draw modulated voice.
         """
-        x = [i for i in range(0, self._samples_per_update_interval, 1)]
-        y = [0.0] * self._samples_per_update_interval
+        x = [i for i in range(0, self._samples_per_frame, 1)]
+        y = [0.0] * self._samples_per_frame
 
         self._input_voice_line.set_data(x, y)
         self._sine_wave_line.set_data(x, y)
         self._modulated_voice_line.set_data(x, y)
 
+        if self._spectrum_analyzer is not None:
+            frequencies: numpy.ndarray = self._spectrum_analyzer.frequencies
+            floor: numpy.ndarray = numpy.full(frequencies.shape[0], -120.0)
+            for spectrum_line in self._spectrum_lines:
+                spectrum_line.set_data(frequencies, floor)
+
         return (self._input_voice_line,
                 self._sine_wave_line,
-                self._modulated_voice_line)
+                self._modulated_voice_line,
+                *self._spectrum_lines)
 
     def _get_frame_for_animation(self):
         """Return data for next animation frame.
 
-        Receive and return input voice, sine wave and modulated voice samples
-        from a multithread queue for plotting.
+        Copy the most recent input voice, sine wave and modulated voice
+        samples from a ring buffer for plotting. Does not wait for
+        new samples, the previous frame is repeated if there are none.
+        Take the latest spectrum, which is not copied,
+        because the analyzer replaces it instead of changing it.
+        Skip a frame if the previous one was drawn too late.
 
         Yields:
             _type_: buffer with input voice samples,
             buffer with sine wave samples,
-            buffer with modulated voice samples.
+            buffer with modulated voice samples,
+            average and peak spectra or None.
+            None - frame is skipped.
         """
-        input_voice_buffer: list[float] = []
-        sine_wave_buffer: list[float] = []
-        modulated_voice_buffer: list[float] = []
-
+        previous_frame_skipped: bool = False
         while self.running is True:
-            input_voice_buffer.clear()
-            sine_wave_buffer.clear()
-            modulated_voice_buffer.clear()
+            # Time between frames includes drawing of the previous frame.
+            frame_time_s: float = time.perf_counter()
+            frame_delay_s: float = \
+                frame_time_s - self._previous_frame_time_s
+            self._previous_frame_time_s = frame_time_s
+            if((previous_frame_skipped is False) and
+               (frame_delay_s > 2 * self._update_interval_s)):
+                self._skipped_frames = self._skipped_frames + 1
+                previous_frame_skipped = True
+                yield None
+                continue
+            previous_frame_skipped = False
 
-            for _ in range(0, self._samples_per_update_interval, 1):
-                input_voice_point: float = 0
-                sine_wave_point: float = 0
-                modulated_voice_point: float = 0
+            self._plot_ring_buffer.read_latest(out=self._frame)
 
-                input_voice_point, sine_wave_point, modulated_voice_point = \
-                    self._multithread_queue.get(block=True)
-                
-                input_voice_buffer.append(input_voice_point)
-                sine_wave_buffer.append(sine_wave_point)
-                modulated_voice_buffer.append(modulated_voice_point)
-
-            input_voice_buffer_copy: list[float] = \
-                input_voice_buffer.copy()
-            sine_wave_buffer_copy: list[float] = \
-                sine_wave_buffer.copy()
-            modulated_voice_buffer_copy: list[float] = \
-                modulated_voice_buffer.copy()
+            spectrum: tuple[numpy.ndarray, numpy.ndarray] | None = None
+            if self._spectrum_analyzer is not None:
+                spectrum = self._spectrum_analyzer.spectrum
             
-            yield (input_voice_buffer_copy,
-                   sine_wave_buffer_copy,
-                   modulated_voice_buffer_copy)
+            yield (self._frame[0],
+                   self._frame[1],
+                   self._frame[2],
+                   spectrum)
                 
     def _update_animation(self, frame: Any, *fargs: Any):
         """Draw animation frame.
 
         Args:
-            frame (Any): data to draw.
+            frame (Any): data to draw. None - frame is skipped.
 
         Returns:
             _type_: line to draw input voice,
             line to draw sine wave,
-            line to draw modulated voice.
+            line to draw modulated voice,
+            lines to draw spectra.
+            Nothing if frame is skipped.
         """
+        if frame is None:
+            return ()
+
         input_voice_buffer: list[float] = []
         sine_wave_buffer: list[float] = []
         modulated_voice_buffer: list[float] = []
+        spectrum: tuple[numpy.ndarray, numpy.ndarray] | None = None
 
-        input_voice_buffer, sine_wave_buffer, modulated_voice_buffer = frame
+        input_voice_buffer, sine_wave_buffer, modulated_voice_buffer, \
+            spectrum = frame
         
         self._input_voice_line.set_ydata(input_voice_buffer)
         self._sine_wave_line.set_ydata(sine_wave_buffer)
         self._modulated_voice_line.set_ydata(modulated_voice_buffer)
 
+        if spectrum is not None:
+            average_spectrum: numpy.ndarray
+            peak_spectrum: numpy.ndarray
+            average_spectrum, peak_spectrum = spectrum
+            self._spectrum_lines[0].set_ydata(average_spectrum[0])
+            self._spectrum_lines[1].set_ydata(average_spectrum[2])
+            self._spectrum_lines[2].set_ydata(peak_spectrum[2])
+
         return (self._input_voice_line,
                 self._sine_wave_line,
-                self._modulated_voice_line)
+                self._modulated_voice_line,
+                *self._spectrum_lines)
     
     def close(self) -> None:
         """Stop animation and close plot."""
@@ -196,4 +280,13 @@ class Plot:
             raise ValueError("ERROR! Invalid argument!")
 
         with self._mutex_running:
-            self._running = new_running
\ No newline at end of file
+            self._running = new_running
+
+    @property
+    def skipped_frames(self) -> int:
+        """Return number of frames that were skipped to catch up.
+
+        Returns:
+            int: number of skipped frames.
+        """
+        return self._skipped_frames
\ No newline at end of file
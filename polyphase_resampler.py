@@ -0,0 +1,337 @@
+import math
+from typing import Any, Callable
+
+import numpy
+
+
+class PolyphaseResampler:
+    def __init__(self,
+                 factor: int,
+                 samples_per_buffer: int,
+                 number_of_channels: int,
+                 taps_per_phase: int = 48) -> None:
+        """Initialize processing of device buffers at a lower internal rate.
+
+        Input is filtered by a low-pass FIR filter and decimated
+        by an integer factor, only every factor-th output of the filter
+        is calculated. Processed internal blocks are interpolated
+        by the same factor with the same filter split into phases,
+        so zeros inserted between samples are never multiplied.
+        Filter is a Kaiser-windowed sinc whose transition band
+        is centered at 0.45 of the internal sampling frequency:
+        it passes up to 0.4 and stops from 0.5 of it,
+        so nothing aliases into the band it passes.
+        Buffer size must be a multiple of factor, so every buffer
+        is decimated into exactly one internal block and output FIFO
+        needs no silence. Added latency is the delay of both filters.
+        If a buffer of another size arrives anyway, internal blocks
+        have a size of buffer size divided by factor, rounded up,
+        and output FIFO starts with enough silence to never run empty,
+        which adds up to a buffer of latency.
+        Both filters cost more per device sample than the default
+        amplification, modulation, noise and clipping, so resampling
+        only lowers CPU load of effect chains that cost more than them.
+
+        Args:
+            factor (int): device sampling frequency divided by
+            internal sampling frequency.
+            samples_per_buffer (int): number of frames in a device buffer,
+            a multiple of factor.
+            number_of_channels (int): number of interleaved channels.
+            taps_per_phase (int): number of filter taps per phase,
+            filter has factor times more taps. Fewer taps widen
+            the transition band and shorten the delay.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(factor, int)) or
+           (factor <= 1) or
+           (not isinstance(samples_per_buffer, int)) or
+           (samples_per_buffer <= 0) or
+           (samples_per_buffer % factor != 0) or
+           (not isinstance(number_of_channels, int)) or
+           (number_of_channels <= 0) or
+           (not isinstance(taps_per_phase, int)) or
+           (taps_per_phase <= 0)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        # Center of the transition band relative to internal
+        # sampling frequency. Taps and Kaiser window make it
+        # about 0.1 wide, from 0.4 to 0.5.
+        self._CUTOFF: float = 0.45
+        # About 70 dB of stopband attenuation.
+        self._KAISER_BETA: float = 7.0
+
+        self._factor: int = factor
+        self._number_of_channels: int = number_of_channels
+        self._taps_per_phase: int = taps_per_phase
+        self._number_of_taps: int = factor * taps_per_phase
+
+        # Low-pass filter at device rate, reversed for dot products.
+        n: numpy.ndarray = numpy.arange(self._number_of_taps) \
+                           - (self._number_of_taps - 1) / 2
+        cutoff: float = self._CUTOFF / factor
+        taps: numpy.ndarray = (2 * cutoff * numpy.sinc(2 * cutoff * n)
+                               * numpy.kaiser(self._number_of_taps,
+                                              self._KAISER_BETA))
+        taps = taps / numpy.sum(taps)
+        self._decimation_taps: numpy.ndarray = taps[::-1].copy()
+        # Phase r of interpolation uses taps r, r + factor, ...
+        # Interpolation multiplies by factor to keep the level.
+        self._interpolation_taps: numpy.ndarray = \
+            (factor * taps).reshape(taps_per_phase, factor)[::-1].copy()
+
+        self._decimation_history: numpy.ndarray = numpy.zeros(
+            (number_of_channels, self._number_of_taps - 1),
+            dtype=numpy.float64)
+        self._interpolation_history: numpy.ndarray = numpy.zeros(
+            (number_of_channels, taps_per_phase - 1),
+            dtype=numpy.float64)
+        # Index of the next input frame modulo factor.
+        self._input_phase: int = 0
+
+        self._allocate_buffers(samples_per_buffer=samples_per_buffer)
+
+    def _allocate_buffers(self, samples_per_buffer: int) -> None:
+        """Allocate FIFOs and scratch buffers for a device buffer size.
+
+        Filter histories are kept, FIFOs start again.
+
+        Args:
+            samples_per_buffer (int): number of frames in a device buffer.
+        """
+        self._samples_per_buffer: int = samples_per_buffer
+        self._internal_samples_per_buffer: int = \
+            math.ceil(samples_per_buffer / self._factor)
+        internal_samples: int = self._internal_samples_per_buffer
+        number_of_channels: int = self._number_of_channels
+
+        # Channels are rows, so filter windows are strided views of a row.
+        self._decimation_input: numpy.ndarray = numpy.zeros(
+            (number_of_channels,
+             self._number_of_taps - 1 + samples_per_buffer),
+            dtype=numpy.float64)
+        self._decimation_output: numpy.ndarray = numpy.zeros(
+            (number_of_channels, internal_samples),
+            dtype=numpy.float64)
+        self._interpolation_input: numpy.ndarray = numpy.zeros(
+            (number_of_channels,
+             self._taps_per_phase - 1 + internal_samples),
+            dtype=numpy.float64)
+        self._interpolation_output: numpy.ndarray = numpy.zeros(
+            (number_of_channels, internal_samples, self._factor),
+            dtype=numpy.float64)
+
+        # Internal input FIFO holds less than 2 internal blocks.
+        self._input_fifo: numpy.ndarray = numpy.zeros(
+            (2 * internal_samples, number_of_channels),
+            dtype=numpy.float32)
+        self._input_fifo_bytes: memoryview = memoryview(
+            self._input_fifo[:internal_samples]).cast("B")
+        self._input_fifo_frames: int = 0
+
+        self._output_fifo_silence: int = self._find_output_fifo_silence()
+        self._output_fifo: numpy.ndarray = numpy.zeros(
+            (self._output_fifo_silence + samples_per_buffer
+             + self._factor * internal_samples,
+             number_of_channels),
+            dtype=numpy.float32)
+        self._output_fifo_frames: int = self._output_fifo_silence
+        self._output_block: numpy.ndarray = numpy.zeros(
+            (samples_per_buffer, number_of_channels),
+            dtype=numpy.float32)
+
+    def _find_output_fifo_silence(self) -> int:
+        """Find the smallest silence that keeps output FIFO from running empty.
+
+        Frame counts of buffers and internal blocks repeat,
+        so they are followed until they repeat.
+
+        Returns:
+            int: number of silent frames at the start of output FIFO.
+        """
+        input_phase: int = self._input_phase
+        input_fifo_frames: int = 0
+        output_fifo_frames: int = 0
+        min_output_fifo_frames: int = 0
+        states: set[tuple[int, int, int]] = set()
+        while ((input_phase, input_fifo_frames, output_fifo_frames)
+               not in states):
+            states.add((input_phase, input_fifo_frames, output_fifo_frames))
+            input_fifo_frames = input_fifo_frames + self._count_outputs(
+                input_phase=input_phase,
+                number_of_frames=self._samples_per_buffer)
+            input_phase = \
+                (input_phase + self._samples_per_buffer) % self._factor
+            if input_fifo_frames >= self._internal_samples_per_buffer:
+                input_fifo_frames = \
+                    input_fifo_frames - self._internal_samples_per_buffer
+                output_fifo_frames = output_fifo_frames \
+                    + self._factor * self._internal_samples_per_buffer
+            output_fifo_frames = output_fifo_frames - self._samples_per_buffer
+            min_output_fifo_frames = min(min_output_fifo_frames,
+                                         output_fifo_frames)
+        return -min_output_fifo_frames
+
+    def _count_outputs(self, input_phase: int, number_of_frames: int) -> int:
+        """Count decimated frames of a buffer.
+
+        Args:
+            input_phase (int): index of the first frame modulo factor.
+            number_of_frames (int): number of frames in a buffer.
+
+        Returns:
+            int: number of decimated frames.
+        """
+        first_frame: int = (-input_phase) % self._factor
+        if first_frame >= number_of_frames:
+            return 0
+        return (number_of_frames - 1 - first_frame) // self._factor + 1
+
+    def process(self,
+                in_data: bytes,
+                process: Callable[[Any], bytes | numpy.ndarray]) \
+            -> numpy.ndarray:
+        """Resample a device buffer down, process it, resample it up.
+
+        Args:
+            in_data (bytes): raw bytes of input float32 data.
+            process (Callable[[Any], bytes | numpy.ndarray]): processes
+            raw bytes of an internal block and returns raw bytes
+            or float32 array of the same shape.
+
+        Returns:
+            numpy.ndarray: float32 array of shape (frames, channels)
+            of processed data. Array is reused by the next call.
+        """
+        input_block: numpy.ndarray = numpy.frombuffer(
+            in_data, dtype=numpy.float32).reshape(
+                -1, self._number_of_channels)
+        number_of_frames: int = input_block.shape[0]
+        if number_of_frames != self._samples_per_buffer:
+            self._allocate_buffers(samples_per_buffer=number_of_frames)
+
+        self._decimate(input_block=input_block)
+
+        internal_samples: int = self._internal_samples_per_buffer
+        if self._input_fifo_frames >= internal_samples:
+            output: bytes | numpy.ndarray = process(self._input_fifo_bytes)
+            if not isinstance(output, numpy.ndarray):
+                output = numpy.frombuffer(output, dtype=numpy.float32)
+            self._interpolate(block=output.reshape(
+                internal_samples, self._number_of_channels))
+
+            # Move the rest of the input FIFO to its start.
+            self._input_fifo_frames = self._input_fifo_frames \
+                                      - internal_samples
+            self._input_fifo[:self._input_fifo_frames] = \
+                self._input_fifo[internal_samples:
+                                 internal_samples + self._input_fifo_frames]
+
+        # Output FIFO always has a buffer, see _find_output_fifo_silence().
+        numpy.copyto(self._output_block,
+                     self._output_fifo[:number_of_frames])
+        self._output_fifo_frames = self._output_fifo_frames - number_of_frames
+        self._output_fifo[:self._output_fifo_frames] = \
+            self._output_fifo[number_of_frames:
+                              number_of_frames + self._output_fifo_frames]
+        return self._output_block
+
+    def _decimate(self, input_block: numpy.ndarray) -> None:
+        """Filter and decimate a device buffer into input FIFO.
+
+        Args:
+            input_block (numpy.ndarray): float32 array of shape
+            (frames, channels).
+        """
+        number_of_frames: int = input_block.shape[0]
+        history: int = self._number_of_taps - 1
+        extended: numpy.ndarray = self._decimation_input
+        extended[:, :history] = self._decimation_history
+        extended[:, history:] = input_block.T
+
+        first_frame: int = (-self._input_phase) % self._factor
+        number_of_outputs: int = self._count_outputs(
+            input_phase=self._input_phase,
+            number_of_frames=number_of_frames)
+        if number_of_outputs > 0:
+            # Window of output i ends at input frame first + i * factor.
+            windows: numpy.ndarray = numpy.lib.stride_tricks.as_strided(
+                extended[:, first_frame:],
+                shape=(self._number_of_channels,
+                       number_of_outputs,
+                       self._number_of_taps),
+                strides=(extended.strides[0],
+                         self._factor * extended.strides[1],
+                         extended.strides[1]),
+                writeable=False)
+            output: numpy.ndarray = \
+                self._decimation_output[:, :number_of_outputs]
+            numpy.matmul(windows, self._decimation_taps, out=output)
+            self._input_fifo[self._input_fifo_frames:
+                             self._input_fifo_frames + number_of_outputs] = \
+                output.T
+            self._input_fifo_frames = \
+                self._input_fifo_frames + number_of_outputs
+
+        self._decimation_history[:] = extended[:, number_of_frames:]
+        self._input_phase = \
+            (self._input_phase + number_of_frames) % self._factor
+
+    def _interpolate(self, block: numpy.ndarray) -> None:
+        """Interpolate a processed internal block into output FIFO.
+
+        Args:
+            block (numpy.ndarray): float32 array of shape
+            (internal frames, channels).
+        """
+        number_of_frames: int = block.shape[0]
+        history: int = self._taps_per_phase - 1
+        extended: numpy.ndarray = self._interpolation_input
+        extended[:, :history] = self._interpolation_history
+        extended[:, history:] = block.T
+
+        windows: numpy.ndarray = numpy.lib.stride_tricks.as_strided(
+            extended,
+            shape=(self._number_of_channels,
+                   number_of_frames,
+                   self._taps_per_phase),
+            strides=(extended.strides[0],
+                     extended.strides[1],
+                     extended.strides[1]),
+            writeable=False)
+        # Output frame i * factor + r is phase r of frame i.
+        numpy.matmul(windows,
+                     self._interpolation_taps,
+                     out=self._interpolation_output)
+        number_of_outputs: int = self._factor * number_of_frames
+        self._output_fifo[self._output_fifo_frames:
+                          self._output_fifo_frames + number_of_outputs] = \
+            self._interpolation_output.reshape(
+                self._number_of_channels, number_of_outputs).T
+        self._output_fifo_frames = \
+            self._output_fifo_frames + number_of_outputs
+
+        self._interpolation_history[:] = extended[:, number_of_frames:]
+
+    @property
+    def internal_samples_per_buffer(self) -> int:
+        """Return number of frames in an internal block.
+
+        Returns:
+            int: number of frames in an internal block.
+        """
+        return self._internal_samples_per_buffer
+
+    @property
+    def added_latency_samples(self) -> int:
+        """Return latency added by filters and output FIFO.
+
+        Returns:
+            int: added latency, device samples.
+        """
+        return self._number_of_taps - 1 + self._output_fifo_silence
@@ -0,0 +1,5 @@
+from enum import Enum
+
+class ProcessingMode(Enum):
+    BLOCK = 0
+    REFERENCE = 1
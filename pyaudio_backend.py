@@ -0,0 +1,87 @@
+from typing import Any, Callable
+
+import pyaudio
+
+from audio_backend import AudioBackend
+
+
+class PyAudioBackend(AudioBackend):
+    def __init__(self) -> None:
+        """Initialize a backend of a PortAudio device through pyaudio.
+
+        PyAudio object is created when device is opened,
+        because PortAudio reads its environment then.
+        """
+        super().__init__()
+
+        self._pyaudio_object: pyaudio.PyAudio | None = None
+        self._stream: pyaudio.Stream | None = None
+
+    def open(self,
+             sampling_frequency: int,
+             number_of_channels: int,
+             samples_per_buffer: int,
+             stream_callback: Callable[[bytes, int, Any, int],
+                                       tuple[Any, int]]) -> None:
+        """Open default input/output device and start calling callback.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            number_of_channels (int): number of interleaved channels
+            of input and output.
+            samples_per_buffer (int): number of frames in a buffer.
+            stream_callback (Callable[[bytes, int, Any, int],
+            tuple[Any, int]]): stream callback.
+
+        Raises:
+            OSError: device could not be opened.
+        """
+        self._pyaudio_object = pyaudio.PyAudio()
+        try:
+            self._stream = self._pyaudio_object.open(
+                rate=sampling_frequency,
+                channels=number_of_channels,
+                format=pyaudio.paFloat32,
+                input=True,
+                output=True,
+                frames_per_buffer=samples_per_buffer,
+                stream_callback=stream_callback)
+        except OSError:
+            # PortAudio reads its environment again only after termination.
+            self._pyaudio_object.terminate()
+            self._pyaudio_object = None
+            raise
+
+    def is_active(self) -> bool:
+        """Return a flag that specifies whether pyaudio stream is active.
+
+        Returns:
+            bool: True - pyaudio input/output stream is active.
+            False - pyaudio input/output stream is not active.
+        """
+        return self._stream.is_active()
+
+    def get_input_latency(self) -> float:
+        """Return input latency reported by PortAudio.
+
+        Returns:
+            float: input latency, s.
+        """
+        return self._stream.get_input_latency()
+
+    def get_output_latency(self) -> float:
+        """Return output latency reported by PortAudio.
+
+        Returns:
+            float: output latency, s.
+        """
+        return self._stream.get_output_latency()
+
+    def close(self) -> None:
+        """Close pyaudio input/output stream."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._pyaudio_object is not None:
+            self._pyaudio_object.terminate()
+            self._pyaudio_object = None
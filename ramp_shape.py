@@ -0,0 +1,5 @@
+from enum import Enum
+
+class RampShape(Enum):
+    LINEAR = 0
+    EXPONENTIAL = 1
\ No newline at end of file
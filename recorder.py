@@ -0,0 +1,295 @@
+import os
+import threading
+import time
+from typing import Any, BinaryIO
+
+import numpy
+
+from recording_format import RecordingFormat
+from wav_writer import WavWriter
+
+
+class Recorder:
+    def __init__(self,
+                 directory: str,
+                 recording_format: RecordingFormat,
+                 sampling_frequency: int,
+                 samples_per_buffer: int,
+                 number_of_channels: int,
+                 number_of_slots: int,
+                 max_file_size_bytes: int | None,
+                 max_file_duration_s: int | float | None) -> None:
+        """Start recording input and output blocks to files.
+
+        Audio callback copies every input and output block to a free slot
+        of a preallocated ring and never waits. A background thread
+        writes filled slots to files. If all slots are filled,
+        because writing falls behind, a block is dropped and counted,
+        so memory does not grow however long the recording is.
+        A file has input channels followed by output channels,
+        32 bit float samples. A new file is started when a file
+        would exceed max size or max duration. After a write error
+        the file is closed, blocks are dropped for a while
+        and writing is retried in a new file. The pause doubles
+        with every error in a row.
+
+        Args:
+            directory (str): directory for recordings, created if needed.
+            recording_format (RecordingFormat): WAV - WAV files,
+            RAW - interleaved little-endian float32 samples without header.
+            sampling_frequency (int): sampling frequency, Hz.
+            samples_per_buffer (int): max number of frames in a block.
+            number_of_channels (int): number of channels of input
+            and of output.
+            number_of_slots (int): number of blocks in the ring.
+            max_file_size_bytes (int | None): max size of samples
+            in a file, bytes. None - no limit.
+            max_file_duration_s (int | float | None): max duration
+            of a file, s. None - no limit.
+
+        Raises:
+            ValueError: invalid arguments.
+            OSError: directory could not be created.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(directory, str)) or
+           (not isinstance(recording_format, RecordingFormat)) or
+           (not isinstance(sampling_frequency, int)) or
+           (sampling_frequency <= 0) or
+           (not isinstance(samples_per_buffer, int)) or
+           (samples_per_buffer <= 0) or
+           (not isinstance(number_of_channels, int)) or
+           (number_of_channels <= 0) or
+           (not isinstance(number_of_slots, int)) or
+           (number_of_slots <= 1) or
+           ((max_file_size_bytes is not None) and
+            ((not isinstance(max_file_size_bytes, int)) or
+             (max_file_size_bytes <= 0))) or
+           ((max_file_duration_s is not None) and
+            ((not isinstance(max_file_duration_s, (int, float))) or
+             (max_file_duration_s <= 0)))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory: str = directory
+        self._recording_format: RecordingFormat = recording_format
+        self._sampling_frequency: int = sampling_frequency
+        self._number_of_channels: int = number_of_channels
+        self._number_of_slots: int = number_of_slots
+        self._bytes_per_frame: int = \
+            2 * number_of_channels * numpy.dtype(numpy.float32).itemsize
+
+        # Input channels, then output channels of every slot.
+        self._slots: numpy.ndarray = numpy.zeros(
+            (number_of_slots, samples_per_buffer, 2 * number_of_channels),
+            dtype=numpy.float32)
+        self._slot_frames: list[int] = [0] * number_of_slots
+
+        # A file holds at least one block.
+        self._max_file_frames: int | None = None
+        if max_file_size_bytes is not None:
+            self._max_file_frames = max(
+                samples_per_buffer,
+                max_file_size_bytes // self._bytes_per_frame)
+        if max_file_duration_s is not None:
+            max_duration_frames: int = max(
+                samples_per_buffer,
+                int(max_file_duration_s * sampling_frequency))
+            if ((self._max_file_frames is None) or
+                (max_duration_frames < self._max_file_frames)):
+                self._max_file_frames = max_duration_frames
+
+        # Indices only grow. Write index is changed by audio callback only,
+        # read index is changed by writer thread only.
+        self._write_index: int = 0
+        self._read_index: int = 0
+        self._dropped_blocks: int = 0
+
+        # Changed by writer thread only.
+        self._file: BinaryIO | None = None
+        self._file_frames: int = 0
+        self._number_of_files: int = 0
+        self._written_frames: int = 0
+        # Pause after the first write error, s. It doubles up to max
+        # while errors repeat and is reset by a successful write.
+        self._RETRY_INTERVAL_S: float = 1.0
+        self._MAX_RETRY_INTERVAL_S: float = 30.0
+        self._retry_interval_s: float = self._RETRY_INTERVAL_S
+        # Time of the next attempt after a write error, s.
+        # None - writing works.
+        self._retry_time: float | None = None
+        self._write_errors: int = 0
+        # Blocks that were taken from the ring after a write error.
+        self._failed_blocks: int = 0
+
+        # Writer wakes up 4 times per ring duration.
+        self._poll_interval_s: float = \
+            number_of_slots * samples_per_buffer / sampling_frequency / 4
+
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run,
+            name="Recorder",
+            daemon=True)
+        self._thread.start()
+
+    def record(self,
+               input_data: bytes | numpy.ndarray,
+               output_data: bytes | numpy.ndarray) -> None:
+        """Copy an input block and an output block to a free slot.
+
+        Does not wait. Block is dropped if there is no free slot.
+
+        Args:
+            input_data (bytes | numpy.ndarray): raw bytes or float32 array
+            of interleaved input frames.
+            output_data (bytes | numpy.ndarray): raw bytes or float32 array
+            of interleaved output frames of the same size.
+        """
+        if (self._write_index - self._read_index) >= self._number_of_slots:
+            self._dropped_blocks = self._dropped_blocks + 1
+            return
+
+        input_block: numpy.ndarray = numpy.frombuffer(
+            input_data, dtype=numpy.float32).reshape(
+                -1, self._number_of_channels)
+        number_of_frames: int = input_block.shape[0]
+        slot_index: int = self._write_index % self._number_of_slots
+        slot: numpy.ndarray = self._slots[slot_index]
+        if number_of_frames > slot.shape[0]:
+            self._dropped_blocks = self._dropped_blocks + 1
+            return
+
+        slot[:number_of_frames, :self._number_of_channels] = input_block
+        slot[:number_of_frames, self._number_of_channels:] = \
+            numpy.frombuffer(output_data, dtype=numpy.float32).reshape(
+                -1, self._number_of_channels)
+        self._slot_frames[slot_index] = number_of_frames
+
+        # Publish filled slot.
+        self._write_index = self._write_index + 1
+
+    def _run(self) -> None:
+        """Write filled slots until recorder is closed."""
+        while self._stop_event.wait(timeout=self._poll_interval_s) is False:
+            self._write_slots()
+        self._write_slots()
+        self._close_file()
+
+    def _write_slots(self) -> None:
+        """Write all filled slots to files."""
+        write_index: int = self._write_index
+        while self._read_index < write_index:
+            slot_index: int = self._read_index % self._number_of_slots
+            number_of_frames: int = self._slot_frames[slot_index]
+
+            if ((self._retry_time is not None) and
+                (time.monotonic() < self._retry_time)):
+                self._failed_blocks = self._failed_blocks + 1
+            else:
+                try:
+                    if ((self._file is not None) and
+                        (self._max_file_frames is not None) and
+                        (self._file_frames + number_of_frames >
+                         self._max_file_frames)):
+                        self._close_file()
+                    if self._file is None:
+                        self._open_file()
+                    self._file.write(
+                        self._slots[slot_index, :number_of_frames].data)
+                    self._file_frames = self._file_frames + number_of_frames
+                    self._written_frames = \
+                        self._written_frames + number_of_frames
+                    self._retry_time = None
+                    self._retry_interval_s = self._RETRY_INTERVAL_S
+                except OSError as e:
+                    print(type(e))
+                    print(e)
+                    print("ERROR! Could not write recording! "
+                          "Next blocks are dropped for "
+                          f"{self._retry_interval_s} s!")
+                    # Writing is retried in a new file.
+                    self._close_file()
+                    self._write_errors = self._write_errors + 1
+                    self._retry_time = \
+                        time.monotonic() + self._retry_interval_s
+                    self._retry_interval_s = min(2 * self._retry_interval_s,
+                                                 self._MAX_RETRY_INTERVAL_S)
+                    self._failed_blocks = self._failed_blocks + 1
+
+            # Free the slot.
+            self._read_index = self._read_index + 1
+
+    def _open_file(self) -> None:
+        """Start a new file.
+
+        Raises:
+            OSError: file could not be created.
+        """
+        extension: str = ".wav"
+        if self._recording_format is RecordingFormat.RAW:
+            extension = ".f32"
+        file_name: str = os.path.join(
+            self._directory,
+            f"recording_{time.strftime('%Y%m%d_%H%M%S')}_"
+            f"{self._number_of_files:04d}{extension}")
+
+        self._file = open(file_name, "wb")
+        self._file_frames = 0
+        self._number_of_files = self._number_of_files + 1
+        if self._recording_format is RecordingFormat.WAV:
+            # Sizes are written when the file is closed.
+            self._file.write(WavWriter.create_header(
+                sampling_frequency=self._sampling_frequency,
+                number_of_channels=2 * self._number_of_channels,
+                number_of_frames=0))
+
+    def _close_file(self) -> None:
+        """Write sizes of a WAV file and close it."""
+        if self._file is None:
+            return
+
+        try:
+            if self._recording_format is RecordingFormat.WAV:
+                self._file.seek(0)
+                self._file.write(WavWriter.create_header(
+                    sampling_frequency=self._sampling_frequency,
+                    number_of_channels=2 * self._number_of_channels,
+                    number_of_frames=self._file_frames))
+        except OSError as e:
+            print(type(e))
+            print(e)
+            print("ERROR! Could not write sizes of recording!")
+        # File is closed even if sizes could not be written.
+        try:
+            self._file.close()
+        except OSError as e:
+            print(type(e))
+            print(e)
+            print("ERROR! Could not close recording!")
+        self._file = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return recording statistics.
+
+        Returns:
+            dict[str, Any]: number of recorded and dropped blocks,
+            recorded duration, number of files and write errors.
+        """
+        return {
+            "recorder_blocks": self._write_index,
+            "recorder_dropped_blocks":
+                self._dropped_blocks + self._failed_blocks,
+            "recorder_written_s":
+                self._written_frames / self._sampling_frequency,
+            "recorder_files": self._number_of_files,
+            "recorder_write_errors": self._write_errors
+        }
+
+    def close(self) -> None:
+        """Write the rest of filled slots and close files."""
+        self._stop_event.set()
+        self._thread.join()
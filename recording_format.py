@@ -0,0 +1,5 @@
+from enum import Enum
+
+class RecordingFormat(Enum):
+    WAV = 0
+    RAW = 1
\ No newline at end of file
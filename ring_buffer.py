@@ -0,0 +1,207 @@
+import numpy
+
+
+class RingBuffer:
+    def __init__(self, number_of_rows: int, capacity: int) -> None:
+        """Initialize a single-producer single-consumer ring buffer.
+
+        Ring buffer stores several rows of float32 samples,
+        for example input voice, sine wave and modulated voice.
+        One thread writes blocks, another thread reads the most recent
+        window. Neither of them blocks. Python assignments of indices
+        are atomic, so no lock is needed.
+        More readers can follow the stream with their own cursors
+        by reading windows that end at a given index.
+
+        Args:
+            number_of_rows (int): number of rows.
+            capacity (int): number of samples in each row.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(number_of_rows, int)) or
+           (number_of_rows <= 0) or
+           (not isinstance(capacity, int)) or
+           (capacity <= 0)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._buffer: numpy.ndarray = numpy.zeros((number_of_rows, capacity),
+                                                  dtype=numpy.float32)
+        self._capacity: int = capacity
+
+        # Indices only grow. Buffer position is index modulo capacity.
+        # Write index is changed by producer only,
+        # read index is changed by consumer only.
+        self._write_index: int = 0
+        self._read_index: int = 0
+        # Index after a block that is being written, it is ahead
+        # of write index while samples are copied.
+        self._reserved_index: int = 0
+
+        self._overrun_samples: int = 0
+
+    def write(self, *blocks: numpy.ndarray) -> None:
+        """Write one block per row.
+
+        Samples that were not read yet and are overwritten
+        are counted as overrun.
+
+        Args:
+            *blocks (numpy.ndarray): blocks of equal size, one per row.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        # Check arguments.
+        if len(blocks) != self._buffer.shape[0]:
+            raise ValueError("ERROR! Invalid arguments!")
+
+        number_of_points: int = blocks[0].shape[0]
+        if number_of_points > self._capacity:
+            raise ValueError("ERROR! Invalid arguments!")
+
+        # Unread samples that were overwritten by previous blocks
+        # are already counted, only samples of this block are new.
+        unread_points: int = self._write_index - self._read_index
+        overwritten_points: int = min(
+            number_of_points,
+            unread_points + number_of_points - self._capacity)
+        if overwritten_points > 0:
+            self._overrun_samples = self._overrun_samples + overwritten_points
+
+        self._reserved_index = self._write_index + number_of_points
+        start: int = self._write_index % self._capacity
+        first_part_size: int = min(number_of_points, self._capacity - start)
+        for row, block in enumerate(blocks):
+            self._buffer[row, start:start + first_part_size] = \
+                block[:first_part_size]
+            self._buffer[row, :number_of_points - first_part_size] = \
+                block[first_part_size:]
+
+        # Publish written samples.
+        self._write_index = self._write_index + number_of_points
+
+    def read_latest(self, out: numpy.ndarray) -> int:
+        """Copy the most recent samples.
+
+        Args:
+            out (numpy.ndarray): float32 array of shape
+            (number of rows, window) to store the most recent samples.
+            Samples older than the first written sample are zeros.
+
+        Raises:
+            ValueError: invalid argument.
+
+        Returns:
+            int: number of samples written since the previous read.
+        """
+        # Check argument.
+        if((not isinstance(out, numpy.ndarray)) or
+           (out.ndim != 2) or
+           (out.shape[0] != self._buffer.shape[0]) or
+           (out.shape[1] > self._capacity)):
+            raise ValueError("ERROR! Invalid argument!")
+
+        window: int = out.shape[1]
+
+        while True:
+            write_index: int = self._write_index
+            start: int = (write_index - window) % self._capacity
+            first_part_size: int = min(window, self._capacity - start)
+            out[:, :first_part_size] = \
+                self._buffer[:, start:start + first_part_size]
+            out[:, first_part_size:] = \
+                self._buffer[:, :window - first_part_size]
+
+            # Copy again if producer reserved the window while copying,
+            # it could be partly overwritten before it is published.
+            if (self._reserved_index - write_index) <= \
+                    (self._capacity - window):
+                break
+
+        new_points: int = write_index - self._read_index
+        self._read_index = write_index
+        return new_points
+
+    def read_window(self, end_index: int, out: numpy.ndarray) -> bool:
+        """Copy samples that end at a given index.
+
+        Does not change read index, so it does not affect
+        the most recent window reader and overrun counting.
+
+        Args:
+            end_index (int): index after the last sample to copy.
+            out (numpy.ndarray): float32 array of shape
+            (number of rows, window) to store samples.
+
+        Raises:
+            ValueError: invalid arguments.
+
+        Returns:
+            bool: True - samples are copied.
+            False - samples are not written yet or are overwritten.
+        """
+        # Check arguments.
+        if((not isinstance(end_index, int)) or
+           (not isinstance(out, numpy.ndarray)) or
+           (out.ndim != 2) or
+           (out.shape[0] != self._buffer.shape[0]) or
+           (out.shape[1] > self._capacity)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        window: int = out.shape[1]
+        start_index: int = end_index - window
+        if((start_index < 0) or
+           (end_index > self._write_index) or
+           (start_index < self._reserved_index - self._capacity)):
+            return False
+
+        start: int = start_index % self._capacity
+        first_part_size: int = min(window, self._capacity - start)
+        out[:, :first_part_size] = \
+            self._buffer[:, start:start + first_part_size]
+        out[:, first_part_size:] = \
+            self._buffer[:, :window - first_part_size]
+
+        # Producer could overwrite the window while copying.
+        return start_index >= self._reserved_index - self._capacity
+
+    @property
+    def write_index(self) -> int:
+        """Return number of samples written since creation.
+
+        Returns:
+            int: index after the last written sample.
+        """
+        return self._write_index
+
+    @property
+    def number_of_rows(self) -> int:
+        """Return number of rows.
+
+        Returns:
+            int: number of rows.
+        """
+        return self._buffer.shape[0]
+
+    @property
+    def capacity(self) -> int:
+        """Return number of samples in each row.
+
+        Returns:
+            int: number of samples in each row.
+        """
+        return self._capacity
+
+    @property
+    def overrun_samples(self) -> int:
+        """Return number of samples overwritten before they were read.
+
+        Returns:
+            int: number of overwritten samples.
+        """
+        return self._overrun_samples
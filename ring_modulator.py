@@ -1,3 +1,6 @@
+import numpy
+
+
 class RingModulator:
     @staticmethod
     def modulate(input_voice_point: int | float,
@@ -20,4 +23,35 @@ class RingModulator:
             raise ValueError("ERROR! Invalid arguments!")
 
         modulated_voice_point: float = input_voice_point * sine_wave_point
-        return modulated_voice_point
\ No newline at end of file
+        return modulated_voice_point
+
+    @staticmethod
+    def modulate_block(input_voice_block: numpy.ndarray,
+                       sine_wave_block: numpy.ndarray,
+                       out: numpy.ndarray | None = None) -> numpy.ndarray:
+        """Modulate input voice points by sine wave points.
+
+        Args:
+            input_voice_block (numpy.ndarray): input voice points.
+            sine_wave_block (numpy.ndarray): sine wave points of the same shape
+            as input voice points or broadcastable to it, for example
+            one column for all channels.
+            out (numpy.ndarray | None): array to store modulated voice points.
+            It may be one of the input arrays. None - allocate a new array.
+
+        Raises:
+            ValueError: invalid arguments, numpy raises it
+            if shapes of arrays can not be broadcast together.
+
+        Returns:
+            numpy.ndarray: modulated voice points.
+        """
+        # Check arguments.
+        # Shapes are checked by numpy, this runs for every block.
+        if ((not isinstance(input_voice_block, numpy.ndarray)) or
+            (not isinstance(sine_wave_block, numpy.ndarray))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        modulated_voice_block: numpy.ndarray = numpy.multiply(
+            input_voice_block, sine_wave_block, out=out)
+        return modulated_voice_block
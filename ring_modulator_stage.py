@@ -0,0 +1,95 @@
+import numpy
+
+from effect_stage import EffectStage
+from ring_modulator import RingModulator
+from sine_wave_generator import SineWaveGenerator
+from stream_parameters import StreamParameters
+
+
+class RingModulatorStage(EffectStage):
+    def __init__(self,
+                 sine_wave_generator: SineWaveGenerator,
+                 carrier_phase_offsets: numpy.ndarray | None) -> None:
+        """Initialize modulation by a sine wave.
+
+        Args:
+            sine_wave_generator (SineWaveGenerator): sine wave generator.
+            Generator must not be shared with another stage.
+            carrier_phase_offsets (numpy.ndarray | None): float64 phase
+            offset of every channel, in sine wave periods.
+            None - all channels get the same sine wave.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(sine_wave_generator, SineWaveGenerator)) or
+           ((carrier_phase_offsets is not None) and
+            (not isinstance(carrier_phase_offsets, numpy.ndarray)))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._sine_wave_generator: SineWaveGenerator = sine_wave_generator
+        self._carrier_phase_offsets: numpy.ndarray | None = \
+            carrier_phase_offsets
+
+        self._sine_wave_block: numpy.ndarray = numpy.empty(0)
+        self._carrier_block: numpy.ndarray = numpy.empty((0, 1))
+        self._carrier_row: numpy.ndarray = numpy.empty(0)
+
+    def allocate(self,
+                 samples_per_buffer: int,
+                 number_of_channels: int) -> None:
+        """Allocate sine wave buffer for a number of frames.
+
+        Args:
+            samples_per_buffer (int): number of frames in a block.
+            number_of_channels (int): number of channels in a block.
+        """
+        # One sine wave column is shared by all channels without offsets.
+        if self._carrier_phase_offsets is None:
+            self._sine_wave_block = numpy.zeros(samples_per_buffer,
+                                                dtype=numpy.float64)
+            self._carrier_block = \
+                self._sine_wave_block.reshape(samples_per_buffer, 1)
+            self._carrier_row = self._sine_wave_block
+        else:
+            self._sine_wave_block = numpy.zeros(
+                (samples_per_buffer, number_of_channels),
+                dtype=numpy.float64)
+            self._carrier_block = self._sine_wave_block
+            self._carrier_row = self._sine_wave_block[:, 0]
+
+    def process(self,
+                block: numpy.ndarray,
+                parameters: StreamParameters) -> None:
+        """Modulate a block in place.
+
+        Args:
+            block (numpy.ndarray): float64 block of shape
+            (frames, channels).
+            parameters (StreamParameters): parameters for this block.
+        """
+        number_of_points: int = block.shape[0]
+        if self._carrier_phase_offsets is None:
+            self._sine_wave_generator.get_block(number_of_points,
+                                                out=self._sine_wave_block)
+        else:
+            self._sine_wave_generator.get_multichannel_block(
+                number_of_points,
+                phase_offsets=self._carrier_phase_offsets,
+                out=self._sine_wave_block)
+
+        RingModulator.modulate_block(input_voice_block=block,
+                                     sine_wave_block=self._carrier_block,
+                                     out=block)
+
+    @property
+    def carrier_row(self) -> numpy.ndarray:
+        """Return sine wave of the first channel of the last block.
+
+        Returns:
+            numpy.ndarray: float64 view of sine wave points.
+        """
+        return self._carrier_row
@@ -0,0 +1,282 @@
+import threading
+import time
+from typing import Any, Callable
+
+import numpy
+
+from audio_backend import AudioBackend
+
+
+class SimulatedDevice(AudioBackend):
+    def __init__(self,
+                 input_samples: numpy.ndarray,
+                 clock_speed: int | float | None = 1.0,
+                 scheduling_jitter_ms: int | float = 0.0,
+                 xrun_probability: float = 0.0,
+                 xrun_flags: dict[int, int] | None = None,
+                 seed: int | None = None) -> None:
+        """Initialize a simulated input/output device.
+
+        Device feeds input samples to a stream callback buffer by buffer
+        and collects output samples, then stops. Last buffer is padded
+        with zeros. Buffers are scheduled by a clock that runs
+        clock speed times faster than real time, a callback starts
+        up to scheduling jitter later than scheduled, chosen at random.
+        Callback that does not return before the next buffer is scheduled
+        misses its deadline, the clock is moved to the moment
+        it returned, like a device that underflowed, and the next callback
+        gets an output underflow flag. Without a clock callbacks
+        are called as fast as they return and deadlines are not checked.
+        Xrun flags by buffer index are passed to callbacks as they are,
+        other callbacks get one random xrun flag with xrun probability.
+        Random choices depend only on seed.
+
+        Args:
+            input_samples (numpy.ndarray): float32 input of shape
+            (frames, channels).
+            clock_speed (int | float | None): speed of the clock
+            relative to real time. None - no clock.
+            scheduling_jitter_ms (int | float): max random delay
+            of a callback after its scheduled start, ms of real time.
+            xrun_probability (float): probability of a random xrun flag
+            in a callback, [0, 1].
+            xrun_flags (dict[int, int] | None): status flags by buffer index.
+            seed (int | None): seed of random generator.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(input_samples, numpy.ndarray)) or
+           (input_samples.ndim != 2) or
+           (input_samples.shape[0] == 0) or
+           ((clock_speed is not None) and
+            ((not isinstance(clock_speed, (int, float))) or
+             (clock_speed <= 0))) or
+           (not isinstance(scheduling_jitter_ms, (int, float))) or
+           (scheduling_jitter_ms < 0) or
+           (not isinstance(xrun_probability, (int, float))) or
+           (xrun_probability < 0) or
+           (xrun_probability > 1) or
+           ((xrun_flags is not None) and
+            (not isinstance(xrun_flags, dict)))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._XRUN_FLAGS: list[int] = [AudioBackend.INPUT_UNDERFLOW,
+                                       AudioBackend.INPUT_OVERFLOW,
+                                       AudioBackend.OUTPUT_UNDERFLOW,
+                                       AudioBackend.OUTPUT_OVERFLOW]
+
+        self._input_samples: numpy.ndarray = \
+            input_samples.astype(numpy.float32)
+        self._clock_speed: float | None = clock_speed
+        self._scheduling_jitter_s: float = scheduling_jitter_ms / 1000
+        self._xrun_probability: float = xrun_probability
+        self._xrun_flags: dict[int, int] = {}
+        if xrun_flags is not None:
+            self._xrun_flags = dict(xrun_flags)
+        self._seed: int | None = seed
+
+        self._sampling_frequency: int = 1
+        self._samples_per_buffer: int = 1
+        self._output_samples: numpy.ndarray = \
+            numpy.zeros_like(self._input_samples)
+        self._is_active: bool = False
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._reset_statistics()
+
+    def _reset_statistics(self) -> None:
+        """Reset device counters."""
+        self._callbacks: int = 0
+        self._deadline_misses: int = 0
+        self._injected_xruns: int = 0
+        self._elapsed_time_s: float = 0.0
+
+    def open(self,
+             sampling_frequency: int,
+             number_of_channels: int,
+             samples_per_buffer: int,
+             stream_callback: Callable[[bytes, int, Any, int],
+                                       tuple[Any, int]]) -> None:
+        """Start feeding input samples to stream callback from the start.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            number_of_channels (int): number of interleaved channels
+            of input and output, the same as of input samples.
+            samples_per_buffer (int): number of frames in a buffer.
+            stream_callback (Callable[[bytes, int, Any, int],
+            tuple[Any, int]]): stream callback.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        # Check arguments.
+        if((not isinstance(sampling_frequency, int)) or
+           (sampling_frequency <= 0) or
+           (not isinstance(number_of_channels, int)) or
+           (number_of_channels != self._input_samples.shape[1]) or
+           (not isinstance(samples_per_buffer, int)) or
+           (samples_per_buffer <= 0) or
+           (not callable(stream_callback))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._sampling_frequency = sampling_frequency
+        self._samples_per_buffer = samples_per_buffer
+
+        # Input and output are padded to whole buffers.
+        number_of_frames: int = self._input_samples.shape[0]
+        number_of_buffers: int = -(-number_of_frames // samples_per_buffer)
+        padded_input: numpy.ndarray = numpy.zeros(
+            (number_of_buffers * samples_per_buffer, number_of_channels),
+            dtype=numpy.float32)
+        padded_input[:number_of_frames] = self._input_samples
+        self._output_samples = numpy.zeros_like(padded_input)
+        self._reset_statistics()
+
+        self._is_active = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(padded_input, stream_callback),
+            name="SimulatedDevice",
+            daemon=True)
+        self._thread.start()
+
+    def _run(self,
+             padded_input: numpy.ndarray,
+             stream_callback: Callable[[bytes, int, Any, int],
+                                       tuple[Any, int]]) -> None:
+        """Call stream callback for every buffer of input.
+
+        Args:
+            padded_input (numpy.ndarray): float32 input of whole buffers.
+            stream_callback (Callable[[bytes, int, Any, int],
+            tuple[Any, int]]): stream callback.
+        """
+        random_generator: numpy.random.Generator = \
+            numpy.random.default_rng(self._seed)
+        number_of_buffers: int = \
+            padded_input.shape[0] // self._samples_per_buffer
+        buffer_period_s: float = 0.0
+        if self._clock_speed is not None:
+            buffer_period_s = (self._samples_per_buffer
+                               / self._sampling_frequency / self._clock_speed)
+
+        start_time_s: float = time.perf_counter()
+        scheduled_time_s: float = start_time_s
+        missed_deadline: bool = False
+        for buffer_index in range(number_of_buffers):
+            if self._stop_event.is_set() is True:
+                break
+
+            if self._clock_speed is not None:
+                delay_s: float = (scheduled_time_s - time.perf_counter()
+                                  + random_generator.uniform(
+                                      0, self._scheduling_jitter_s))
+                if delay_s > 0:
+                    time.sleep(delay_s)
+
+            status_flags: int = 0
+            if missed_deadline is True:
+                status_flags = AudioBackend.OUTPUT_UNDERFLOW
+            if buffer_index in self._xrun_flags:
+                status_flags = status_flags | self._xrun_flags[buffer_index]
+                self._injected_xruns = self._injected_xruns + 1
+            elif random_generator.random() < self._xrun_probability:
+                status_flags = status_flags | self._XRUN_FLAGS[
+                    random_generator.integers(len(self._XRUN_FLAGS))]
+                self._injected_xruns = self._injected_xruns + 1
+
+            start: int = buffer_index * self._samples_per_buffer
+            end: int = start + self._samples_per_buffer
+            output_data: Any
+            return_code: int
+            output_data, return_code = stream_callback(
+                padded_input[start:end].tobytes(),
+                self._samples_per_buffer,
+                None,
+                status_flags)
+            self._output_samples[start:end] = numpy.frombuffer(
+                output_data, dtype=numpy.float32).reshape(
+                    self._samples_per_buffer, -1)
+            self._callbacks = self._callbacks + 1
+
+            if self._clock_speed is not None:
+                scheduled_time_s = scheduled_time_s + buffer_period_s
+                end_time_s: float = time.perf_counter()
+                missed_deadline = end_time_s > scheduled_time_s
+                if missed_deadline is True:
+                    self._deadline_misses = self._deadline_misses + 1
+                    scheduled_time_s = end_time_s
+
+            if return_code != AudioBackend.CONTINUE:
+                break
+
+        self._elapsed_time_s = time.perf_counter() - start_time_s
+        self._is_active = False
+
+    def is_active(self) -> bool:
+        """Return a flag that specifies whether device calls its callback.
+
+        Returns:
+            bool: True - device is active. False - device is stopped.
+        """
+        return self._is_active
+
+    def get_input_latency(self) -> float:
+        """Return input latency.
+
+        Returns:
+            float: one buffer, s.
+        """
+        return self._samples_per_buffer / self._sampling_frequency
+
+    def get_output_latency(self) -> float:
+        """Return output latency.
+
+        Returns:
+            float: one buffer, s.
+        """
+        return self._samples_per_buffer / self._sampling_frequency
+
+    def stats(self) -> dict[str, Any]:
+        """Return device statistics.
+
+        Returns:
+            dict[str, Any]: number of callbacks, deadline misses
+            and injected xruns, ratio of processed audio duration
+            to elapsed time, after device stops.
+        """
+        real_time_factor: float | None = None
+        if ((self._is_active is False) and
+            (self._elapsed_time_s > 0)):
+            real_time_factor = (self._callbacks * self._samples_per_buffer
+                                / self._sampling_frequency
+                                / self._elapsed_time_s)
+        return {
+            "simulated_callbacks": self._callbacks,
+            "simulated_deadline_misses": self._deadline_misses,
+            "simulated_injected_xruns": self._injected_xruns,
+            "simulated_real_time_factor": real_time_factor
+        }
+
+    def close(self) -> None:
+        """Stop calling stream callback."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def output_samples(self) -> numpy.ndarray:
+        """Return collected output.
+
+        Returns:
+            numpy.ndarray: float32 output of shape (frames, channels)
+            of the same length as input, zeros after the last callback.
+        """
+        return self._output_samples[:self._input_samples.shape[0]]
@@ -0,0 +1,202 @@
+import threading
+from typing import Any, Callable
+
+import numpy
+
+from audio_backend import AudioBackend
+
+
+class SimulatedLoopback(AudioBackend):
+    def __init__(self,
+                 latency_ms: int | float,
+                 jitter_ms: int | float,
+                 noise_level: float,
+                 seed: int | None = None) -> None:
+        """Initialize a simulated input/output device whose output is its input.
+
+        Device calls a stream callback like a pyaudio stream does,
+        as fast as the callback returns, without waiting for real time.
+        Output of a callback comes back as input after one buffer
+        of input, one buffer of output and latency.
+        Every output block is delayed by up to jitter more,
+        chosen at random. Input is attenuated by half and white noise
+        of noise level RMS is added.
+        Device stops when callback returns anything but CONTINUE.
+
+        Args:
+            latency_ms (int | float): latency of the device, ms.
+            jitter_ms (int | float): max random extra latency, ms.
+            noise_level (float): RMS of added noise.
+            seed (int | None): seed of random generator.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(latency_ms, (int, float))) or
+           (latency_ms < 0) or
+           (not isinstance(jitter_ms, (int, float))) or
+           (jitter_ms < 0) or
+           (not isinstance(noise_level, (int, float))) or
+           (noise_level < 0)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._GAIN: float = 0.5
+
+        self._latency_ms: float = latency_ms
+        self._jitter_ms: float = jitter_ms
+        self._noise_level: float = noise_level
+        self._seed: int | None = seed
+
+        self._sampling_frequency: int = 1
+        self._samples_per_buffer: int = 1
+        self._latency_samples: int = 0
+        self._is_active: bool = False
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def open(self,
+             sampling_frequency: int,
+             number_of_channels: int,
+             samples_per_buffer: int,
+             stream_callback: Callable[[bytes, int, Any, int],
+                                       tuple[Any, int]]) -> None:
+        """Start calling stream callback with silence in the loop.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            number_of_channels (int): number of interleaved channels
+            of input and output.
+            samples_per_buffer (int): number of frames in a buffer.
+            stream_callback (Callable[[bytes, int, Any, int],
+            tuple[Any, int]]): stream callback.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        # Check arguments.
+        if((not isinstance(sampling_frequency, int)) or
+           (sampling_frequency <= 0) or
+           (not isinstance(number_of_channels, int)) or
+           (number_of_channels <= 0) or
+           (not isinstance(samples_per_buffer, int)) or
+           (samples_per_buffer <= 0) or
+           (not callable(stream_callback))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._sampling_frequency = sampling_frequency
+        self._samples_per_buffer = samples_per_buffer
+        self._latency_samples = \
+            round(self._latency_ms / 1000 * sampling_frequency)
+
+        self._is_active = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(number_of_channels, stream_callback),
+            name="SimulatedLoopback",
+            daemon=True)
+        self._thread.start()
+
+    def _run(self,
+             number_of_channels: int,
+             stream_callback: Callable[[bytes, int, Any, int],
+                                       tuple[Any, int]]) -> None:
+        """Call stream callback until it stops or device is closed.
+
+        Args:
+            number_of_channels (int): number of interleaved channels.
+            stream_callback (Callable[[bytes, int, Any, int],
+            tuple[Any, int]]): stream callback.
+        """
+        random_generator: numpy.random.Generator = \
+            numpy.random.default_rng(self._seed)
+        jitter_samples: int = \
+            round(self._jitter_ms / 1000 * self._sampling_frequency)
+
+        # Output block is added to the line at the position it comes back
+        # as input. Read blocks are cleared for the next turn.
+        min_delay_samples: int = \
+            2 * self._samples_per_buffer + self._latency_samples
+        line_capacity: int = \
+            min_delay_samples + jitter_samples + 2 * self._samples_per_buffer
+        line: numpy.ndarray = numpy.zeros(
+            (line_capacity, number_of_channels), dtype=numpy.float32)
+        line_index: int = 0
+        input_block: numpy.ndarray = numpy.zeros(
+            (self._samples_per_buffer, number_of_channels),
+            dtype=numpy.float32)
+
+        indices: numpy.ndarray
+        while self._stop_event.is_set() is False:
+            # Input.
+            indices = (line_index + numpy.arange(self._samples_per_buffer)) \
+                      % line_capacity
+            numpy.multiply(line[indices], self._GAIN, out=input_block)
+            line[indices] = 0
+            if self._noise_level > 0:
+                input_block += random_generator.normal(
+                    scale=self._noise_level,
+                    size=input_block.shape).astype(numpy.float32)
+
+            output_data: Any
+            return_code: int
+            output_data, return_code = stream_callback(
+                input_block.tobytes(),
+                self._samples_per_buffer,
+                None,
+                0)
+
+            # Output.
+            output_block: numpy.ndarray = numpy.frombuffer(
+                output_data, dtype=numpy.float32).reshape(
+                    -1, number_of_channels)
+            delay_samples: int = min_delay_samples
+            if jitter_samples > 0:
+                delay_samples = delay_samples + int(
+                    random_generator.integers(jitter_samples + 1))
+            indices = (line_index + delay_samples
+                       + numpy.arange(output_block.shape[0])) \
+                      % line_capacity
+            line[indices] += output_block
+            line_index = (line_index + self._samples_per_buffer) \
+                         % line_capacity
+
+            if return_code != AudioBackend.CONTINUE:
+                break
+        self._is_active = False
+
+    def is_active(self) -> bool:
+        """Return a flag that specifies whether device calls its callback.
+
+        Returns:
+            bool: True - device is active. False - device is stopped.
+        """
+        return self._is_active
+
+    def get_input_latency(self) -> float:
+        """Return nominal input latency.
+
+        Returns:
+            float: half of device latency and one buffer, s.
+        """
+        return ((self._latency_samples / 2 + self._samples_per_buffer)
+                / self._sampling_frequency)
+
+    def get_output_latency(self) -> float:
+        """Return nominal output latency.
+
+        Returns:
+            float: half of device latency and one buffer, s.
+        """
+        return ((self._latency_samples / 2 + self._samples_per_buffer)
+                / self._sampling_frequency)
+
+    def close(self) -> None:
+        """Stop device."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
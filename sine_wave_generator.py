@@ -1,16 +1,40 @@
 import math
-import threading
+
+import numpy
+
+from carrier_waveform import CarrierWaveform
+from parameter_smoother import ParameterSmoother
+from ramp_shape import RampShape
+from sine_wave_parameters import SineWaveParameters
+from wavetable import Wavetable
 
 
 class SineWaveGenerator:
     def __init__(self,
                  sampling_frequency: int,
-                 sine_wave_frequency: int) -> None:
+                 sine_wave_frequency: int | float,
+                 carrier_waveform: CarrierWaveform = CarrierWaveform.SINE,
+                 smoothing_ramp_samples: int = 0,
+                 ramp_shape: RampShape = RampShape.LINEAR) -> None:
         """Initialize a sine wave with a specified frequency.
 
+        Sine wave is generated by a phase accumulator,
+        so any frequency below Nyquist frequency is exact
+        and phase stays continuous when frequency changes.
+        Other carrier waveforms are read from band-limited wavetables
+        with linear interpolation.
+        Sine wave points must be taken from one thread only.
+        Frequency and waveform may be changed from any thread
+        and take effect at the next block. Blocks glide to a new
+        frequency over a ramp, single points change it at once.
+
         Args:
             sampling_frequency (int): sampling frequency, Hz.
-            sine_wave_frequency (int): sine wave frequency. Hz.
+            sine_wave_frequency (int | float): sine wave frequency. Hz.
+            carrier_waveform (CarrierWaveform): carrier waveform.
+            smoothing_ramp_samples (int): duration of a frequency glide,
+            samples. 0 - do not glide.
+            ramp_shape (RampShape): shape of a frequency glide.
 
         Raises:
             ValueError: invalid arguments.
@@ -20,87 +44,514 @@ class SineWaveGenerator:
         # Check arguments.
         if((not isinstance(sampling_frequency, int)) or
            (sampling_frequency <= 0) or
-           (not isinstance(sine_wave_frequency, int)) or
+           (not isinstance(sine_wave_frequency, (int, float))) or
            (sine_wave_frequency <= 0) or
-           (sine_wave_frequency >= sampling_frequency/2)):
+           (sine_wave_frequency >= sampling_frequency/2) or
+           (not isinstance(carrier_waveform, CarrierWaveform)) or
+           (not isinstance(smoothing_ramp_samples, int)) or
+           (smoothing_ramp_samples < 0) or
+           (not isinstance(ramp_shape, RampShape))):
             raise ValueError("ERROR! Invalid arguments!")
-        
-        self._mutex_sine_wave_generator: threading.Lock = threading.Lock()
 
         self._sampling_frequency: int = sampling_frequency
-        self._sine_wave_frequency: int = sine_wave_frequency
-
-        self._number_of_samples_in_sine_wave_period: int \
-            = self._sampling_frequency // self._sine_wave_frequency
-        self._current_sample_index: int = 0
-
-        self._sine_wave: list[float] = []
-        self._generate_sine_wave()
-
-    def _generate_sine_wave(self) -> None:
-        """Generate a buffer that contains one sine wave period."""
-        with self._mutex_sine_wave_generator:
-            self._sine_wave.clear()
-            for i in range(0, self._number_of_samples_in_sine_wave_period, 1):
-                current_time: float = i * 1 / self._sampling_frequency
-                sine_wave_point: float = math.sin(
-                    2 * math.pi * self._sine_wave_frequency * current_time)
-                self._sine_wave.append(sine_wave_point)
-    
+
+        self._parameters: SineWaveParameters = self._create_parameters(
+            sine_wave_frequency=sine_wave_frequency,
+            carrier_waveform=carrier_waveform,
+            glide_start_frequency=sine_wave_frequency)
+
+        # Phase is measured in sine wave periods and is kept in [0, 1).
+        # Phase of a point is base phase plus point count times increment,
+        # calculated the same way for single points and blocks,
+        # so both produce identical points. Base phase moves forward
+        # when increment changes and every rebase period.
+        self._PHASE_REBASE_SAMPLES: int = 65536
+        self._phase: float = 0.0
+        self._phase_count: int = 0
+        self._base_phase_increment: float = self._parameters.phase_increment
+
+        self._sample_indices: numpy.ndarray = numpy.empty(0)
+
+        # Phase increment glides to a new frequency.
+        self._phase_increment_smoother: ParameterSmoother = \
+            ParameterSmoother(value=self._parameters.phase_increment,
+                              ramp_samples=smoothing_ramp_samples,
+                              ramp_shape=ramp_shape)
+        self._phase_increments: numpy.ndarray = numpy.empty(0)
+
+        # Scratch arrays of multichannel blocks.
+        self._angles: numpy.ndarray = numpy.empty(0)
+        self._angles_column: numpy.ndarray = numpy.empty((0, 1))
+        self._cosines: numpy.ndarray = numpy.empty(0)
+        self._cosines_column: numpy.ndarray = numpy.empty((0, 1))
+        self._products: numpy.ndarray = numpy.empty((0, 0))
+        self._phase_offsets: numpy.ndarray | None = None
+        self._offset_cosines: numpy.ndarray = numpy.empty(0)
+        self._offset_sines: numpy.ndarray = numpy.empty(0)
+
+        # Scratch arrays of wavetable lookup.
+        self._table_positions: numpy.ndarray = numpy.empty(0)
+        self._table_indices: numpy.ndarray = numpy.empty(0, dtype=numpy.intp)
+        self._next_values: numpy.ndarray = numpy.empty(0)
+
     def get_sine_wave_point(self) -> float:
         """Return next sine wave point.
 
         Returns:
             float: next sine wave point.
         """
-        sine_wave_point: float = 0
+        parameters: SineWaveParameters = self._parameters
+        if((parameters.phase_increment != self._base_phase_increment) or
+           (self._phase_count >= self._PHASE_REBASE_SAMPLES)):
+            self._rebase_phase(parameters.phase_increment)
+        phase: float = (self._phase +
+                        self._phase_count * parameters.phase_increment) % 1.0
+        self._phase_count += 1
 
-        with self._mutex_sine_wave_generator:
-            sine_wave_point = self._sine_wave[self._current_sample_index]
-            
-            self._current_sample_index = self._current_sample_index + 1
-            if (self._current_sample_index
-                >= self._number_of_samples_in_sine_wave_period):
-                self._current_sample_index = 0
+        if parameters.wavetable is None:
+            # Same sine as of a block, so points do not differ by rounding.
+            sine_wave_point: float = float(numpy.sin(phase * (2 * math.pi)))
+            return sine_wave_point
 
+        position: float = phase * Wavetable.TABLE_SIZE
+        index: int = int(position)
+        fraction: float = position - index
+        first_point: float = float(parameters.wavetable[index])
+        second_point: float = float(parameters.wavetable[index + 1])
+        sine_wave_point = first_point + fraction * (second_point - first_point)
         return sine_wave_point
-    
+
+    def get_block(self,
+                  number_of_points: int,
+                  out: numpy.ndarray | None = None) -> numpy.ndarray:
+        """Return next sine wave points.
+
+        Parameters are read once per block.
+
+        Args:
+            number_of_points (int): number of sine wave points.
+            out (numpy.ndarray | None): float64 array to store
+            sine wave points. None - allocate a new array.
+
+        Returns:
+            numpy.ndarray: next sine wave points.
+        """
+        if out is None:
+            out = numpy.empty(number_of_points, dtype=numpy.float64)
+
+        parameters: SineWaveParameters = self._parameters
+        max_phase_increment: float = self._get_phases(
+            number_of_points=number_of_points,
+            phase_increment=parameters.phase_increment,
+            out=out)
+        if parameters.wavetable is None:
+            numpy.multiply(out, 2 * math.pi, out=out)
+            numpy.sin(out, out=out)
+        else:
+            self._read_wavetable(
+                wavetable=self._get_wavetable(
+                    parameters=parameters,
+                    max_phase_increment=max_phase_increment),
+                phases=out,
+                out=out)
+        return out
+
+    def get_multichannel_block(self,
+                               number_of_points: int,
+                               phase_offsets: numpy.ndarray,
+                               out: numpy.ndarray | None = None) \
+                                -> numpy.ndarray:
+        """Return next sine wave points of several phase shifted channels.
+
+        Sine and cosine are calculated once per point, not once per
+        channel: sin(a + b) = sin(a) * cos(b) + cos(a) * sin(b).
+        Other carrier waveforms are read from a wavetable per channel.
+        Parameters are read once per block.
+
+        Args:
+            number_of_points (int): number of sine wave points per channel.
+            phase_offsets (numpy.ndarray): float64 phase offset of every
+            channel, in sine wave periods. Sines and cosines of offsets
+            are cached while the same array is passed.
+            out (numpy.ndarray | None): float64 array of shape
+            (number of points, number of channels) to store sine wave points.
+            None - allocate a new array.
+
+        Returns:
+            numpy.ndarray: next sine wave points of shape
+            (number of points, number of channels).
+        """
+        number_of_channels: int = phase_offsets.shape[0]
+        if out is None:
+            out = numpy.empty((number_of_points, number_of_channels),
+                              dtype=numpy.float64)
+
+        if phase_offsets is not self._phase_offsets:
+            self._phase_offsets = phase_offsets
+            self._offset_cosines = numpy.cos(2 * math.pi * phase_offsets)
+            self._offset_sines = numpy.sin(2 * math.pi * phase_offsets)
+
+        if self._products.shape != (number_of_points, number_of_channels):
+            self._angles = numpy.empty(number_of_points, dtype=numpy.float64)
+            self._angles_column = self._angles.reshape(number_of_points, 1)
+            self._cosines = numpy.empty(number_of_points, dtype=numpy.float64)
+            self._cosines_column = self._cosines.reshape(number_of_points, 1)
+            self._products = numpy.empty(
+                (number_of_points, number_of_channels),
+                dtype=numpy.float64)
+
+        parameters: SineWaveParameters = self._parameters
+        max_phase_increment: float = self._get_phases(
+            number_of_points=number_of_points,
+            phase_increment=parameters.phase_increment,
+            out=self._angles)
+
+        if parameters.wavetable is not None:
+            numpy.add(self._angles_column, phase_offsets, out=self._products)
+            self._read_wavetable(
+                wavetable=self._get_wavetable(
+                    parameters=parameters,
+                    max_phase_increment=max_phase_increment),
+                phases=self._products,
+                out=out)
+            return out
+
+        numpy.multiply(self._angles, 2 * math.pi, out=self._angles)
+        numpy.cos(self._angles, out=self._cosines)
+        numpy.sin(self._angles, out=self._angles)
+
+        numpy.multiply(self._angles_column, self._offset_cosines, out=out)
+        numpy.multiply(self._cosines_column,
+                       self._offset_sines,
+                       out=self._products)
+        numpy.add(out, self._products, out=out)
+        return out
+
+    def _get_phases(self,
+                    number_of_points: int,
+                    phase_increment: float,
+                    out: numpy.ndarray) -> float:
+        """Calculate next sine wave phases and advance phase.
+
+        Without a glide phases are the same as of single points.
+
+        Args:
+            number_of_points (int): number of sine wave points.
+            phase_increment (float): target phase increment per point,
+            in sine wave periods.
+            out (numpy.ndarray): float64 array to store phases,
+            in sine wave periods. Phases are wrapped to [0, 1).
+
+        Returns:
+            float: largest phase increment of the block.
+        """
+        # Reuse sample indices while block size does not change.
+        if self._sample_indices.size != number_of_points:
+            self._sample_indices = numpy.arange(number_of_points,
+                                                dtype=numpy.float64)
+            self._phase_increments = numpy.empty(number_of_points,
+                                                 dtype=numpy.float64)
+
+        phase_increments: float | numpy.ndarray = \
+            self._phase_increment_smoother.get_block(
+                target=phase_increment,
+                out=self._phase_increments)
+
+        if not isinstance(phase_increments, numpy.ndarray):
+            if phase_increment != self._base_phase_increment:
+                self._rebase_phase(phase_increment)
+            # Block is split where base phase moves forward.
+            start: int = 0
+            while start < number_of_points:
+                if self._phase_count >= self._PHASE_REBASE_SAMPLES:
+                    self._rebase_phase(phase_increment)
+                stop: int = min(number_of_points,
+                                start + self._PHASE_REBASE_SAMPLES
+                                - self._phase_count)
+                phases: numpy.ndarray = out[start:stop]
+                numpy.add(self._sample_indices[:stop - start],
+                          self._phase_count,
+                          out=phases)
+                numpy.multiply(phases, phase_increment, out=phases)
+                numpy.add(phases, self._phase, out=phases)
+                numpy.remainder(phases, 1.0, out=phases)
+                self._phase_count += stop - start
+                start = stop
+            return phase_increment
+
+        # Phase of a point is the sum of increments of previous points.
+        self._rebase_phase(phase_increment)
+        phase: float = self._phase
+        numpy.cumsum(phase_increments, out=out)
+        self._phase = (phase + float(out[-1])) % 1.0
+        numpy.subtract(out, phase_increments, out=out)
+        numpy.add(out, phase, out=out)
+        numpy.remainder(out, 1.0, out=out)
+        # Ramp is monotonic.
+        return max(float(phase_increments[0]), float(phase_increments[-1]))
+
+    def _rebase_phase(self, phase_increment: float) -> None:
+        """Move base phase to the next point and set a new increment.
+
+        Args:
+            phase_increment (float): phase increment from the next point,
+            in sine wave periods.
+        """
+        self._phase = (self._phase +
+                       self._phase_count * self._base_phase_increment) % 1.0
+        self._phase_count = 0
+        self._base_phase_increment = phase_increment
+
+    def _get_wavetable(self,
+                       parameters: SineWaveParameters,
+                       max_phase_increment: float) -> numpy.ndarray:
+        """Return wavetable without aliasing for the whole block.
+
+        Table of a snapshot is built for the target frequency.
+        While frequency glides down from a higher one, a table
+        with fewer harmonics is taken from the tables of the glide,
+        which were built with the snapshot, so nothing is built here.
+
+        Args:
+            parameters (SineWaveParameters): parameters of the block.
+            max_phase_increment (float): largest phase increment
+            of the block.
+
+        Returns:
+            numpy.ndarray: wavetable.
+        """
+        if max_phase_increment <= parameters.phase_increment:
+            return parameters.wavetable
+        number_of_harmonics: int = Wavetable.get_number_of_harmonics(
+            sampling_frequency=self._sampling_frequency,
+            frequency=max_phase_increment * self._sampling_frequency)
+        wavetable: numpy.ndarray | None = \
+            parameters.glide_wavetables.get(number_of_harmonics)
+        if wavetable is None:
+            # Glide started higher than expected, fewest harmonics
+            # are the safest against aliasing.
+            wavetable = parameters.glide_wavetables[
+                min(parameters.glide_wavetables)]
+        return wavetable
+
+    def _read_wavetable(self,
+                        wavetable: numpy.ndarray,
+                        phases: numpy.ndarray,
+                        out: numpy.ndarray) -> None:
+        """Read wavetable with linear interpolation.
+
+        Args:
+            wavetable (numpy.ndarray): wavetable with two guard points.
+            phases (numpy.ndarray): float64 phases, in sine wave periods.
+            out (numpy.ndarray): float64 array of the same shape
+            to store points. May be phases.
+        """
+        if self._table_positions.shape != phases.shape:
+            self._table_positions = numpy.empty(phases.shape,
+                                                dtype=numpy.float64)
+            self._table_indices = numpy.empty(phases.shape, dtype=numpy.intp)
+            self._next_values = numpy.empty(phases.shape, dtype=numpy.float64)
+
+        positions: numpy.ndarray = self._table_positions
+        indices: numpy.ndarray = self._table_indices
+        next_values: numpy.ndarray = self._next_values
+
+        numpy.remainder(phases, 1.0, out=positions)
+        numpy.multiply(positions, Wavetable.TABLE_SIZE, out=positions)
+        numpy.copyto(indices, positions, casting="unsafe")
+        # Positions become fractions between neighbouring points.
+        numpy.subtract(positions, indices, out=positions)
+
+        numpy.take(wavetable, indices, out=out)
+        numpy.add(indices, 1, out=indices)
+        numpy.take(wavetable, indices, out=next_values)
+        numpy.subtract(next_values, out, out=next_values)
+        numpy.multiply(next_values, positions, out=next_values)
+        numpy.add(out, next_values, out=out)
+
+    def _create_parameters(self,
+                           sine_wave_frequency: int | float,
+                           carrier_waveform: CarrierWaveform,
+                           glide_start_frequency: int | float) \
+                            -> SineWaveParameters:
+        """Create parameters snapshot with wavetables for the frequency.
+
+        Tables of every frequency between the start of a glide
+        and the new frequency are built here, in the caller's thread,
+        so a glide never builds a table in the audio thread.
+        Wavetables are cached, so retuning to a known frequency range
+        does not build a table again.
+
+        Args:
+            sine_wave_frequency (int | float): sine wave frequency, Hz.
+            carrier_waveform (CarrierWaveform): carrier waveform.
+            glide_start_frequency (int | float): highest frequency
+            a glide to the new frequency may start from, Hz.
+
+        Returns:
+            SineWaveParameters: new parameters snapshot.
+        """
+        wavetable: numpy.ndarray | None = Wavetable.get_table(
+            carrier_waveform=carrier_waveform,
+            sampling_frequency=self._sampling_frequency,
+            frequency=sine_wave_frequency)
+        glide_wavetables: dict[int, numpy.ndarray] | None = None
+        if wavetable is not None:
+            glide_wavetables = Wavetable.get_tables(
+                carrier_waveform=carrier_waveform,
+                sampling_frequency=self._sampling_frequency,
+                low_frequency=sine_wave_frequency,
+                high_frequency=max(sine_wave_frequency,
+                                   glide_start_frequency))
+        return SineWaveParameters(
+            sine_wave_frequency=sine_wave_frequency,
+            phase_increment=sine_wave_frequency / self._sampling_frequency,
+            carrier_waveform=carrier_waveform,
+            wavetable=wavetable,
+            glide_wavetables=glide_wavetables)
+
+    def _get_glide_start_frequency(self) -> float:
+        """Return highest frequency a glide from now on may start from.
+
+        A glide starts from the frequency of the last generated point,
+        which lies between the frequency read here and the current target.
+
+        Returns:
+            float: frequency, Hz.
+        """
+        return max(self._parameters.sine_wave_frequency,
+                   self._phase_increment_smoother.value *
+                   self._sampling_frequency)
+
+    def create_parameters(self,
+                          sine_wave_frequency: int | float,
+                          carrier_waveform: CarrierWaveform) \
+                           -> SineWaveParameters:
+        """Check and create parameters snapshot for this generator.
+
+        Wavetables are built here, so a control thread creates a snapshot
+        and the audio thread only publishes it with the parameters setter.
+
+        Args:
+            sine_wave_frequency (int | float): sine wave frequency, Hz.
+            carrier_waveform (CarrierWaveform): carrier waveform.
+
+        Raises:
+            ValueError: invalid arguments.
+
+        Returns:
+            SineWaveParameters: new parameters snapshot.
+        """
+        # Check arguments.
+        if((not isinstance(sine_wave_frequency, (int, float))) or
+           (sine_wave_frequency <= 0) or
+           (sine_wave_frequency >= self._sampling_frequency/2) or
+           (not isinstance(carrier_waveform, CarrierWaveform))):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        return self._create_parameters(
+            sine_wave_frequency=sine_wave_frequency,
+            carrier_waveform=carrier_waveform,
+            glide_start_frequency=self._get_glide_start_frequency())
+
+    @property
+    def parameters(self) -> SineWaveParameters:
+        """Return parameters snapshot.
+
+        Returns:
+            SineWaveParameters: parameters snapshot.
+        """
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self, new_parameters: SineWaveParameters) -> None:
+        """Publish parameters snapshot created by create_parameters().
+
+        Only replaces a reference, so it may be called
+        from an audio callback.
+
+        Args:
+            new_parameters (SineWaveParameters): new parameters snapshot.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        # Check argument.
+        if not isinstance(new_parameters, SineWaveParameters):
+            raise ValueError("ERROR! Invalid argument!")
+
+        self._parameters = new_parameters
+
+    @property
+    def sampling_frequency(self) -> int:
+        """Return sampling frequency.
+
+        Returns:
+            int: sampling frequency, Hz.
+        """
+        return self._sampling_frequency
+
     @property
-    def sine_wave_frequency(self) -> int:
+    def sine_wave_frequency(self) -> int | float:
         """Return sine wave frequency.
 
         Returns:
-            int: sine wave frequency, Hz.
+            int | float: sine wave frequency, Hz.
         """
-        sine_wave_frequency_copy: int = 0
-        with self._mutex_sine_wave_generator:
-            sine_wave_frequency_copy = self._sine_wave_frequency
-        return sine_wave_frequency_copy
+        return self._parameters.sine_wave_frequency
 
     @sine_wave_frequency.setter
-    def sine_wave_frequency(self, new_sine_wave_frequency: int) -> None:
+    def sine_wave_frequency(self,
+                            new_sine_wave_frequency: int | float) -> None:
         """Check and set new sine wave frequency.
 
         Check and set new sine wave frequency.
-        Regenerate a buffer that contains one sine wave period.
+        Current phase is kept, so sine wave does not jump.
 
         Args:
-            new_sine_wave_frequency (int): new sine wave frequency, Hz.
+            new_sine_wave_frequency (int | float): new sine wave frequency, Hz.
 
         Raises:
             ValueError: invalid argument.
         """
         # Check argument.
-        if((not isinstance(new_sine_wave_frequency, int)) or
+        if((not isinstance(new_sine_wave_frequency, (int, float))) or
            (new_sine_wave_frequency <= 0) or
            (new_sine_wave_frequency >= self._sampling_frequency/2)):
             raise ValueError("ERROR! Invalid argument!")
-        
-        with self._mutex_sine_wave_generator:
-            self._sine_wave_frequency = new_sine_wave_frequency
-        
-            self._number_of_samples_in_sine_wave_period \
-                = self._sampling_frequency // self._sine_wave_frequency
-            self._current_sample_index = 0
-
-        self._generate_sine_wave()
\ No newline at end of file
+
+        self._parameters = self._create_parameters(
+            sine_wave_frequency=new_sine_wave_frequency,
+            carrier_waveform=self._parameters.carrier_waveform,
+            glide_start_frequency=self._get_glide_start_frequency())
+
+    @property
+    def carrier_waveform(self) -> CarrierWaveform:
+        """Return carrier waveform.
+
+        Returns:
+            CarrierWaveform: carrier waveform.
+        """
+        return self._parameters.carrier_waveform
+
+    @carrier_waveform.setter
+    def carrier_waveform(self,
+                         new_carrier_waveform: CarrierWaveform) -> None:
+        """Check and set new carrier waveform.
+
+        Current phase is kept.
+
+        Args:
+            new_carrier_waveform (CarrierWaveform): new carrier waveform.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        # Check argument.
+        if not isinstance(new_carrier_waveform, CarrierWaveform):
+            raise ValueError("ERROR! Invalid argument!")
+
+        self._parameters = self._create_parameters(
+            sine_wave_frequency=self._parameters.sine_wave_frequency,
+            carrier_waveform=new_carrier_waveform,
+            glide_start_frequency=self._get_glide_start_frequency())
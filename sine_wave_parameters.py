@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+import numpy
+
+from carrier_waveform import CarrierWaveform
+
+
+@dataclass(frozen=True, eq=False)
+class SineWaveParameters:
+    """Immutable snapshot of sine wave generator parameters.
+
+    A new snapshot is published by replacing the reference,
+    so sine wave generation reads all parameters at once without a lock.
+    Wavetables are built before the snapshot is published.
+    """
+    sine_wave_frequency: int | float
+    phase_increment: float
+    carrier_waveform: CarrierWaveform
+    # None - sine carrier is calculated, not read from a table.
+    wavetable: numpy.ndarray | None
+    # Tables by number of harmonics for frequencies that a glide
+    # to this frequency passes. None - sine carrier.
+    glide_wavetables: dict[int, numpy.ndarray] | None
@@ -0,0 +1,205 @@
+import threading
+
+import numpy
+
+from ring_buffer import RingBuffer
+
+
+class SpectrumAnalyzer:
+    def __init__(self,
+                 sampling_frequency: int,
+                 ring_buffer: RingBuffer,
+                 frame_size: int,
+                 hop_size: int,
+                 averaging: int | float,
+                 peak_decay_db_per_s: int | float) -> None:
+        """Start calculating spectra of ring buffer rows in a background thread.
+
+        Frames of samples overlap by frame size minus hop size.
+        Every frame is multiplied by a Hann window and transformed
+        by a real FFT. Power spectra are averaged exponentially,
+        peaks are held and decay at a constant rate.
+        Audio callback only writes samples to a ring buffer,
+        so FFT does not delay audio. Plot only reads the latest spectrum,
+        so FFT does not delay redraws. If analyzer falls behind,
+        it skips to the most recent frame.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            ring_buffer (RingBuffer): ring buffer to read samples from.
+            frame_size (int): number of samples in a frame.
+            hop_size (int): number of samples between starts of frames.
+            averaging (int | float): weight of the newest frame
+            in the average, (0, 1]. 1 - do not average.
+            peak_decay_db_per_s (int | float): decay of held peaks, dB/s.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(sampling_frequency, int)) or
+           (sampling_frequency <= 0) or
+           (not isinstance(ring_buffer, RingBuffer)) or
+           (not isinstance(frame_size, int)) or
+           (frame_size <= 1) or
+           (frame_size > ring_buffer.capacity) or
+           (not isinstance(hop_size, int)) or
+           (hop_size <= 0) or
+           (hop_size > frame_size) or
+           (not isinstance(averaging, (int, float))) or
+           (averaging <= 0) or
+           (averaging > 1) or
+           (not isinstance(peak_decay_db_per_s, (int, float))) or
+           (peak_decay_db_per_s < 0)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        # Floor of spectra, dB relative to a full scale sine wave.
+        self._MIN_DB: float = -120.0
+
+        self._ring_buffer: RingBuffer = ring_buffer
+        self._frame_size: int = frame_size
+        self._hop_size: int = hop_size
+        self._averaging: float = averaging
+        self._hop_time_s: float = hop_size / sampling_frequency
+
+        number_of_rows: int = ring_buffer.number_of_rows
+        number_of_bins: int = frame_size // 2 + 1
+
+        # Periodic Hann window.
+        self._window: numpy.ndarray = 0.5 - 0.5 * numpy.cos(
+            2 * numpy.pi * numpy.arange(frame_size) / frame_size)
+        # Full scale sine wave has power 1 in its bin.
+        self._power_scale: float = (2 / numpy.sum(self._window)) ** 2
+        self._peak_decay: float = \
+            10 ** (-peak_decay_db_per_s * self._hop_time_s / 10)
+        self._min_power: float = 10 ** (self._MIN_DB / 10)
+
+        self._frequencies: numpy.ndarray = numpy.fft.rfftfreq(
+            frame_size, d=1 / sampling_frequency)
+        self._frequencies.setflags(write=False)
+
+        self._frame: numpy.ndarray = numpy.zeros(
+            (number_of_rows, frame_size), dtype=numpy.float32)
+        self._windowed_frame: numpy.ndarray = numpy.zeros(
+            (number_of_rows, frame_size), dtype=numpy.float64)
+        self._power: numpy.ndarray = numpy.zeros(
+            (number_of_rows, number_of_bins), dtype=numpy.float64)
+        self._average_power: numpy.ndarray = numpy.zeros(
+            (number_of_rows, number_of_bins), dtype=numpy.float64)
+        self._peak_power: numpy.ndarray = numpy.zeros(
+            (number_of_rows, number_of_bins), dtype=numpy.float64)
+
+        # Start with the first frame written after start.
+        self._next_end_index: int = ring_buffer.write_index + frame_size
+        self._skipped_frames: int = 0
+
+        # Spectrum is replaced, never changed, so readers need no lock.
+        self._spectrum: tuple[numpy.ndarray, numpy.ndarray] = \
+            self._convert_to_db()
+
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run,
+            name="SpectrumAnalyzer",
+            daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Analyze new frames until analyzer is closed."""
+        while self._stop_event.wait(timeout=self._hop_time_s) is False:
+            self._analyze_new_frames()
+
+    def _analyze_new_frames(self) -> None:
+        """Analyze all frames that were written since the previous call."""
+        write_index: int = self._ring_buffer.write_index
+
+        # Frames that are about to be overwritten are skipped.
+        max_lag: int = self._ring_buffer.capacity - self._frame_size
+        if write_index - self._next_end_index > max_lag:
+            behind_frames: int = \
+                (write_index - self._next_end_index) // self._hop_size
+            self._skipped_frames = self._skipped_frames + behind_frames
+            self._next_end_index = \
+                self._next_end_index + behind_frames * self._hop_size
+
+        analyzed: bool = False
+        while self._next_end_index <= write_index:
+            if self._ring_buffer.read_window(end_index=self._next_end_index,
+                                             out=self._frame) is True:
+                self._analyze_frame()
+                analyzed = True
+            else:
+                self._skipped_frames = self._skipped_frames + 1
+            self._next_end_index = self._next_end_index + self._hop_size
+
+        if analyzed is True:
+            self._spectrum = self._convert_to_db()
+
+    def _analyze_frame(self) -> None:
+        """Add power spectrum of a frame to the average and the peaks."""
+        numpy.multiply(self._frame, self._window, out=self._windowed_frame)
+        spectrum: numpy.ndarray = numpy.fft.rfft(self._windowed_frame, axis=1)
+        numpy.abs(spectrum, out=self._power)
+        numpy.square(self._power, out=self._power)
+        numpy.multiply(self._power, self._power_scale, out=self._power)
+
+        numpy.multiply(self._peak_power,
+                       self._peak_decay,
+                       out=self._peak_power)
+        numpy.maximum(self._peak_power, self._power, out=self._peak_power)
+
+        # Average += averaging * (power - average).
+        numpy.subtract(self._power, self._average_power, out=self._power)
+        numpy.multiply(self._power, self._averaging, out=self._power)
+        numpy.add(self._average_power, self._power, out=self._average_power)
+
+    def _convert_to_db(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Convert average and peak power spectra to new read-only arrays.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: average and peak spectra
+            of every row, dB.
+        """
+        spectrum: list[numpy.ndarray] = []
+        for power in (self._average_power, self._peak_power):
+            power_db: numpy.ndarray = numpy.maximum(power, self._min_power)
+            numpy.log10(power_db, out=power_db)
+            numpy.multiply(power_db, 10, out=power_db)
+            power_db.setflags(write=False)
+            spectrum.append(power_db)
+        return (spectrum[0], spectrum[1])
+
+    def close(self) -> None:
+        """Stop analyzing."""
+        self._stop_event.set()
+        self._thread.join()
+
+    @property
+    def frequencies(self) -> numpy.ndarray:
+        """Return frequencies of spectrum bins.
+
+        Returns:
+            numpy.ndarray: read-only float64 frequency of every bin, Hz.
+        """
+        return self._frequencies
+
+    @property
+    def spectrum(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Return the latest spectrum.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: read-only float64
+            average and peak spectra of shape (rows, bins), dB.
+        """
+        return self._spectrum
+
+    @property
+    def skipped_frames(self) -> int:
+        """Return number of frames that were overwritten before analysis.
+
+        Returns:
+            int: number of skipped frames.
+        """
+        return self._skipped_frames
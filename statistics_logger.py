@@ -0,0 +1,64 @@
+import json
+import threading
+import time
+from typing import Any, Callable
+
+
+class StatisticsLogger:
+    def __init__(self,
+                 get_statistics: Callable[[], dict[str, Any]],
+                 file_name: str,
+                 interval_s: int | float) -> None:
+        """Start appending statistics to a JSON lines file periodically.
+
+        Args:
+            get_statistics (Callable[[], dict[str, Any]]): function
+            that returns current statistics.
+            file_name (str): JSON lines file name.
+            interval_s (int | float): interval between lines, s.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not callable(get_statistics)) or
+           (not isinstance(file_name, str)) or
+           (not isinstance(interval_s, (int, float))) or
+           (interval_s <= 0)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._get_statistics: Callable[[], dict[str, Any]] = get_statistics
+        self._file_name: str = file_name
+        self._interval_s: float = interval_s
+
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run,
+            name="StatisticsLogger",
+            daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Append statistics until logger is closed."""
+        while self._stop_event.wait(timeout=self._interval_s) is False:
+            self._write_line()
+        self._write_line()
+
+    def _write_line(self) -> None:
+        """Append current statistics with a timestamp."""
+        line: dict[str, Any] = {"time": time.time()}
+        line.update(self._get_statistics())
+        try:
+            with open(self._file_name, "a") as statistics_file:
+                statistics_file.write(json.dumps(line) + "\n")
+        except OSError as e:
+            print(type(e))
+            print(e)
+            print("ERROR! Could not write statistics to file!")
+
+    def close(self) -> None:
+        """Write last statistics and stop logging."""
+        self._stop_event.set()
+        self._thread.join()
@@ -1,13 +1,22 @@
-import queue
-import struct
-import threading
+import os
+import time
 from typing import Any
 
-import pyaudio
+import numpy
 
+from audio_backend import AudioBackend
+from audio_processor import AudioProcessor
+from carrier_waveform import CarrierWaveform
+from dsp_worker import DspWorker
+from execution_mode import ExecutionMode
 from noise_generator import NoiseGenerator
-from ring_modulator import RingModulator
+from processing_mode import ProcessingMode
+from ramp_shape import RampShape
+from recorder import Recorder
+from ring_buffer import RingBuffer
 from sine_wave_generator import SineWaveGenerator
+from stream_statistics import StreamStatistics
+from xrun_recovery_policy import XrunRecoveryPolicy
 
 
 class Stream:
@@ -15,15 +24,58 @@ class Stream:
                  sampling_frequency: int,
                  samples_per_buffer: int,
                  sine_wave_generator: SineWaveGenerator,
+                 noise_generator: NoiseGenerator,
                  add_noise: bool,
                  volume: int | float,
-                 multithread_queue: queue.Queue[tuple[float, float, float]]) \
-                    -> None:
+                 plot_ring_buffer: RingBuffer | None,
+                 processing_mode: ProcessingMode = ProcessingMode.BLOCK,
+                 min_latency_ms: int | None = None,
+                 xrun_recovery_policy: XrunRecoveryPolicy = \
+                    XrunRecoveryPolicy.ABORT,
+                 max_consecutive_xruns: int = 1,
+                 execution_mode: ExecutionMode = ExecutionMode.IN_CALLBACK,
+                 number_of_channels: int = 1,
+                 carrier_phase_offsets: list[int | float] | None = None,
+                 smoothing_ramp_samples: int = 0,
+                 ramp_shape: RampShape = RampShape.LINEAR,
+                 effect_chain: list[dict[str, Any]] | None = None,
+                 recorder: Recorder | None = None,
+                 audio_backend: AudioBackend | None = None,
+                 resampling_factor: int = 1) -> None:
         super().__init__()
-        """Start pyaudio input/output stream.
+        """Start input/output stream on an audio backend.
+
+        If plot ring buffer is None, samples are not sent to plot.
+        If minimum latency is not None, it is passed to PortAudio through
+        PA_MIN_LATENCY_MSEC environment variable. PortAudio reads it
+        when pyaudio object is created, so it must be set before that.
+        Only Windows host APIs of PortAudio use it.
+        On an underflow or overflow the stream recovers according to
+        xrun recovery policy. ABORT policy stops the stream after
+        max consecutive xruns, previous xruns are processed as usual.
+        In WORKER_PROCESS execution mode input voice is processed
+        in a separate process with its own copies of sine wave and noise
+        generators, which adds one buffer of latency.
+        Input and output have the same number of interleaved channels.
+        Carrier phase offsets are in degrees, one per channel.
+        Volume ramps to a new value over smoothing ramp samples.
+        Sine wave generator glides to a new frequency by itself,
+        a worker process glides over smoothing ramp samples.
+        Effect chain describes processing stages, None - amplify,
+        modulate, add noise, clip.
+        If recorder is not None, every input and output block is copied
+        to it, recorder writes them to files in its own thread.
+        If audio backend is None, default PortAudio device is opened
+        through pyaudio, which is imported only then.
+        With a resampling factor voice is processed at sampling frequency
+        divided by it, sine wave generator must run at that frequency,
+        plot samples are at that frequency too. Samples per buffer
+        must be a multiple of it. Resampling costs more CPU time
+        than default processing saves, it helps expensive effect chains only.
 
         Raises:
             ValueError: invalid arguments.
+            RuntimeError: worker process did not start.
         """
         # Check arguments.
         if((not isinstance(sampling_frequency, int)) or
@@ -31,61 +83,136 @@ class Stream:
            (not isinstance(samples_per_buffer, int)) or
            (samples_per_buffer <= 0) or
            (not isinstance(sine_wave_generator, SineWaveGenerator)) or
+           (not isinstance(noise_generator, NoiseGenerator)) or
            (not isinstance(add_noise, bool)) or
            (not isinstance(volume, (int, float))) or
            (volume <= 0) or
-           (not isinstance(multithread_queue, queue.Queue))):
+           ((plot_ring_buffer is not None) and
+            (not isinstance(plot_ring_buffer, RingBuffer))) or
+           (not isinstance(processing_mode, ProcessingMode)) or
+           ((min_latency_ms is not None) and
+            ((not isinstance(min_latency_ms, int)) or
+             (min_latency_ms <= 0))) or
+           (not isinstance(xrun_recovery_policy, XrunRecoveryPolicy)) or
+           (not isinstance(max_consecutive_xruns, int)) or
+           (max_consecutive_xruns <= 0) or
+           (not isinstance(execution_mode, ExecutionMode)) or
+           (not isinstance(number_of_channels, int)) or
+           (number_of_channels <= 0) or
+           (not isinstance(smoothing_ramp_samples, int)) or
+           (smoothing_ramp_samples < 0) or
+           (not isinstance(ramp_shape, RampShape)) or
+           ((recorder is not None) and
+            (not isinstance(recorder, Recorder))) or
+           ((audio_backend is not None) and
+            (not isinstance(audio_backend, AudioBackend))) or
+           (not isinstance(resampling_factor, int)) or
+           (resampling_factor <= 0) or
+           (sine_wave_generator.sampling_frequency * resampling_factor
+            != sampling_frequency) or
+           (samples_per_buffer % resampling_factor != 0)):
            raise ValueError("ERROR! Invalid arguments!")
 
-        self._pyaudio_object: pyaudio.PyAudio = pyaudio.PyAudio()
-        self._format_of_sample = pyaudio.paFloat32
-        self._bytes_per_sample: int = pyaudio.get_sample_size(
-            self._format_of_sample)
-        self._number_of_channels: int = 1
+        # Worker process processes blocks in BLOCK processing mode.
+        self._audio_processor: AudioProcessor | DspWorker
+        if execution_mode is ExecutionMode.WORKER_PROCESS:
+            self._audio_processor = DspWorker(
+                sampling_frequency=sampling_frequency,
+                samples_per_buffer=samples_per_buffer,
+                sine_wave_frequency=sine_wave_generator.sine_wave_frequency,
+                noise_color=noise_generator.noise_color,
+                add_noise=add_noise,
+                volume=volume,
+                plot_ring_buffer=plot_ring_buffer,
+                number_of_channels=number_of_channels,
+                carrier_phase_offsets=carrier_phase_offsets,
+                carrier_waveform=sine_wave_generator.carrier_waveform,
+                smoothing_ramp_samples=smoothing_ramp_samples,
+                ramp_shape=ramp_shape,
+                effect_chain=effect_chain,
+                resampling_factor=resampling_factor)
+            print("DSP worker process latency = "
+                  f"{self._audio_processor.added_latency_ms} ms")
+        else:
+            self._audio_processor = AudioProcessor(
+                samples_per_buffer=samples_per_buffer,
+                sine_wave_generator=sine_wave_generator,
+                noise_generator=noise_generator,
+                add_noise=add_noise,
+                volume=volume,
+                plot_ring_buffer=plot_ring_buffer,
+                processing_mode=processing_mode,
+                number_of_channels=number_of_channels,
+                carrier_phase_offsets=carrier_phase_offsets,
+                smoothing_ramp_samples=smoothing_ramp_samples,
+                ramp_shape=ramp_shape,
+                effect_chain=effect_chain,
+                resampling_factor=resampling_factor)
+            if resampling_factor > 1:
+                resampling_latency_ms: float = \
+                    (self._audio_processor.added_latency_samples
+                     / sampling_frequency * 1000)
+                print(f"Resampling latency = {resampling_latency_ms} ms")
+
+        if min_latency_ms is not None:
+            os.environ["PA_MIN_LATENCY_MSEC"] = str(min_latency_ms)
+
+        if audio_backend is None:
+            from pyaudio_backend import PyAudioBackend
+            audio_backend = PyAudioBackend()
+        self._audio_backend: AudioBackend = audio_backend
+        self._bytes_per_sample: int = numpy.dtype(numpy.float32).itemsize
+        self._number_of_channels: int = number_of_channels
         self._sampling_frequency: int = sampling_frequency
         self._samples_per_buffer: int = samples_per_buffer
-        
+
         self._sine_wave_generator: SineWaveGenerator = sine_wave_generator
-        self._add_noise: bool = add_noise
-        self._mutex_add_noise: threading.Lock = threading.Lock()
-        self._volume: float = volume
-        self._mutex_volume: threading.Lock = threading.Lock()
-
-        self._multithread_queue: queue.Queue[tuple[float, float, float]] = \
-            multithread_queue
-
-        self._stream: pyaudio.Pyaudio.Stream = self._pyaudio_object.open(
-            rate=sampling_frequency,
-            channels=self._number_of_channels,
-            format=self._format_of_sample,
-            input=True,
-            output=True,
-            frames_per_buffer=samples_per_buffer,
-            stream_callback=self._callback)
+        self._noise_generator: NoiseGenerator = noise_generator
+        self._plot_ring_buffer: RingBuffer | None = plot_ring_buffer
+        self._recorder: Recorder | None = recorder
+        self._xrun_recovery_policy: XrunRecoveryPolicy = xrun_recovery_policy
+        self._max_consecutive_xruns: int = max_consecutive_xruns
+        self._stream_statistics: StreamStatistics = StreamStatistics(
+            buffer_period_ms=samples_per_buffer / sampling_frequency * 1000)
+        
+        try:
+            self._audio_backend.open(
+                sampling_frequency=sampling_frequency,
+                number_of_channels=self._number_of_channels,
+                samples_per_buffer=samples_per_buffer,
+                stream_callback=self._callback)
+        except (OSError, ValueError):
+            if isinstance(self._audio_processor, DspWorker):
+                self._audio_processor.close()
+            raise
         
-        input_latency_ms: float = self._stream.get_input_latency() * 1000
-        output_latency_ms: float = self._stream.get_output_latency() * 1000
-        total_latency_ms: float = input_latency_ms + output_latency_ms
+        input_latency_ms: float = \
+            self._audio_backend.get_input_latency() * 1000
+        output_latency_ms: float = \
+            self._audio_backend.get_output_latency() * 1000
+        self._total_latency_ms: float = input_latency_ms + output_latency_ms
         print(f"Input latency = {input_latency_ms} ms")
         print(f"Output latency = {output_latency_ms} ms")
-        print(f"Total latency = {total_latency_ms} ms")
+        print(f"Total latency = {self._total_latency_ms} ms")
     
     def _callback(self,
                   in_data: bytes,
                   frame_count: int,
                   time_info: Any,
                   status_flags: Any):
-        """Pyaudio input/output stream callback.
+        """Audio backend input/output stream callback.
 
         Get input voice from a microphone,
         modulate it by a sine wave
         and output modulated voice to a speaker.
         Send input voice, sine wave and modulated voice samples to
-        a multithread queue for later plotting.
+        a ring buffer for later plotting.
+        Recover from underflows and overflows according to
+        xrun recovery policy.
 
         Args:
             in_data (bytes): raw bytes of input voice data.
-            frame_count (int): number of input voice float samples.
+            frame_count (int): number of input voice frames.
             time_info (Any): time information.
             status_flags (Any): portAutio callback flag.
 
@@ -93,82 +220,150 @@ class Stream:
             _type_: raw bytes of modulated voice data,
             portAudio callback return code.
         """
+        start_time: float = time.perf_counter()
+
         # Check arguments.
-        if ((status_flags == pyaudio.paInputUnderflow) or
-            (status_flags == pyaudio.paInputOverflow) or
-            (status_flags == pyaudio.paOutputUnderflow) or
-            (status_flags == pyaudio.paOutputOverflow)):
-            dummy_bytes: bytes = bytes(frame_count *
-                                       self._number_of_channels *
-                                       self._bytes_per_sample)
-            return (dummy_bytes, pyaudio.paAbort)
-        
-        i: int = 0
-        output_byte_array: bytearray = bytearray()
-        while (i + self._bytes_per_sample - 1) <= (len(in_data) - 1):
-            # Get input voice point as bytes.
-            input_voice_point_bytes: bytes = \
-                in_data[i:i + self._bytes_per_sample]
-            input_voice_point: float = \
-                (struct.unpack("f", input_voice_point_bytes))[0]
-          
-            # Amplify.
-            input_voice_point = input_voice_point * self.volume
-
-            # Get sine wave point.
-            sine_wave_point: float = \
-                self._sine_wave_generator.get_sine_wave_point()
-            
-            # Modulate.
-            modulated_voice_point: float = RingModulator.modulate(
-                input_voice_point=input_voice_point,
-                sine_wave_point=sine_wave_point)
-
-            # Add noise optionally.
-            if self.add_noise is True:
-                noise_point: float = NoiseGenerator.get_noise_point()
-                modulated_voice_point = modulated_voice_point + noise_point
-   
-            # Prevent clipping.
-            if modulated_voice_point > 1:
-                modulated_voice_point = 1
-            elif modulated_voice_point < -1:
-                modulated_voice_point = -1
-
-            # Add to output byte array.
-            modulated_voice_point_bytes: bytes = \
-                struct.pack("f", modulated_voice_point)
-            for output_byte in modulated_voice_point_bytes:
-                output_byte_array.append(output_byte)
-
-            # Send points to plot.
-            points: tuple[float, float, float] = (input_voice_point,
-                                                  sine_wave_point,
-                                                  modulated_voice_point)
-            try:
-                self._multithread_queue.put(points, block=False)
-            except queue.Full:
-                pass
-            
-            # Increment index.
-            i = i + self._bytes_per_sample
-
-        output_bytes: bytes = bytes(output_byte_array)
-        return (output_bytes, pyaudio.paContinue)
+        input_underflow: bool = \
+            (status_flags & AudioBackend.INPUT_UNDERFLOW) != 0
+        input_overflow: bool = \
+            (status_flags & AudioBackend.INPUT_OVERFLOW) != 0
+        output_underflow: bool = \
+            (status_flags & AudioBackend.OUTPUT_UNDERFLOW) != 0
+        output_overflow: bool = \
+            (status_flags & AudioBackend.OUTPUT_OVERFLOW) != 0
+        output_bytes: bytes | numpy.ndarray
+        if ((input_underflow is True) or
+            (input_overflow is True) or
+            (output_underflow is True) or
+            (output_overflow is True)):
+            self._stream_statistics.add_xruns(
+                input_underflow=input_underflow,
+                input_overflow=input_overflow,
+                output_underflow=output_underflow,
+                output_overflow=output_overflow)
+
+            match self._xrun_recovery_policy:
+                case XrunRecoveryPolicy.ABORT:
+                    if (self._stream_statistics.consecutive_xruns >=
+                        self._max_consecutive_xruns):
+                        dummy_bytes: bytes = bytes(frame_count *
+                                                   self._number_of_channels *
+                                                   self._bytes_per_sample)
+                        return (dummy_bytes, AudioBackend.ABORT)
+                    output_bytes = \
+                        self._audio_processor.process(in_data=in_data)
+                case XrunRecoveryPolicy.CONTINUE:
+                    output_bytes = \
+                        self._audio_processor.process(in_data=in_data)
+                case XrunRecoveryPolicy.CONCEAL_REPEAT:
+                    output_bytes = self._audio_processor.conceal_repeat()
+                    self._stream_statistics.add_concealed_buffer()
+                case XrunRecoveryPolicy.CONCEAL_CROSSFADE:
+                    output_bytes = self._audio_processor.conceal_crossfade(
+                        in_data=in_data)
+                    self._stream_statistics.add_concealed_buffer()
+        else:
+            self._stream_statistics.reset_consecutive_xruns()
+
+            # Numpy array is passed to backend as a read-only buffer
+            # without copying.
+            output_bytes = self._audio_processor.process(in_data=in_data)
+
+        # Recorder copies blocks and never waits for its files.
+        if self._recorder is not None:
+            self._recorder.record(input_data=in_data, output_data=output_bytes)
+
+        callback_duration_ms: float = \
+            (time.perf_counter() - start_time) * 1000
+        self._stream_statistics.add_callback_duration(
+            callback_duration_ms=callback_duration_ms)
+        return (output_bytes, AudioBackend.CONTINUE)
     
     def is_active(self) -> bool:
-        """Return a flag that specifies whether pyaudio stream is active.
+        """Return a flag that specifies whether input/output stream is active.
 
         Returns:
-            bool: True - pyaudio input/output stream is active.
-            False - pyaudio input/output stream is not active.
+            bool: True - input/output stream is active.
+            False - input/output stream is not active.
         """
-        return self._stream.is_active()
+        return self._audio_backend.is_active()
+
+    def stats(self) -> dict[str, Any]:
+        """Return stream statistics.
+
+        Returns:
+            dict[str, Any]: callback duration histogram,
+            underflow and overflow counters, number of plot samples
+            dropped by ring buffer, number of noise points
+            replaced by silence, number of parameter changes,
+            worker process latency, late and dropped blocks,
+            whether worker process is alive or failed,
+            recorded and dropped blocks of recorder, statistics
+            of audio backend.
+        """
+        statistics: dict[str, Any] = self._stream_statistics.get()
+        statistics["plot_overrun_samples"] = 0
+        if self._plot_ring_buffer is not None:
+            statistics["plot_overrun_samples"] = \
+                self._plot_ring_buffer.overrun_samples
+        if isinstance(self._audio_processor, DspWorker):
+            statistics.update(self._audio_processor.stats())
+        else:
+            statistics["noise_underrun_points"] = \
+                self._noise_generator.underrun_points
+        if self._recorder is not None:
+            statistics.update(self._recorder.stats())
+        statistics.update(self._audio_backend.stats())
+        return statistics
 
     def close(self) -> None:
-        """Close pyaudio input/output stream."""
-        self._stream.close()
-        self._pyaudio_object.terminate()
+        """Close input/output stream."""
+        self._audio_backend.close()
+        if isinstance(self._audio_processor, DspWorker):
+            self._audio_processor.close()
+
+    def change_parameters(self, changes: dict[str, Any]) -> None:
+        """Check and change several parameters at the same buffer.
+
+        Args:
+            changes (dict[str, Any]): new values of "sine_wave_frequency",
+            "add_noise", "volume" and "carrier_waveform".
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        self._audio_processor.change_parameters(changes=changes)
+        if isinstance(self._audio_processor, DspWorker):
+            # Sine wave generator of this process is not used by audio,
+            # it keeps current frequency and waveform only.
+            if "sine_wave_frequency" in changes:
+                self._sine_wave_generator.sine_wave_frequency = \
+                    changes["sine_wave_frequency"]
+            if "carrier_waveform" in changes:
+                self._sine_wave_generator.carrier_waveform = \
+                    changes["carrier_waveform"]
+        self._stream_statistics.add_parameter_change()
+
+    @property
+    def total_latency_ms(self) -> float:
+        """Return input and output latency reported by PortAudio.
+
+        Returns:
+            float: total latency, ms.
+        """
+        return self._total_latency_ms
+
+    @property
+    def added_latency_ms(self) -> float:
+        """Return latency added by processing on top of device latency.
+
+        Returns:
+            float: latency of worker process or resampling, ms.
+        """
+        if isinstance(self._audio_processor, DspWorker):
+            return self._audio_processor.added_latency_ms
+        return (self._audio_processor.added_latency_samples
+                / self._sampling_frequency * 1000)
 
     @property
     def add_noise(self) -> bool:
@@ -177,10 +372,7 @@ class Stream:
         Returns:
             bool: current "add noise" parameter.
         """
-        add_noise_copy: bool = True
-        with self._mutex_add_noise:
-            add_noise_copy = self._add_noise
-        return add_noise_copy
+        return self._audio_processor.add_noise
     
     @add_noise.setter
     def add_noise(self, new_add_noise: bool) -> None:
@@ -192,12 +384,8 @@ class Stream:
         Raises:
             ValueError: invalid argument.
         """
-        # Check argument.
-        if((not isinstance(new_add_noise, bool))):
-            raise ValueError("ERROR! Invalid argument!")
-
-        with self._mutex_add_noise:
-            self._add_noise = new_add_noise
+        self._audio_processor.add_noise = new_add_noise
+        self._stream_statistics.add_parameter_change()
 
     @property
     def volume(self) -> float:
@@ -206,10 +394,7 @@ class Stream:
         Returns:
             float: volume.
         """
-        volume_copy: float = 0
-        with self._mutex_volume:
-            volume_copy = self._volume
-        return volume_copy
+        return self._audio_processor.volume
 
     @volume.setter
     def volume(self, new_volume: int | float) -> None:
@@ -221,10 +406,55 @@ class Stream:
         Raises:
             ValueError: invalid argument.
         """
-        # Check argument.
-        if((not isinstance(new_volume, (int, float))) or
-           (new_volume <= 0)):
-            raise ValueError("ERROR! Invalid argument!")
+        self._audio_processor.volume = new_volume
+        self._stream_statistics.add_parameter_change()
+
+    @property
+    def sine_wave_frequency(self) -> int | float:
+        """Return sine wave frequency.
+
+        Returns:
+            int | float: sine wave frequency, Hz.
+        """
+        return self._sine_wave_generator.sine_wave_frequency
+
+    @sine_wave_frequency.setter
+    def sine_wave_frequency(self,
+                            new_sine_wave_frequency: int | float) -> None:
+        """Check and set new sine wave frequency.
+
+        Args:
+            new_sine_wave_frequency (int | float): new sine wave frequency, Hz.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        self._sine_wave_generator.sine_wave_frequency = new_sine_wave_frequency
+        if isinstance(self._audio_processor, DspWorker):
+            self._audio_processor.sine_wave_frequency = \
+                new_sine_wave_frequency
+        self._stream_statistics.add_parameter_change()
+
+    @property
+    def carrier_waveform(self) -> CarrierWaveform:
+        """Return carrier waveform.
+
+        Returns:
+            CarrierWaveform: carrier waveform.
+        """
+        return self._sine_wave_generator.carrier_waveform
+
+    @carrier_waveform.setter
+    def carrier_waveform(self, new_carrier_waveform: CarrierWaveform) -> None:
+        """Check and set new carrier waveform.
+
+        Args:
+            new_carrier_waveform (CarrierWaveform): new carrier waveform.
 
-        with self._mutex_volume:
-            self._volume = new_volume
\ No newline at end of file
+        Raises:
+            ValueError: invalid argument.
+        """
+        self._sine_wave_generator.carrier_waveform = new_carrier_waveform
+        if isinstance(self._audio_processor, DspWorker):
+            self._audio_processor.carrier_waveform = new_carrier_waveform
+        self._stream_statistics.add_parameter_change()
\ No newline at end of file
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StreamParameters:
+    """Immutable snapshot of input voice processing parameters.
+
+    A new snapshot is published by replacing the reference,
+    so the audio callback reads all parameters at once without a lock.
+    """
+    volume: int | float
+    add_noise: bool
@@ -0,0 +1,138 @@
+import bisect
+from typing import Any
+
+
+class StreamStatistics:
+    def __init__(self, buffer_period_ms: float) -> None:
+        """Initialize stream counters.
+
+        Every counter has exactly one writer thread and Python assignments
+        are atomic, so counters are updated without a lock.
+        Readers may see counters from slightly different moments.
+
+        Args:
+            buffer_period_ms (float): duration of one buffer, ms.
+
+        Raises:
+            ValueError: invalid argument.
+        """
+        super().__init__()
+
+        # Check argument.
+        if((not isinstance(buffer_period_ms, (int, float))) or
+           (buffer_period_ms <= 0)):
+            raise ValueError("ERROR! Invalid argument!")
+
+        self._buffer_period_ms: float = buffer_period_ms
+
+        # Upper edges of callback duration histogram bins, ms.
+        # The last bin counts all longer callbacks.
+        self._HISTOGRAM_EDGES_MS: list[float] = \
+            [0.01 * (2 ** i) for i in range(0, 15, 1)]
+        self._callback_duration_counts: list[int] = \
+            [0] * (len(self._HISTOGRAM_EDGES_MS) + 1)
+        self._number_of_callbacks: int = 0
+        self._total_callback_duration_ms: float = 0.0
+        self._max_callback_duration_ms: float = 0.0
+
+        self._input_underflows: int = 0
+        self._input_overflows: int = 0
+        self._output_underflows: int = 0
+        self._output_overflows: int = 0
+        self._xrun_callbacks: int = 0
+        self._consecutive_xruns: int = 0
+        self._max_consecutive_xruns: int = 0
+        self._concealed_buffers: int = 0
+
+        self._parameter_changes: int = 0
+
+    def add_callback_duration(self, callback_duration_ms: float) -> None:
+        """Count callback duration. Called by audio thread only.
+
+        Args:
+            callback_duration_ms (float): callback duration, ms.
+        """
+        bin_index: int = bisect.bisect_left(self._HISTOGRAM_EDGES_MS,
+                                            callback_duration_ms)
+        self._callback_duration_counts[bin_index] += 1
+        self._number_of_callbacks += 1
+        self._total_callback_duration_ms += callback_duration_ms
+        if callback_duration_ms > self._max_callback_duration_ms:
+            self._max_callback_duration_ms = callback_duration_ms
+
+    def add_xruns(self,
+                  input_underflow: bool,
+                  input_overflow: bool,
+                  output_underflow: bool,
+                  output_overflow: bool) -> None:
+        """Count underflows and overflows. Called by audio thread only.
+
+        Callback with any of them counts as one xrun.
+
+        Args:
+            input_underflow (bool): input underflow happened.
+            input_overflow (bool): input overflow happened.
+            output_underflow (bool): output underflow happened.
+            output_overflow (bool): output overflow happened.
+        """
+        self._input_underflows += int(input_underflow)
+        self._input_overflows += int(input_overflow)
+        self._output_underflows += int(output_underflow)
+        self._output_overflows += int(output_overflow)
+        self._xrun_callbacks += 1
+        self._consecutive_xruns += 1
+        if self._consecutive_xruns > self._max_consecutive_xruns:
+            self._max_consecutive_xruns = self._consecutive_xruns
+
+    def reset_consecutive_xruns(self) -> None:
+        """End a series of xruns. Called by audio thread only."""
+        self._consecutive_xruns = 0
+
+    def add_concealed_buffer(self) -> None:
+        """Count concealed buffer. Called by audio thread only."""
+        self._concealed_buffers += 1
+
+    def add_parameter_change(self) -> None:
+        """Count parameter change. Called by control thread only."""
+        self._parameter_changes += 1
+
+    @property
+    def consecutive_xruns(self) -> int:
+        """Return number of xruns in a row up to the last callback.
+
+        Returns:
+            int: number of consecutive xruns.
+        """
+        return self._consecutive_xruns
+
+    def get(self) -> dict[str, Any]:
+        """Return current counters.
+
+        Returns:
+            dict[str, Any]: current counters.
+        """
+        number_of_callbacks: int = self._number_of_callbacks
+        mean_callback_duration_ms: float = 0.0
+        if number_of_callbacks > 0:
+            mean_callback_duration_ms = \
+                self._total_callback_duration_ms / number_of_callbacks
+
+        return {
+            "buffer_period_ms": self._buffer_period_ms,
+            "callbacks": number_of_callbacks,
+            "callback_duration_mean_ms": mean_callback_duration_ms,
+            "callback_duration_max_ms": self._max_callback_duration_ms,
+            "callback_duration_histogram": {
+                "upper_edges_ms": list(self._HISTOGRAM_EDGES_MS),
+                "counts": list(self._callback_duration_counts)
+            },
+            "input_underflows": self._input_underflows,
+            "input_overflows": self._input_overflows,
+            "output_underflows": self._output_underflows,
+            "output_overflows": self._output_overflows,
+            "xrun_callbacks": self._xrun_callbacks,
+            "consecutive_xruns": self._consecutive_xruns,
+            "max_consecutive_xruns": self._max_consecutive_xruns,
+            "concealed_buffers": self._concealed_buffers,
+            "parameter_changes": self._parameter_changes
+        }
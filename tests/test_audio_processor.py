@@ -0,0 +1,136 @@
+import numpy
+import pytest
+
+from audio_processor import AudioProcessor
+from carrier_waveform import CarrierWaveform
+from noise_generator import NoiseGenerator
+from processing_mode import ProcessingMode
+from ring_buffer import RingBuffer
+from sine_wave_generator import SineWaveGenerator
+from wavetable import Wavetable
+
+
+SAMPLING_FREQUENCY: int = 48000
+SAMPLES_PER_BUFFER: int = 1024
+# More buffers than a rebase period of sine wave phase.
+NUMBER_OF_BUFFERS: int = 80
+
+
+def process(processing_mode: ProcessingMode,
+            sine_wave_frequency: int | float,
+            carrier_waveform: CarrierWaveform,
+            add_noise: bool,
+            changes: dict | None = None) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Process the same input voice and return output and plotted points."""
+    sine_wave_generator: SineWaveGenerator = SineWaveGenerator(
+        sampling_frequency=SAMPLING_FREQUENCY,
+        sine_wave_frequency=sine_wave_frequency,
+        carrier_waveform=carrier_waveform)
+    noise_generator: NoiseGenerator = NoiseGenerator(seed=1, real_time=False)
+    plot_ring_buffer: RingBuffer = RingBuffer(
+        number_of_rows=3,
+        capacity=SAMPLES_PER_BUFFER * NUMBER_OF_BUFFERS)
+    audio_processor: AudioProcessor = AudioProcessor(
+        samples_per_buffer=SAMPLES_PER_BUFFER,
+        sine_wave_generator=sine_wave_generator,
+        noise_generator=noise_generator,
+        add_noise=add_noise,
+        volume=3.0,
+        plot_ring_buffer=plot_ring_buffer,
+        processing_mode=processing_mode)
+
+    random_generator: numpy.random.Generator = numpy.random.default_rng(0)
+    output_blocks: list[numpy.ndarray] = []
+    try:
+        for i in range(NUMBER_OF_BUFFERS):
+            if (changes is not None) and (i == NUMBER_OF_BUFFERS // 2):
+                audio_processor.change_parameters(changes=changes)
+            input_voice: numpy.ndarray = \
+                (random_generator.standard_normal(SAMPLES_PER_BUFFER) *
+                 0.2).astype(numpy.float32)
+            output: bytes | numpy.ndarray = \
+                audio_processor.process(in_data=input_voice.tobytes())
+            if isinstance(output, numpy.ndarray):
+                output = output.tobytes()
+            output_blocks.append(numpy.frombuffer(output,
+                                                  dtype=numpy.float32))
+    finally:
+        noise_generator.close()
+
+    plotted_points: numpy.ndarray = numpy.zeros(
+        (3, SAMPLES_PER_BUFFER * NUMBER_OF_BUFFERS),
+        dtype=numpy.float32)
+    plot_ring_buffer.read_latest(out=plotted_points)
+    return numpy.concatenate(output_blocks), plotted_points
+
+
+@pytest.mark.parametrize("sine_wave_frequency", [1000, 220, 333.3])
+@pytest.mark.parametrize("add_noise", [False, True])
+def test_block_matches_reference(sine_wave_frequency: int | float,
+                                 add_noise: bool) -> None:
+    block: tuple[numpy.ndarray, numpy.ndarray] = process(
+        processing_mode=ProcessingMode.BLOCK,
+        sine_wave_frequency=sine_wave_frequency,
+        carrier_waveform=CarrierWaveform.SINE,
+        add_noise=add_noise)
+    reference: tuple[numpy.ndarray, numpy.ndarray] = process(
+        processing_mode=ProcessingMode.REFERENCE,
+        sine_wave_frequency=sine_wave_frequency,
+        carrier_waveform=CarrierWaveform.SINE,
+        add_noise=add_noise)
+
+    assert numpy.array_equal(block[0], reference[0])
+    # Input voice, sine wave and modulated voice are plotted the same way.
+    assert numpy.array_equal(block[1], reference[1])
+
+
+@pytest.mark.parametrize("carrier_waveform", list(CarrierWaveform))
+def test_block_matches_reference_after_changes(
+        carrier_waveform: CarrierWaveform) -> None:
+    changes: dict = {"sine_wave_frequency": 777.7,
+                     "volume": 1.5,
+                     "add_noise": True}
+    block: tuple[numpy.ndarray, numpy.ndarray] = process(
+        processing_mode=ProcessingMode.BLOCK,
+        sine_wave_frequency=1234.5,
+        carrier_waveform=carrier_waveform,
+        add_noise=False,
+        changes=changes)
+    reference: tuple[numpy.ndarray, numpy.ndarray] = process(
+        processing_mode=ProcessingMode.REFERENCE,
+        sine_wave_frequency=1234.5,
+        carrier_waveform=carrier_waveform,
+        add_noise=False,
+        changes=changes)
+
+    assert numpy.array_equal(block[0], reference[0])
+    # Input voice, sine wave and modulated voice are plotted the same way.
+    assert numpy.array_equal(block[1], reference[1])
+
+
+def test_callback_does_not_build_wavetables() -> None:
+    Wavetable._build_table.cache_clear()
+    sine_wave_generator: SineWaveGenerator = SineWaveGenerator(
+        sampling_frequency=SAMPLING_FREQUENCY,
+        sine_wave_frequency=1000,
+        carrier_waveform=CarrierWaveform.SINE)
+    noise_generator: NoiseGenerator = NoiseGenerator(seed=1, real_time=False)
+    audio_processor: AudioProcessor = AudioProcessor(
+        samples_per_buffer=SAMPLES_PER_BUFFER,
+        sine_wave_generator=sine_wave_generator,
+        noise_generator=noise_generator,
+        add_noise=False,
+        volume=1.0,
+        plot_ring_buffer=None)
+    in_data: bytes = bytes(SAMPLES_PER_BUFFER * 4)
+
+    # Wavetable is built by the control thread that changes parameters.
+    audio_processor.change_parameters(
+        changes={"carrier_waveform": CarrierWaveform.SAW})
+    audio_processor.change_parameters(changes={"sine_wave_frequency": 50})
+    misses: int = Wavetable._build_table.cache_info().misses
+    audio_processor.process(in_data=in_data)
+
+    assert Wavetable._build_table.cache_info().misses == misses
+    assert sine_wave_generator.carrier_waveform is CarrierWaveform.SAW
+    assert sine_wave_generator.sine_wave_frequency == 50
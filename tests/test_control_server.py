@@ -0,0 +1,131 @@
+import json
+import pathlib
+import socket
+from typing import Any
+
+import pytest
+
+from control_client import ControlClient
+from control_server import ControlServer
+from manual_backend import ManualBackend
+from noise_generator import NoiseGenerator
+from parameters import Parameters
+from sine_wave_generator import SineWaveGenerator
+from stream import Stream
+
+
+# Sine wave frequency of 450 Hz is valid for parameters,
+# but not below the Nyquist frequency of the stream.
+SAMPLING_FREQUENCY: int = 800
+SAMPLES_PER_BUFFER: int = 64
+
+
+@pytest.fixture
+def parameters(tmp_path: pathlib.Path,
+               monkeypatch: pytest.MonkeyPatch) -> Parameters:
+    monkeypatch.chdir(tmp_path)
+    with open("config.json", "w") as config_file:
+        json.dump({"sine_wave_frequency": 220.0,
+                   "add_noise": False,
+                   "volume": 1.0,
+                   "carrier_waveform": "sine"}, config_file)
+    parameters: Parameters = Parameters()
+    yield parameters
+    parameters.close()
+
+
+@pytest.fixture
+def control_server(parameters: Parameters) -> ControlServer:
+    noise_generator: NoiseGenerator = NoiseGenerator(seed=0,
+                                                     real_time=False)
+    stream: Stream = Stream(
+        sampling_frequency=SAMPLING_FREQUENCY,
+        samples_per_buffer=SAMPLES_PER_BUFFER,
+        sine_wave_generator=SineWaveGenerator(
+            sampling_frequency=SAMPLING_FREQUENCY,
+            sine_wave_frequency=parameters.sine_wave_frequency),
+        noise_generator=noise_generator,
+        add_noise=parameters.add_noise,
+        volume=parameters.volume,
+        plot_ring_buffer=None,
+        audio_backend=ManualBackend())
+    control_server: ControlServer = ControlServer(parameters=parameters,
+                                                  stream=stream,
+                                                  host="127.0.0.1",
+                                                  port=0)
+    yield control_server
+    control_server.close()
+    stream.close()
+    noise_generator.close()
+
+
+@pytest.fixture
+def control_client(control_server: ControlServer) -> ControlClient:
+    control_client: ControlClient = ControlClient(host="127.0.0.1",
+                                                  port=control_server.port)
+    yield control_client
+    control_client.close()
+
+
+def get_parameters(control_client: ControlClient) -> dict[str, Any]:
+    response: dict[str, Any] = control_client.request(
+        request={"command": "get"})
+    assert response["ok"] is True
+    return response["parameters"]
+
+
+def test_set_changes_and_saves_parameters(
+        parameters: Parameters,
+        control_client: ControlClient) -> None:
+    response: dict[str, Any] = control_client.request(
+        request={"command": "set",
+                 "parameters": {"volume": 2.0, "carrier_waveform": "saw"},
+                 "id": 7})
+
+    assert response["ok"] is True
+    assert response["id"] == 7
+    assert response["parameters"]["volume"] == 2.0
+    assert response["parameters"]["carrier_waveform"] == "saw"
+    parameters.close()
+    with open("config.json", "r") as config_file:
+        config: dict[str, Any] = json.load(config_file)
+    assert config["volume"] == 2.0
+    assert config["carrier_waveform"] == "saw"
+
+
+def test_invalid_requests_are_answered(
+        control_server: ControlServer) -> None:
+    with socket.create_connection(("127.0.0.1", control_server.port)) \
+            as client_socket:
+        client_file = client_socket.makefile("r", encoding="utf-8")
+        responses: list[dict[str, Any]] = []
+        for line in [b"not json\n",
+                     b"[1, 2]\n",
+                     b"{\"command\": \"unknown\", \"id\": 1}\n"]:
+            client_socket.sendall(line)
+            responses.append(json.loads(client_file.readline()))
+        client_file.close()
+
+    assert all(response["ok"] is False for response in responses)
+    assert responses[0]["error"].startswith("Invalid JSON!")
+    assert responses[2]["id"] == 1
+
+
+@pytest.mark.parametrize("changes", [
+    # Volume is valid, sine wave frequency is not.
+    {"volume": 3.0, "sine_wave_frequency": -1.0},
+    # Both are valid for parameters, but the stream rejects the frequency.
+    {"volume": 3.0, "sine_wave_frequency": 450.0}])
+def test_invalid_set_changes_nothing(parameters: Parameters,
+                                     control_client: ControlClient,
+                                     changes: dict[str, Any]) -> None:
+    before: dict[str, Any] = get_parameters(control_client=control_client)
+
+    response: dict[str, Any] = control_client.request(
+        request={"command": "set", "parameters": changes})
+
+    assert response["ok"] is False
+    assert get_parameters(control_client=control_client) == before
+    parameters.close()
+    with open("config.json", "r") as config_file:
+        assert json.load(config_file)["volume"] == 1.0
@@ -0,0 +1,99 @@
+import time
+
+import numpy
+import pytest
+
+from execution_mode import ExecutionMode
+from manual_backend import ManualBackend
+from noise_generator import NoiseGenerator
+from sine_wave_generator import SineWaveGenerator
+from stream import Stream
+
+
+SAMPLING_FREQUENCY: int = 16000
+SAMPLES_PER_BUFFER: int = 256
+NUMBER_OF_BUFFERS: int = 6
+# Worker processes a buffer in much less time.
+WORKER_INTERVAL_S: float = 0.1
+
+
+def create_stream(execution_mode: ExecutionMode,
+                  noise_generator: NoiseGenerator,
+                  backend: ManualBackend) -> Stream:
+    return Stream(
+        sampling_frequency=SAMPLING_FREQUENCY,
+        samples_per_buffer=SAMPLES_PER_BUFFER,
+        sine_wave_generator=SineWaveGenerator(
+            sampling_frequency=SAMPLING_FREQUENCY,
+            sine_wave_frequency=220),
+        noise_generator=noise_generator,
+        add_noise=False,
+        volume=2.0,
+        plot_ring_buffer=None,
+        execution_mode=execution_mode,
+        audio_backend=backend)
+
+
+def test_worker_output_equals_in_process_output_one_buffer_later() -> None:
+    random: numpy.random.Generator = numpy.random.default_rng(seed=0)
+    buffers: list[bytes] = [
+        random.uniform(-0.5, 0.5, SAMPLES_PER_BUFFER).astype(
+            numpy.float32).tobytes()
+        for _ in range(NUMBER_OF_BUFFERS)]
+    noise_generator: NoiseGenerator = NoiseGenerator(seed=0,
+                                                     real_time=False)
+    outputs: dict[ExecutionMode, list[numpy.ndarray]] = {}
+    try:
+        for execution_mode in [ExecutionMode.IN_CALLBACK,
+                               ExecutionMode.WORKER_PROCESS]:
+            backend: ManualBackend = ManualBackend()
+            stream: Stream = create_stream(execution_mode=execution_mode,
+                                           noise_generator=noise_generator,
+                                           backend=backend)
+            try:
+                outputs[execution_mode] = []
+                for index, in_data in enumerate(buffers):
+                    # The same change reaches both before the same buffer.
+                    if index == NUMBER_OF_BUFFERS // 2:
+                        stream.change_parameters(
+                            changes={"sine_wave_frequency": 440,
+                                     "volume": 3.0})
+                    out_data, _ = backend.call(in_data=in_data)
+                    outputs[execution_mode].append(numpy.frombuffer(
+                        out_data, dtype=numpy.float32).copy())
+                    if execution_mode is ExecutionMode.WORKER_PROCESS:
+                        time.sleep(WORKER_INTERVAL_S)
+                statistics: dict = stream.stats()
+            finally:
+                stream.close()
+    finally:
+        noise_generator.close()
+
+    assert statistics["worker_late_blocks"] == 0
+    assert statistics["worker_failed"] is False
+    worker_outputs: list[numpy.ndarray] = \
+        outputs[ExecutionMode.WORKER_PROCESS]
+    assert numpy.all(worker_outputs[0] == 0)
+    for expected, actual in zip(outputs[ExecutionMode.IN_CALLBACK][:-1],
+                                worker_outputs[1:]):
+        numpy.testing.assert_allclose(actual, expected, atol=1e-6)
+
+
+def test_worker_rejects_sine_wave_frequency_above_nyquist() -> None:
+    noise_generator: NoiseGenerator = NoiseGenerator(seed=0,
+                                                     real_time=False)
+    stream: Stream = create_stream(
+        execution_mode=ExecutionMode.WORKER_PROCESS,
+        noise_generator=noise_generator,
+        backend=ManualBackend())
+    try:
+        with pytest.raises(ValueError):
+            stream.change_parameters(
+                changes={"sine_wave_frequency": SAMPLING_FREQUENCY / 2})
+        with pytest.raises(ValueError):
+            stream.sine_wave_frequency = SAMPLING_FREQUENCY / 2
+        assert stream.sine_wave_frequency == 220
+        assert stream.stats()["worker_failed"] is False
+    finally:
+        stream.close()
+        noise_generator.close()
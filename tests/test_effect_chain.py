@@ -0,0 +1,105 @@
+import numpy
+import pytest
+
+from effect_chain import EffectChain
+from noise_generator import NoiseGenerator
+from ramp_shape import RampShape
+from sine_wave_generator import SineWaveGenerator
+from stream_parameters import StreamParameters
+
+
+SAMPLING_FREQUENCY: int = 16000
+SAMPLES_PER_BUFFER: int = 256
+
+
+def process(description: list[dict],
+            blocks: list[numpy.ndarray],
+            volume: float = 1.0) -> list[numpy.ndarray]:
+    """Process blocks of one channel by a chain and return them."""
+    noise_generator: NoiseGenerator = NoiseGenerator(seed=0, real_time=False)
+    effect_chain: EffectChain = EffectChain(
+        description=description,
+        sine_wave_generator=SineWaveGenerator(
+            sampling_frequency=SAMPLING_FREQUENCY,
+            sine_wave_frequency=100),
+        noise_generator=noise_generator,
+        volume=volume,
+        carrier_phase_offsets=None,
+        smoothing_ramp_samples=0,
+        ramp_shape=RampShape.LINEAR)
+    effect_chain.allocate(samples_per_buffer=SAMPLES_PER_BUFFER,
+                          number_of_channels=1)
+    parameters: StreamParameters = StreamParameters(volume=volume,
+                                                    add_noise=False)
+    processed_blocks: list[numpy.ndarray] = []
+    for block in blocks:
+        processed_block: numpy.ndarray = \
+            block.reshape(SAMPLES_PER_BUFFER, 1).copy()
+        effect_chain.process(block=processed_block, parameters=parameters)
+        processed_blocks.append(processed_block.reshape(-1))
+    noise_generator.close()
+    return processed_blocks
+
+
+def test_stages_run_in_description_order() -> None:
+    block: numpy.ndarray = numpy.full(SAMPLES_PER_BUFFER, 0.5)
+
+    clipped_last: numpy.ndarray = process(
+        [{"type": "volume"}, {"type": "clip", "level": 0.5}],
+        [block], volume=3.0)[0]
+    clipped_first: numpy.ndarray = process(
+        [{"type": "clip", "level": 0.5}, {"type": "volume"}],
+        [block], volume=3.0)[0]
+
+    assert numpy.all(clipped_last == 0.5)
+    assert numpy.all(clipped_first == 1.5)
+
+
+def test_consecutive_clips_keep_the_tighter_level() -> None:
+    block: numpy.ndarray = numpy.full(SAMPLES_PER_BUFFER, 0.9)
+
+    output: numpy.ndarray = process(
+        [{"type": "clip", "level": 0.8}, {"type": "clip", "level": 0.3}],
+        [block])[0]
+
+    assert numpy.all(output == 0.3)
+
+
+def test_gate_mutes_quiet_blocks_without_clicks() -> None:
+    loud: numpy.ndarray = numpy.full(SAMPLES_PER_BUFFER, 0.5)
+    quiet: numpy.ndarray = numpy.full(SAMPLES_PER_BUFFER, 0.001)
+
+    output: list[numpy.ndarray] = process(
+        [{"type": "gate", "threshold": 0.01}],
+        [loud, quiet, quiet, loud])
+
+    assert numpy.array_equal(output[0], loud)
+    # Gain ramps down across the first quiet block.
+    assert output[1][0] == pytest.approx(0.001, rel=0.01)
+    assert output[1][-1] == 0.0
+    assert not output[2].any()
+    # Gain ramps up across the next loud block.
+    assert output[3][0] == pytest.approx(0.5 / SAMPLES_PER_BUFFER)
+    assert output[3][-1] == 0.5
+
+
+@pytest.mark.parametrize("description, sampling_frequency, valid", [
+    (EffectChain.get_default_description(), None, True),
+    ([{"type": "ring_modulator"}, {"type": "ring_modulator",
+                                   "frequency": 30}], 16000, True),
+    ("volume", None, False),
+    ([{"type": "reverb"}], None, False),
+    ([{"type": "gate"}], None, False),
+    ([{"type": "clip", "level": 2.0}], None, False),
+    ([{"type": "volume", "level": 0.5}], None, False),
+    ([{"type": "ring_modulator"}, {"type": "ring_modulator"}], None, False),
+    # Frequency above Nyquist frequency of the chain.
+    ([{"type": "ring_modulator", "frequency": 12000}], None, True),
+    ([{"type": "ring_modulator", "frequency": 12000}], 16000, False),
+])
+def test_check_description(description: list[dict],
+                           sampling_frequency: int | None,
+                           valid: bool) -> None:
+    assert EffectChain.check_description(
+        description=description,
+        sampling_frequency=sampling_frequency) is valid
@@ -0,0 +1,77 @@
+import os
+import pathlib
+
+import numpy
+import pytest
+
+from file_renderer import FileRenderer
+from noise_color import NoiseColor
+from wav_reader import WavReader
+from wav_writer import WavWriter
+
+
+SAMPLING_FREQUENCY: int = 48000
+NUMBER_OF_FRAMES: int = 4000
+
+
+def write_voice(file_name: str) -> numpy.ndarray:
+    voice: numpy.ndarray = (0.5 * numpy.sin(
+        2 * numpy.pi * 440 * numpy.arange(NUMBER_OF_FRAMES)
+        / SAMPLING_FREQUENCY)).astype(numpy.float32)
+    wav_writer: WavWriter = WavWriter(file_name=file_name,
+                                      sampling_frequency=SAMPLING_FREQUENCY,
+                                      number_of_channels=1,
+                                      number_of_frames=NUMBER_OF_FRAMES)
+    wav_writer.write(start_frame=0, block=voice)
+    wav_writer.close()
+    return voice
+
+
+def read_voice(file_name: str) -> numpy.ndarray:
+    wav_reader: WavReader = WavReader(file_name=file_name)
+    voice: numpy.ndarray = wav_reader.read(
+        start_frame=0,
+        number_of_frames=wav_reader.number_of_frames).reshape(-1).copy()
+    wav_reader.close()
+    return voice
+
+
+def render(input_file_names: list[str], output_directory: str) -> None:
+    FileRenderer.render_files(input_file_names=input_file_names,
+                              output_directory=output_directory,
+                              number_of_processes=1,
+                              samples_per_buffer=1024,
+                              sine_wave_frequency=220,
+                              add_noise=False,
+                              volume=1.0,
+                              noise_color=NoiseColor.WHITE)
+
+
+def test_render_modulates_voice(tmp_path: pathlib.Path) -> None:
+    input_file_name: str = str(tmp_path / "voice.wav")
+    voice: numpy.ndarray = write_voice(input_file_name)
+    render([input_file_name], str(tmp_path / "rendered"))
+
+    output: numpy.ndarray = read_voice(str(tmp_path / "rendered" /
+                                           "voice.wav"))
+    sine_wave: numpy.ndarray = numpy.sin(
+        2 * numpy.pi * 220 * numpy.arange(NUMBER_OF_FRAMES)
+        / SAMPLING_FREQUENCY)
+    assert numpy.allclose(output, voice * sine_wave, atol=1e-5)
+
+
+def test_render_does_not_overwrite_input(tmp_path: pathlib.Path) -> None:
+    input_file_name: str = str(tmp_path / "voice.wav")
+    voice: numpy.ndarray = write_voice(input_file_name)
+    render([input_file_name], str(tmp_path))
+
+    assert numpy.array_equal(read_voice(input_file_name), voice)
+    with pytest.raises(ValueError):
+        FileRenderer.render_file(
+            input_file_name=input_file_name,
+            output_file_name=os.path.join(str(tmp_path), ".", "voice.wav"),
+            samples_per_buffer=1024,
+            sine_wave_frequency=220,
+            add_noise=False,
+            volume=1.0,
+            noise_color=NoiseColor.WHITE)
@@ -0,0 +1,34 @@
+import pytest
+
+from latency_meter import LatencyMeter
+from simulated_loopback import SimulatedLoopback
+
+
+SAMPLING_FREQUENCY: int = 16000
+
+
+@pytest.mark.parametrize("samples_per_buffer, latency_ms", [(256, 20),
+                                                            (512, 5)])
+def test_measures_latency_of_simulated_loopback(samples_per_buffer: int,
+                                                latency_ms: int) -> None:
+    latency_meter: LatencyMeter = LatencyMeter(
+        sampling_frequency=SAMPLING_FREQUENCY,
+        samples_per_buffer=samples_per_buffer,
+        number_of_channels=1,
+        number_of_trials=3,
+        min_latency_ms=None,
+        audio_backend=SimulatedLoopback(latency_ms=latency_ms,
+                                        jitter_ms=0,
+                                        noise_level=0.001,
+                                        seed=0))
+
+    result: dict = latency_meter.measure()
+
+    # Output comes back after a buffer of input, a buffer of output
+    # and latency of the device.
+    expected_latency_ms: float = \
+        2 * samples_per_buffer / SAMPLING_FREQUENCY * 1000 + latency_ms
+    assert result["valid_trials"] == 3
+    assert result["latency_ms"] == pytest.approx(
+        expected_latency_ms, abs=1000 / SAMPLING_FREQUENCY)
+    assert result["jitter_ms"] < 1000 / SAMPLING_FREQUENCY
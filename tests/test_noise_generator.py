@@ -0,0 +1,40 @@
+import numpy
+import pytest
+
+from noise_color import NoiseColor
+from noise_generator import NoiseGenerator
+
+
+@pytest.mark.parametrize("noise_color", list(NoiseColor))
+def test_colored_noise_is_continuous_between_batches(
+        noise_color: NoiseColor) -> None:
+    batch_size: int = 1024
+    noise_generator: NoiseGenerator = NoiseGenerator(noise_color=noise_color,
+                                                     seed=0,
+                                                     batch_size=batch_size,
+                                                     real_time=False)
+    noise: numpy.ndarray = noise_generator.get_block(batch_size * 64)
+
+    # Batch boundaries do not step more than points inside a batch.
+    steps: numpy.ndarray = numpy.abs(numpy.diff(noise))
+    boundary_steps: numpy.ndarray = steps[batch_size - 1::batch_size]
+    assert boundary_steps.mean() < 1.5 * steps.mean()
+    # Same power as white noise.
+    assert numpy.var(noise * 10000) == pytest.approx(1.0, rel=0.2)
+
+
+def test_underrun_returns_silence_without_waiting() -> None:
+    noise_generator: NoiseGenerator = NoiseGenerator(seed=0,
+                                                     pool_size=4096,
+                                                     batch_size=1024)
+    # Background thread stops, so the pool is not refilled.
+    noise_generator.close()
+
+    out: numpy.ndarray = numpy.empty(1024, dtype=numpy.float64)
+    for _ in range(4):
+        noise_generator.get_block(1024, out=out)
+    assert out.any()
+    noise_generator.get_block(1024, out=out)
+
+    assert not out.any()
+    assert noise_generator.underrun_points == 1024
@@ -0,0 +1,90 @@
+import json
+import os
+import pathlib
+
+import pytest
+
+import parameters as parameters_module
+from parameters import Parameters
+
+
+CONFIG: dict = {"sine_wave_frequency": 220.0,
+                "add_noise": False,
+                "volume": 1.0,
+                "samples_per_buffer": 1024}
+
+
+def write_config(config: dict) -> None:
+    with open("config.json", "w") as config_file:
+        json.dump(config, config_file)
+    # Config file looks changed even within the resolution of its time.
+    modification_time_ns: int = os.stat("config.json").st_mtime_ns
+    os.utime("config.json",
+             ns=(modification_time_ns, modification_time_ns + 10**9))
+
+
+def read_config() -> dict:
+    with open("config.json", "r") as config_file:
+        return json.load(config_file)
+
+
+@pytest.fixture
+def parameters(tmp_path: pathlib.Path,
+               monkeypatch: pytest.MonkeyPatch) -> Parameters:
+    monkeypatch.chdir(tmp_path)
+    write_config(CONFIG)
+    parameters: Parameters = Parameters()
+    yield parameters
+    parameters.close()
+
+
+def test_changes_in_a_row_are_saved_once(
+        parameters: Parameters,
+        capsys: pytest.CaptureFixture) -> None:
+    capsys.readouterr()
+    for volume in [2.0, 3.0, 4.0]:
+        assert parameters.change(changes={"volume": volume}) is True
+    parameters.close()
+
+    assert capsys.readouterr().out.count(
+        "Parameters are saved to config file successfully.") == 1
+    assert read_config()["volume"] == 4.0
+
+
+def test_failed_save_keeps_config_file(
+        parameters: Parameters,
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(file_descriptor: int) -> None:
+        raise OSError("disk is full")
+
+    monkeypatch.setattr(parameters_module.os, "fsync", fail)
+    parameters.change(changes={"volume": 5.0})
+    parameters.close()
+
+    assert read_config() == CONFIG
+    assert [path.name for path in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_reload_applies_live_parameters(parameters: Parameters) -> None:
+    write_config(dict(CONFIG, volume=3.0, sine_wave_frequency=5000.0))
+
+    # Invalid frequency is not applied, valid volume is.
+    assert parameters.reload() == {"volume": 3.0}
+    assert parameters.volume == 3.0
+    assert parameters.sine_wave_frequency == 220.0
+
+
+def test_reload_keeps_restart_parameters_in_config_file(
+        parameters: Parameters) -> None:
+    write_config(dict(CONFIG, samples_per_buffer=512))
+
+    assert parameters.reload() == {}
+    assert parameters.samples_per_buffer == 1024
+
+    # A later save does not revert the edit.
+    parameters.change(changes={"volume": 2.0})
+    parameters.close()
+    config: dict = read_config()
+    assert config["samples_per_buffer"] == 512
+    assert config["volume"] == 2.0
@@ -0,0 +1,58 @@
+import numpy
+import pytest
+
+from polyphase_resampler import PolyphaseResampler
+
+
+@pytest.mark.parametrize("factor", [2, 3, 4, 6])
+def test_whole_internal_blocks_add_filter_delay_only(factor: int) -> None:
+    resampler: PolyphaseResampler = PolyphaseResampler(
+        factor=factor,
+        samples_per_buffer=factor * 341,
+        number_of_channels=1)
+
+    assert resampler.internal_samples_per_buffer == 341
+    assert resampler.added_latency_samples == factor * 48 - 1
+
+
+def test_buffer_size_must_be_multiple_of_factor() -> None:
+    with pytest.raises(ValueError):
+        PolyphaseResampler(factor=3, samples_per_buffer=1024,
+                           number_of_channels=1)
+
+
+@pytest.mark.parametrize("relative_frequency, min_gain_db, max_gain_db", [
+    # Passband.
+    (0.3, -0.1, 0.1),
+    # Stopband, above Nyquist frequency of internal rate.
+    (0.6, None, -60.0)])
+def test_filter_passes_low_and_stops_high_frequencies(
+        relative_frequency: float,
+        min_gain_db: float | None,
+        max_gain_db: float) -> None:
+    factor: int = 3
+    samples_per_buffer: int = 240
+    resampler: PolyphaseResampler = PolyphaseResampler(
+        factor=factor,
+        samples_per_buffer=samples_per_buffer,
+        number_of_channels=1)
+    # Frequency relative to internal sampling frequency.
+    n: numpy.ndarray = numpy.arange(samples_per_buffer * 64)
+    tone: numpy.ndarray = numpy.sin(
+        2 * numpy.pi * relative_frequency / factor * n).astype(numpy.float32)
+
+    output: list[numpy.ndarray] = []
+    for start in range(0, len(tone), samples_per_buffer):
+        output.append(resampler.process(
+            in_data=tone[start:start + samples_per_buffer].tobytes(),
+            process=lambda block: block).copy())
+
+    # Skip the delay of both filters.
+    steady_output: numpy.ndarray = numpy.concatenate(output)[
+        resampler.added_latency_samples + samples_per_buffer:, 0]
+    gain_db: float = 20 * numpy.log10(
+        numpy.sqrt(numpy.mean(steady_output.astype(numpy.float64) ** 2))
+        / numpy.sqrt(0.5))
+    if min_gain_db is not None:
+        assert gain_db >= min_gain_db
+    assert gain_db <= max_gain_db
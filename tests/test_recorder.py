@@ -0,0 +1,114 @@
+import os
+import pathlib
+import struct
+import time
+
+import numpy
+
+from recorder import Recorder
+from recording_format import RecordingFormat
+from wav_reader import WavReader
+
+
+SAMPLING_FREQUENCY: int = 48000
+SAMPLES_PER_BUFFER: int = 256
+BYTES_PER_FRAME: int = 2 * numpy.dtype(numpy.float32).itemsize
+
+
+def create_recorder(directory: pathlib.Path,
+                    recording_format: RecordingFormat,
+                    max_file_duration_s: int | float | None) -> Recorder:
+    return Recorder(directory=str(directory),
+                    recording_format=recording_format,
+                    sampling_frequency=SAMPLING_FREQUENCY,
+                    samples_per_buffer=SAMPLES_PER_BUFFER,
+                    number_of_channels=1,
+                    number_of_slots=8,
+                    max_file_size_bytes=None,
+                    max_file_duration_s=max_file_duration_s)
+
+
+def wait_for_stats(recorder: Recorder, name: str, value: int | float) -> None:
+    for _ in range(200):
+        if recorder.stats()[name] == value:
+            return
+        time.sleep(0.01)
+
+
+def test_recording_resumes_after_write_error(tmp_path: pathlib.Path) -> None:
+    directory: pathlib.Path = tmp_path / "recordings"
+    recorder: Recorder = create_recorder(
+        directory=directory,
+        recording_format=RecordingFormat.RAW,
+        max_file_duration_s=None)
+    block: numpy.ndarray = numpy.ones(SAMPLES_PER_BUFFER,
+                                      dtype=numpy.float32)
+    try:
+        # File can not be created.
+        os.rmdir(directory)
+        recorder.record(input_data=block, output_data=block)
+        wait_for_stats(recorder=recorder,
+                       name="recorder_write_errors",
+                       value=1)
+        assert recorder.stats()["recorder_write_errors"] == 1
+        assert recorder.stats()["recorder_files"] == 0
+
+        # Writing is retried after the first pause of 1 s.
+        os.mkdir(directory)
+        time.sleep(1.1)
+        recorder.record(input_data=block, output_data=block)
+        wait_for_stats(recorder=recorder,
+                       name="recorder_written_s",
+                       value=SAMPLES_PER_BUFFER / SAMPLING_FREQUENCY)
+    finally:
+        recorder.close()
+
+    statistics: dict = recorder.stats()
+    assert statistics["recorder_write_errors"] == 1
+    assert statistics["recorder_dropped_blocks"] == 1
+    assert statistics["recorder_files"] == 1
+    recordings: list[pathlib.Path] = list(directory.iterdir())
+    assert len(recordings) == 1
+    assert recordings[0].stat().st_size == \
+        SAMPLES_PER_BUFFER * BYTES_PER_FRAME
+
+
+def test_files_are_rotated_by_duration(tmp_path: pathlib.Path) -> None:
+    directory: pathlib.Path = tmp_path / "recordings"
+    # A file holds 2 blocks.
+    recorder: Recorder = create_recorder(
+        directory=directory,
+        recording_format=RecordingFormat.WAV,
+        max_file_duration_s=2 * SAMPLES_PER_BUFFER / SAMPLING_FREQUENCY)
+    try:
+        for index in range(5):
+            block: numpy.ndarray = numpy.full(SAMPLES_PER_BUFFER,
+                                              index,
+                                              dtype=numpy.float32)
+            recorder.record(input_data=block, output_data=block)
+    finally:
+        recorder.close()
+
+    statistics: dict = recorder.stats()
+    assert statistics["recorder_files"] == 3
+    assert statistics["recorder_dropped_blocks"] == 0
+    recordings: list[pathlib.Path] = sorted(directory.iterdir())
+    assert len(recordings) == 3
+    for recording, number_of_blocks in zip(recordings, [2, 2, 1]):
+        number_of_frames: int = number_of_blocks * SAMPLES_PER_BUFFER
+        # Sizes in the header are written when the file is closed.
+        with open(recording, "rb") as recording_file:
+            riff_size: int = struct.unpack("<4sI", recording_file.read(8))[1]
+        assert riff_size == recording.stat().st_size - 8
+        wav_reader: WavReader = WavReader(file_name=str(recording))
+        try:
+            assert wav_reader.number_of_channels == 2
+            assert wav_reader.number_of_frames == number_of_frames
+            samples: numpy.ndarray = wav_reader.read(
+                start_frame=0,
+                number_of_frames=number_of_frames)
+        finally:
+            wav_reader.close()
+        assert samples.shape == (number_of_frames, 2)
+    # The last file has the last block.
+    assert numpy.all(samples == 4)
@@ -0,0 +1,71 @@
+import threading
+
+import numpy
+
+from ring_buffer import RingBuffer
+
+
+def write_blocks(ring_buffer: RingBuffer,
+                 number_of_blocks: int,
+                 block_size: int) -> None:
+    """Write blocks of zeros to every row."""
+    block: numpy.ndarray = numpy.zeros(block_size, dtype=numpy.float32)
+    for _ in range(number_of_blocks):
+        ring_buffer.write(*([block] * ring_buffer.number_of_rows))
+
+
+def test_overrun_counts_every_overwritten_sample_once() -> None:
+    ring_buffer: RingBuffer = RingBuffer(number_of_rows=3, capacity=1000)
+
+    # Fill without overrun.
+    write_blocks(ring_buffer=ring_buffer, number_of_blocks=4, block_size=250)
+    assert ring_buffer.overrun_samples == 0
+
+    # Reader stalls, so every later sample overwrites an unread one.
+    write_blocks(ring_buffer=ring_buffer, number_of_blocks=10, block_size=250)
+    assert ring_buffer.overrun_samples == 2500
+
+    # Reading catches up, the next capacity of samples is not lost.
+    window: numpy.ndarray = numpy.zeros((3, 100), dtype=numpy.float32)
+    ring_buffer.read_latest(out=window)
+    write_blocks(ring_buffer=ring_buffer, number_of_blocks=4, block_size=250)
+    assert ring_buffer.overrun_samples == 2500
+
+    write_blocks(ring_buffer=ring_buffer, number_of_blocks=1, block_size=300)
+    assert ring_buffer.overrun_samples == 2800
+
+
+class PausingBlock(numpy.ndarray):
+    """Block that runs a callback when its second slice is copied."""
+
+    on_slice = None
+    number_of_slices: int = 0
+
+    def __getitem__(self, key):
+        PausingBlock.number_of_slices = PausingBlock.number_of_slices + 1
+        if PausingBlock.number_of_slices == 2:
+            PausingBlock.on_slice()
+        return super().__getitem__(key)
+
+
+def test_read_latest_does_not_return_a_reserved_window() -> None:
+    ring_buffer: RingBuffer = RingBuffer(number_of_rows=1, capacity=8)
+    ring_buffer.write(numpy.arange(8, dtype=numpy.float32))
+    window: numpy.ndarray = numpy.zeros((1, 4), dtype=numpy.float32)
+    reader: threading.Thread = threading.Thread(
+        target=ring_buffer.read_latest,
+        kwargs={"out": window})
+
+    def read_while_writing() -> None:
+        # Samples 8 to 13 are reserved and copied, but not published,
+        # so the latest published window 4 to 7 is partly overwritten.
+        reader.start()
+        reader.join(timeout=0.2)
+
+    PausingBlock.on_slice = read_while_writing
+    ring_buffer.write(numpy.arange(8, 14, dtype=numpy.float32).view(
+        PausingBlock))
+    reader.join()
+
+    # Reader waits for the write and copies the window 10 to 13.
+    assert window[0].tolist() == [10, 11, 12, 13]
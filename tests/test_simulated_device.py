@@ -0,0 +1,64 @@
+import time
+
+import numpy
+
+from noise_generator import NoiseGenerator
+from simulated_device import SimulatedDevice
+from sine_wave_generator import SineWaveGenerator
+from stream import Stream
+from xrun_recovery_policy import XrunRecoveryPolicy
+
+
+SAMPLING_FREQUENCY: int = 16000
+SAMPLES_PER_BUFFER: int = 256
+
+
+def run(input_samples: numpy.ndarray) -> tuple[numpy.ndarray, dict]:
+    """Stream input through a simulated device with random xruns."""
+    device: SimulatedDevice = SimulatedDevice(input_samples=input_samples,
+                                              clock_speed=None,
+                                              xrun_probability=0.2,
+                                              seed=0)
+    noise_generator: NoiseGenerator = NoiseGenerator(seed=0,
+                                                     real_time=False)
+    stream: Stream = Stream(
+        sampling_frequency=SAMPLING_FREQUENCY,
+        samples_per_buffer=SAMPLES_PER_BUFFER,
+        sine_wave_generator=SineWaveGenerator(
+            sampling_frequency=SAMPLING_FREQUENCY,
+            sine_wave_frequency=220),
+        noise_generator=noise_generator,
+        add_noise=True,
+        volume=2.0,
+        plot_ring_buffer=None,
+        xrun_recovery_policy=XrunRecoveryPolicy.CONCEAL_CROSSFADE,
+        max_consecutive_xruns=1000,
+        audio_backend=device)
+    try:
+        while stream.is_active() is True:
+            time.sleep(0.01)
+    finally:
+        stream.close()
+        noise_generator.close()
+    return (device.output_samples.copy(), device.stats())
+
+
+def test_repeated_runs_give_the_same_output() -> None:
+    random: numpy.random.Generator = numpy.random.default_rng(seed=1)
+    input_samples: numpy.ndarray = random.uniform(
+        -0.5, 0.5, (SAMPLES_PER_BUFFER * 40 + 100, 1)).astype(numpy.float32)
+
+    first_output: numpy.ndarray
+    first_statistics: dict
+    first_output, first_statistics = run(input_samples=input_samples)
+    second_output: numpy.ndarray
+    second_statistics: dict
+    second_output, second_statistics = run(input_samples=input_samples)
+
+    # Last buffer is padded, so every input frame is processed.
+    assert first_statistics["simulated_callbacks"] == 41
+    assert first_statistics["simulated_injected_xruns"] > 0
+    assert first_statistics["simulated_injected_xruns"] == \
+        second_statistics["simulated_injected_xruns"]
+    assert numpy.any(first_output != 0)
+    numpy.testing.assert_array_equal(first_output, second_output)
@@ -0,0 +1,32 @@
+import numpy
+import pytest
+
+from carrier_waveform import CarrierWaveform
+from ramp_shape import RampShape
+from sine_wave_generator import SineWaveGenerator
+from wavetable import Wavetable
+
+
+@pytest.mark.parametrize("carrier_waveform", [CarrierWaveform.TRIANGLE,
+                                              CarrierWaveform.SQUARE,
+                                              CarrierWaveform.SAW])
+def test_glide_down_does_not_build_wavetables(
+        carrier_waveform: CarrierWaveform) -> None:
+    Wavetable._build_table.cache_clear()
+    sine_wave_generator: SineWaveGenerator = SineWaveGenerator(
+        sampling_frequency=48000,
+        sine_wave_frequency=8000,
+        carrier_waveform=carrier_waveform,
+        smoothing_ramp_samples=4096,
+        ramp_shape=RampShape.LINEAR)
+    out: numpy.ndarray = numpy.empty(256, dtype=numpy.float64)
+    sine_wave_generator.get_block(256, out=out)
+
+    # Tables of the glide are built with the new snapshot.
+    sine_wave_generator.sine_wave_frequency = 50
+    misses: int = Wavetable._build_table.cache_info().misses
+    for _ in range(32):
+        sine_wave_generator.get_block(256, out=out)
+
+    assert Wavetable._build_table.cache_info().misses == misses
+    assert numpy.abs(out).max() <= 1.5
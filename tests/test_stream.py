@@ -0,0 +1,67 @@
+import tracemalloc
+
+import numpy
+import pytest
+
+from manual_backend import ManualBackend
+from noise_generator import NoiseGenerator
+from ring_buffer import RingBuffer
+from sine_wave_generator import SineWaveGenerator
+from stream import Stream
+
+
+SAMPLING_FREQUENCY: int = 48000
+SAMPLES_PER_BUFFER: int = 1024
+
+
+@pytest.mark.parametrize("add_noise", [False, True])
+def test_callback_does_not_allocate_after_warm_up(add_noise: bool) -> None:
+    # Pool holds noise of all buffers, so no batch is generated.
+    noise_generator: NoiseGenerator = NoiseGenerator(seed=0,
+                                                     pool_size=1 << 19,
+                                                     real_time=False)
+    backend: ManualBackend = ManualBackend()
+    stream: Stream = Stream(
+        sampling_frequency=SAMPLING_FREQUENCY,
+        samples_per_buffer=SAMPLES_PER_BUFFER,
+        sine_wave_generator=SineWaveGenerator(
+            sampling_frequency=SAMPLING_FREQUENCY,
+            sine_wave_frequency=1000),
+        noise_generator=noise_generator,
+        add_noise=add_noise,
+        volume=2.0,
+        plot_ring_buffer=RingBuffer(number_of_rows=3,
+                                    capacity=SAMPLES_PER_BUFFER * 8),
+        audio_backend=backend)
+    in_data: bytes = numpy.full(SAMPLES_PER_BUFFER,
+                                0.1,
+                                dtype=numpy.float32).tobytes()
+
+    def call_back(number_of_buffers: int) -> None:
+        for _ in range(number_of_buffers):
+            backend.call(in_data=in_data)
+
+    try:
+        # Scratch buffers are allocated by the first buffers.
+        call_back(number_of_buffers=16)
+        tracemalloc.start()
+        try:
+            call_back(number_of_buffers=16)
+            tracemalloc.reset_peak()
+            start_size: int
+            start_size, _ = tracemalloc.get_traced_memory()
+            call_back(number_of_buffers=256)
+            size: int
+            peak_size: int
+            size, peak_size = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        stream.close()
+        noise_generator.close()
+
+    # Nothing is kept per buffer and no block sized array is allocated,
+    # only small temporary Python objects.
+    assert size - start_size < 1024
+    assert peak_size - start_size < \
+        SAMPLES_PER_BUFFER * numpy.dtype(numpy.float32).itemsize
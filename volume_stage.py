@@ -0,0 +1,66 @@
+import numpy
+
+from effect_stage import EffectStage
+from parameter_smoother import ParameterSmoother
+from ramp_shape import RampShape
+from stream_parameters import StreamParameters
+
+
+class VolumeStage(EffectStage):
+    def __init__(self,
+                 volume: int | float,
+                 smoothing_ramp_samples: int,
+                 ramp_shape: RampShape) -> None:
+        """Initialize amplification by current volume.
+
+        Volume ramps to a new value instead of jumping.
+
+        Args:
+            volume (int | float): initial volume.
+            smoothing_ramp_samples (int): duration of a volume ramp,
+            samples. 0 - do not smooth.
+            ramp_shape (RampShape): shape of a volume ramp.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        super().__init__()
+
+        self._volume_smoother: ParameterSmoother = ParameterSmoother(
+            value=volume,
+            ramp_samples=smoothing_ramp_samples,
+            ramp_shape=ramp_shape)
+
+        self._volume_ramp: numpy.ndarray = numpy.empty(0)
+        self._volume_ramp_column: numpy.ndarray = numpy.empty((0, 1))
+
+    def allocate(self,
+                 samples_per_buffer: int,
+                 number_of_channels: int) -> None:
+        """Allocate volume ramp for a number of frames.
+
+        Args:
+            samples_per_buffer (int): number of frames in a block.
+            number_of_channels (int): number of channels in a block.
+        """
+        self._volume_ramp = numpy.zeros(samples_per_buffer,
+                                        dtype=numpy.float64)
+        self._volume_ramp_column = \
+            self._volume_ramp.reshape(samples_per_buffer, 1)
+
+    def process(self,
+                block: numpy.ndarray,
+                parameters: StreamParameters) -> None:
+        """Amplify a block in place.
+
+        Args:
+            block (numpy.ndarray): float64 block of shape
+            (frames, channels).
+            parameters (StreamParameters): parameters for this block.
+        """
+        volume: float | numpy.ndarray = self._volume_smoother.get_block(
+            target=parameters.volume,
+            out=self._volume_ramp)
+        if isinstance(volume, numpy.ndarray):
+            volume = self._volume_ramp_column
+        numpy.multiply(block, volume, out=block)
@@ -0,0 +1,192 @@
+import os
+import struct
+
+import numpy
+
+
+class WavReader:
+    def __init__(self, file_name: str) -> None:
+        """Open a WAV file for reading through a memory map.
+
+        Samples are not loaded into memory.
+        Only requested blocks are read and converted to float32.
+        Supported formats: 16, 24 and 32 bit PCM, 32 and 64 bit float.
+
+        Args:
+            file_name (str): WAV file name.
+
+        Raises:
+            ValueError: invalid argument or unsupported WAV file.
+            OSError: file could not be read.
+        """
+        super().__init__()
+
+        # Check argument.
+        if not isinstance(file_name, str):
+            raise ValueError("ERROR! Invalid argument!")
+
+        self._PCM_FORMAT: int = 1
+        self._FLOAT_FORMAT: int = 3
+        self._EXTENSIBLE_FORMAT: int = 0xFFFE
+
+        self._file_name: str = file_name
+
+        audio_format: int = 0
+        self._number_of_channels: int = 0
+        self._sampling_frequency: int = 0
+        self._bits_per_sample: int = 0
+        block_align: int = 0
+        data_offset: int = -1
+        data_size: int = 0
+
+        with open(file_name, "rb") as wav_file:
+            riff_header: bytes = wav_file.read(12)
+            if ((len(riff_header) != 12) or
+                (riff_header[0:4] != b"RIFF") or
+                (riff_header[8:12] != b"WAVE")):
+                raise ValueError("ERROR! Not a WAV file!")
+
+            # Find format and data chunks.
+            while True:
+                chunk_header: bytes = wav_file.read(8)
+                if len(chunk_header) != 8:
+                    break
+                chunk_id: bytes = chunk_header[0:4]
+                chunk_size: int = struct.unpack("<I", chunk_header[4:8])[0]
+
+                if chunk_id == b"fmt ":
+                    chunk: bytes = wav_file.read(chunk_size)
+                    (audio_format,
+                     self._number_of_channels,
+                     self._sampling_frequency,
+                     _,
+                     block_align,
+                     self._bits_per_sample) = \
+                        struct.unpack("<HHIIHH", chunk[0:16])
+                    if ((audio_format == self._EXTENSIBLE_FORMAT) and
+                        (chunk_size >= 40)):
+                        audio_format = struct.unpack("<H", chunk[24:26])[0]
+                elif chunk_id == b"data":
+                    data_offset = wav_file.tell()
+                    data_size = chunk_size
+                    wav_file.seek(chunk_size, 1)
+                else:
+                    wav_file.seek(chunk_size, 1)
+
+                # Chunks are padded to an even size.
+                if (chunk_size % 2) == 1:
+                    wav_file.seek(1, 1)
+
+        if ((self._number_of_channels <= 0) or
+            (block_align <= 0) or
+            (data_offset < 0)):
+            raise ValueError("ERROR! Invalid WAV file!")
+
+        self._dtype: str
+        match (audio_format, self._bits_per_sample):
+            case (self._PCM_FORMAT, 16):
+                self._dtype = "<i2"
+            case (self._PCM_FORMAT, 24):
+                self._dtype = "u1"
+            case (self._PCM_FORMAT, 32):
+                self._dtype = "<i4"
+            case (self._FLOAT_FORMAT, 32):
+                self._dtype = "<f4"
+            case (self._FLOAT_FORMAT, 64):
+                self._dtype = "<f8"
+            case _:
+                raise ValueError("ERROR! Unsupported WAV format!")
+
+        # Some writers leave data size unset when recording is interrupted.
+        file_size: int = os.path.getsize(file_name)
+        data_size = min(data_size, file_size - data_offset)
+        self._number_of_frames: int = data_size // block_align
+
+        self._samples: numpy.memmap | None = None
+        if self._number_of_frames > 0:
+            shape: tuple[int, ...] = (self._number_of_frames,
+                                      self._number_of_channels)
+            if self._bits_per_sample == 24:
+                shape = shape + (3,)
+            self._samples = numpy.memmap(file_name,
+                                         dtype=self._dtype,
+                                         mode="r",
+                                         offset=data_offset,
+                                         shape=shape)
+
+    def read(self, start_frame: int, number_of_frames: int) -> numpy.ndarray:
+        """Read and convert a block of frames.
+
+        Args:
+            start_frame (int): index of the first frame.
+            number_of_frames (int): number of frames to read.
+            Fewer frames are returned at the end of the file.
+
+        Raises:
+            ValueError: invalid arguments.
+
+        Returns:
+            numpy.ndarray: float32 array of shape
+            (number of frames, number of channels) with samples in [-1, 1].
+        """
+        # Check arguments.
+        if((not isinstance(start_frame, int)) or
+           (start_frame < 0) or
+           (not isinstance(number_of_frames, int)) or
+           (number_of_frames < 0)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        if self._samples is None:
+            return numpy.zeros((0, self._number_of_channels),
+                               dtype=numpy.float32)
+
+        raw_block: numpy.ndarray = \
+            self._samples[start_frame:start_frame + number_of_frames]
+
+        block: numpy.ndarray
+        match self._bits_per_sample:
+            case 24:
+                # Place 3 little-endian bytes in the top of int32.
+                block = (raw_block[..., 0].astype(numpy.int32) << 8) \
+                        | (raw_block[..., 1].astype(numpy.int32) << 16) \
+                        | (raw_block[..., 2].astype(numpy.int32) << 24)
+                block = block.astype(numpy.float32) / 2 ** 31
+            case _ if numpy.dtype(self._dtype).kind == "i":
+                block = raw_block.astype(numpy.float32) \
+                        / (2 ** (self._bits_per_sample - 1))
+            case _:
+                block = raw_block.astype(numpy.float32)
+
+        return block
+
+    def close(self) -> None:
+        """Close memory map of a WAV file."""
+        # Memory map is closed when the last reference is released.
+        self._samples = None
+
+    @property
+    def sampling_frequency(self) -> int:
+        """Return sampling frequency.
+
+        Returns:
+            int: sampling frequency, Hz.
+        """
+        return self._sampling_frequency
+
+    @property
+    def number_of_channels(self) -> int:
+        """Return number of channels.
+
+        Returns:
+            int: number of channels.
+        """
+        return self._number_of_channels
+
+    @property
+    def number_of_frames(self) -> int:
+        """Return number of frames.
+
+        Returns:
+            int: number of frames.
+        """
+        return self._number_of_frames
@@ -0,0 +1,135 @@
+import struct
+
+import numpy
+
+
+class WavWriter:
+    def __init__(self,
+                 file_name: str,
+                 sampling_frequency: int,
+                 number_of_channels: int,
+                 number_of_frames: int) -> None:
+        """Create a 32 bit float WAV file for writing through a memory map.
+
+        File is created with its final size,
+        so blocks can be written in any order without keeping them in memory.
+
+        Args:
+            file_name (str): WAV file name.
+            sampling_frequency (int): sampling frequency, Hz.
+            number_of_channels (int): number of channels.
+            number_of_frames (int): number of frames.
+
+        Raises:
+            ValueError: invalid arguments.
+            OSError: file could not be written.
+        """
+        super().__init__()
+
+        # Check arguments.
+        if((not isinstance(file_name, str)) or
+           (not isinstance(sampling_frequency, int)) or
+           (sampling_frequency <= 0) or
+           (not isinstance(number_of_channels, int)) or
+           (number_of_channels <= 0) or
+           (not isinstance(number_of_frames, int)) or
+           (number_of_frames < 0)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        self._number_of_channels: int = number_of_channels
+        self._number_of_frames: int = number_of_frames
+
+        header: bytes = WavWriter.create_header(
+            sampling_frequency=sampling_frequency,
+            number_of_channels=number_of_channels,
+            number_of_frames=number_of_frames)
+        data_size: int = (number_of_frames * number_of_channels
+                          * numpy.dtype(numpy.float32).itemsize)
+
+        with open(file_name, "wb") as wav_file:
+            wav_file.write(header)
+            wav_file.truncate(len(header) + data_size)
+
+        self._samples: numpy.memmap | None = None
+        if number_of_frames > 0:
+            self._samples = numpy.memmap(file_name,
+                                         dtype="<f4",
+                                         mode="r+",
+                                         offset=len(header),
+                                         shape=(number_of_frames,
+                                                number_of_channels))
+
+    @staticmethod
+    def create_header(sampling_frequency: int,
+                      number_of_channels: int,
+                      number_of_frames: int) -> bytes:
+        """Create a header of a 32 bit float WAV file.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            number_of_channels (int): number of channels.
+            number_of_frames (int): number of frames.
+
+        Returns:
+            bytes: header, samples follow it.
+        """
+        FLOAT_FORMAT: int = 3
+        BYTES_PER_SAMPLE: int = 4
+
+        block_align: int = number_of_channels * BYTES_PER_SAMPLE
+        byte_rate: int = sampling_frequency * block_align
+        data_size: int = number_of_frames * block_align
+
+        format_chunk: bytes = struct.pack("<4sIHHIIHHH",
+                                          b"fmt ",
+                                          18,
+                                          FLOAT_FORMAT,
+                                          number_of_channels,
+                                          sampling_frequency,
+                                          byte_rate,
+                                          block_align,
+                                          BYTES_PER_SAMPLE * 8,
+                                          0)
+        # Non-PCM WAV files must have a "fact" chunk.
+        fact_chunk: bytes = struct.pack("<4sII",
+                                        b"fact",
+                                        4,
+                                        number_of_frames)
+        data_chunk_header: bytes = struct.pack("<4sI", b"data", data_size)
+        riff_size: int = (4 + len(format_chunk) + len(fact_chunk)
+                          + len(data_chunk_header) + data_size)
+        riff_header: bytes = struct.pack("<4sI4s", b"RIFF", riff_size, b"WAVE")
+        return (riff_header + format_chunk + fact_chunk
+                + data_chunk_header)
+
+    def write(self, start_frame: int, block: numpy.ndarray) -> None:
+        """Write a block of frames.
+
+        Args:
+            start_frame (int): index of the first frame.
+            block (numpy.ndarray): array of shape
+            (number of frames, number of channels) or (number of frames,)
+            for one channel.
+
+        Raises:
+            ValueError: invalid arguments.
+        """
+        # Check arguments.
+        if((not isinstance(start_frame, int)) or
+           (start_frame < 0) or
+           (not isinstance(block, numpy.ndarray)) or
+           (start_frame + block.shape[0] > self._number_of_frames)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        if self._samples is None:
+            return
+
+        self._samples[start_frame:start_frame + block.shape[0]] = \
+            block.reshape(block.shape[0], -1)
+
+    def close(self) -> None:
+        """Flush written frames and close memory map of a WAV file."""
+        if self._samples is not None:
+            self._samples.flush()
+            # Memory map is closed when the last reference is released.
+            self._samples = None
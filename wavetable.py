@@ -0,0 +1,183 @@
+import functools
+import math
+
+import numpy
+
+from carrier_waveform import CarrierWaveform
+
+
+class Wavetable:
+    # Number of points in one period of a table.
+    TABLE_SIZE: int = 4096
+    # Largest number of harmonics of a table, power of two.
+    MAX_NUMBER_OF_HARMONICS: int = 1024
+
+    @staticmethod
+    def get_table(carrier_waveform: CarrierWaveform,
+                  sampling_frequency: int,
+                  frequency: int | float) -> numpy.ndarray | None:
+        """Return a band-limited table for a carrier frequency.
+
+        Tables are mip-mapped: there is one table per power of two
+        number of harmonics. The table with the most harmonics
+        below Nyquist frequency is chosen, so a carrier does not alias.
+
+        Args:
+            carrier_waveform (CarrierWaveform): carrier waveform.
+            sampling_frequency (int): sampling frequency, Hz.
+            frequency (int | float): carrier frequency, Hz.
+
+        Raises:
+            ValueError: invalid arguments.
+
+        Returns:
+            numpy.ndarray | None: read-only float64 table
+            of TABLE_SIZE + 2 points, the last two points repeat
+            the first two. None - sine carrier, which needs no table.
+        """
+        # Check arguments.
+        if((not isinstance(carrier_waveform, CarrierWaveform)) or
+           (not isinstance(sampling_frequency, int)) or
+           (sampling_frequency <= 0) or
+           (not isinstance(frequency, (int, float))) or
+           (frequency <= 0) or
+           (frequency >= sampling_frequency/2)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        if carrier_waveform == CarrierWaveform.SINE:
+            return None
+
+        return Wavetable._build_table(
+            carrier_waveform=carrier_waveform,
+            number_of_harmonics=Wavetable.get_number_of_harmonics(
+                sampling_frequency=sampling_frequency,
+                frequency=frequency))
+
+    @staticmethod
+    def get_tables(carrier_waveform: CarrierWaveform,
+                   sampling_frequency: int,
+                   low_frequency: int | float,
+                   high_frequency: int | float) \
+                    -> dict[int, numpy.ndarray]:
+        """Return tables of all frequencies of a range.
+
+        Frequency glide reads these tables without building any.
+
+        Args:
+            carrier_waveform (CarrierWaveform): carrier waveform
+            other than sine.
+            sampling_frequency (int): sampling frequency, Hz.
+            low_frequency (int | float): lowest carrier frequency, Hz.
+            high_frequency (int | float): highest carrier frequency, Hz.
+
+        Raises:
+            ValueError: invalid arguments.
+
+        Returns:
+            dict[int, numpy.ndarray]: tables by number of harmonics.
+        """
+        # Check arguments.
+        if((carrier_waveform == CarrierWaveform.SINE) or
+           (not isinstance(low_frequency, (int, float))) or
+           (not isinstance(high_frequency, (int, float))) or
+           (low_frequency > high_frequency)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        tables: dict[int, numpy.ndarray] = {}
+        number_of_harmonics: int = Wavetable.get_number_of_harmonics(
+            sampling_frequency=sampling_frequency,
+            frequency=high_frequency)
+        max_number_of_harmonics: int = Wavetable.get_number_of_harmonics(
+            sampling_frequency=sampling_frequency,
+            frequency=low_frequency)
+        while number_of_harmonics <= max_number_of_harmonics:
+            tables[number_of_harmonics] = Wavetable._build_table(
+                carrier_waveform=carrier_waveform,
+                number_of_harmonics=number_of_harmonics)
+            number_of_harmonics = number_of_harmonics * 2
+        return tables
+
+    @staticmethod
+    def get_number_of_harmonics(sampling_frequency: int,
+                                frequency: int | float) -> int:
+        """Return number of harmonics of a table for a carrier frequency.
+
+        Only arithmetic, so it may be called from an audio callback.
+
+        Args:
+            sampling_frequency (int): sampling frequency, Hz.
+            frequency (int | float): carrier frequency, Hz.
+
+        Raises:
+            ValueError: invalid arguments.
+
+        Returns:
+            int: the largest power of two number of harmonics
+            below Nyquist frequency.
+        """
+        # Check arguments.
+        if((not isinstance(sampling_frequency, int)) or
+           (sampling_frequency <= 0) or
+           (not isinstance(frequency, (int, float))) or
+           (frequency <= 0) or
+           (frequency >= sampling_frequency/2)):
+            raise ValueError("ERROR! Invalid arguments!")
+
+        # Harmonics strictly below Nyquist frequency.
+        max_number_of_harmonics: int = max(
+            1, math.ceil(sampling_frequency / 2 / frequency) - 1)
+        number_of_harmonics: int = 1
+        while ((number_of_harmonics * 2 <= max_number_of_harmonics) and
+               (number_of_harmonics * 2 <= Wavetable.MAX_NUMBER_OF_HARMONICS)):
+            number_of_harmonics = number_of_harmonics * 2
+        return number_of_harmonics
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _build_table(carrier_waveform: CarrierWaveform,
+                     number_of_harmonics: int) -> numpy.ndarray:
+        """Build a table from a Fourier series by an inverse FFT.
+
+        Tables are cached and shared, so they are read-only.
+
+        Args:
+            carrier_waveform (CarrierWaveform): carrier waveform.
+            number_of_harmonics (int): number of harmonics.
+
+        Returns:
+            numpy.ndarray: read-only float64 table normalized to peak 1.
+        """
+        harmonics: numpy.ndarray = numpy.arange(1,
+                                                number_of_harmonics + 1,
+                                                dtype=numpy.float64)
+        amplitudes: numpy.ndarray = numpy.zeros(number_of_harmonics,
+                                                dtype=numpy.float64)
+        is_odd: numpy.ndarray = (harmonics % 2) == 1
+        match carrier_waveform:
+            case CarrierWaveform.TRIANGLE:
+                # Odd harmonics with alternating signs, 1 / k^2.
+                signs: numpy.ndarray = \
+                    numpy.where(((harmonics - 1) / 2) % 2 == 0, 1.0, -1.0)
+                amplitudes[is_odd] = signs[is_odd] / harmonics[is_odd] ** 2
+            case CarrierWaveform.SQUARE:
+                # Odd harmonics, 1 / k.
+                amplitudes[is_odd] = 1.0 / harmonics[is_odd]
+            case CarrierWaveform.SAW:
+                # All harmonics with alternating signs, 1 / k.
+                amplitudes = numpy.where(is_odd, 1.0, -1.0) / harmonics
+            case _:
+                amplitudes[0] = 1.0
+
+        # Sine of harmonic k is bin k with imaginary part -N / 2.
+        spectrum: numpy.ndarray = numpy.zeros(Wavetable.TABLE_SIZE // 2 + 1,
+                                              dtype=numpy.complex128)
+        spectrum[1:number_of_harmonics + 1] = \
+            -0.5j * Wavetable.TABLE_SIZE * amplitudes
+        period: numpy.ndarray = numpy.fft.irfft(spectrum,
+                                                n=Wavetable.TABLE_SIZE)
+        period = period / numpy.max(numpy.abs(period))
+
+        # Guard points let interpolation read two points past any index.
+        table: numpy.ndarray = numpy.concatenate((period, period[:2]))
+        table.setflags(write=False)
+        return table
@@ -0,0 +1,7 @@
+from enum import Enum
+
+class XrunRecoveryPolicy(Enum):
+    ABORT = 0
+    CONTINUE = 1
+    CONCEAL_REPEAT = 2
+    CONCEAL_CROSSFADE = 3
\ No newline at end of file